@@ -14,45 +14,86 @@
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
 import boto3
+import json
 import os
-def lambda_handler(event, context):
-    # import Lambda runtime env var for function name
-    functionName = os.environ['AWS_LAMBDA_FUNCTION_NAME']
-    # create boto3 clients
-    securityhub = boto3.client('securityhub')
-    # parse deleted resource ARN and resource ID from Config Event
+# created once per Lambda container and reused by every warm invocation
+securityhub = boto3.client('securityhub')
+# import Lambda runtime env var for function name
+functionName = os.environ['AWS_LAMBDA_FUNCTION_NAME']
+# Security Hub accepts up to 20 values for one filter field, values of the same field are ORed
+maxFilterValues = 20
+pruneNote = 'The resource related to this finding was identified as being deleted from AWS Config and has been archived. Please investigate further to ensure the deletion was not due to malicious activity or an improperly configured change.'
+
+def config_events(event):
+    # deletion events come straight from the Event Rule as (None, event), or batched up by the SQS queue
+    # in front of this function as (messageId, event)
+    if 'Records' not in event:
+        return [(None, event)]
+    configEvents = []
+    for record in event['Records']:
+        try:
+            configEvent = json.loads(record['body'])
+        except (KeyError, TypeError, ValueError) as e:
+            configEvent = None
+            print(e)
+        if not isinstance(configEvent, dict):
+            # a message that will never parse is dropped instead of holding up the rest of the batch
+            print('Skipping unparsable SQS message ' + str(record.get('messageId')))
+            continue
+        configEvents.append((record['messageId'], configEvent))
+    return configEvents
+
+def deleted_resource_identifiers(configEvent):
     # Resource.[i].Id in the ASFF *should* be the ARN but just in case try both
-    try:
-        deletedResourceArn = str(event['detail']['configurationItem']['ARN'])
-    except Exception as e:
-        print(e)
-    try:
-        deletedResourceId = str(event['detail']['configurationItem']['resourceId'])
-    except Exception as e:
-        print(e)
-    # archive all findings related to resource ARN
-    try:
-        response = securityhub.update_findings(
-            Filters={'ResourceId': [{'Value': deletedResourceArn,'Comparison': 'EQUALS'}]},
-            Note={
-                'Text': 'The resource related to this finding was identified as being deleted from AWS Config and has been archived. Please investigate further to ensure the deletion was not due to malicious activity or an improperly configured change.',
-                'UpdatedBy': functionName
-            },
-            RecordState='ARCHIVED'
-        )
-        print(response)
-    except Exception as e:
-        print(e)
-    # archive all findings related to resource ID
-    try:
-        response = securityhub.update_findings(
-            Filters={'ResourceId': [{'Value': deletedResourceId,'Comparison': 'EQUALS'}]},
-            Note={
-                'Text': 'The resource related to this finding was identified as being deleted from AWS Config and has been archived. Please investigate further to ensure the deletion was not due to malicious activity or an improperly configured change.',
-                'UpdatedBy': functionName
-            },
-            RecordState='ARCHIVED'
-        )
-        print(response)
-    except Exception as e:
-        print(e)
\ No newline at end of file
+    configurationItem = configEvent.get('detail', {}).get('configurationItem', {})
+    identifiers = []
+    for key in ('ARN', 'resourceId'):
+        if configurationItem.get(key):
+            identifiers.append(str(configurationItem[key]))
+        else:
+            print('Config event ' + str(configEvent.get('id')) + ' has no ' + key)
+    return identifiers
+
+def archive_findings(identifiers):
+    # one UpdateFindings call archives every active finding for up to 20 ARNs / resource IDs
+    response = securityhub.update_findings(
+        Filters={
+            'ResourceId': [{'Value': identifier, 'Comparison': 'EQUALS'} for identifier in identifiers],
+            'RecordState': [{'Value': 'ACTIVE', 'Comparison': 'EQUALS'}]
+        },
+        Note={
+            'Text': pruneNote,
+            'UpdatedBy': functionName
+        },
+        RecordState='ARCHIVED'
+    )
+    print('Archived findings for ' + ', '.join(identifiers))
+    return response
+
+def lambda_handler(event, context):
+    # parse deleted resource ARNs and resource IDs from every Config event in this invocation,
+    # along with the SQS messages they came from
+    identifierMessages = {}
+    for messageId, configEvent in config_events(event):
+        for identifier in deleted_resource_identifiers(configEvent):
+            messageIds = identifierMessages.setdefault(identifier, [])
+            if messageId not in messageIds:
+                messageIds.append(messageId)
+    identifiers = list(identifierMessages)
+    failedMessageIds = []
+    for start in range(0, len(identifiers), maxFilterValues):
+        chunk = identifiers[start:start + maxFilterValues]
+        try:
+            archive_findings(chunk)
+        except Exception as e:
+            print(e)
+            # a direct invocation is retried by Lambda
+            if 'Records' not in event:
+                raise
+            for identifier in chunk:
+                for messageId in identifierMessages[identifier]:
+                    if messageId not in failedMessageIds:
+                        failedMessageIds.append(messageId)
+    # only the messages of a failed call are delivered again (ReportBatchItemFailures),
+    # after maxReceiveCount deliveries SQS moves them to the dead letter queue
+    return {'batchItemFailures': [{'itemIdentifier': messageId} for messageId in failedMessageIds]}
@@ -55,6 +55,15 @@ resource "aws_iam_policy" "ElectricEye_ConfigPruner_Lambda_Role_Policy" {
               "securityhub:UpdateFindings"
             ],
             "Resource": "*"
+        },
+        {
+            "Effect": "Allow",
+            "Action": [
+              "sqs:ReceiveMessage",
+              "sqs:DeleteMessage",
+              "sqs:GetQueueAttributes"
+            ],
+            "Resource": "${aws_sqs_queue.ElectricEye_ConfigPruner_Queue.arn}"
         }
     ]
 }
@@ -92,14 +101,45 @@ resource "aws_cloudwatch_event_rule" "ElectricEye_ConfigPruner_Event_Rule" {
 }
 PATTERN
 }
-resource "aws_cloudwatch_event_target" "ElectricEye_ConfigPruner_Event_Rule_Lambda_Target" {
+resource "aws_cloudwatch_event_target" "ElectricEye_ConfigPruner_Event_Rule_SQS_Target" {
   rule      = "${aws_cloudwatch_event_rule.ElectricEye_ConfigPruner_Event_Rule.name}"
-  arn       = "${aws_lambda_function.ElectricEye_ConfigPruner_Lambda_Function.arn}"
+  arn       = "${aws_sqs_queue.ElectricEye_ConfigPruner_Queue.arn}"
+}
+resource "aws_sqs_queue" "ElectricEye_ConfigPruner_Queue" {
+  name                       = "ElectricEye-ConfigPruner"
+  visibility_timeout_seconds = 366
+  redrive_policy             = "{\"deadLetterTargetArn\":\"${aws_sqs_queue.ElectricEye_ConfigPruner_DLQ.arn}\",\"maxReceiveCount\":5}"
+}
+resource "aws_sqs_queue" "ElectricEye_ConfigPruner_DLQ" {
+  name                      = "ElectricEye-ConfigPruner-DLQ"
+  message_retention_seconds = 1209600
+}
+resource "aws_sqs_queue_policy" "ElectricEye_ConfigPruner_Queue_Policy" {
+  queue_url = "${aws_sqs_queue.ElectricEye_ConfigPruner_Queue.id}"
+  policy = <<EOF
+{
+  "Version": "2012-10-17",
+  "Statement": [
+    {
+      "Effect": "Allow",
+      "Principal": {
+        "Service": "events.amazonaws.com"
+      },
+      "Action": "sqs:SendMessage",
+      "Resource": "${aws_sqs_queue.ElectricEye_ConfigPruner_Queue.arn}",
+      "Condition": {
+        "ArnEquals": {
+          "aws:SourceArn": "${aws_cloudwatch_event_rule.ElectricEye_ConfigPruner_Event_Rule.arn}"
+        }
+      }
+    }
+  ]
+}
+EOF
 }
-resource "aws_lambda_permission" "ElectricEye_ConfigPruner_CWE_Lambda_Permission" {
-  statement_id  = "AllowExecutionFromCloudWatch"
-  action        = "lambda:InvokeFunction"
-  function_name = "${aws_lambda_function.ElectricEye_ConfigPruner_Lambda_Function.function_name}"
-  principal     = "events.amazonaws.com"
-  source_arn    = "${aws_cloudwatch_event_rule.ElectricEye_ConfigPruner_Event_Rule.arn}"
+resource "aws_lambda_event_source_mapping" "ElectricEye_ConfigPruner_SQS_Mapping" {
+  event_source_arn = "${aws_sqs_queue.ElectricEye_ConfigPruner_Queue.arn}"
+  function_name    = "${aws_lambda_function.ElectricEye_ConfigPruner_Lambda_Function.arn}"
+  batch_size       = 10
+  function_response_types = ["ReportBatchItemFailures"]
 }
\ No newline at end of file
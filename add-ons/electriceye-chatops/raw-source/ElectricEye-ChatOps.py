@@ -15,25 +15,116 @@
 import os
 import boto3
 import json
+import time
 import requests
-def lambda_handler(event, context):
-    # create ssm client
-    ssm = boto3.client('ssm')
-    # create env var for SSM Parameter containing Slack Webhook URL
-    webhookParam = os.environ['SLACK_WEBHOOK_PARAMETER']
+# built once per Lambda container and reused by every warm invocation
+ssm = boto3.client('ssm')
+slackSession = requests.Session()
+slackSession.headers.update({ 'Content-Type': 'application/json' })
+# create env var for SSM Parameter containing Slack Webhook URL
+webhookParam = os.environ['SLACK_WEBHOOK_PARAMETER']
+# the webhook URL is read from SSM again once it is older than this
+webhookCacheSeconds = int(os.environ.get('SLACK_WEBHOOK_CACHE_SECONDS', '300'))
+# with a digest window, findings are held in this container and posted as one message once the
+# oldest of them has waited this long, 0 posts one digest per invocation
+digestWindowSeconds = int(os.environ.get('SLACK_DIGEST_WINDOW_SECONDS', '0'))
+# Slack truncates long messages and allows about one webhook post per second
+maxMessageChars = 3500
+slackPostInterval = 1.0
+maxSlackRetries = 3
+# lines that could not be posted are kept for the next flush, the oldest are dropped past this many
+maxBufferedLines = 5000
+webhookCache = { 'Url': None, 'FetchedAt': 0.0 }
+digestBuffer = { 'Lines': [], 'OpenedAt': None }
+lastPostAt = { 'Time': 0.0 }
+
+def slack_webhook():
     # retrieve slack webhook from SSM
-    try:
+    if webhookCache['Url'] is None or time.time() - webhookCache['FetchedAt'] >= webhookCacheSeconds:
         response = ssm.get_parameter(Name=webhookParam)
-        slackWebhook = str(response['Parameter']['Value'])
-    except Exception as e:
-        print(e)
-    slackHeaders = { 'Content-Type': 'application/json' }
+        webhookCache['Url'] = str(response['Parameter']['Value'])
+        webhookCache['FetchedAt'] = time.time()
+    return webhookCache['Url']
+
+def finding_lines(event):
     for findings in event['detail']['findings']:
         severityLabel = str(findings['ProductFields']['aws/securityhub/SeverityLabel'])
         electricEyeCheck = str(findings['Title'])
         awsAccountId = str(findings['AwsAccountId'])
         for resources in findings['Resources']:
             resourceId = str(resources['Id'])
-            slackMessage = 'A new ' + severityLabel + ' severity finding for ' + resourceId + ' in acccount ' + awsAccountId + ' has been created in Security Hub due to failing the check: ' + electricEyeCheck
-            message = { 'text': slackMessage }
-            requests.post(slackWebhook, headers=slackHeaders, data=json.dumps(message))
\ No newline at end of file
+            yield '*' + severityLabel + '* ' + resourceId + ' in account ' + awsAccountId + ' failed the check: ' + electricEyeCheck
+
+def digest_messages(lines):
+    # one message for all lines, split only where a message would grow past what Slack displays,
+    # returns (message, number of finding lines in it)
+    header = str(len(lines)) + ' new ElectricEye finding(s) have been created in Security Hub'
+    messages = []
+    messageLines = [header]
+    messageChars = len(header)
+    for line in lines:
+        if messageChars + len(line) + 1 > maxMessageChars and len(messageLines) > 1:
+            messages.append(('\n'.join(messageLines), len(messageLines) - 1))
+            messageLines = [header + ' (continued)']
+            messageChars = len(messageLines[0])
+        messageLines.append(line)
+        messageChars += len(line) + 1
+    messages.append(('\n'.join(messageLines), len(messageLines) - 1))
+    return messages
+
+def post_to_slack(slackMessage, context):
+    # back off on 429 for as long as Slack's Retry-After asks, as long as the invocation has time left
+    for attempt in range(maxSlackRetries + 1):
+        waitSeconds = lastPostAt['Time'] + slackPostInterval - time.time()
+        if waitSeconds > 0:
+            time.sleep(waitSeconds)
+        response = slackSession.post(slack_webhook(), data=json.dumps({ 'text': slackMessage }))
+        lastPostAt['Time'] = time.time()
+        if 200 <= response.status_code < 300:
+            return True
+        if response.status_code != 429:
+            print('Slack returned ' + str(response.status_code) + ': ' + response.text)
+            return False
+        retryAfter = float(response.headers.get('Retry-After', 2 ** attempt))
+        if context is not None and retryAfter * 1000 + 5000 > context.get_remaining_time_in_millis():
+            break
+        time.sleep(retryAfter)
+    print('Slack is still rate limiting this webhook, ' + str(len(slackMessage)) + ' characters were not posted')
+    return False
+
+def flush_digest(context):
+    # lines only leave the buffer once the message carrying them was posted, the rest are
+    # posted with the next flush
+    lines = digestBuffer['Lines']
+    if not lines:
+        digestBuffer['OpenedAt'] = None
+        return
+    postedLines = 0
+    try:
+        for slackMessage, messageLineCount in digest_messages(lines):
+            if not post_to_slack(slackMessage, context):
+                break
+            postedLines += messageLineCount
+    finally:
+        remainingLines = lines[postedLines:]
+        if len(remainingLines) > maxBufferedLines:
+            print(str(len(remainingLines) - maxBufferedLines) + ' unposted findings were dropped from the digest')
+            remainingLines = remainingLines[-maxBufferedLines:]
+        digestBuffer['Lines'] = remainingLines
+        if not remainingLines:
+            digestBuffer['OpenedAt'] = None
+
+def lambda_handler(event, context):
+    try:
+        lines = list(finding_lines(event))
+    except Exception as e:
+        print(e)
+        return
+    if lines and digestBuffer['OpenedAt'] is None:
+        digestBuffer['OpenedAt'] = time.time()
+    digestBuffer['Lines'].extend(lines)
+    if digestBuffer['OpenedAt'] is not None and time.time() - digestBuffer['OpenedAt'] >= digestWindowSeconds:
+        try:
+            flush_digest(context)
+        except Exception as e:
+            print(e)
@@ -25,6 +25,7 @@ resource "aws_lambda_function" "ElectricEye_ChatOps_Lambda_Function" {
   environment {
     variables = {
       SLACK_WEBHOOK_PARAMETER = "${var.Slack_Webhook_Parameter}"
+      SLACK_DIGEST_WINDOW_SECONDS = "${var.Slack_Digest_Window_Seconds}"
     }
   }
 }
@@ -22,4 +22,8 @@ variable "Python3_Requests_Layer_ARN" {
 variable "Slack_Webhook_Parameter" {
   default     = ""
   description = "The name of the SSM Parameter that contains the Slack App Webhook URL for ElectricEye-ChatOps"
+}
+variable "Slack_Digest_Window_Seconds" {
+  default     = "0"
+  description = "Seconds to hold findings before they are posted as one Slack digest, 0 posts one digest per invocation"
 }
\ No newline at end of file
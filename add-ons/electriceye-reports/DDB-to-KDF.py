@@ -13,16 +13,79 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 import boto3
+import decimal
 import json
 import os
+import random
+import time
+from boto3.dynamodb.types import TypeDeserializer
+# built once per Lambda container and reused by every warm invocation
+kdf = boto3.client('firehose')
+firehoseStream = os.environ['FIREHOSE_TARGET']
+deserializer = TypeDeserializer()
+# PutRecordBatch accepts up to 500 records and 4 MiB per call
+maxBatchRecords = 500
+maxBatchBytes = 4 * 1024 * 1024
+maxRetries = 5
+
+def json_default(value):
+    # DynamoDB numbers deserialize to Decimal and string sets to set
+    if isinstance(value, decimal.Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, set):
+        return sorted(value)
+    return str(value)
+
+def firehose_record(newImage):
+    # plain, newline delimited JSON so Athena reads one finding per line without unwrapping type descriptors
+    finding = {key: deserializer.deserialize(value) for key, value in newImage.items()}
+    return {'Data': (json.dumps(finding, default=json_default) + '\n').encode('utf-8')}
+
+def record_batches(firehoseRecords):
+    batch = []
+    batchBytes = 0
+    for record in firehoseRecords:
+        recordBytes = len(record['Data'])
+        if batch and (len(batch) >= maxBatchRecords or batchBytes + recordBytes > maxBatchBytes):
+            yield batch
+            batch = []
+            batchBytes = 0
+        batch.append(record)
+        batchBytes += recordBytes
+    if batch:
+        yield batch
+
+def put_record_batch(batch):
+    # only the records Firehose reports as failed are sent again, with full jitter backoff
+    pending = batch
+    for attempt in range(maxRetries + 1):
+        response = kdf.put_record_batch(DeliveryStreamName=firehoseStream, Records=pending)
+        if response['FailedPutCount'] == 0:
+            return
+        failedRecords = []
+        errorCodes = set()
+        for record, result in zip(pending, response['RequestResponses']):
+            if 'ErrorCode' in result:
+                failedRecords.append(record)
+                errorCodes.add(result['ErrorCode'])
+        print(str(len(failedRecords)) + ' records failed on attempt ' + str(attempt + 1) + ': ' + ', '.join(sorted(errorCodes)))
+        pending = failedRecords
+        if attempt < maxRetries:
+            time.sleep(random.uniform(0, min(10, 0.2 * (2 ** attempt))))
+    raise RuntimeError(str(len(pending)) + ' records could not be delivered to ' + firehoseStream)
+
 def lambda_handler(event, context):
-    kdf = boto3.client('firehose')
-    firehoseStream = os.environ['FIREHOSE_TARGET']
+    firehoseRecords = []
     for records in event['Records']:
-        findingInfo = records['dynamodb']['NewImage']
-        findingDump = json.dumps(findingInfo)
+        # REMOVE events carry no new image
+        newImage = records['dynamodb'].get('NewImage')
+        if newImage is None:
+            continue
         try:
-            response = kdf.put_record(DeliveryStreamName=firehoseStream,Record={'Data': findingDump})
-            print(response)
+            firehoseRecords.append(firehose_record(newImage))
         except Exception as e:
-            print(e)
\ No newline at end of file
+            print(e)
+    # a batch that can't be delivered fails the invocation so the DynamoDB stream retries these records,
+    # batches already delivered are sent again (Firehose delivery is at least once)
+    for batch in record_batches(firehoseRecords):
+        put_record_batch(batch)
@@ -15,38 +15,57 @@
 import boto3
 import json
 import os
+# built once per Lambda container and reused by every warm invocation
+awsRegion = os.environ['AWS_REGION']
+electricDdbTable = os.environ['ELECTRIC_EYE_DDB_TABLE']
+dynamodb = boto3.resource('dynamodb', region_name=awsRegion)
+table = dynamodb.Table(electricDdbTable)
+# the table's key attributes, read once, so the batch writer can drop an earlier item with the same key
+# from its buffer (BatchWriteItem rejects a batch that writes the same key twice)
+tableKeys = None
+
+def table_keys():
+    global tableKeys
+    if tableKeys is None:
+        tableKeys = [key['AttributeName'] for key in table.key_schema]
+    return tableKeys
+
+def finding_items(findings):
+    # one item per resource in the finding
+    findingTypes = findings['Types']
+    findingCreationDate = str(findings['CreatedAt'])
+    findingId = str(findings['Id'])
+    findingOwner = str(findings['AwsAccountId'])
+    findingTitle = str(findings['Title'])
+    findingSeverity = str(findings['ProductFields']['aws/securityhub/SeverityLabel'])
+    items = []
+    for resources in findings['Resources']:
+        items.append(
+            {
+                'FINDING_ID': findingId,
+                'FINDING_CREATION': findingCreationDate,
+                'FINDING_TYPES': [findingTypes],
+                'AWS_ACCOUNT': findingOwner,
+                'FINDING_TITLE': findingTitle,
+                'FINDING_SEV': findingSeverity,
+                'RESOURCE_ID': str(resources['Id']),
+                'RESOURCE_TYPE': str(resources['Type']),
+                'RESOURCE_REGION': str(resources['Region'])
+            }
+        )
+    return items
+
 def lambda_handler(event, context):
-    awsRegion = os.environ['AWS_REGION']
-    electricDdbTable = os.environ['ELECTRIC_EYE_DDB_TABLE']
     securityHubEvent = (event['detail']['findings'])
-    for findings in securityHubEvent:
-        # parse finding ID
-        findingTypes = findings['Types']
-        findingCreationDate = str(findings['CreatedAt'])
-        findingId = str(findings['Id'])
-        findingOwner = str(findings['AwsAccountId'])
-        findingTitle = str(findings['Title'])
-        findingSeverity = str(findings['ProductFields']['aws/securityhub/SeverityLabel'])
-        for resources in findings['Resources']:
-            resourceId = str(resources['Id'])
-            resourceType = str(resources['Type'])
-            resourceRegion = str(resources['Region'])
+    # batch_writer sends 25 items per BatchWriteItem call and resends any unprocessed items, DynamoDB
+    # errors are left to fail the invocation so EventBridge retries the event
+    with table.batch_writer(overwrite_by_pkeys=table_keys()) as batch:
+        for findings in securityHubEvent:
             try:
-                dynamodb = boto3.resource('dynamodb', region_name=awsRegion)
-                table = dynamodb.Table(electricDdbTable)
-                response = table.put_item(
-                    Item={
-                        'FINDING_ID': findingId,
-                        'FINDING_CREATION': findingCreationDate,
-                        'FINDING_TYPES': [findingTypes],
-                        'AWS_ACCOUNT': findingOwner,
-                        'FINDING_TITLE': findingTitle,
-                        'FINDING_SEV': findingSeverity,
-                        'RESOURCE_ID': resourceId,
-                        'RESOURCE_TYPE': resourceType,
-                        'RESOURCE_REGION': resourceRegion
-                    }
-                )
-                print(response)
+                items = finding_items(findings)
             except Exception as e:
-                print(e)
\ No newline at end of file
+                # a malformed finding is skipped, the rest of the event is still written
+                print(e)
+                continue
+            for item in items:
+                batch.put_item(Item=item)
@@ -12,17 +12,16 @@
 
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
-import boto3
 import os
+from response_sessions import local_client, master_account_id, member_client
 
 def lambda_handler(event, context):
     # boto3 clients
-    sts = boto3.client('sts')
-    securityhub = boto3.client('securityhub')
+    securityhub = local_client('securityhub')
     # create env vars
     awsRegion = os.environ['AWS_REGION']
     lambdaFunctionName = os.environ['AWS_LAMBDA_FUNCTION_NAME']
-    masterAccountId = sts.get_caller_identity()['Account']
+    masterAccountId = master_account_id()
     # parse Security Hub CWE
     securityHubEvent = (event['detail']['findings'])
     for findings in securityHubEvent:
@@ -35,13 +34,8 @@ def lambda_handler(event, context):
             # create resource ID
             cognitoUserPoolId = resourceId.replace('arn:aws:cognito-idp:' + awsRegion + ':' + findingOwner + ':userpool/', '')
             if findingOwner != masterAccountId:
-                memberAcct = sts.assume_role(RoleArn='arn:aws:iam::' + findingOwner + ':role/XA-ElectricEye-Response',RoleSessionName='x_acct_sechub')
-                # retrieve creds from member account
-                xAcctAccessKey = memberAcct['Credentials']['AccessKeyId']
-                xAcctSecretKey = memberAcct['Credentials']['SecretAccessKey']
-                xAcctSeshToken = memberAcct['Credentials']['SessionToken']
-                # create service client using the assumed role credentials
-                cognitoidp = boto3.client('cognito-idp',aws_access_key_id=xAcctAccessKey,aws_secret_access_key=xAcctSecretKey,aws_session_token=xAcctSeshToken)
+                # create service client using the cached assumed role session
+                cognitoidp = member_client(findingOwner, 'cognito-idp')
                 try:
                     # modify Cognito User Pool temporary password policy to expire temp passwords within 24 hours
                     response = cognitoidp.update_user_pool(UserPoolId=cognitoUserPoolId,Policies={ 'PasswordPolicy': { 'TemporaryPasswordValidityDays': 1 } })
@@ -59,7 +53,7 @@ def lambda_handler(event, context):
                     print(e)
             else:
                 try:
-                    cognitoidp = boto3.client('cognito-idp')
+                    cognitoidp = local_client('cognito-idp')
                     # modify Cognito User Pool temporary password policy to expire temp passwords within 24 hours
                     response = cognitoidp.update_user_pool(UserPoolId=cognitoUserPoolId,Policies={ 'PasswordPolicy': { 'TemporaryPasswordValidityDays': 1 } })
                     print(response)
@@ -13,14 +13,14 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 from jira import JIRA
-import boto3
 import os
+from response_sessions import local_client
 
 # THIS REQUIRES THE LAMBDA LAYER FROM: https://github.com/jonrau1/ElectricEye/blob/master/add-ons/electriceye-response/lambda-layers/jira_lambda_layer.zip
 def lambda_handler(event, context):
     # boto3 clients
-    ssm = boto3.client('ssm')
-    securityhub = boto3.client('securityhub')
+    ssm = local_client('ssm')
+    securityhub = local_client('securityhub')
     # create env vars
     lambdaFunctionName = os.environ['AWS_LAMBDA_FUNCTION_NAME']
     # JIRA specific variables
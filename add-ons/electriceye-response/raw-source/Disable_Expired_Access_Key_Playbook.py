@@ -12,18 +12,17 @@
 
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
-import boto3
 import os
 import datetime
+from response_sessions import local_client, local_resource, master_account_id, member_client, member_resource
 
 def lambda_handler(event, context):
     # boto3 clients
-    sts = boto3.client('sts')
-    securityhub = boto3.client('securityhub')
+    securityhub = local_client('securityhub')
     # create env vars
     awsRegion = os.environ['AWS_REGION']
     lambdaFunctionName = os.environ['AWS_LAMBDA_FUNCTION_NAME']
-    masterAccountId = sts.get_caller_identity()['Account']
+    masterAccountId = master_account_id()
     # parse Security Hub CWE
     securityHubEvent = (event['detail']['findings'])
     for findings in securityHubEvent:
@@ -36,14 +35,9 @@ def lambda_handler(event, context):
             # create resource ID
             nonRotatedKeyUser = resourceId.replace('arn:aws:iam::' + findingOwner + ':user/', '') 
             if findingOwner != masterAccountId:
-                memberAcct = sts.assume_role(RoleArn='arn:aws:iam::' + findingOwner + ':role/XA-ElectricEye-Response',RoleSessionName='x_acct_sechub')
-                # retrieve creds from member account
-                xAcctAccessKey = memberAcct['Credentials']['AccessKeyId']
-                xAcctSecretKey = memberAcct['Credentials']['SecretAccessKey']
-                xAcctSeshToken = memberAcct['Credentials']['SessionToken']
-                # create service client using the assumed role credentials
-                iam_resource = boto3.resource('iam',aws_access_key_id=xAcctAccessKey,aws_secret_access_key=xAcctSecretKey,aws_session_token=xAcctSeshToken)
-                iam = boto3.client('iam',aws_access_key_id=xAcctAccessKey,aws_secret_access_key=xAcctSecretKey,aws_session_token=xAcctSeshToken)
+                # create service client using the cached assumed role session
+                iam_resource = member_resource(findingOwner, 'iam')
+                iam = member_client(findingOwner, 'iam')
                 try:
                     todaysDatetime = datetime.datetime.now(datetime.timezone.utc)
                     paginator = iam.get_paginator('list_access_keys')
@@ -78,8 +72,8 @@ def lambda_handler(event, context):
                     print(e)
             else:
                 try:
-                    iam_resource = boto3.resource('iam')
-                    iam = boto3.client('iam')
+                    iam_resource = local_resource('iam')
+                    iam = local_client('iam')
                     todaysDatetime = datetime.datetime.now(datetime.timezone.utc)
                     paginator = iam.get_paginator('list_access_keys')
                     for response in paginator.paginate(UserName=nonRotatedKeyUser):
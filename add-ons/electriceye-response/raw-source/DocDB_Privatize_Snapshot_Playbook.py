@@ -12,17 +12,16 @@
 
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
-import boto3
 import os
+from response_sessions import local_client, master_account_id, member_client
 
 def lambda_handler(event, context):
     # boto3 clients
-    sts = boto3.client('sts')
-    securityhub = boto3.client('securityhub')
+    securityhub = local_client('securityhub')
     # create env vars
     awsRegion = os.environ['AWS_REGION']
     lambdaFunctionName = os.environ['AWS_LAMBDA_FUNCTION_NAME']
-    masterAccountId = sts.get_caller_identity()['Account']
+    masterAccountId = master_account_id()
     # parse ASFF
     securityHubEvent = (event['detail']['findings'])
     for findings in securityHubEvent:
@@ -33,13 +32,8 @@ def lambda_handler(event, context):
         for resources in findings['Resources']:
             docDbSnapshotId = str(resources['Details']['Other']['SnapshotId'])
             if findingOwner != masterAccountId:
-                memberAcct = sts.assume_role(RoleArn='arn:aws:iam::' + findingOwner + ':role/XA-ElectricEye-Response',RoleSessionName='x_acct_sechub')
-                # retrieve creds from member account
-                xAcctAccessKey = memberAcct['Credentials']['AccessKeyId']
-                xAcctSecretKey = memberAcct['Credentials']['SecretAccessKey']
-                xAcctSeshToken = memberAcct['Credentials']['SessionToken']
-                # create service client using the assumed role credentials
-                documentdb = boto3.client('docdb',aws_access_key_id=xAcctAccessKey,aws_secret_access_key=xAcctSecretKey,aws_session_token=xAcctSeshToken)
+                # create service client using the cached assumed role session
+                documentdb = member_client(findingOwner, 'docdb')
                 try:
                     # remove public sharing from DocDB cluster snapshot
                     response = documentdb.modify_db_cluster_snapshot_attribute(
@@ -61,7 +55,7 @@ def lambda_handler(event, context):
                     print(e)
             else:
                 try:
-                    documentdb = boto3.client('docdb')
+                    documentdb = local_client('docdb')
                     # remove public sharing from DocDB cluster snapshot
                     response = documentdb.modify_db_cluster_snapshot_attribute(
                         DBClusterSnapshotIdentifier=docDbSnapshotId,
@@ -12,18 +12,17 @@
 
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
-import boto3
 import os
 import json
+from response_sessions import local_client, master_account_id, member_client
 
 def lambda_handler(event, context):
     # boto3 clients
-    sts = boto3.client('sts')
-    securityhub = boto3.client('securityhub')
+    securityhub = local_client('securityhub')
     # create env vars
     awsRegion = os.environ['AWS_REGION']
     lambdaFunctionName = os.environ['AWS_LAMBDA_FUNCTION_NAME']
-    masterAccountId = sts.get_caller_identity()['Account']
+    masterAccountId = master_account_id()
     # parse Security Hub CWE
     securityHubEvent = (event['detail']['findings'])
     for findings in securityHubEvent:
@@ -36,13 +35,8 @@ def lambda_handler(event, context):
             # create resource ID
             repoName = resourceId.replace('arn:aws:ecr:' + awsRegion + ':' + findingOwner + ':repository/', '')
             if findingOwner != masterAccountId:
-                memberAcct = sts.assume_role(RoleArn='arn:aws:iam::' + findingOwner + ':role/XA-ElectricEye-Response',RoleSessionName='x_acct_sechub')
-                # retrieve creds from member account
-                xAcctAccessKey = memberAcct['Credentials']['AccessKeyId']
-                xAcctSecretKey = memberAcct['Credentials']['SecretAccessKey']
-                xAcctSeshToken = memberAcct['Credentials']['SessionToken']
-                # create service client using the assumed role credentials
-                ecr = boto3.client('ecr',aws_access_key_id=xAcctAccessKey,aws_secret_access_key=xAcctSecretKey,aws_session_token=xAcctSeshToken)
+                # create service client using the cached assumed role session
+                ecr = member_client(findingOwner, 'ecr')
                 try:
                     # create a lifecycle policy that will expire untagged images if the total count moves above 2
                     ecrLifecyclePolicy = {
@@ -79,7 +73,7 @@ def lambda_handler(event, context):
                     print(e)
             else:
                 try:
-                    ecr = boto3.client('ecr')
+                    ecr = local_client('ecr')
                     # create a lifecycle policy that will expire untagged images if the total count moves above 2
                     ecrLifecyclePolicy = {
                     "rules": [
@@ -12,17 +12,16 @@
 
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
-import boto3
 import os
+from response_sessions import local_client, master_account_id, member_client
 
 def lambda_handler(event, context):
     # boto3 clients
-    sts = boto3.client('sts')
-    securityhub = boto3.client('securityhub')
+    securityhub = local_client('securityhub')
     # create env vars
     awsRegion = os.environ['AWS_REGION']
     lambdaFunctionName = os.environ['AWS_LAMBDA_FUNCTION_NAME']
-    masterAccountId = sts.get_caller_identity()['Account']
+    masterAccountId = master_account_id()
     # parse Security Hub CWE
     securityHubEvent = (event['detail']['findings'])
     for findings in securityHubEvent:
@@ -33,13 +32,8 @@ def lambda_handler(event, context):
         for resources in findings['Resources']:
             resourceId = str(resources['Id'])
             if findingOwner != masterAccountId:
-                memberAcct = sts.assume_role(RoleArn='arn:aws:iam::' + findingOwner + ':role/XA-ElectricEye-Response',RoleSessionName='x_acct_sechub')
-                # retrieve creds from member account
-                xAcctAccessKey = memberAcct['Credentials']['AccessKeyId']
-                xAcctSecretKey = memberAcct['Credentials']['SecretAccessKey']
-                xAcctSeshToken = memberAcct['Credentials']['SessionToken']
-                # create service client using the assumed role credentials
-                elbv2 = boto3.client('elbv2',aws_access_key_id=xAcctAccessKey,aws_secret_access_key=xAcctSecretKey,aws_session_token=xAcctSeshToken)
+                # create service client using the cached assumed role session
+                elbv2 = member_client(findingOwner, 'elbv2')
                 try:
                     # configure ALB to drop invalid HTTP headers
                     response = elbv2.modify_load_balancer_attributes(
@@ -61,7 +55,7 @@ def lambda_handler(event, context):
             else:
                 try:
                     # configure ALB to drop invalid HTTP headers
-                    elbv2 = boto3.client('elbv2')
+                    elbv2 = local_client('elbv2')
                     response = elbv2.modify_load_balancer_attributes(
                         LoadBalancerArn=resourceId,
                         Attributes=[ { 'Key': 'routing.http.drop_invalid_header_fields.enabled','Value': 'true' }  ]
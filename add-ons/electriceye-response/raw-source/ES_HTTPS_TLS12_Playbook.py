@@ -12,17 +12,16 @@
 
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
-import boto3
 import os
+from response_sessions import local_client, master_account_id, member_client
 
 def lambda_handler(event, context):
     # boto3 clients
-    sts = boto3.client('sts')
-    securityhub = boto3.client('securityhub')
+    securityhub = local_client('securityhub')
     # create env vars
     awsRegion = os.environ['AWS_REGION']
     lambdaFunctionName = os.environ['AWS_LAMBDA_FUNCTION_NAME']
-    masterAccountId = sts.get_caller_identity()['Account']
+    masterAccountId = master_account_id()
     # parse Security Hub CWE
     securityHubEvent = (event['detail']['findings'])
     for findings in securityHubEvent:
@@ -35,13 +34,8 @@ def lambda_handler(event, context):
             # create resource ID
             esDomainName = resourceId.replace('arn:aws:es:' + awsRegion + ':' + findingOwner + ':domain/', '')
             if findingOwner != masterAccountId:
-                memberAcct = sts.assume_role(RoleArn='arn:aws:iam::' + findingOwner + ':role/XA-ElectricEye-Response',RoleSessionName='x_acct_sechub')
-                # retrieve creds from member account
-                xAcctAccessKey = memberAcct['Credentials']['AccessKeyId']
-                xAcctSecretKey = memberAcct['Credentials']['SecretAccessKey']
-                xAcctSeshToken = memberAcct['Credentials']['SessionToken']
-                # create service client using the assumed role credentials
-                es = boto3.client('es',aws_access_key_id=xAcctAccessKey,aws_secret_access_key=xAcctSecretKey,aws_session_token=xAcctSeshToken)
+                # create service client using the cached assumed role session
+                es = member_client(findingOwner, 'es')
                 try:
                     # apply HTTPS-only and a TLS 1.2 policy
                     response = es.update_elasticsearch_domain_config(DomainName=esDomainName,DomainEndpointOptions={'EnforceHTTPS':True,'TLSSecurityPolicy':'Policy-Min-TLS-1-2-2019-07'})
@@ -58,7 +52,7 @@ def lambda_handler(event, context):
                     print(e)
             else:
                 try:
-                    es = boto3.client('es')
+                    es = local_client('es')
                     # apply HTTPS-only and a TLS 1.2 policy
                     response = es.update_elasticsearch_domain_config(DomainName=esDomainName,DomainEndpointOptions={'EnforceHTTPS':True,'TLSSecurityPolicy':'Policy-Min-TLS-1-2-2019-07'})
                     try:
@@ -12,15 +12,14 @@
 
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
-import boto3
 import os
+from response_sessions import local_client, master_account_id, member_client
 def lambda_handler(event, context):
     # boto3 clients
-    sts = boto3.client('sts')
-    securityhub = boto3.client('securityhub')
+    securityhub = local_client('securityhub')
     # create env vars
     lambdaFunctionName = os.environ['AWS_LAMBDA_FUNCTION_NAME']
-    masterAccountId = sts.get_caller_identity()['Account']
+    masterAccountId = master_account_id()
     # parse Security Hub CWE
     securityHubEvent = (event['detail']['findings'])
     for findings in securityHubEvent:
@@ -29,13 +28,8 @@ def lambda_handler(event, context):
         # parse Account from SecHub Finding
         findingOwner = str(findings['AwsAccountId'])
         if findingOwner != masterAccountId:
-            memberAcct = sts.assume_role(RoleArn='arn:aws:iam::' + findingOwner + ':role/XA-ElectricEye-Response',RoleSessionName='x_acct_sechub')
-            # retrieve creds from member account
-            xAcctAccessKey = memberAcct['Credentials']['AccessKeyId']
-            xAcctSecretKey = memberAcct['Credentials']['SecretAccessKey']
-            xAcctSeshToken = memberAcct['Credentials']['SessionToken']
-            # create service client using the assumed role credentials
-            iam = boto3.client('iam',aws_access_key_id=xAcctAccessKey,aws_secret_access_key=xAcctSecretKey,aws_session_token=xAcctSeshToken)
+            # create service client using the cached assumed role session
+            iam = member_client(findingOwner, 'iam')
             try:
                 response = iam.update_account_password_policy(
                     MinimumPasswordLength=15,
@@ -62,7 +56,7 @@ def lambda_handler(event, context):
                 print(e)
         else:
             try:
-                iam = boto3.client('iam')
+                iam = local_client('iam')
                 response = iam.update_account_password_policy(
                     MinimumPasswordLength=14,
                     RequireSymbols=True,
@@ -12,16 +12,15 @@
 
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
-import boto3
 import os
+from response_sessions import local_client, master_account_id, member_client
 def lambda_handler(event, context):
     # boto3 clients
-    sts = boto3.client('sts')
-    securityhub = boto3.client('securityhub')
+    securityhub = local_client('securityhub')
     # create env vars
     awsRegion = os.environ['AWS_REGION']
     lambdaFunctionName = os.environ['AWS_LAMBDA_FUNCTION_NAME']
-    masterAccountId = sts.get_caller_identity()['Account']
+    masterAccountId = master_account_id()
     # parse Security Hub CWE
     securityHubEvent = (event['detail']['findings'])
     for findings in securityHubEvent:
@@ -34,13 +33,8 @@ def lambda_handler(event, context):
             # create resource ID
             kdsName = resourceId.replace('arn:aws:kinesis:' + awsRegion + ':' + findingOwner + ':stream/', '')
             if findingOwner != masterAccountId:
-                memberAcct = sts.assume_role(RoleArn='arn:aws:iam::' + findingOwner + ':role/XA-ElectricEye-Response',RoleSessionName='x_acct_sechub')
-                # retrieve creds from member account
-                xAcctAccessKey = memberAcct['Credentials']['AccessKeyId']
-                xAcctSecretKey = memberAcct['Credentials']['SecretAccessKey']
-                xAcctSeshToken = memberAcct['Credentials']['SessionToken']
-                # create service client using the assumed role credentials
-                kinesis = boto3.client('kinesis',aws_access_key_id=xAcctAccessKey,aws_secret_access_key=xAcctSecretKey,aws_session_token=xAcctSeshToken)
+                # create service client using the cached assumed role session
+                kinesis = member_client(findingOwner, 'kinesis')
                 try:
                     # put default KDS encryption
                     response = kinesis.start_stream_encryption(StreamName=kdsName,EncryptionType='KMS',KeyId='alias/aws/kinesis')
@@ -58,7 +52,7 @@ def lambda_handler(event, context):
                     print(e)
             else:
                 try:
-                    kinesis = boto3.client('kinesis')
+                    kinesis = local_client('kinesis')
                     # put default KDS encryption
                     response = kinesis.start_stream_encryption(StreamName=kdsName,EncryptionType='KMS',KeyId='alias/aws/kinesis')
                     print(response)
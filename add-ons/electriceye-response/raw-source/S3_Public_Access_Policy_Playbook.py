@@ -12,16 +12,15 @@
 
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
-import boto3
 import os
+from response_sessions import local_client, master_account_id, member_client
 def lambda_handler(event, context):
     # boto3 clients
-    sts = boto3.client('sts')
-    securityhub = boto3.client('securityhub')
+    securityhub = local_client('securityhub')
     # create env vars
     awsRegion = os.environ['AWS_REGION']
     lambdaFunctionName = os.environ['AWS_LAMBDA_FUNCTION_NAME']
-    masterAccountId = sts.get_caller_identity()['Account']
+    masterAccountId = master_account_id()
     # parse Security Hub CWE
     securityHubEvent = (event['detail']['findings'])
     for findings in securityHubEvent:
@@ -30,13 +29,8 @@ def lambda_handler(event, context):
         # parse Account from SecHub Finding
         findingOwner = str(findings['AwsAccountId'])
         if findingOwner != masterAcctId:
-            memberAcct = sts.assume_role(RoleArn='arn:aws:iam::' + findingOwner + ':role/XA-ElectricEye-Response',RoleSessionName='x_acct_sechub')
-            # retrieve creds from member account
-            xAcctAccessKey = memberAcct['Credentials']['AccessKeyId']
-            xAcctSecretKey = memberAcct['Credentials']['SecretAccessKey']
-            xAcctSeshToken = memberAcct['Credentials']['SessionToken']
-            # create service client using the assumed role credentials
-            s3control = boto3.client('s3control',aws_access_key_id=xAcctAccessKey,aws_secret_access_key=xAcctSecretKey,aws_session_token=xAcctSeshToken)
+            # create service client using the cached assumed role session
+            s3control = member_client(findingOwner, 's3control')
             try:
                 response = s3control.put_public_access_block(
                     PublicAccessBlockConfiguration={
@@ -61,7 +55,7 @@ def lambda_handler(event, context):
                 print(e)
         else:
             try:
-                s3control = boto3.client('s3control')
+                s3control = local_client('s3control')
                 response = s3control.put_public_access_block(
                     PublicAccessBlockConfiguration={
                         'BlockPublicAcls': True,
@@ -12,17 +12,16 @@
 
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
-import boto3
 import os
+from response_sessions import local_client, master_account_id, member_client
 
 def lambda_handler(event, context):
     # boto3 clients
-    sts = boto3.client('sts')
-    securityhub = boto3.client('securityhub')
+    securityhub = local_client('securityhub')
     # create env vars
     awsRegion = os.environ['AWS_REGION']
     lambdaFunctionName = os.environ['AWS_LAMBDA_FUNCTION_NAME']
-    masterAccountId = sts.get_caller_identity()['Account']
+    masterAccountId = master_account_id()
     # parse ASFF
     securityHubEvent = (event['detail']['findings'])
     for findings in securityHubEvent:
@@ -31,13 +30,8 @@ def lambda_handler(event, context):
         # parse Account from SecHub Finding
         findingOwner = str(findings['AwsAccountId'])
         if findingOwner != masterAccountId:
-            memberAcct = sts.assume_role(RoleArn='arn:aws:iam::' + findingOwner + ':role/XA-ElectricEye-Response',RoleSessionName='x_acct_sechub')
-            # retrieve creds from member account
-            xAcctAccessKey = memberAcct['Credentials']['AccessKeyId']
-            xAcctSecretKey = memberAcct['Credentials']['SecretAccessKey']
-            xAcctSeshToken = memberAcct['Credentials']['SessionToken']
-            # create service client using the assumed role credentials
-            shield = boto3.client('shield',aws_access_key_id=xAcctAccessKey,aws_secret_access_key=xAcctSecretKey,aws_session_token=xAcctSeshToken)
+            # create service client using the cached assumed role session
+            shield = member_client(findingOwner, 'shield')
             try:
                 # auto-renew shield adv subscription
                 response = shield.update_subscription(AutoRenew='ENABLED')
@@ -55,7 +49,7 @@ def lambda_handler(event, context):
                 print(e)
         else:
             try:
-                shield = boto3.client('shield')
+                shield = local_client('shield')
                 # auto-renew shield adv subscription
                 response = shield.update_subscription(AutoRenew='ENABLED')
                 print(response)
@@ -12,18 +12,17 @@
 
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
-import boto3
 import os
+from response_sessions import local_client, master_account_id, member_client
 def lambda_handler(event, context):
     # boto3 clients
-    sts = boto3.client('sts')
-    securityhub = boto3.client('securityhub')
+    securityhub = local_client('securityhub')
     # create env vars
     awsRegion = os.environ['AWS_REGION']
     lambdaFunctionName = os.environ['AWS_LAMBDA_FUNCTION_NAME']
     # this is set via Lambda env var
     wafv1IpSet = os.environ['WAFV1_IPSET']
-    masterAccountId = sts.get_caller_identity()['Account']
+    masterAccountId = master_account_id()
     # parse Security Hub CWE
     securityHubEvent = (event['detail']['findings'])
     for findings in securityHubEvent:
@@ -35,14 +34,9 @@ def lambda_handler(event, context):
         gdDetector = str(findings['ProductFields']['detectorId'])
         gdFinding = findingId.replace('arn:aws:guardduty:' + awsRegion + ':' + findingOwner + ':detector/' + gdDetector + '/finding/', '' )
         if findingOwner != masterAccountId:
-            memberAcct = sts.assume_role(RoleArn='arn:aws:iam::' + findingOwner + ':role/XA-ElectricEye-Response',RoleSessionName='x_acct_sechub')
-            # retrieve creds from member account
-            xAcctAccessKey = memberAcct['Credentials']['AccessKeyId']
-            xAcctSecretKey = memberAcct['Credentials']['SecretAccessKey']
-            xAcctSeshToken = memberAcct['Credentials']['SessionToken']
-            # create service client using the assumed role credentials
-            guardduty = boto3.client('guardduty',aws_access_key_id=xAcctAccessKey,aws_secret_access_key=xAcctSecretKey,aws_session_token=xAcctSeshToken)
-            waf = boto3.client('waf',aws_access_key_id=xAcctAccessKey,aws_secret_access_key=xAcctSecretKey,aws_session_token=xAcctSeshToken)
+            # create service client using the cached assumed role session
+            guardduty = member_client(findingOwner, 'guardduty')
+            waf = member_client(findingOwner, 'waf')
             try:
                 # loop through GuardDuty Finding
                 response = guardduty.get_findings(DetectorId=gdDetector,FindingIds=[gdFinding])
@@ -73,8 +67,8 @@ def lambda_handler(event, context):
                 print(e)
         else:
             try:
-                guardduty = boto3.client('guardduty')
-                waf = boto3.client('waf')
+                guardduty = local_client('guardduty')
+                waf = local_client('waf')
                 # loop through GuardDuty Finding
                 response = guardduty.get_findings(DetectorId=gdDetector,FindingIds=[gdFinding])
                 for gdfindings in response['Findings']:
@@ -0,0 +1,72 @@
+# This file is part of ElectricEye.
+
+# ElectricEye is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# ElectricEye is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License along with ElectricEye.
+# If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
+import datetime
+import boto3
+# packaged with every playbook, module level state lives as long as the Lambda container so
+# the account ID, assumed role sessions and clients are shared across findings and warm invocations
+memberRoleName = 'XA-ElectricEye-Response'
+memberSessionName = 'x_acct_sechub'
+# assumed role sessions are replaced this long before their credentials expire
+refreshMarginSeconds = 300
+sts = boto3.client('sts')
+masterAccount = {}
+# {accountId: (boto3 Session, credential expiration)}
+memberSessions = {}
+# {(accountId, 'client' or 'resource', serviceName): client or resource}, accountId None is this account
+serviceObjects = {}
+
+def master_account_id():
+    if 'Account' not in masterAccount:
+        masterAccount['Account'] = sts.get_caller_identity()['Account']
+    return masterAccount['Account']
+
+def member_session(accountId):
+    # assumes XA-ElectricEye-Response in the member account at most once per credential lifetime
+    cachedSession = memberSessions.get(accountId)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    if cachedSession is not None and (cachedSession[1] - now).total_seconds() > refreshMarginSeconds:
+        return cachedSession[0]
+    memberAcct = sts.assume_role(RoleArn='arn:aws:iam::' + accountId + ':role/' + memberRoleName,RoleSessionName=memberSessionName)
+    # retrieve creds from member account
+    credentials = memberAcct['Credentials']
+    session = boto3.session.Session(
+        aws_access_key_id=credentials['AccessKeyId'],
+        aws_secret_access_key=credentials['SecretAccessKey'],
+        aws_session_token=credentials['SessionToken']
+    )
+    memberSessions[accountId] = (session, credentials['Expiration'])
+    # clients built from the old credentials are dropped with them
+    for key in [key for key in serviceObjects if key[0] == accountId]:
+        del serviceObjects[key]
+    return session
+
+def service_object(accountId, kind, serviceName):
+    session = boto3 if accountId is None else member_session(accountId)
+    key = (accountId, kind, serviceName)
+    if key not in serviceObjects:
+        serviceObjects[key] = getattr(session, kind)(serviceName)
+    return serviceObjects[key]
+
+def member_client(accountId, serviceName):
+    return service_object(accountId, 'client', serviceName)
+
+def member_resource(accountId, serviceName):
+    return service_object(accountId, 'resource', serviceName)
+
+def local_client(serviceName):
+    return service_object(None, 'client', serviceName)
+
+def local_resource(serviceName):
+    return service_object(None, 'resource', serviceName)
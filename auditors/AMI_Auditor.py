@@ -13,21 +13,22 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import datetime
 import os
+from finding_sink import default_sink
+from resource_inventory import default_inventory
+from scan_scope import lazy_account_id
 # import boto3 clients
-securityhub = boto3.client('securityhub')
-ec2 = boto3.client('ec2')
-sts = boto3.client('sts')
+findingSink = default_sink()
+inventory = default_inventory()
 # create account id & region variables
-awsAccount = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 awsRegion = os.environ['AWS_REGION']
 # find AMIs created by the account
-response = ec2.describe_images(Filters=[ { 'Name': 'owner-id','Values': [ awsAccount ] } ],DryRun=False)
-myAmis = response['Images']
+myAmis = inventory.lazy('ec2', 'describe_images', 'Images', Owners=[ 'self' ])
 
 def public_ami_check():
+    awsAccount = accountId.get()
     for ami in myAmis:
         imageId = str(ami['ImageId'])
         amiArn = 'arn:aws:ec2:' + awsRegion + '::image/' + imageId
@@ -39,8 +40,116 @@ def public_ami_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': amiArn + '/public-ami',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
+                        'GeneratorId': amiArn,
+                        'AwsAccountId': awsAccount,
+                        'Types': [
+                            'Software and Configuration Checks/AWS Security Best Practices',
+                            'Effects/Data Exposure'
+                        ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 90 },
+                        'Confidence': 99,
+                        'Title': '[AMI.1] Self-managed Amazon Machine Images (AMIs) should not be public',
+                        'Description': 'Amazon Machine Image (AMI) ' + imageName + ' is exposed to the public. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your AMI is not intended to be public refer to the Sharing an AMI with Specific AWS Accounts section of the EC2 user guide',
+                                'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/sharingamis-explicit.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': amiArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'AMI Id': imageId, 'AMI CreatedAt': imageCreatedDate }
+                                }
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
+                )
+            except Exception as e:
+                print(e)
+        else:
+            try:
+                # ISO Time
+                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                # create Sec Hub finding
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': amiArn + '/public-ami',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
+                        'GeneratorId': amiArn,
+                        'AwsAccountId': awsAccount,
+                        'Types': [
+                            'Software and Configuration Checks/AWS Security Best Practices',
+                            'Effects/Data Exposure'
+                        ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[AMI.1] Self-managed Amazon Machine Images (AMIs) should not be public',
+                        'Description': 'Amazon Machine Image (AMI) ' + imageName + ' is private.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your AMI is not intended to be public refer to the Sharing an AMI with Specific AWS Accounts section of the EC2 user guide',
+                                'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/sharingamis-explicit.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': amiArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'AMI Id': imageId, 'AMI CreatedAt': imageCreatedDate }
+                                }
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
+                )
+            except Exception as e:
+                print(e)
+
+def encrypted_ami_check():
+    awsAccount = accountId.get()
+    for ami in myAmis:
+        imageId = str(ami['ImageId'])
+        amiArn = 'arn:aws:ec2:' + awsRegion + '::image/' + imageId
+        imageName = str(ami['Name'])
+        imageCreatedDate = str(ami['CreationDate'])
+        BlockDevices = ami['BlockDeviceMappings']
+        for ebsmapping in BlockDevices:
+            encryptionCheck = str(ebsmapping['Ebs']['Encrypted'])
+            if encryptionCheck == 'False':
+                try:
+                    # ISO Time
+                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                    # create Sec Hub finding
+                    findingSink.put(
                         {
                             'SchemaVersion': '2018-10-08',
                             'Id': amiArn + '/public-ami',
@@ -54,14 +163,14 @@ def public_ami_check():
                             'FirstObservedAt': iso8601Time,
                             'CreatedAt': iso8601Time,
                             'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 90 },
+                            'Severity': { 'Normalized': 80 },
                             'Confidence': 99,
-                            'Title': '[AMI.1] Self-managed Amazon Machine Images (AMIs) should not be public',
-                            'Description': 'Amazon Machine Image (AMI) ' + imageName + ' is exposed to the public. Refer to the remediation instructions if this configuration is not intended',
+                            'Title': '[AMI.2] Self-managed Amazon Machine Images (AMIs) should be encrypted',
+                            'Description': 'Amazon Machine Image (AMI) ' + imageName + ' is not encrypted. Refer to the remediation instructions if this configuration is not intended',
                             'Remediation': {
                                 'Recommendation': {
-                                    'Text': 'If your AMI is not intended to be public refer to the Sharing an AMI with Specific AWS Accounts section of the EC2 user guide',
-                                    'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/sharingamis-explicit.html'
+                                    'Text': 'If your AMI should be encrypted refer to the Image-Copying Scenarios section of the EC2 user guide',
+                                    'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/AMIEncryption.html#AMI-encryption-copy'
                                 }
                             },
                             'ProductFields': {
@@ -81,18 +190,15 @@ def public_ami_check():
                             'Compliance': { 'Status': 'FAILED' },
                             'RecordState': 'ACTIVE'
                         }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        else:
-            try:
-                # ISO Time
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
+                    )
+                except Exception as e:
+                    print(e)
+            else:
+                try:
+                    # ISO Time
+                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                    # create Sec Hub finding
+                    findingSink.put(
                         {
                             'SchemaVersion': '2018-10-08',
                             'Id': amiArn + '/public-ami',
@@ -108,12 +214,12 @@ def public_ami_check():
                             'UpdatedAt': iso8601Time,
                             'Severity': { 'Normalized': 0 },
                             'Confidence': 99,
-                            'Title': '[AMI.1] Self-managed Amazon Machine Images (AMIs) should not be public',
-                            'Description': 'Amazon Machine Image (AMI) ' + imageName + ' is private.',
+                            'Title': '[AMI.2] Self-managed Amazon Machine Images (AMIs) should be encrypted',
+                            'Description': 'Amazon Machine Image (AMI) ' + imageName + ' is encrypted.',
                             'Remediation': {
                                 'Recommendation': {
-                                    'Text': 'If your AMI is not intended to be public refer to the Sharing an AMI with Specific AWS Accounts section of the EC2 user guide',
-                                    'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/sharingamis-explicit.html'
+                                    'Text': 'If your AMI should be encrypted refer to the Image-Copying Scenarios section of the EC2 user guide',
+                                    'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/AMIEncryption.html#AMI-encryption-copy'
                                 }
                             },
                             'ProductFields': {
@@ -133,123 +239,7 @@ def public_ami_check():
                             'Compliance': { 'Status': 'PASSED' },
                             'RecordState': 'ARCHIVED'
                         }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-
-def encrypted_ami_check():
-    for ami in myAmis:
-        imageId = str(ami['ImageId'])
-        amiArn = 'arn:aws:ec2:' + awsRegion + '::image/' + imageId
-        imageName = str(ami['Name'])
-        imageCreatedDate = str(ami['CreationDate'])
-        BlockDevices = ami['BlockDeviceMappings']
-        for ebsmapping in BlockDevices:
-            encryptionCheck = str(ebsmapping['Ebs']['Encrypted'])
-            if encryptionCheck == 'False':
-                try:
-                    # ISO Time
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': amiArn + '/public-ami',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
-                                'GeneratorId': amiArn,
-                                'AwsAccountId': awsAccount,
-                                'Types': [
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 80 },
-                                'Confidence': 99,
-                                'Title': '[AMI.2] Self-managed Amazon Machine Images (AMIs) should be encrypted',
-                                'Description': 'Amazon Machine Image (AMI) ' + imageName + ' is not encrypted. Refer to the remediation instructions if this configuration is not intended',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your AMI should be encrypted refer to the Image-Copying Scenarios section of the EC2 user guide',
-                                        'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/AMIEncryption.html#AMI-encryption-copy'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'Other',
-                                        'Id': amiArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 'AMI Id': imageId, 'AMI CreatedAt': imageCreatedDate }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-            else:
-                try:
-                    # ISO Time
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': amiArn + '/public-ami',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
-                                'GeneratorId': amiArn,
-                                'AwsAccountId': awsAccount,
-                                'Types': [
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[AMI.2] Self-managed Amazon Machine Images (AMIs) should be encrypted',
-                                'Description': 'Amazon Machine Image (AMI) ' + imageName + ' is encrypted.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your AMI should be encrypted refer to the Image-Copying Scenarios section of the EC2 user guide',
-                                        'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/AMIEncryption.html#AMI-encryption-copy'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'Other',
-                                        'Id': amiArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 'AMI Id': imageId, 'AMI CreatedAt': imageCreatedDate }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
 
@@ -257,4 +247,5 @@ def ami_auditor():
     public_ami_check()
     encrypted_ami_check()
 
-ami_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    ami_auditor()
\ No newline at end of file
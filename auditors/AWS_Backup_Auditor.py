@@ -13,134 +13,146 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import os
 import datetime
+from finding_sink import default_sink
+from resource_inventory import default_inventory, lazy_value
+from scan_scope import lazy_account_id, lazy_client
 # import boto3 clients
-sts = boto3.client('sts')
-securityhub = boto3.client('securityhub')
-sts = boto3.client('sts')
-ec2 = boto3.client('ec2')
-dynamodb = boto3.client('dynamodb')
-rds = boto3.client('rds')
-efs = boto3.client('efs')
-backup = boto3.client('backup')
+findingSink = default_sink()
+inventory = default_inventory()
+backup = lazy_client('backup')
 # create env vars
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 awsRegion = os.environ['AWS_REGION']
+# every resource AWS Backup has a recovery point for, paginated once so each check is a set lookup
+def protected_resource_arns():
+    try:
+        return set(
+            str(resource['ResourceArn']) for resource in inventory.iterate('backup', 'list_protected_resources', 'Results')
+        )
+    except Exception as e:
+        # e.g. a task role without backup:ListProtectedResources, resources are then looked up one at a time
+        print('ListProtectedResources failed, falling back to DescribeProtectedResource: ' + str(e))
+        return None
+
+myProtectedResourceArns = lazy_value(protected_resource_arns)
+
+def is_protected(resourceArn):
+    protectedArns = myProtectedResourceArns.get()
+    if protectedArns is not None:
+        return resourceArn in protectedArns
+    try:
+        backup.describe_protected_resource(ResourceArn=resourceArn)
+        return True
+    except Exception:
+        return False
 
 def volume_backup_check():
+    awsAccountId = accountId.get()
     # loop through available or in-use ebs volumes
-    response = ec2.describe_volumes(Filters=[{'Name': 'status','Values': ['available', 'in-use']}])
-    myEbsVolumes = response['Volumes']
+    myEbsVolumes = inventory.get('ec2', 'describe_volumes', 'Volumes', Filters=[{'Name': 'status','Values': ['available', 'in-use']}])
     for volumes in myEbsVolumes:
         volumeId = str(volumes['VolumeId'])
         volumeArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':volume/' + volumeId
-        try:
+        if is_protected(volumeArn):
             # check if ebs volumes are backed up
-            response = backup.describe_protected_resource(ResourceArn=volumeArn)
             try:
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': volumeArn + '/ebs-backups',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': volumeArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[Backup.1] EBS volumes should be protected by AWS Backup',
-                            'Description': 'EBS volume ' + volumeId + ' is protected by AWS Backup',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsEc2Volume',
-                                    'Id': volumeArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'VolumeId': volumeId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': volumeArn + '/ebs-backups',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': volumeArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[Backup.1] EBS volumes should be protected by AWS Backup',
+                        'Description': 'EBS volume ' + volumeId + ' is protected by AWS Backup',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEc2Volume',
+                                'Id': volumeArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'VolumeId': volumeId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
-        except:
+        else:
             try:
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': volumeArn + '/ebs-backups',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': volumeArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 40 },
-                            'Confidence': 99,
-                            'Title': '[Backup.1] EBS volumes should be protected by AWS Backup',
-                            'Description': 'EBS volume ' + volumeId + ' is not protected by AWS Backup. Refer to the remediation instructions for information on ensuring disaster recovery and business continuity requirements are fulfilled for EBS volumes',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsEc2Volume',
-                                    'Id': volumeArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'VolumeId': volumeId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': volumeArn + '/ebs-backups',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': volumeArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 40 },
+                        'Confidence': 99,
+                        'Title': '[Backup.1] EBS volumes should be protected by AWS Backup',
+                        'Description': 'EBS volume ' + volumeId + ' is not protected by AWS Backup. Refer to the remediation instructions for information on ensuring disaster recovery and business continuity requirements are fulfilled for EBS volumes',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEc2Volume',
+                                'Id': volumeArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'VolumeId': volumeId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def ec2_backup_check():
+    awsAccountId = accountId.get()
     # loop through ec2 instances
-    response = ec2.describe_instances(DryRun=False)
-    myReservations = response['Reservations']
+    myReservations = inventory.get('ec2', 'describe_instances', 'Reservations')
     for reservations in myReservations:
         myInstances = reservations['Instances']
         for instances in myInstances:
@@ -150,139 +162,18 @@ def ec2_backup_check():
             subnetId = str(instances['SubnetId'])
             vpcId = str(instances['VpcId'])
             instanceArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':instance/' + instanceId
-            try:
+            if is_protected(instanceArn):
                 # check if ec2 instances are backed up
-                response = backup.describe_protected_resource(ResourceArn=instanceArn)
                 try:
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                     # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': instanceArn + '/ec2-backups',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': instanceArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[Backup.2] EC2 instances should be protected by AWS Backup',
-                                'Description': 'EC2 instance ' + instanceId + ' is protected by AWS Backup.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsEc2Instance',
-                                        'Id': instanceArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'AwsEc2Instance': {
-                                                'Type': instanceType,
-                                                'ImageId': imageId,
-                                                'VpcId': vpcId,
-                                                'SubnetId': subnetId
-                                            }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-            except:
-                try:
-                    # ISO Time
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': instanceArn + '/ec2-backups',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': instanceArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 40 },
-                                'Confidence': 99,
-                                'Title': '[Backup.2] EC2 instances should be protected by AWS Backup',
-                                'Description': 'EC2 instance ' + instanceId + ' is not protected by AWS Backup. Refer to the remediation instructions for information on ensuring disaster recovery and business continuity requirements are fulfilled for EC2 instances',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsEc2Instance',
-                                        'Id': instanceArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'AwsEc2Instance': {
-                                                'Type': instanceType,
-                                                'ImageId': imageId,
-                                                'VpcId': vpcId,
-                                                'SubnetId': subnetId
-                                            }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-
-def ddb_backup_check():
-    # loop through dynamodb tables
-    response = dynamodb.list_tables()
-    myDdbTables = response['TableNames']
-    for tables in myDdbTables:
-        response = dynamodb.describe_table(TableName=tables)
-        tableArn = str(response['Table']['TableArn'])
-        tableName = str(response['Table']['TableName'])
-        try:
-            # check if ddb tables are backed up
-            response = backup.describe_protected_resource(ResourceArn=tableArn)
-            try:
-                # ISO Time
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
+                    findingSink.put(
                         {
                             'SchemaVersion': '2018-10-08',
-                            'Id': tableArn + '/dynamodb-backups',
+                            'Id': instanceArn + '/ec2-backups',
                             'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': tableArn,
+                            'GeneratorId': instanceArn,
                             'AwsAccountId': awsAccountId,
                             'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
                             'FirstObservedAt': iso8601Time,
@@ -290,8 +181,8 @@ def ddb_backup_check():
                             'UpdatedAt': iso8601Time,
                             'Severity': { 'Normalized': 0 },
                             'Confidence': 99,
-                            'Title': '[Backup.3] DynamoDB tables should be protected by AWS Backup',
-                            'Description': 'DynamoDB table ' + tableName + ' is protected by AWS Backup.',
+                            'Title': '[Backup.2] EC2 instances should be protected by AWS Backup',
+                            'Description': 'EC2 instance ' + instanceId + ' is protected by AWS Backup.',
                             'Remediation': {
                                 'Recommendation': {
                                     'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
@@ -303,35 +194,37 @@ def ddb_backup_check():
                             },
                             'Resources': [
                                 {
-                                    'Type': 'AwsDynamoDbTable',
-                                    'Id': tableArn,
+                                    'Type': 'AwsEc2Instance',
+                                    'Id': instanceArn,
                                     'Partition': 'aws',
                                     'Region': awsRegion,
                                     'Details': {
-                                        'Other': { 'TableName': tableName }
+                                        'AwsEc2Instance': {
+                                            'Type': instanceType,
+                                            'ImageId': imageId,
+                                            'VpcId': vpcId,
+                                            'SubnetId': subnetId
+                                        }
                                     }
                                 }
                             ],
                             'Compliance': { 'Status': 'PASSED' },
                             'RecordState': 'ARCHIVED'
                         }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        except:
-            try:
-                # ISO Time
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
+                    )
+                except Exception as e:
+                    print(e)
+            else:
+                try:
+                    # ISO Time
+                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                    # create Sec Hub finding
+                    findingSink.put(
                         {
                             'SchemaVersion': '2018-10-08',
-                            'Id': tableArn + '/dynamodb-backups',
+                            'Id': instanceArn + '/ec2-backups',
                             'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': tableArn,
+                            'GeneratorId': instanceArn,
                             'AwsAccountId': awsAccountId,
                             'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
                             'FirstObservedAt': iso8601Time,
@@ -339,8 +232,8 @@ def ddb_backup_check():
                             'UpdatedAt': iso8601Time,
                             'Severity': { 'Normalized': 40 },
                             'Confidence': 99,
-                            'Title': '[Backup.3] DynamoDB tables should be protected by AWS Backup',
-                            'Description': 'DynamoDB table ' + tableName + ' is not protected by AWS Backup. Refer to the remediation instructions for information on ensuring disaster recovery and business continuity requirements are fulfilled for DynamoDB tables',
+                            'Title': '[Backup.2] EC2 instances should be protected by AWS Backup',
+                            'Description': 'EC2 instance ' + instanceId + ' is not protected by AWS Backup. Refer to the remediation instructions for information on ensuring disaster recovery and business continuity requirements are fulfilled for EC2 instances',
                             'Remediation': {
                                 'Recommendation': {
                                     'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
@@ -352,27 +245,136 @@ def ddb_backup_check():
                             },
                             'Resources': [
                                 {
-                                    'Type': 'AwsDynamoDbTable',
-                                    'Id': tableArn,
+                                    'Type': 'AwsEc2Instance',
+                                    'Id': instanceArn,
                                     'Partition': 'aws',
                                     'Region': awsRegion,
                                     'Details': {
-                                        'Other': { 'TableName': tableName }
+                                        'AwsEc2Instance': {
+                                            'Type': instanceType,
+                                            'ImageId': imageId,
+                                            'VpcId': vpcId,
+                                            'SubnetId': subnetId
+                                        }
                                     }
                                 }
                             ],
                             'Compliance': { 'Status': 'FAILED' },
                             'RecordState': 'ACTIVE'
                         }
-                    ]
+                    )
+                except Exception as e:
+                    print(e)
+
+def ddb_backup_check():
+    awsAccountId = accountId.get()
+    # loop through dynamodb tables
+    myDdbTables = inventory.get('dynamodb', 'list_tables', 'TableNames')
+    for tables in myDdbTables:
+        # table ARNs follow a fixed format, so there is no DescribeTable call per table
+        tableName = str(tables)
+        tableArn = 'arn:aws:dynamodb:' + awsRegion + ':' + awsAccountId + ':table/' + tableName
+        if is_protected(tableArn):
+            # check if ddb tables are backed up
+            try:
+                # ISO Time
+                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                # create Sec Hub finding
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': tableArn + '/dynamodb-backups',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': tableArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[Backup.3] DynamoDB tables should be protected by AWS Backup',
+                        'Description': 'DynamoDB table ' + tableName + ' is protected by AWS Backup.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsDynamoDbTable',
+                                'Id': tableArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'TableName': tableName }
+                                }
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
+                )
+            except Exception as e:
+                print(e)
+        else:
+            try:
+                # ISO Time
+                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                # create Sec Hub finding
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': tableArn + '/dynamodb-backups',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': tableArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 40 },
+                        'Confidence': 99,
+                        'Title': '[Backup.3] DynamoDB tables should be protected by AWS Backup',
+                        'Description': 'DynamoDB table ' + tableName + ' is not protected by AWS Backup. Refer to the remediation instructions for information on ensuring disaster recovery and business continuity requirements are fulfilled for DynamoDB tables',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsDynamoDbTable',
+                                'Id': tableArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'TableName': tableName }
+                                }
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
             
 def rds_backup_check():
+    awsAccountId = accountId.get()
     # loop through rds db instances
-    response = rds.describe_db_instances(
+    myRdsInstances = inventory.get(
+        'rds',
+        'describe_db_instances',
+        'DBInstances',
         Filters=[
             {
                 'Name': 'engine',
@@ -390,233 +392,217 @@ def rds_backup_check():
                     'sqlserver-web'
                 ]
             }
-        ],
-        MaxRecords=100
+        ]
     )
-    myRdsInstances = response['DBInstances']
     for databases in myRdsInstances:
         dbArn = str(databases['DBInstanceArn'])
         dbId = str(databases['DBInstanceIdentifier'])
         dbEngine = str(databases['Engine'])
         dbEngineVersion = str(databases['EngineVersion'])
-        try:
+        if is_protected(dbArn):
             # check if db instances are backed up
-            response = backup.describe_protected_resource(ResourceArn=dbArn)
             try:
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': dbArn + '/rds-backups',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': dbArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[Backup.4] RDS database instances should be protected by AWS Backup',
-                            'Description': 'RDS database instance ' + dbId + ' is protected by AWS Backup.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbInstance',
-                                    'Id': dbArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsRdsDbInstance': {
-                                            'DBInstanceIdentifier': dbId,
-                                            'Engine': dbEngine,
-                                            'EngineVersion': dbEngineVersion
-                                        }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': dbArn + '/rds-backups',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': dbArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[Backup.4] RDS database instances should be protected by AWS Backup',
+                        'Description': 'RDS database instance ' + dbId + ' is protected by AWS Backup.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsRdsDbInstance',
+                                'Id': dbArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'AwsRdsDbInstance': {
+                                        'DBInstanceIdentifier': dbId,
+                                        'Engine': dbEngine,
+                                        'EngineVersion': dbEngineVersion
                                     }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
-        except:
+        else:
             try:
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': dbArn + '/rds-backups',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': dbArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 40 },
-                            'Confidence': 99,
-                            'Title': '[Backup.4] RDS database instances should be protected by AWS Backup',
-                            'Description': 'RDS database instance ' + dbId + ' is not protected by AWS Backup. Refer to the remediation instructions for information on ensuring disaster recovery and business continuity requirements are fulfilled for RDS instances',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbInstance',
-                                    'Id': dbArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsRdsDbInstance': {
-                                            'DBInstanceIdentifier': dbId,
-                                            'Engine': dbEngine,
-                                            'EngineVersion': dbEngineVersion
-                                        }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': dbArn + '/rds-backups',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': dbArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 40 },
+                        'Confidence': 99,
+                        'Title': '[Backup.4] RDS database instances should be protected by AWS Backup',
+                        'Description': 'RDS database instance ' + dbId + ' is not protected by AWS Backup. Refer to the remediation instructions for information on ensuring disaster recovery and business continuity requirements are fulfilled for RDS instances',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsRdsDbInstance',
+                                'Id': dbArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'AwsRdsDbInstance': {
+                                        'DBInstanceIdentifier': dbId,
+                                        'Engine': dbEngine,
+                                        'EngineVersion': dbEngineVersion
                                     }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def efs_backup_check():
+    awsAccountId = accountId.get()
     # loop through EFS file systems
-    response = efs.describe_file_systems()
-    myFileSys = response['FileSystems']
+    myFileSys = inventory.get('efs', 'describe_file_systems', 'FileSystems')
     for filesys in myFileSys:
         fileSysId = str(filesys['FileSystemId'])
         fileSysArn = 'arn:aws:elasticfilesystem:' + awsRegion + ':' + awsAccountId + ':file-system/' + fileSysId
-        try:
+        if is_protected(fileSysArn):
             # check if db instances are backed up
-            response = backup.describe_protected_resource(ResourceArn=fileSysArn)
             try:
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': fileSysArn + '/efs-backups',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': fileSysArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[Backup.5] EFS file systems should be protected by AWS Backup',
-                            'Description': 'EFS file system ' + fileSysId + ' is protected by AWS Backup.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': fileSysArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': {
-                                            'FileSystemId': fileSysId
-                                        }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': fileSysArn + '/efs-backups',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': fileSysArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[Backup.5] EFS file systems should be protected by AWS Backup',
+                        'Description': 'EFS file system ' + fileSysId + ' is protected by AWS Backup.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': fileSysArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': {
+                                        'FileSystemId': fileSysId
                                     }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
-        except:
+        else:
             try:
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': fileSysArn + '/efs-backups',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': fileSysArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 40 },
-                            'Confidence': 99,
-                            'Title': '[Backup.5] EFS file systems should be protected by AWS Backup',
-                            'Description': 'EFS file system ' + fileSysId + ' is not protected by AWS Backup. Refer to the remediation instructions for information on ensuring disaster recovery and business continuity requirements are fulfilled for EFS file systems.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': fileSysArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': {
-                                            'FileSystemId': fileSysId
-                                        }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': fileSysArn + '/efs-backups',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': fileSysArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 40 },
+                        'Confidence': 99,
+                        'Title': '[Backup.5] EFS file systems should be protected by AWS Backup',
+                        'Description': 'EFS file system ' + fileSysId + ' is not protected by AWS Backup. Refer to the remediation instructions for information on ensuring disaster recovery and business continuity requirements are fulfilled for EFS file systems.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For information on creating scheduled backups refer to the Assign Resources to a Backup Plan section of the AWS Backup Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/aws-backup/latest/devguide/create-a-scheduled-backup.html#assign-resources-to-plan'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': fileSysArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': {
+                                        'FileSystemId': fileSysId
                                     }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
             
@@ -627,4 +613,5 @@ def backup_auditor():
     rds_backup_check()
     efs_backup_check
     
-backup_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    backup_auditor()
\ No newline at end of file
@@ -13,233 +13,67 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import os
-import datetime
+from check_registry import CheckRegistry
+from finding_sink import default_sink
+from resource_inventory import default_inventory
+from scan_scope import lazy_account_id
 # import boto3 clients
-sts = boto3.client('sts')
-cloudformation = boto3.client('cloudformation')
-securityhub = boto3.client('securityhub')
+findingSink = default_sink()
+inventory = default_inventory()
+registry = CheckRegistry()
 # create env vars for account and region
-#awsRegion = os.environ['AWS_REGION']
-awsRegion = 'us-east-1'
-awsAccountId = sts.get_caller_identity()['Account']
+awsRegion = os.environ['AWS_REGION']
+accountId = lazy_account_id()
 # describe all cfn stacks
-response = cloudformation.describe_stacks()
-myCfnStacks = response['Stacks']
+myCfnStacks = inventory.lazy('cloudformation', 'describe_stacks', 'Stacks')
 
-def cfn_drift_check():
-    for stacks in myCfnStacks:
-        stackName = str(stacks['StackName'])
-        stackId = str(stacks['StackId'])
-        stackArn = 'arn:aws:cloudformation:' + awsRegion + ':' + awsAccountId + ':stack/' + stackName + '/' + stackId
-        driftCheck = str(stacks['DriftInformation']['StackDriftStatus'])
-        if driftCheck != 'IN_SYNC':
-            try:
-                # ISO Time
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': stackArn + '/cloudformation-drift-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': stackArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 20 },
-                            'Confidence': 99,
-                            'Title': '[CloudFormation.1] CloudFormation stacks should be monitored for configuration drift',
-                            'Description': 'CloudFormation stack ' + stackName + ' has not been monitored for drift detection. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'To learn more about drift detection refer to the Detecting Unmanaged Configuration Changes to Stacks and Resources section of the AWS CloudFormation User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/using-cfn-stack-drift.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': stackArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'Stack Name': stackName }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        else:
-            try:
-                # ISO Time
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': stackArn + '/cloudformation-drift-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': stackArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[CloudFormation.1] CloudFormation stacks should be monitored for configuration drift',
-                            'Description': 'CloudFormation stack ' + stackName + ' has been monitored for drift detection.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'To learn more about drift detection refer to the Detecting Unmanaged Configuration Changes to Stacks and Resources section of the AWS CloudFormation User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/using-cfn-stack-drift.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': stackArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'Stack Name': stackName }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
+def cfn_stack_resource(stacks):
+    awsAccountId = accountId.get()
+    stackName = str(stacks['StackName'])
+    stackId = str(stacks['StackId'])
+    return {
+        'Type': 'Other',
+        'Id': 'arn:aws:cloudformation:' + awsRegion + ':' + awsAccountId + ':stack/' + stackName + '/' + stackId,
+        'Details': {
+            'Other': { 'Stack Name': stackName }
+        },
+        'Fields': { 'StackName': stackName }
+    }
+
+@registry.collection('stacks', cfn_stack_resource)
+def cfn_stacks():
+    return myCfnStacks
+
+@registry.check(
+    'stacks',
+    findingId='cloudformation-drift-check',
+    title='[CloudFormation.1] CloudFormation stacks should be monitored for configuration drift',
+    severity=20,
+    failedDescription='CloudFormation stack {StackName} has not been monitored for drift detection. Refer to the remediation instructions if this configuration is not intended',
+    passedDescription='CloudFormation stack {StackName} has been monitored for drift detection.',
+    remediationText='To learn more about drift detection refer to the Detecting Unmanaged Configuration Changes to Stacks and Resources section of the AWS CloudFormation User Guide',
+    remediationUrl='https://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/using-cfn-stack-drift.html'
+)
+def cfn_drift_check(stacks):
+    return str(stacks['DriftInformation']['StackDriftStatus']) == 'IN_SYNC'
+
+@registry.check(
+    'stacks',
+    findingId='cloudformation-monitoring-check',
+    title='[CloudFormation.2] CloudFormation stacks should be monitored for changes',
+    severity=20,
+    failedDescription='CloudFormation stack {StackName} does not have monitoring enabled. Refer to the remediation instructions if this configuration is not intended',
+    passedDescription='CloudFormation stack {StackName} has monitoring enabled.',
+    remediationText='If your stack should having monitoring enabled refer to the Monitor and Roll Back Stack Operations section of the AWS CloudFormation User Guide',
+    remediationUrl='https://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/using-cfn-rollback-triggers.html'
+)
+def cfn_monitoring_check(stacks):
+    return len(stacks['NotificationARNs']) > 0
 
-def cfn_monitoring_check():
-    for stacks in myCfnStacks:
-        stackName = str(stacks['StackName'])
-        stackId = str(stacks['StackId'])
-        stackArn = 'arn:aws:cloudformation:' + awsRegion + ':' + awsAccountId + ':stack/' + stackName + '/' + stackId
-        alertsCheck = str(stacks['NotificationARNs'])
-        if alertsCheck == '[]':
-            try:
-                # ISO Time
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': stackArn + '/cloudformation-monitoring-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': stackArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 20 },
-                            'Confidence': 99,
-                            'Title': '[CloudFormation.2] CloudFormation stacks should be monitored for changes',
-                            'Description': 'CloudFormation stack ' + stackName + ' does not have monitoring enabled. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your stack should having monitoring enabled refer to the Monitor and Roll Back Stack Operations section of the AWS CloudFormation User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/using-cfn-rollback-triggers.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': stackArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'Stack Name': stackName }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        else:
-            try:
-                # ISO Time
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': stackArn + '/cloudformation-monitoring-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': stackArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[CloudFormation.2] CloudFormation stacks should be monitored for changes',
-                            'Description': 'CloudFormation stack ' + stackName + ' has monitoring enabled.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your stack should having monitoring enabled refer to the Monitor and Roll Back Stack Operations section of the AWS CloudFormation User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/using-cfn-rollback-triggers.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': stackArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'Stack Name': stackName }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        
 def cloudformation_auditor():
-    cfn_drift_check()
-    cfn_monitoring_check()
+    awsAccountId = accountId.get()
+    registry.run(findingSink, awsRegion, awsAccountId)
 
-cloudformation_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    cloudformation_auditor()
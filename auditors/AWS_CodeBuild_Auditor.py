@@ -13,23 +13,32 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import os
 import datetime
+from finding_sink import default_sink
+from resource_inventory import default_inventory, lazy_value
+from scan_scope import lazy_account_id, lazy_client
 # import boto3 clients
-sts = boto3.client('sts')
-codebuild = boto3.client('codebuild')
-securityhub = boto3.client('securityhub')
+codebuild = lazy_client('codebuild')
+findingSink = default_sink()
+inventory = default_inventory()
 # create env vars
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 awsRegion = os.environ['AWS_REGION']
 # loop through all CodeBuild projects and list their attributes
-response = codebuild.list_projects()
-allCodebuildProjects = response['projects']
-response = codebuild.batch_get_projects(names=allCodebuildProjects)
-myCodeBuildProjects = response['projects']
+# BatchGetProjects accepts up to 100 project names per call
+allCodebuildProjects = inventory.lazy('codebuild', 'list_projects', 'projects')
+def codebuild_projects():
+    codebuildProjects = []
+    for start in range(0, len(allCodebuildProjects), 100):
+        response = codebuild.batch_get_projects(names=allCodebuildProjects[start:start + 100])
+        codebuildProjects.extend(response['projects'])
+    return codebuildProjects
+
+myCodeBuildProjects = lazy_value(codebuild_projects)
 
 def artifact_encryption_check(): 
+    awsAccountId = accountId.get()
     for projects in myCodeBuildProjects:
         buildProjectName = str(projects['name'])
         buildProjectArn = str(projects['arn'])
@@ -47,122 +56,10 @@ def artifact_encryption_check():
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                     # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': buildProjectArn + '/unencrypted-artifacts',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': buildProjectArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 40 },
-                                'Confidence': 99,
-                                'Title': '[CodeBuild.1] CodeBuild projects should not have artifact encryption disabled',
-                                'Description': 'CodeBuild project ' + buildProjectName + ' has artifact encryption disabled. Refer to the remediation instructions if this configuration is not intended',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your project should have artifact encryption enabled scroll down to item 8 in the Create a Build Project (Console) section of the AWS CodeBuild User Guide',
-                                        'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/create-project.html'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsCodeBuildProject',
-                                        'Id': buildProjectArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'AwsCodeBuildProject': { 'Name': buildProjectName }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-            else:
-                try:
-                    # ISO Time
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': buildProjectArn + '/unencrypted-artifacts',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': buildProjectArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[CodeBuild.1] CodeBuild projects should not have artifact encryption disabled',
-                                'Description': 'CodeBuild project ' + buildProjectName + ' has artifact encryption enabled.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your project should have artifact encryption enabled scroll down to item 8 in the Create a Build Project (Console) section of the AWS CodeBuild User Guide',
-                                        'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/create-project.html'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsCodeBuildProject',
-                                        'Id': buildProjectArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'AwsCodeBuildProject': { 'Name': buildProjectName }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-
-def insecure_ssl_check():
-    for projects in myCodeBuildProjects:
-        buildProjectName = str(projects['name'])
-        buildProjectArn = str(projects['arn'])
-        # check if Insecure SSL is enabled for your Source
-        sourceInsecureSslCheck = str(projects['source']['insecureSsl'])
-        if sourceInsecureSslCheck != 'False':
-            try:
-                # ISO Time
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
+                    findingSink.put(
                         {
                             'SchemaVersion': '2018-10-08',
-                            'Id': buildProjectArn + '/insecure-ssl',
+                            'Id': buildProjectArn + '/unencrypted-artifacts',
                             'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
                             'GeneratorId': buildProjectArn,
                             'AwsAccountId': awsAccountId,
@@ -175,12 +72,12 @@ def insecure_ssl_check():
                             'UpdatedAt': iso8601Time,
                             'Severity': { 'Normalized': 40 },
                             'Confidence': 99,
-                            'Title': '[CodeBuild.2] CodeBuild projects should not have insecure SSL configured',
-                            'Description': 'CodeBuild project ' + buildProjectName + ' has insecure SSL configured. Refer to the remediation instructions if this configuration is not intended',
+                            'Title': '[CodeBuild.1] CodeBuild projects should not have artifact encryption disabled',
+                            'Description': 'CodeBuild project ' + buildProjectName + ' has artifact encryption disabled. Refer to the remediation instructions if this configuration is not intended',
                             'Remediation': {
                                 'Recommendation': {
-                                    'Text': 'If your project should not have insecure SSL configured refer to the Troubleshooting CodeBuild section of the AWS CodeBuild User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/troubleshooting.html#troubleshooting-self-signed-certificate'
+                                    'Text': 'If your project should have artifact encryption enabled scroll down to item 8 in the Create a Build Project (Console) section of the AWS CodeBuild User Guide',
+                                    'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/create-project.html'
                                 }
                             },
                             'ProductFields': {
@@ -200,21 +97,18 @@ def insecure_ssl_check():
                             'Compliance': { 'Status': 'FAILED' },
                             'RecordState': 'ACTIVE'
                         }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        else:
-            try:
-                # ISO Time
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
+                    )
+                except Exception as e:
+                    print(e)
+            else:
+                try:
+                    # ISO Time
+                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                    # create Sec Hub finding
+                    findingSink.put(
                         {
                             'SchemaVersion': '2018-10-08',
-                            'Id': buildProjectArn + '/insecure-ssl',
+                            'Id': buildProjectArn + '/unencrypted-artifacts',
                             'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
                             'GeneratorId': buildProjectArn,
                             'AwsAccountId': awsAccountId,
@@ -227,12 +121,12 @@ def insecure_ssl_check():
                             'UpdatedAt': iso8601Time,
                             'Severity': { 'Normalized': 0 },
                             'Confidence': 99,
-                            'Title': '[CodeBuild.2] CodeBuild projects should not have insecure SSL configured',
-                            'Description': 'CodeBuild project ' + buildProjectName + ' doesnt have insecure SSL configured.',
+                            'Title': '[CodeBuild.1] CodeBuild projects should not have artifact encryption disabled',
+                            'Description': 'CodeBuild project ' + buildProjectName + ' has artifact encryption enabled.',
                             'Remediation': {
                                 'Recommendation': {
-                                    'Text': 'If your project should not have insecure SSL configured refer to the Troubleshooting CodeBuild section of the AWS CodeBuild User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/troubleshooting.html#troubleshooting-self-signed-certificate'
+                                    'Text': 'If your project should have artifact encryption enabled scroll down to item 8 in the Create a Build Project (Console) section of the AWS CodeBuild User Guide',
+                                    'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/create-project.html'
                                 }
                             },
                             'ProductFields': {
@@ -252,13 +146,118 @@ def insecure_ssl_check():
                             'Compliance': { 'Status': 'PASSED' },
                             'RecordState': 'ARCHIVED'
                         }
-                    ]
+                    )
+                except Exception as e:
+                    print(e)
+
+def insecure_ssl_check():
+    awsAccountId = accountId.get()
+    for projects in myCodeBuildProjects:
+        buildProjectName = str(projects['name'])
+        buildProjectArn = str(projects['arn'])
+        # check if Insecure SSL is enabled for your Source
+        sourceInsecureSslCheck = str(projects['source']['insecureSsl'])
+        if sourceInsecureSslCheck != 'False':
+            try:
+                # ISO Time
+                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                # create Sec Hub finding
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': buildProjectArn + '/insecure-ssl',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': buildProjectArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [
+                            'Software and Configuration Checks/AWS Security Best Practices',
+                            'Effects/Data Exposure'
+                        ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 40 },
+                        'Confidence': 99,
+                        'Title': '[CodeBuild.2] CodeBuild projects should not have insecure SSL configured',
+                        'Description': 'CodeBuild project ' + buildProjectName + ' has insecure SSL configured. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your project should not have insecure SSL configured refer to the Troubleshooting CodeBuild section of the AWS CodeBuild User Guide',
+                                'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/troubleshooting.html#troubleshooting-self-signed-certificate'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsCodeBuildProject',
+                                'Id': buildProjectArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'AwsCodeBuildProject': { 'Name': buildProjectName }
+                                }
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
+                )
+            except Exception as e:
+                print(e)
+        else:
+            try:
+                # ISO Time
+                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                # create Sec Hub finding
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': buildProjectArn + '/insecure-ssl',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': buildProjectArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [
+                            'Software and Configuration Checks/AWS Security Best Practices',
+                            'Effects/Data Exposure'
+                        ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[CodeBuild.2] CodeBuild projects should not have insecure SSL configured',
+                        'Description': 'CodeBuild project ' + buildProjectName + ' doesnt have insecure SSL configured.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your project should not have insecure SSL configured refer to the Troubleshooting CodeBuild section of the AWS CodeBuild User Guide',
+                                'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/troubleshooting.html#troubleshooting-self-signed-certificate'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsCodeBuildProject',
+                                'Id': buildProjectArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'AwsCodeBuildProject': { 'Name': buildProjectName }
+                                }
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def plaintext_env_var_check():
+    awsAccountId = accountId.get()
     for projects in myCodeBuildProjects:
         buildProjectName = str(projects['name'])
         buildProjectArn = str(projects['arn'])
@@ -278,52 +277,49 @@ def plaintext_env_var_check():
                         # ISO Time
                         iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                         # create Sec Hub finding
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': buildProjectArn + '/plaintext-env-vars',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': buildProjectArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure',
-                                        'Sensitive Data Identifications'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[CodeBuild.3] CodeBuild projects should not have plaintext environment variables',
-                                    'Description': 'CodeBuild project ' + buildProjectName + ' contains plaintext environment variables. Refer to the remediation instructions if this configuration is not intended',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'If your project should not contain plaintext environment variables refer to the Buildspec File Name and Storage Location section of the AWS CodeBuild User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/build-spec-ref.html#build-spec-ref-syntax'
-                                        }
-                                    },
-                                    'ProductFields': {
-                                        'Product Name': 'ElectricEye'
-                                    },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsCodeBuildProject',
-                                            'Id': buildProjectArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsCodeBuildProject': { 'Name': buildProjectName }
-                                            }
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': buildProjectArn + '/plaintext-env-vars',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': buildProjectArn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': [
+                                    'Software and Configuration Checks/AWS Security Best Practices',
+                                    'Effects/Data Exposure',
+                                    'Sensitive Data Identifications'
+                                ],
+                                'FirstObservedAt': iso8601Time,
+                                'CreatedAt': iso8601Time,
+                                'UpdatedAt': iso8601Time,
+                                'Severity': { 'Normalized': 40 },
+                                'Confidence': 99,
+                                'Title': '[CodeBuild.3] CodeBuild projects should not have plaintext environment variables',
+                                'Description': 'CodeBuild project ' + buildProjectName + ' contains plaintext environment variables. Refer to the remediation instructions if this configuration is not intended',
+                                'Remediation': {
+                                    'Recommendation': {
+                                        'Text': 'If your project should not contain plaintext environment variables refer to the Buildspec File Name and Storage Location section of the AWS CodeBuild User Guide',
+                                        'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/build-spec-ref.html#build-spec-ref-syntax'
+                                    }
+                                },
+                                'ProductFields': {
+                                    'Product Name': 'ElectricEye'
+                                },
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsCodeBuildProject',
+                                        'Id': buildProjectArn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsCodeBuildProject': { 'Name': buildProjectName }
                                         }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'FAILED' },
+                                'RecordState': 'ACTIVE'
+                            }
                         )
-                        print(response)
                     except Exception as e:
                         print(e)
                 else:
@@ -331,56 +327,54 @@ def plaintext_env_var_check():
                         # ISO Time
                         iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                         # create Sec Hub finding
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': buildProjectArn + '/plaintext-env-vars',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': buildProjectArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure',
-                                        'Sensitive Data Identifications'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[CodeBuild.3] CodeBuild projects should not have plaintext environment variables',
-                                    'Description': 'CodeBuild project ' + buildProjectName + ' does not contain plaintext environment variables.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'If your project should not contain plaintext environment variables refer to the Buildspec File Name and Storage Location section of the AWS CodeBuild User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/build-spec-ref.html#build-spec-ref-syntax'
-                                        }
-                                    },
-                                    'ProductFields': {
-                                        'Product Name': 'ElectricEye'
-                                    },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsCodeBuildProject',
-                                            'Id': buildProjectArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsCodeBuildProject': { 'Name': buildProjectName }
-                                            }
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': buildProjectArn + '/plaintext-env-vars',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': buildProjectArn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': [
+                                    'Software and Configuration Checks/AWS Security Best Practices',
+                                    'Effects/Data Exposure',
+                                    'Sensitive Data Identifications'
+                                ],
+                                'FirstObservedAt': iso8601Time,
+                                'CreatedAt': iso8601Time,
+                                'UpdatedAt': iso8601Time,
+                                'Severity': { 'Normalized': 0 },
+                                'Confidence': 99,
+                                'Title': '[CodeBuild.3] CodeBuild projects should not have plaintext environment variables',
+                                'Description': 'CodeBuild project ' + buildProjectName + ' does not contain plaintext environment variables.',
+                                'Remediation': {
+                                    'Recommendation': {
+                                        'Text': 'If your project should not contain plaintext environment variables refer to the Buildspec File Name and Storage Location section of the AWS CodeBuild User Guide',
+                                        'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/build-spec-ref.html#build-spec-ref-syntax'
+                                    }
+                                },
+                                'ProductFields': {
+                                    'Product Name': 'ElectricEye'
+                                },
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsCodeBuildProject',
+                                        'Id': buildProjectArn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsCodeBuildProject': { 'Name': buildProjectName }
                                         }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'PASSED' },
+                                'RecordState': 'ARCHIVED'
+                            }
                         )
-                        print(response)
                     except Exception as e:
                         print(e)
 
 def s3_logging_encryption_check():
+    awsAccountId = accountId.get()
     for projects in myCodeBuildProjects:
         buildProjectName = str(projects['name'])
         buildProjectArn = str(projects['arn'])
@@ -391,51 +385,48 @@ def s3_logging_encryption_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': buildProjectArn + '/s3-encryption',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': buildProjectArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 40 },
-                            'Confidence': 99,
-                            'Title': '[CodeBuild.4] CodeBuild projects should not have S3 log encryption disabled',
-                            'Description': 'CodeBuild project ' + buildProjectName + ' has S3 log encryption disabled. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your project should not have S3 log encryption disabled refer to #20 in the Change a Build Projects Settings (AWS CLI) section of the AWS CodeBuild User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/change-project.html#change-project-console'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsCodeBuildProject',
-                                    'Id': buildProjectArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsCodeBuildProject': { 'Name': buildProjectName }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': buildProjectArn + '/s3-encryption',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': buildProjectArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [
+                            'Software and Configuration Checks/AWS Security Best Practices',
+                            'Effects/Data Exposure'
+                        ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 40 },
+                        'Confidence': 99,
+                        'Title': '[CodeBuild.4] CodeBuild projects should not have S3 log encryption disabled',
+                        'Description': 'CodeBuild project ' + buildProjectName + ' has S3 log encryption disabled. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your project should not have S3 log encryption disabled refer to #20 in the Change a Build Projects Settings (AWS CLI) section of the AWS CodeBuild User Guide',
+                                'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/change-project.html#change-project-console'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsCodeBuildProject',
+                                'Id': buildProjectArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'AwsCodeBuildProject': { 'Name': buildProjectName }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
@@ -443,55 +434,53 @@ def s3_logging_encryption_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': buildProjectArn + '/s3-encryption',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': buildProjectArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[CodeBuild.4] CodeBuild projects should not have S3 log encryption disabled',
-                            'Description': 'CodeBuild project ' + buildProjectName + ' has S3 log encryption enabled.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your project should not have S3 log encryption disabled refer to #20 in the Change a Build Projects Settings (AWS CLI) section of the AWS CodeBuild User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/change-project.html#change-project-console'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsCodeBuildProject',
-                                    'Id': buildProjectArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsCodeBuildProject': { 'Name': buildProjectName }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': buildProjectArn + '/s3-encryption',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': buildProjectArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [
+                            'Software and Configuration Checks/AWS Security Best Practices',
+                            'Effects/Data Exposure'
+                        ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[CodeBuild.4] CodeBuild projects should not have S3 log encryption disabled',
+                        'Description': 'CodeBuild project ' + buildProjectName + ' has S3 log encryption enabled.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your project should not have S3 log encryption disabled refer to #20 in the Change a Build Projects Settings (AWS CLI) section of the AWS CodeBuild User Guide',
+                                'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/change-project.html#change-project-console'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsCodeBuildProject',
+                                'Id': buildProjectArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'AwsCodeBuildProject': { 'Name': buildProjectName }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def cloudwatch_logging_check():
+    awsAccountId = accountId.get()
     for projects in myCodeBuildProjects:
         buildProjectName = str(projects['name'])
         buildProjectArn = str(projects['arn'])
@@ -502,48 +491,45 @@ def cloudwatch_logging_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': buildProjectArn + '/cloudwatch-logging',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': buildProjectArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 40 },
-                            'Confidence': 99,
-                            'Title': '[CodeBuild.5] CodeBuild projects should have CloudWatch logging enabled',
-                            'Description': 'CodeBuild project ' + buildProjectName + ' has CloudWatch logging disabled. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your project should not have CloudWatch logging disabled refer to #20 in the Change a Build Projects Settings (AWS CLI) section of the AWS CodeBuild User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/change-project.html#change-project-console'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsCodeBuildProject',
-                                    'Id': buildProjectArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsCodeBuildProject': { 'Name': buildProjectName }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': buildProjectArn + '/cloudwatch-logging',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': buildProjectArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 40 },
+                        'Confidence': 99,
+                        'Title': '[CodeBuild.5] CodeBuild projects should have CloudWatch logging enabled',
+                        'Description': 'CodeBuild project ' + buildProjectName + ' has CloudWatch logging disabled. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your project should not have CloudWatch logging disabled refer to #20 in the Change a Build Projects Settings (AWS CLI) section of the AWS CodeBuild User Guide',
+                                'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/change-project.html#change-project-console'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsCodeBuildProject',
+                                'Id': buildProjectArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'AwsCodeBuildProject': { 'Name': buildProjectName }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
@@ -551,48 +537,45 @@ def cloudwatch_logging_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': buildProjectArn + '/cloudwatch-logging',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': buildProjectArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[CodeBuild.5] CodeBuild projects should have CloudWatch logging enabled',
-                            'Description': 'CodeBuild project ' + buildProjectName + ' has CloudWatch logging enabled.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your project should not have CloudWatch logging disabled refer to #20 in the Change a Build Projects Settings (AWS CLI) section of the AWS CodeBuild User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/change-project.html#change-project-console'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsCodeBuildProject',
-                                    'Id': buildProjectArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsCodeBuildProject': { 'Name': buildProjectName }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': buildProjectArn + '/cloudwatch-logging',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': buildProjectArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[CodeBuild.5] CodeBuild projects should have CloudWatch logging enabled',
+                        'Description': 'CodeBuild project ' + buildProjectName + ' has CloudWatch logging enabled.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your project should not have CloudWatch logging disabled refer to #20 in the Change a Build Projects Settings (AWS CLI) section of the AWS CodeBuild User Guide',
+                                'Url': 'https://docs.aws.amazon.com/codebuild/latest/userguide/change-project.html#change-project-console'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsCodeBuildProject',
+                                'Id': buildProjectArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'AwsCodeBuildProject': { 'Name': buildProjectName }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
@@ -603,4 +586,5 @@ def codebuild_auditor():
     s3_logging_encryption_check()
     cloudwatch_logging_check()
 
-codebuild_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    codebuild_auditor()
\ No newline at end of file
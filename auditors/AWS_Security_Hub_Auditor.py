@@ -13,76 +13,80 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import datetime
 import os
+from finding_sink import default_sink
+from scan_scope import lazy_account_id, lazy_client
 # import boto3 clients
-securityhub = boto3.client('securityhub')
-sts = boto3.client('sts')
+securityhub = lazy_client('securityhub')
+findingSink = default_sink()
 # create aws account ID variable for filters
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 awsRegion = os.environ['AWS_REGION']
-try:
-    # look for active high or critical findings from AWS products
-    getFindings = securityhub.get_findings(
-        Filters={
-            # look for findings that belong to current account
-            # will help deconflict checks run in a master account
-            'AwsAccountId': [
-                {
-                    'Value': awsAccountId,
-                    'Comparison': 'EQUALS'
-                }
-            ],
-            # look for high or critical severity findings
-            'SeverityLabel': [
-                {
-                    'Value': 'HIGH',
-                    'Comparison': 'EQUALS'
-                },
-                {
-                    'Value': 'CRITICAL',
-                    'Comparison': 'EQUALS'
-                }
-            ],
-            # look for AWS security hub integrations
-            # company can be AWS or Amazon depending on service
-            'CompanyName': [
-                {
-                    'Value': 'AWS',
-                    'Comparison': 'EQUALS'
-                },
+
+def security_hub_auditor():
+    awsAccountId = accountId.get()
+    try:
+        # look for active high or critical findings from AWS products
+        getFindings = securityhub.get_findings(
+            Filters={
+                # look for findings that belong to current account
+                # will help deconflict checks run in a master account
+                'AwsAccountId': [
+                    {
+                        'Value': awsAccountId,
+                        'Comparison': 'EQUALS'
+                    }
+                ],
+                # look for high or critical severity findings
+                'SeverityLabel': [
+                    {
+                        'Value': 'HIGH',
+                        'Comparison': 'EQUALS'
+                    },
+                    {
+                        'Value': 'CRITICAL',
+                        'Comparison': 'EQUALS'
+                    }
+                ],
+                # look for AWS security hub integrations
+                # company can be AWS or Amazon depending on service
+                'CompanyName': [
+                    {
+                        'Value': 'AWS',
+                        'Comparison': 'EQUALS'
+                    },
+                    {
+                        'Value': 'Amazon',
+                        'Comparison': 'EQUALS'
+                    }
+                ],
+                # check for Active Records
+                'RecordState': [
+                    {
+                        'Value': 'ACTIVE',
+                        'Comparison': 'EQUALS'
+                    }
+                ]
+            },
+            SortCriteria=[
                 {
-                    'Value': 'Amazon',
-                    'Comparison': 'EQUALS'
+                    'Field': 'SeverityLabel',
+                    'SortOrder': 'asc'
                 }
             ],
-            # check for Active Records
-            'RecordState': [
-                {
-                    'Value': 'ACTIVE',
-                    'Comparison': 'EQUALS'
-                }
-            ]
-        },
-        SortCriteria=[
-            {
-                'Field': 'SeverityLabel',
-                'SortOrder': 'asc'
-            }
-        ],
-        MaxResults=100
-    )          
-except Exception as e:
-    print(e)
+            MaxResults=100
+        )          
+    except Exception as e:
+        print(e)
+        return
 
-if str(getFindings['Findings']) == '[]':
-    generatorId = str(getFindings['ResponseMetadata']['RequestId'])
-    try:
-        # ISO Time
-        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-        response = securityhub.batch_import_findings(
-            Findings=[
+    if str(getFindings['Findings']) == '[]':
+        generatorId = str(getFindings['ResponseMetadata']['RequestId'])
+        try:
+            # ISO Time
+            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+            findingSink.put(
                 {
                     'SchemaVersion': '2018-10-08',
                     'Id': 'high-critical-findings-located/' + awsAccountId,
@@ -109,18 +113,15 @@ if str(getFindings['Findings']) == '[]':
                     },
                     'RecordState': 'ARCHIVED'
                 }
-            ]
-        )
-        print(response)
-    except Exception as e:
-        print(e)
-else:
-    generatorId = str(getFindings['ResponseMetadata']['RequestId'])
-    try:
-        # ISO Time
-        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-        response = securityhub.batch_import_findings(
-            Findings=[
+            )
+        except Exception as e:
+            print(e)
+    else:
+        generatorId = str(getFindings['ResponseMetadata']['RequestId'])
+        try:
+            # ISO Time
+            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+            findingSink.put(
                 {
                     'SchemaVersion': '2018-10-08',
                     'Id': 'high-critical-findings-located/' + awsAccountId,
@@ -149,8 +150,9 @@ else:
                     },
                     'RecordState': 'ACTIVE'
                 }
-            ]
-        )
-        print(response)
-    except Exception as e:
-        print(e)
\ No newline at end of file
+            )
+        except Exception as e:
+            print(e)
+
+if __name__ == '__main__':
+    security_hub_auditor()
\ No newline at end of file
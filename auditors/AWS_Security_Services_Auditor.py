@@ -13,20 +13,21 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import uuid
 import os
 import datetime
+from finding_sink import default_sink
+from scan_scope import lazy_account_id, lazy_client
 # import boto3 clients
-sts = boto3.client('sts')
-accessanalyzer = boto3.client('accessanalyzer')
-guardduty = boto3.client('guardduty')
-securityhub = boto3.client('securityhub')
+accessanalyzer = lazy_client('accessanalyzer')
+guardduty = lazy_client('guardduty')
+findingSink = default_sink()
 # create env vars
 awsRegion = os.environ['AWS_REGION']
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 
 def iam_access_analyzer_detector_check():
+    awsAccountId = accountId.get()
     response = accessanalyzer.list_analyzers()
     iamAccessAnalyzerCheck = str(response['analyzers'])
     if iamAccessAnalyzerCheck == '[]':
@@ -36,45 +37,42 @@ def iam_access_analyzer_detector_check():
             # unique ID
             generatorUuid = str(uuid.uuid4())
             # create Sec Hub finding
-            response = securityhub.batch_import_findings(
-                Findings=[
-                    {
-                        'SchemaVersion': '2018-10-08',
-                        'Id': awsAccountId + '/security-services-iaa-enabled-check',
-                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                        'GeneratorId': generatorUuid,
-                        'AwsAccountId': awsAccountId,
-                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                        'FirstObservedAt': iso8601Time,
-                        'CreatedAt': iso8601Time,
-                        'UpdatedAt': iso8601Time,
-                        'Severity': { 'Normalized': 60 },
-                        'Confidence': 99,
-                        'Title': '[SecSvcs.1] IAM Access Analyzer should be enabled',
-                        'Description': 'IAM Access Analyzer is not enabled. Refer to the remediation instructions if this configuration is not intended',
-                        'Remediation': {
-                            'Recommendation': {
-                                'Text': 'If IAM Access Analyzer should be enabled refer to the Enabling Access Analyzer section of the AWS Identity and Access Management User Guide',
-                                'Url': 'https://docs.aws.amazon.com/IAM/latest/UserGuide/access-analyzer-getting-started.html#access-analyzer-enabling'
-                            }
-                        },
-                        'ProductFields': {
-                            'Product Name': 'ElectricEye'
-                        },
-                        'Resources': [
-                            {
-                                'Type': 'AwsAccount',
-                                'Id': 'AWS::::Account:' + awsAccountId,
-                                'Partition': 'aws',
-                                'Region': awsRegion
-                            }
-                        ],
-                        'Compliance': { 'Status': 'FAILED' },
-                        'RecordState': 'ACTIVE'
-                    }
-                ]
+            findingSink.put(
+                {
+                    'SchemaVersion': '2018-10-08',
+                    'Id': awsAccountId + '/security-services-iaa-enabled-check',
+                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                    'GeneratorId': generatorUuid,
+                    'AwsAccountId': awsAccountId,
+                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                    'FirstObservedAt': iso8601Time,
+                    'CreatedAt': iso8601Time,
+                    'UpdatedAt': iso8601Time,
+                    'Severity': { 'Normalized': 60 },
+                    'Confidence': 99,
+                    'Title': '[SecSvcs.1] IAM Access Analyzer should be enabled',
+                    'Description': 'IAM Access Analyzer is not enabled. Refer to the remediation instructions if this configuration is not intended',
+                    'Remediation': {
+                        'Recommendation': {
+                            'Text': 'If IAM Access Analyzer should be enabled refer to the Enabling Access Analyzer section of the AWS Identity and Access Management User Guide',
+                            'Url': 'https://docs.aws.amazon.com/IAM/latest/UserGuide/access-analyzer-getting-started.html#access-analyzer-enabling'
+                        }
+                    },
+                    'ProductFields': {
+                        'Product Name': 'ElectricEye'
+                    },
+                    'Resources': [
+                        {
+                            'Type': 'AwsAccount',
+                            'Id': 'AWS::::Account:' + awsAccountId,
+                            'Partition': 'aws',
+                            'Region': awsRegion
+                        }
+                    ],
+                    'Compliance': { 'Status': 'FAILED' },
+                    'RecordState': 'ACTIVE'
+                }
             )
-            print(response)
         except Exception as e:
             print(e)
     else:
@@ -84,49 +82,47 @@ def iam_access_analyzer_detector_check():
             # unique ID
             generatorUuid = str(uuid.uuid4())
             # create Sec Hub finding
-            response = securityhub.batch_import_findings(
-                Findings=[
-                    {
-                        'SchemaVersion': '2018-10-08',
-                        'Id': awsAccountId + '/security-services-iaa-enabled-check',
-                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                        'GeneratorId': generatorUuid,
-                        'AwsAccountId': awsAccountId,
-                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                        'FirstObservedAt': iso8601Time,
-                        'CreatedAt': iso8601Time,
-                        'UpdatedAt': iso8601Time,
-                        'Severity': { 'Normalized': 0 },
-                        'Confidence': 99,
-                        'Title': '[SecSvcs.1] IAM Access Analyzer should be enabled',
-                        'Description': 'IAM Access Analyzer is enabled.',
-                        'Remediation': {
-                            'Recommendation': {
-                                'Text': 'If IAM Access Analyzer should be enabled refer to the Enabling Access Analyzer section of the AWS Identity and Access Management User Guide',
-                                'Url': 'https://docs.aws.amazon.com/IAM/latest/UserGuide/access-analyzer-getting-started.html#access-analyzer-enabling'
-                            }
-                        },
-                        'ProductFields': {
-                            'Product Name': 'ElectricEye'
-                        },
-                        'Resources': [
-                            {
-                                'Type': 'AwsAccount',
-                                'Id': 'AWS::::Account:' + awsAccountId,
-                                'Partition': 'aws',
-                                'Region': awsRegion
-                            }
-                        ],
-                        'Compliance': { 'Status': 'PASSED' },
-                        'RecordState': 'ARCHIVED'
-                    }
-                ]
+            findingSink.put(
+                {
+                    'SchemaVersion': '2018-10-08',
+                    'Id': awsAccountId + '/security-services-iaa-enabled-check',
+                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                    'GeneratorId': generatorUuid,
+                    'AwsAccountId': awsAccountId,
+                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                    'FirstObservedAt': iso8601Time,
+                    'CreatedAt': iso8601Time,
+                    'UpdatedAt': iso8601Time,
+                    'Severity': { 'Normalized': 0 },
+                    'Confidence': 99,
+                    'Title': '[SecSvcs.1] IAM Access Analyzer should be enabled',
+                    'Description': 'IAM Access Analyzer is enabled.',
+                    'Remediation': {
+                        'Recommendation': {
+                            'Text': 'If IAM Access Analyzer should be enabled refer to the Enabling Access Analyzer section of the AWS Identity and Access Management User Guide',
+                            'Url': 'https://docs.aws.amazon.com/IAM/latest/UserGuide/access-analyzer-getting-started.html#access-analyzer-enabling'
+                        }
+                    },
+                    'ProductFields': {
+                        'Product Name': 'ElectricEye'
+                    },
+                    'Resources': [
+                        {
+                            'Type': 'AwsAccount',
+                            'Id': 'AWS::::Account:' + awsAccountId,
+                            'Partition': 'aws',
+                            'Region': awsRegion
+                        }
+                    ],
+                    'Compliance': { 'Status': 'PASSED' },
+                    'RecordState': 'ARCHIVED'
+                }
             )
-            print(response)
         except Exception as e:
             print(e)
 
 def guardduty_detector_check():
+    awsAccountId = accountId.get()
     response = guardduty.list_detectors()
     guarddutyDetectorCheck = str(response['DetectorIds'])
     if guarddutyDetectorCheck == '[]':
@@ -136,45 +132,42 @@ def guardduty_detector_check():
             # unique ID
             generatorUuid = str(uuid.uuid4())
             # create Sec Hub finding
-            response = securityhub.batch_import_findings(
-                Findings=[
-                    {
-                        'SchemaVersion': '2018-10-08',
-                        'Id': awsAccountId + '/security-services-guardduty-enabled-check',
-                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                        'GeneratorId': generatorUuid,
-                        'AwsAccountId': awsAccountId,
-                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                        'FirstObservedAt': iso8601Time,
-                        'CreatedAt': iso8601Time,
-                        'UpdatedAt': iso8601Time,
-                        'Severity': { 'Normalized': 60 },
-                        'Confidence': 99,
-                        'Title': '[SecSvcs.2] GuardDuty should be enabled',
-                        'Description': 'GuardDuty is not enabled. Refer to the remediation instructions if this configuration is not intended',
-                        'Remediation': {
-                            'Recommendation': {
-                                'Text': 'If GuardDuty should be enabled refer to the Setting Up GuardDuty section of the Amazon GuardDuty User Guide',
-                                'Url': 'https://docs.aws.amazon.com/guardduty/latest/ug/guardduty_settingup.html'
-                            }
-                        },
-                        'ProductFields': {
-                            'Product Name': 'ElectricEye'
-                        },
-                        'Resources': [
-                            {
-                                'Type': 'AwsAccount',
-                                'Id': 'AWS::::Account:' + awsAccountId,
-                                'Partition': 'aws',
-                                'Region': awsRegion
-                            }
-                        ],
-                        'Compliance': { 'Status': 'FAILED' },
-                        'RecordState': 'ACTIVE'
-                    }
-                ]
+            findingSink.put(
+                {
+                    'SchemaVersion': '2018-10-08',
+                    'Id': awsAccountId + '/security-services-guardduty-enabled-check',
+                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                    'GeneratorId': generatorUuid,
+                    'AwsAccountId': awsAccountId,
+                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                    'FirstObservedAt': iso8601Time,
+                    'CreatedAt': iso8601Time,
+                    'UpdatedAt': iso8601Time,
+                    'Severity': { 'Normalized': 60 },
+                    'Confidence': 99,
+                    'Title': '[SecSvcs.2] GuardDuty should be enabled',
+                    'Description': 'GuardDuty is not enabled. Refer to the remediation instructions if this configuration is not intended',
+                    'Remediation': {
+                        'Recommendation': {
+                            'Text': 'If GuardDuty should be enabled refer to the Setting Up GuardDuty section of the Amazon GuardDuty User Guide',
+                            'Url': 'https://docs.aws.amazon.com/guardduty/latest/ug/guardduty_settingup.html'
+                        }
+                    },
+                    'ProductFields': {
+                        'Product Name': 'ElectricEye'
+                    },
+                    'Resources': [
+                        {
+                            'Type': 'AwsAccount',
+                            'Id': 'AWS::::Account:' + awsAccountId,
+                            'Partition': 'aws',
+                            'Region': awsRegion
+                        }
+                    ],
+                    'Compliance': { 'Status': 'FAILED' },
+                    'RecordState': 'ACTIVE'
+                }
             )
-            print(response)
         except Exception as e:
             print(e)
     else:
@@ -184,45 +177,42 @@ def guardduty_detector_check():
             # unique ID
             generatorUuid = str(uuid.uuid4())
             # create Sec Hub finding
-            response = securityhub.batch_import_findings(
-                Findings=[
-                    {
-                        'SchemaVersion': '2018-10-08',
-                        'Id': awsAccountId + '/security-services-guardduty-enabled-check',
-                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                        'GeneratorId': generatorUuid,
-                        'AwsAccountId': awsAccountId,
-                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                        'FirstObservedAt': iso8601Time,
-                        'CreatedAt': iso8601Time,
-                        'UpdatedAt': iso8601Time,
-                        'Severity': { 'Normalized': 0 },
-                        'Confidence': 99,
-                        'Title': '[SecSvcs.2] GuardDuty should be enabled',
-                        'Description': 'GuardDuty is not enabled. Refer to the remediation instructions if this configuration is not intended',
-                        'Remediation': {
-                            'Recommendation': {
-                                'Text': 'If GuardDuty should be enabled refer to the Setting Up GuardDuty section of the Amazon GuardDuty User Guide',
-                                'Url': 'https://docs.aws.amazon.com/guardduty/latest/ug/guardduty_settingup.html'
-                            }
-                        },
-                        'ProductFields': {
-                            'Product Name': 'ElectricEye'
-                        },
-                        'Resources': [
-                            {
-                                'Type': 'AwsAccount',
-                                'Id': 'AWS::::Account:' + awsAccountId,
-                                'Partition': 'aws',
-                                'Region': awsRegion
-                            }
-                        ],
-                        'Compliance': { 'Status': 'PASSED' },
-                        'RecordState': 'ARCHIVED'
-                    }
-                ]
+            findingSink.put(
+                {
+                    'SchemaVersion': '2018-10-08',
+                    'Id': awsAccountId + '/security-services-guardduty-enabled-check',
+                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                    'GeneratorId': generatorUuid,
+                    'AwsAccountId': awsAccountId,
+                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                    'FirstObservedAt': iso8601Time,
+                    'CreatedAt': iso8601Time,
+                    'UpdatedAt': iso8601Time,
+                    'Severity': { 'Normalized': 0 },
+                    'Confidence': 99,
+                    'Title': '[SecSvcs.2] GuardDuty should be enabled',
+                    'Description': 'GuardDuty is not enabled. Refer to the remediation instructions if this configuration is not intended',
+                    'Remediation': {
+                        'Recommendation': {
+                            'Text': 'If GuardDuty should be enabled refer to the Setting Up GuardDuty section of the Amazon GuardDuty User Guide',
+                            'Url': 'https://docs.aws.amazon.com/guardduty/latest/ug/guardduty_settingup.html'
+                        }
+                    },
+                    'ProductFields': {
+                        'Product Name': 'ElectricEye'
+                    },
+                    'Resources': [
+                        {
+                            'Type': 'AwsAccount',
+                            'Id': 'AWS::::Account:' + awsAccountId,
+                            'Partition': 'aws',
+                            'Region': awsRegion
+                        }
+                    ],
+                    'Compliance': { 'Status': 'PASSED' },
+                    'RecordState': 'ARCHIVED'
+                }
             )
-            print(response)
         except Exception as e:
             print(e)
 
@@ -230,4 +220,5 @@ def security_services_auditor():
     iam_access_analyzer_detector_check()
     guardduty_detector_check()
 
-security_services_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    security_services_auditor()
\ No newline at end of file
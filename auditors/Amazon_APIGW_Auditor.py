@@ -1,23 +1,38 @@
-import boto3
 import datetime
 import os
+from finding_sink import default_sink
+from resource_inventory import default_inventory, lazy_value
+from scan_scope import lazy_account_id
+from rate_limiter import map_rate_limited
 # import boto3 clients
-securityhub = boto3.client('securityhub')
-apigateway = boto3.client('apigateway')
-sts = boto3.client('sts')
+findingSink = default_sink()
+inventory = default_inventory()
 # create account id & region variables
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 awsRegion = os.environ['AWS_REGION']
 # loop through API Gateway rest apis
-response = apigateway.get_rest_apis(limit=500)
-myRestApis = response['items']
+myRestApis = inventory.lazy('apigateway', 'get_rest_apis', 'items', limit=500)
+# stages are fetched once per API from a small pool and shared by every check, the client governor
+# already holds API Gateway calls to its low control plane limit (ELECTRICEYE_RATE_LIMITS apigateway=...)
+stageWorkers = 4
+
+def rest_api_stages():
+    return map_rate_limited(
+        lambda apiGwApiId: inventory.get('apigateway', 'get_stages', 'item', restApiId=apiGwApiId),
+        [str(restapi['id']) for restapi in myRestApis],
+        None,
+        None,
+        stageWorkers
+    )
+
+myRestApiStages = lazy_value(rest_api_stages)
 
 def api_gateway_stage_metrics_enabled_check():
+    awsAccountId = accountId.get()
     for restapi in myRestApis:
         apiGwApiId = str(restapi['id'])
         apiGwApiName = str(restapi['name'])
-        response = apigateway.get_stages(restApiId=apiGwApiId)
-        for apistages in response['item']:
+        for apistages in myRestApiStages.get(apiGwApiId, []):
             apiStageName = str(apistages['stageName'])
             apiStageDeploymentId = str(apistages['deploymentId'])
             apiStageArn = 'arn:aws:apigateway:' + awsRegion + '::/restapis/' + apiGwApiId + '/stages/' + apiStageName
@@ -26,111 +41,105 @@ def api_gateway_stage_metrics_enabled_check():
                 try:
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': apiStageArn + '/apigateway-stage-metrics-enabled-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': apiStageArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 20 },
-                                'Confidence': 99,
-                                'Title': '[APIGateway.1] API Gateway Rest API Stages should have CloudWatch Metrics enabled',
-                                'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' does not have CloudWatch metrics enabled. Refer to the remediation instructions if this configuration is not intended',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your API Gateway stage should have CloudWatch Metrics enabled refer to the Monitor API Execution with Amazon CloudWatch section of the Amazon API Gateway Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/monitoring-cloudwatch.html'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'Other',
-                                        'Id': apiStageArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 
-                                                'deploymentId': apiStageDeploymentId,
-                                                'stageName': apiStageName
-                                            }
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': apiStageArn + '/apigateway-stage-metrics-enabled-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': apiStageArn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 20 },
+                            'Confidence': 99,
+                            'Title': '[APIGateway.1] API Gateway Rest API Stages should have CloudWatch Metrics enabled',
+                            'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' does not have CloudWatch metrics enabled. Refer to the remediation instructions if this configuration is not intended',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'If your API Gateway stage should have CloudWatch Metrics enabled refer to the Monitor API Execution with Amazon CloudWatch section of the Amazon API Gateway Developer Guide',
+                                    'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/monitoring-cloudwatch.html'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'Other',
+                                    'Id': apiStageArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 
+                                            'deploymentId': apiStageDeploymentId,
+                                            'stageName': apiStageName
                                         }
                                     }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'FAILED' },
+                            'RecordState': 'ACTIVE'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
             else:
                 try:
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': apiStageArn + '/apigateway-stage-metrics-enabled-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': apiStageArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[APIGateway.1] API Gateway Rest API Stages should have CloudWatch Metrics enabled',
-                                'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' has CloudWatch metrics enabled.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your API Gateway stage should have CloudWatch Metrics enabled refer to the Monitor API Execution with Amazon CloudWatch section of the Amazon API Gateway Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/monitoring-cloudwatch.html'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'Other',
-                                        'Id': apiStageArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 
-                                                'deploymentId': apiStageDeploymentId,
-                                                'stageName': apiStageName
-                                            }
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': apiStageArn + '/apigateway-stage-metrics-enabled-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': apiStageArn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 0 },
+                            'Confidence': 99,
+                            'Title': '[APIGateway.1] API Gateway Rest API Stages should have CloudWatch Metrics enabled',
+                            'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' has CloudWatch metrics enabled.',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'If your API Gateway stage should have CloudWatch Metrics enabled refer to the Monitor API Execution with Amazon CloudWatch section of the Amazon API Gateway Developer Guide',
+                                    'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/monitoring-cloudwatch.html'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'Other',
+                                    'Id': apiStageArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 
+                                            'deploymentId': apiStageDeploymentId,
+                                            'stageName': apiStageName
                                         }
                                     }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'PASSED' },
+                            'RecordState': 'ARCHIVED'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
 
 def api_gateway_stage_logging_check():
+    awsAccountId = accountId.get()
     for restapi in myRestApis:
         apiGwApiId = str(restapi['id'])
         apiGwApiName = str(restapi['name'])
-        response = apigateway.get_stages(restApiId=apiGwApiId)
-        for apistages in response['item']:
+        for apistages in myRestApiStages.get(apiGwApiId, []):
             apiStageName = str(apistages['stageName'])
             apiStageDeploymentId = str(apistages['deploymentId'])
             apiStageArn = 'arn:aws:apigateway:' + awsRegion + '::/restapis/' + apiGwApiId + '/stages/' + apiStageName
@@ -139,111 +148,105 @@ def api_gateway_stage_logging_check():
                 try:
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': apiStageArn + '/apigateway-stage-api-logging-enabled-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': apiStageArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 20 },
-                                'Confidence': 99,
-                                'Title': '[APIGateway.2] API Gateway Rest API Stages should have CloudWatch API Logging enabled',
-                                'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' does not have CloudWatch API Logging enabled. Refer to the remediation instructions if this configuration is not intended',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your API Gateway stage should have CloudWatch API Logging enabled refer to the Set Up CloudWatch API Logging in API Gateway section of the Amazon API Gateway Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/set-up-logging.html'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'Other',
-                                        'Id': apiStageArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 
-                                                'deploymentId': apiStageDeploymentId,
-                                                'stageName': apiStageName
-                                            }
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': apiStageArn + '/apigateway-stage-api-logging-enabled-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': apiStageArn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 20 },
+                            'Confidence': 99,
+                            'Title': '[APIGateway.2] API Gateway Rest API Stages should have CloudWatch API Logging enabled',
+                            'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' does not have CloudWatch API Logging enabled. Refer to the remediation instructions if this configuration is not intended',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'If your API Gateway stage should have CloudWatch API Logging enabled refer to the Set Up CloudWatch API Logging in API Gateway section of the Amazon API Gateway Developer Guide',
+                                    'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/set-up-logging.html'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'Other',
+                                    'Id': apiStageArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 
+                                            'deploymentId': apiStageDeploymentId,
+                                            'stageName': apiStageName
                                         }
                                     }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'FAILED' },
+                            'RecordState': 'ACTIVE'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
             else:
                 try:
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': apiStageArn + '/apigateway-stage-api-logging-enabled-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': apiStageArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[APIGateway.2] API Gateway Rest API Stages should have CloudWatch API Logging enabled',
-                                'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' has CloudWatch API Logging enabled.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your API Gateway stage should have CloudWatch API Logging enabled refer to the Set Up CloudWatch API Logging in API Gateway section of the Amazon API Gateway Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/set-up-logging.html'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'Other',
-                                        'Id': apiStageArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 
-                                                'deploymentId': apiStageDeploymentId,
-                                                'stageName': apiStageName
-                                            }
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': apiStageArn + '/apigateway-stage-api-logging-enabled-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': apiStageArn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 0 },
+                            'Confidence': 99,
+                            'Title': '[APIGateway.2] API Gateway Rest API Stages should have CloudWatch API Logging enabled',
+                            'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' has CloudWatch API Logging enabled.',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'If your API Gateway stage should have CloudWatch API Logging enabled refer to the Set Up CloudWatch API Logging in API Gateway section of the Amazon API Gateway Developer Guide',
+                                    'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/set-up-logging.html'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'Other',
+                                    'Id': apiStageArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 
+                                            'deploymentId': apiStageDeploymentId,
+                                            'stageName': apiStageName
                                         }
                                     }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'PASSED' },
+                            'RecordState': 'ARCHIVED'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
 
 def api_gateway_stage_caching_enabled_check():
+    awsAccountId = accountId.get()
     for restapi in myRestApis:
         apiGwApiId = str(restapi['id'])
         apiGwApiName = str(restapi['name'])
-        response = apigateway.get_stages(restApiId=apiGwApiId)
-        for apistages in response['item']:
+        for apistages in myRestApiStages.get(apiGwApiId, []):
             apiStageName = str(apistages['stageName'])
             apiStageDeploymentId = str(apistages['deploymentId'])
             apiStageArn = 'arn:aws:apigateway:' + awsRegion + '::/restapis/' + apiGwApiId + '/stages/' + apiStageName
@@ -252,111 +255,105 @@ def api_gateway_stage_caching_enabled_check():
                 try:
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': apiStageArn + '/apigateway-stage-caching-enabled-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': apiStageArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 20 },
-                                'Confidence': 99,
-                                'Title': '[APIGateway.3] API Gateway Rest API Stages should have Caching enabled',
-                                'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' does not have Caching enabled. Refer to the remediation instructions if this configuration is not intended',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your API Gateway stage should have caching enabled refer to the Enable API Caching to Enhance Responsiveness section of the Amazon API Gateway Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/api-gateway-caching.html'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'Other',
-                                        'Id': apiStageArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 
-                                                'deploymentId': apiStageDeploymentId,
-                                                'stageName': apiStageName
-                                            }
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': apiStageArn + '/apigateway-stage-caching-enabled-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': apiStageArn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 20 },
+                            'Confidence': 99,
+                            'Title': '[APIGateway.3] API Gateway Rest API Stages should have Caching enabled',
+                            'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' does not have Caching enabled. Refer to the remediation instructions if this configuration is not intended',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'If your API Gateway stage should have caching enabled refer to the Enable API Caching to Enhance Responsiveness section of the Amazon API Gateway Developer Guide',
+                                    'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/api-gateway-caching.html'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'Other',
+                                    'Id': apiStageArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 
+                                            'deploymentId': apiStageDeploymentId,
+                                            'stageName': apiStageName
                                         }
                                     }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'FAILED' },
+                            'RecordState': 'ACTIVE'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
             else:
                 try:
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': apiStageArn + '/apigateway-stage-caching-enabled-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': apiStageArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[APIGateway.3] API Gateway Rest API Stages should have Caching enabled',
-                                'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' has Caching enabled.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your API Gateway stage should have caching enabled refer to the Enable API Caching to Enhance Responsiveness section of the Amazon API Gateway Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/api-gateway-caching.html'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'Other',
-                                        'Id': apiStageArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 
-                                                'deploymentId': apiStageDeploymentId,
-                                                'stageName': apiStageName
-                                            }
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': apiStageArn + '/apigateway-stage-caching-enabled-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': apiStageArn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 0 },
+                            'Confidence': 99,
+                            'Title': '[APIGateway.3] API Gateway Rest API Stages should have Caching enabled',
+                            'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' has Caching enabled.',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'If your API Gateway stage should have caching enabled refer to the Enable API Caching to Enhance Responsiveness section of the Amazon API Gateway Developer Guide',
+                                    'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/api-gateway-caching.html'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'Other',
+                                    'Id': apiStageArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 
+                                            'deploymentId': apiStageDeploymentId,
+                                            'stageName': apiStageName
                                         }
                                     }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'PASSED' },
+                            'RecordState': 'ARCHIVED'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
 
 def api_gateway_stage_cache_encryption_check():
+    awsAccountId = accountId.get()
     for restapi in myRestApis:
         apiGwApiId = str(restapi['id'])
         apiGwApiName = str(restapi['name'])
-        response = apigateway.get_stages(restApiId=apiGwApiId)
-        for apistages in response['item']:
+        for apistages in myRestApiStages.get(apiGwApiId, []):
             apiStageName = str(apistages['stageName'])
             apiStageDeploymentId = str(apistages['deploymentId'])
             apiStageArn = 'arn:aws:apigateway:' + awsRegion + '::/restapis/' + apiGwApiId + '/stages/' + apiStageName
@@ -365,117 +362,111 @@ def api_gateway_stage_cache_encryption_check():
                 try:
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': apiStageArn + '/apigateway-stage-cache-encryption-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': apiStageArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 80 },
-                                'Confidence': 99,
-                                'Title': '[APIGateway.4] API Gateway Rest API Stages should have cache encryption enabled',
-                                'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' does not have cache encryption enabled. Refer to the remediation instructions if this configuration is not intended',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your API Gateway stage should have caching encryption enabled refer to the Override API Gateway Stage-Level Caching for Method Caching section of the Amazon API Gateway Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/api-gateway-caching.html#override-api-gateway-stage-cache-for-method-cache'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'Other',
-                                        'Id': apiStageArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 
-                                                'deploymentId': apiStageDeploymentId,
-                                                'stageName': apiStageName
-                                            }
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': apiStageArn + '/apigateway-stage-cache-encryption-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': apiStageArn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [
+                                'Software and Configuration Checks/AWS Security Best Practices',
+                                'Effects/Data Exposure'
+                            ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 80 },
+                            'Confidence': 99,
+                            'Title': '[APIGateway.4] API Gateway Rest API Stages should have cache encryption enabled',
+                            'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' does not have cache encryption enabled. Refer to the remediation instructions if this configuration is not intended',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'If your API Gateway stage should have caching encryption enabled refer to the Override API Gateway Stage-Level Caching for Method Caching section of the Amazon API Gateway Developer Guide',
+                                    'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/api-gateway-caching.html#override-api-gateway-stage-cache-for-method-cache'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'Other',
+                                    'Id': apiStageArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 
+                                            'deploymentId': apiStageDeploymentId,
+                                            'stageName': apiStageName
                                         }
                                     }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'FAILED' },
+                            'RecordState': 'ACTIVE'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
             else:
                 try:
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': apiStageArn + '/apigateway-stage-cache-encryption-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': apiStageArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[APIGateway.4] API Gateway Rest API Stages should have cache encryption enabled',
-                                'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' has cache encryption enabled.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your API Gateway stage should have caching encryption enabled refer to the Override API Gateway Stage-Level Caching for Method Caching section of the Amazon API Gateway Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/api-gateway-caching.html#override-api-gateway-stage-cache-for-method-cache'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'Other',
-                                        'Id': apiStageArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 
-                                                'deploymentId': apiStageDeploymentId,
-                                                'stageName': apiStageName
-                                            }
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': apiStageArn + '/apigateway-stage-cache-encryption-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': apiStageArn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [
+                                'Software and Configuration Checks/AWS Security Best Practices',
+                                'Effects/Data Exposure'
+                            ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 0 },
+                            'Confidence': 99,
+                            'Title': '[APIGateway.4] API Gateway Rest API Stages should have cache encryption enabled',
+                            'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' has cache encryption enabled.',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'If your API Gateway stage should have caching encryption enabled refer to the Override API Gateway Stage-Level Caching for Method Caching section of the Amazon API Gateway Developer Guide',
+                                    'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/api-gateway-caching.html#override-api-gateway-stage-cache-for-method-cache'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'Other',
+                                    'Id': apiStageArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 
+                                            'deploymentId': apiStageDeploymentId,
+                                            'stageName': apiStageName
                                         }
                                     }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'PASSED' },
+                            'RecordState': 'ARCHIVED'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
 
 def api_gateway_stage_xray_tracing_check():
+    awsAccountId = accountId.get()
     for restapi in myRestApis:
         apiGwApiId = str(restapi['id'])
         apiGwApiName = str(restapi['name'])
-        response = apigateway.get_stages(restApiId=apiGwApiId)
-        for apistages in response['item']:
+        for apistages in myRestApiStages.get(apiGwApiId, []):
             apiStageName = str(apistages['stageName'])
             apiStageDeploymentId = str(apistages['deploymentId'])
             apiStageArn = 'arn:aws:apigateway:' + awsRegion + '::/restapis/' + apiGwApiId + '/stages/' + apiStageName
@@ -484,111 +475,105 @@ def api_gateway_stage_xray_tracing_check():
                 try:
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': apiStageArn + '/apigateway-stage-xray-tracing-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': apiStageArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 20 },
-                                'Confidence': 99,
-                                'Title': '[APIGateway.5] API Gateway Rest API Stages should have tracing enabled',
-                                'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' does not have tracing enabled. Refer to the remediation instructions if this configuration is not intended',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your API Gateway stage should have tracing enabled refer to the Set Up X-Ray Tracing in API Gateway section of the Amazon API Gateway Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/apigateway-set-up-tracing.html'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'Other',
-                                        'Id': apiStageArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 
-                                                'deploymentId': apiStageDeploymentId,
-                                                'stageName': apiStageName
-                                            }
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': apiStageArn + '/apigateway-stage-xray-tracing-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': apiStageArn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 20 },
+                            'Confidence': 99,
+                            'Title': '[APIGateway.5] API Gateway Rest API Stages should have tracing enabled',
+                            'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' does not have tracing enabled. Refer to the remediation instructions if this configuration is not intended',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'If your API Gateway stage should have tracing enabled refer to the Set Up X-Ray Tracing in API Gateway section of the Amazon API Gateway Developer Guide',
+                                    'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/apigateway-set-up-tracing.html'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'Other',
+                                    'Id': apiStageArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 
+                                            'deploymentId': apiStageDeploymentId,
+                                            'stageName': apiStageName
                                         }
                                     }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'FAILED' },
+                            'RecordState': 'ACTIVE'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
             else:
                 try:
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': apiStageArn + '/apigateway-stage-xray-tracing-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': apiStageArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[APIGateway.5] API Gateway Rest API Stages should have tracing enabled',
-                                'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' has tracing enabled.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your API Gateway stage should have tracing enabled refer to the Set Up X-Ray Tracing in API Gateway section of the Amazon API Gateway Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/apigateway-set-up-tracing.html'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'Other',
-                                        'Id': apiStageArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 
-                                                'deploymentId': apiStageDeploymentId,
-                                                'stageName': apiStageName
-                                            }
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': apiStageArn + '/apigateway-stage-xray-tracing-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': apiStageArn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 0 },
+                            'Confidence': 99,
+                            'Title': '[APIGateway.5] API Gateway Rest API Stages should have tracing enabled',
+                            'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' has tracing enabled.',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'If your API Gateway stage should have tracing enabled refer to the Set Up X-Ray Tracing in API Gateway section of the Amazon API Gateway Developer Guide',
+                                    'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/apigateway-set-up-tracing.html'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'Other',
+                                    'Id': apiStageArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 
+                                            'deploymentId': apiStageDeploymentId,
+                                            'stageName': apiStageName
                                         }
                                     }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'PASSED' },
+                            'RecordState': 'ARCHIVED'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
 
 def api_gateway_stage_waf_check_check():
+    awsAccountId = accountId.get()
     for restapi in myRestApis:
         apiGwApiId = str(restapi['id'])
         apiGwApiName = str(restapi['name'])
-        response = apigateway.get_stages(restApiId=apiGwApiId)
-        for apistages in response['item']:
+        for apistages in myRestApiStages.get(apiGwApiId, []):
             apiStageName = str(apistages['stageName'])
             apiStageDeploymentId = str(apistages['deploymentId'])
             apiStageArn = 'arn:aws:apigateway:' + awsRegion + '::/restapis/' + apiGwApiId + '/stages/' + apiStageName
@@ -598,8 +583,59 @@ def api_gateway_stage_waf_check_check():
                 try:
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': apiStageArn + '/apigateway-stage-waf-protection-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': apiStageArn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [
+                                'Software and Configuration Checks/AWS Security Best Practices',
+                                'Effects/Data Exposure'
+                            ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 0 },
+                            'Confidence': 99,
+                            'Title': '[APIGateway.6] API Gateway Rest API Stages should be protected by an AWS WAF Web ACL',
+                            'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' is protected by an AWS WAF Web ACL.',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'If your API Gateway stage should be protected by WAF refer to the Set Up AWS WAF in API Gateway section of the Amazon API Gateway Developer Guide',
+                                    'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/apigateway-setup-waf.html'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'Other',
+                                    'Id': apiStageArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 
+                                            'deploymentId': apiStageDeploymentId,
+                                            'stageName': apiStageName
+                                        }
+                                    }
+                                }
+                            ],
+                            'Compliance': { 'Status': 'PASSED' },
+                            'RecordState': 'ARCHIVED'
+                        }
+                    )
+                except Exception as e:
+                    print(e)
+            except Exception as e:
+                if str(e) == "'webAclArn'":
+                    try:
+                        # ISO Time
+                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                        findingSink.put(
                             {
                                 'SchemaVersion': '2018-10-08',
                                 'Id': apiStageArn + '/apigateway-stage-waf-protection-check',
@@ -613,10 +649,10 @@ def api_gateway_stage_waf_check_check():
                                 'FirstObservedAt': iso8601Time,
                                 'CreatedAt': iso8601Time,
                                 'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
+                                'Severity': { 'Normalized': 80 },
                                 'Confidence': 99,
                                 'Title': '[APIGateway.6] API Gateway Rest API Stages should be protected by an AWS WAF Web ACL',
-                                'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' is protected by an AWS WAF Web ACL.',
+                                'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' is not protected by an AWS WAF Web ACL. Refer to the remediation instructions if this configuration is not intended',
                                 'Remediation': {
                                     'Recommendation': {
                                         'Text': 'If your API Gateway stage should be protected by WAF refer to the Set Up AWS WAF in API Gateway section of the Amazon API Gateway Developer Guide',
@@ -640,67 +676,10 @@ def api_gateway_stage_waf_check_check():
                                         }
                                     }
                                 ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
+                                'Compliance': { 'Status': 'FAILED' },
+                                'RecordState': 'ACTIVE'
                             }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-            except Exception as e:
-                if str(e) == "'webAclArn'":
-                    try:
-                        # ISO Time
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': apiStageArn + '/apigateway-stage-waf-protection-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': apiStageArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 80 },
-                                    'Confidence': 99,
-                                    'Title': '[APIGateway.6] API Gateway Rest API Stages should be protected by an AWS WAF Web ACL',
-                                    'Description': 'API Gateway stage ' + apiStageName + ' for Rest API ' + apiGwApiName + ' is not protected by an AWS WAF Web ACL. Refer to the remediation instructions if this configuration is not intended',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'If your API Gateway stage should be protected by WAF refer to the Set Up AWS WAF in API Gateway section of the Amazon API Gateway Developer Guide',
-                                            'Url': 'https://docs.aws.amazon.com/apigateway/latest/developerguide/apigateway-setup-waf.html'
-                                        }
-                                    },
-                                    'ProductFields': {
-                                        'Product Name': 'ElectricEye'
-                                    },
-                                    'Resources': [
-                                        {
-                                            'Type': 'Other',
-                                            'Id': apiStageArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'Other': { 
-                                                    'deploymentId': apiStageDeploymentId,
-                                                    'stageName': apiStageName
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
                         )
-                        print(response)
                     except Exception as e:
                         print(e)
                 else:
@@ -714,4 +693,5 @@ def api_gateway_auditor():
     api_gateway_stage_xray_tracing_check()
     api_gateway_stage_waf_check_check()
 
-api_gateway_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    api_gateway_auditor()
\ No newline at end of file
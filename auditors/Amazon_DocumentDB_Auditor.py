@@ -13,29 +13,33 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import datetime
 import os
+from finding_sink import default_sink
+from resource_inventory import default_inventory
+from scan_scope import lazy_account_id, lazy_client
 # import boto3 clients
-securityhub = boto3.client('securityhub')
-documentdb = boto3.client('docdb')
-sts = boto3.client('sts')
+findingSink = default_sink()
+inventory = default_inventory()
+documentdb = lazy_client('docdb')
 # create account id & region variables
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 awsRegion = os.environ['AWS_REGION']
 # find document db instances
-response = documentdb.describe_db_instances(
+myDocDbs = inventory.lazy(
+    'docdb',
+    'describe_db_instances',
+    'DBInstances',
     Filters=[
         {
             'Name': 'engine',
             'Values': [ 'docdb' ]
         }
-    ],
-    MaxRecords=100
+    ]
 )
-myDocDbs = response['DBInstances']
 
 def docdb_public_instance_check():   
+    awsAccountId = accountId.get()
     for docdb in myDocDbs:
         docdbId = str(docdb['DBInstanceIdentifier'])
         docdbArn = str(docdb['DBInstanceArn'])
@@ -45,51 +49,48 @@ def docdb_public_instance_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': docdbArn + '/docdb-public-access',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': docdbArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 80 },
-                            'Confidence': 99,
-                            'Title': '[DocDb.1] DocumentDB instances should not be exposed to the public',
-                            'Description': 'DocumentDB instance ' + docdbId + ' is exposed to the public. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your DocumentDB is not intended to be public refer to the Connecting to an Amazon DocumentDB Cluster from Outside an Amazon VPC section in the Amazon DocumentDB Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/connect-from-outside-a-vpc.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': docdbArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'InstanceId': docdbId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': docdbArn + '/docdb-public-access',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': docdbArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [
+                            'Software and Configuration Checks/AWS Security Best Practices',
+                            'Effects/Data Exposure'
+                        ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 80 },
+                        'Confidence': 99,
+                        'Title': '[DocDb.1] DocumentDB instances should not be exposed to the public',
+                        'Description': 'DocumentDB instance ' + docdbId + ' is exposed to the public. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your DocumentDB is not intended to be public refer to the Connecting to an Amazon DocumentDB Cluster from Outside an Amazon VPC section in the Amazon DocumentDB Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/connect-from-outside-a-vpc.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': docdbArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'InstanceId': docdbId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
@@ -97,55 +98,53 @@ def docdb_public_instance_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': docdbArn + '/docdb-public-access',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': docdbArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[DocDb.1] DocumentDB instances should not be exposed to the public',
-                            'Description': 'DocumentDB instance ' + docdbId + ' is not exposed to the public.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your DocumentDB is not intended to be public refer to the Connecting to an Amazon DocumentDB Cluster from Outside an Amazon VPC section in the Amazon DocumentDB Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/connect-from-outside-a-vpc.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': docdbArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'InstanceId': docdbId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': docdbArn + '/docdb-public-access',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': docdbArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [
+                            'Software and Configuration Checks/AWS Security Best Practices',
+                            'Effects/Data Exposure'
+                        ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[DocDb.1] DocumentDB instances should not be exposed to the public',
+                        'Description': 'DocumentDB instance ' + docdbId + ' is not exposed to the public.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your DocumentDB is not intended to be public refer to the Connecting to an Amazon DocumentDB Cluster from Outside an Amazon VPC section in the Amazon DocumentDB Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/connect-from-outside-a-vpc.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': docdbArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'InstanceId': docdbId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def docdb_instance_encryption_check():
+    awsAccountId = accountId.get()
     for docdb in myDocDbs:
         docdbId = str(docdb['DBInstanceIdentifier'])
         docdbArn = str(docdb['DBInstanceArn'])
@@ -155,51 +154,48 @@ def docdb_instance_encryption_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': docdbArn + '/docdb-encryption-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': docdbArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 80 },
-                            'Confidence': 99,
-                            'Title': '[DocDb.2] DocumentDB instances should be encrypted',
-                            'Description': 'DocumentDB instance ' + docdbId + ' is not encrypted. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your DocumentDB is not intended to be unencrypted refer to Encrypting Amazon DocumentDB Data at Rest in the Amazon DocumentDB Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/encryption-at-rest.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': docdbArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'InstanceId': docdbId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': docdbArn + '/docdb-encryption-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': docdbArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [
+                            'Software and Configuration Checks/AWS Security Best Practices',
+                            'Effects/Data Exposure'
+                        ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 80 },
+                        'Confidence': 99,
+                        'Title': '[DocDb.2] DocumentDB instances should be encrypted',
+                        'Description': 'DocumentDB instance ' + docdbId + ' is not encrypted. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your DocumentDB is not intended to be unencrypted refer to Encrypting Amazon DocumentDB Data at Rest in the Amazon DocumentDB Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/encryption-at-rest.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': docdbArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'InstanceId': docdbId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
@@ -207,55 +203,53 @@ def docdb_instance_encryption_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': docdbArn + '/docdb-encryption-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': docdbArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[DocDb.2] DocumentDB instances should be encrypted',
-                            'Description': 'DocumentDB instance ' + docdbId + ' is encrypted.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your DocumentDB is not intended to be unencrypted refer to Encrypting Amazon DocumentDB Data at Rest in the Amazon DocumentDB Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/encryption-at-rest.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': docdbArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'InstanceId': docdbId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': docdbArn + '/docdb-encryption-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': docdbArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [
+                            'Software and Configuration Checks/AWS Security Best Practices',
+                            'Effects/Data Exposure'
+                        ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[DocDb.2] DocumentDB instances should be encrypted',
+                        'Description': 'DocumentDB instance ' + docdbId + ' is encrypted.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your DocumentDB is not intended to be unencrypted refer to Encrypting Amazon DocumentDB Data at Rest in the Amazon DocumentDB Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/encryption-at-rest.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': docdbArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'InstanceId': docdbId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def docdb_instance_audit_logging_check():
+    awsAccountId = accountId.get()
     for docdb in myDocDbs:
         docdbId = str(docdb['DBInstanceIdentifier'])
         docdbArn = str(docdb['DBInstanceArn'])
@@ -266,48 +260,45 @@ def docdb_instance_audit_logging_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': docdbArn + '/docdb-instance-audit-logging-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': docdbArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[DocDb.3] DocumentDB instances should have audit logging configured',
-                            'Description': 'DocumentDB instance ' + docdbId + ' has audit logging configured.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For information on DocumentDB audit logging refer to the Auditing Amazon DocumentDB Events section in the Amazon DocumentDB Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/event-auditing.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': docdbArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'InstanceId': docdbId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': docdbArn + '/docdb-instance-audit-logging-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': docdbArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[DocDb.3] DocumentDB instances should have audit logging configured',
+                        'Description': 'DocumentDB instance ' + docdbId + ' has audit logging configured.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For information on DocumentDB audit logging refer to the Auditing Amazon DocumentDB Events section in the Amazon DocumentDB Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/event-auditing.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': docdbArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'InstanceId': docdbId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         except:
@@ -315,52 +306,50 @@ def docdb_instance_audit_logging_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': docdbArn + '/docdb-instance-audit-logging-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': docdbArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 20 },
-                            'Confidence': 99,
-                            'Title': '[DocDb.3] DocumentDB instances should have audit logging configured',
-                            'Description': 'DocumentDB instance ' + docdbId + ' does not have audit logging configured. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For information on DocumentDB audit logging refer to the Auditing Amazon DocumentDB Events section in the Amazon DocumentDB Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/event-auditing.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': docdbArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'InstanceId': docdbId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': docdbArn + '/docdb-instance-audit-logging-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': docdbArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 20 },
+                        'Confidence': 99,
+                        'Title': '[DocDb.3] DocumentDB instances should have audit logging configured',
+                        'Description': 'DocumentDB instance ' + docdbId + ' does not have audit logging configured. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For information on DocumentDB audit logging refer to the Auditing Amazon DocumentDB Events section in the Amazon DocumentDB Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/event-auditing.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': docdbArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'InstanceId': docdbId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def docdb_cluster_multiaz_check():
+    awsAccountId = accountId.get()
     # find document db clusters
     response = documentdb.describe_db_clusters(MaxRecords=100)
     myDocDbClusters = response['DBClusters']
@@ -373,48 +362,45 @@ def docdb_cluster_multiaz_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': docdbClusterArn + '/docdb-cluster-multi-az-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': docdbclusterId,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 20 },
-                            'Confidence': 99,
-                            'Title': '[DocDb.4] DocumentDB clusters should be configured for Multi-AZ',
-                            'Description': 'DocumentDB cluster ' + docdbclusterId + ' is not configured for Multi-AZ. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your DocumentDB cluster should be in Multi-AZ configuration refer to the Understanding Amazon DocumentDB Cluster Fault Tolerance section in the Amazon DocumentDB Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/db-cluster-fault-tolerance.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': docdbClusterArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'ClusterId': docdbclusterId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': docdbClusterArn + '/docdb-cluster-multi-az-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': docdbclusterId,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 20 },
+                        'Confidence': 99,
+                        'Title': '[DocDb.4] DocumentDB clusters should be configured for Multi-AZ',
+                        'Description': 'DocumentDB cluster ' + docdbclusterId + ' is not configured for Multi-AZ. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your DocumentDB cluster should be in Multi-AZ configuration refer to the Understanding Amazon DocumentDB Cluster Fault Tolerance section in the Amazon DocumentDB Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/db-cluster-fault-tolerance.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': docdbClusterArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'ClusterId': docdbclusterId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
@@ -422,52 +408,50 @@ def docdb_cluster_multiaz_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': docdbClusterArn + '/docdb-cluster-multi-az-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': docdbClusterArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[DocDb.4] DocumentDB clusters should be configured for Multi-AZ',
-                            'Description': 'DocumentDB cluster ' + docdbclusterId + ' is configured for Multi-AZ.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your DocumentDB cluster should be in Multi-AZ configuration refer to the Understanding Amazon DocumentDB Cluster Fault Tolerance section in the Amazon DocumentDB Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/db-cluster-fault-tolerance.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': docdbClusterArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'ClusterId': docdbclusterId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': docdbClusterArn + '/docdb-cluster-multi-az-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': docdbClusterArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[DocDb.4] DocumentDB clusters should be configured for Multi-AZ',
+                        'Description': 'DocumentDB cluster ' + docdbclusterId + ' is configured for Multi-AZ.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your DocumentDB cluster should be in Multi-AZ configuration refer to the Understanding Amazon DocumentDB Cluster Fault Tolerance section in the Amazon DocumentDB Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/db-cluster-fault-tolerance.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': docdbClusterArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'ClusterId': docdbclusterId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def docdb_cluster_deletion_protection_check():
+    awsAccountId = accountId.get()
     # find document db instances
     response = documentdb.describe_db_clusters(MaxRecords=100)
     myDocDbClusters = response['DBClusters']
@@ -480,48 +464,45 @@ def docdb_cluster_deletion_protection_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': docdbClusterArn + '/docdb-cluster-deletion-protection-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': docdbClusterArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 20 },
-                            'Confidence': 99,
-                            'Title': '[DocDb.5] DocumentDB clusters should have deletion protection enabled',
-                            'Description': 'DocumentDB cluster ' + docdbclusterId + ' does not have deletion protection enabled. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your DocumentDB cluster should have deletion protection enabled refer to the Deletion Protection section in the Amazon DocumentDB Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/db-cluster-delete.html#db-cluster-deletion-protection'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': docdbClusterArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'ClusterId': docdbclusterId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': docdbClusterArn + '/docdb-cluster-deletion-protection-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': docdbClusterArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 20 },
+                        'Confidence': 99,
+                        'Title': '[DocDb.5] DocumentDB clusters should have deletion protection enabled',
+                        'Description': 'DocumentDB cluster ' + docdbclusterId + ' does not have deletion protection enabled. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your DocumentDB cluster should have deletion protection enabled refer to the Deletion Protection section in the Amazon DocumentDB Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/db-cluster-delete.html#db-cluster-deletion-protection'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': docdbClusterArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'ClusterId': docdbclusterId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
@@ -529,52 +510,50 @@ def docdb_cluster_deletion_protection_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': docdbClusterArn + '/docdb-cluster-deletion-protection-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': docdbClusterArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[DocDb.5] DocumentDB clusters should have deletion protection enabled',
-                            'Description': 'DocumentDB cluster ' + docdbclusterId + ' has deletion protection enabled.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your DocumentDB cluster should have deletion protection enabled refer to the Deletion Protection section in the Amazon DocumentDB Developer Guide',
-                                    'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/db-cluster-delete.html#db-cluster-deletion-protection'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': docdbClusterArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'ClusterId': docdbclusterId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': docdbClusterArn + '/docdb-cluster-deletion-protection-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': docdbClusterArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[DocDb.5] DocumentDB clusters should have deletion protection enabled',
+                        'Description': 'DocumentDB cluster ' + docdbclusterId + ' has deletion protection enabled.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your DocumentDB cluster should have deletion protection enabled refer to the Deletion Protection section in the Amazon DocumentDB Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/db-cluster-delete.html#db-cluster-deletion-protection'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': docdbClusterArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'ClusterId': docdbclusterId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def documentdb_parameter_group_audit_log_check():
+    awsAccountId = accountId.get()
     response = documentdb.describe_db_cluster_parameter_groups()
     dbClusterParameters = response['DBClusterParameterGroups']
     for parametergroup in dbClusterParameters:
@@ -590,48 +569,45 @@ def documentdb_parameter_group_audit_log_check():
                             # ISO Time
                             iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                             # create Sec Hub finding
-                            response = securityhub.batch_import_findings(
-                                Findings=[
-                                    {
-                                        'SchemaVersion': '2018-10-08',
-                                        'Id': parameterGroupArn + '/docdb-cluster-parameter-audit-logging-check',
-                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                        'GeneratorId': parameterGroupArn,
-                                        'AwsAccountId': awsAccountId,
-                                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                        'FirstObservedAt': iso8601Time,
-                                        'CreatedAt': iso8601Time,
-                                        'UpdatedAt': iso8601Time,
-                                        'Severity': { 'Normalized': 40 },
-                                        'Confidence': 99,
-                                        'Title': '[DocDb.6] DocumentDB cluster parameter groups should enforce audit logging for DocumentDB databases',
-                                        'Description': 'DocumentDB cluster parameter group ' + parameterGroupName + ' does not enforce audit logging. Refer to the remediation instructions to remediate this behavior',
-                                        'Remediation': {
-                                            'Recommendation': {
-                                                'Text': 'If your DocumentDB cluster should have audit logging enabled refer to the Enabling Auditing section in the Amazon DocumentDB Developer Guide',
-                                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/event-auditing.html#event-auditing-enabling-auditing'
-                                            }
-                                        },
-                                        'ProductFields': {
-                                            'Product Name': 'ElectricEye'
-                                        },
-                                        'Resources': [
-                                            {
-                                                'Type': 'Other',
-                                                'Id': parameterGroupArn,
-                                                'Partition': 'aws',
-                                                'Region': awsRegion,
-                                                'Details': {
-                                                    'Other': { 'ParameterGroupName': parameterGroupName }
-                                                }
+                            findingSink.put(
+                                {
+                                    'SchemaVersion': '2018-10-08',
+                                    'Id': parameterGroupArn + '/docdb-cluster-parameter-audit-logging-check',
+                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                    'GeneratorId': parameterGroupArn,
+                                    'AwsAccountId': awsAccountId,
+                                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                    'FirstObservedAt': iso8601Time,
+                                    'CreatedAt': iso8601Time,
+                                    'UpdatedAt': iso8601Time,
+                                    'Severity': { 'Normalized': 40 },
+                                    'Confidence': 99,
+                                    'Title': '[DocDb.6] DocumentDB cluster parameter groups should enforce audit logging for DocumentDB databases',
+                                    'Description': 'DocumentDB cluster parameter group ' + parameterGroupName + ' does not enforce audit logging. Refer to the remediation instructions to remediate this behavior',
+                                    'Remediation': {
+                                        'Recommendation': {
+                                            'Text': 'If your DocumentDB cluster should have audit logging enabled refer to the Enabling Auditing section in the Amazon DocumentDB Developer Guide',
+                                            'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/event-auditing.html#event-auditing-enabling-auditing'
+                                        }
+                                    },
+                                    'ProductFields': {
+                                        'Product Name': 'ElectricEye'
+                                    },
+                                    'Resources': [
+                                        {
+                                            'Type': 'Other',
+                                            'Id': parameterGroupArn,
+                                            'Partition': 'aws',
+                                            'Region': awsRegion,
+                                            'Details': {
+                                                'Other': { 'ParameterGroupName': parameterGroupName }
                                             }
-                                        ],
-                                        'Compliance': { 'Status': 'FAILED' },
-                                        'RecordState': 'ACTIVE'
-                                    }
-                                ]
+                                        }
+                                    ],
+                                    'Compliance': { 'Status': 'FAILED' },
+                                    'RecordState': 'ACTIVE'
+                                }
                             )
-                            print(response)
                         except Exception as e:
                             print(e)
                     else:
@@ -639,48 +615,45 @@ def documentdb_parameter_group_audit_log_check():
                             # ISO Time
                             iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                             # create Sec Hub finding
-                            response = securityhub.batch_import_findings(
-                                Findings=[
-                                    {
-                                        'SchemaVersion': '2018-10-08',
-                                        'Id': parameterGroupArn + '/docdb-cluster-parameter-audit-logging-check',
-                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                        'GeneratorId': parameterGroupArn,
-                                        'AwsAccountId': awsAccountId,
-                                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                        'FirstObservedAt': iso8601Time,
-                                        'CreatedAt': iso8601Time,
-                                        'UpdatedAt': iso8601Time,
-                                        'Severity': { 'Normalized': 0 },
-                                        'Confidence': 99,
-                                        'Title': '[DocDb.6] DocumentDB cluster parameter groups should enforce audit logging for DocumentDB databases',
-                                        'Description': 'DocumentDB cluster parameter group ' + parameterGroupName + ' enforces audit logging.',
-                                        'Remediation': {
-                                            'Recommendation': {
-                                                'Text': 'If your DocumentDB cluster should have audit logging enabled refer to the Enabling Auditing section in the Amazon DocumentDB Developer Guide',
-                                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/event-auditing.html#event-auditing-enabling-auditing'
-                                            }
-                                        },
-                                        'ProductFields': {
-                                            'Product Name': 'ElectricEye'
-                                        },
-                                        'Resources': [
-                                            {
-                                                'Type': 'Other',
-                                                'Id': parameterGroupArn,
-                                                'Partition': 'aws',
-                                                'Region': awsRegion,
-                                                'Details': {
-                                                    'Other': { 'ParameterGroupName': parameterGroupName }
-                                                }
+                            findingSink.put(
+                                {
+                                    'SchemaVersion': '2018-10-08',
+                                    'Id': parameterGroupArn + '/docdb-cluster-parameter-audit-logging-check',
+                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                    'GeneratorId': parameterGroupArn,
+                                    'AwsAccountId': awsAccountId,
+                                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                    'FirstObservedAt': iso8601Time,
+                                    'CreatedAt': iso8601Time,
+                                    'UpdatedAt': iso8601Time,
+                                    'Severity': { 'Normalized': 0 },
+                                    'Confidence': 99,
+                                    'Title': '[DocDb.6] DocumentDB cluster parameter groups should enforce audit logging for DocumentDB databases',
+                                    'Description': 'DocumentDB cluster parameter group ' + parameterGroupName + ' enforces audit logging.',
+                                    'Remediation': {
+                                        'Recommendation': {
+                                            'Text': 'If your DocumentDB cluster should have audit logging enabled refer to the Enabling Auditing section in the Amazon DocumentDB Developer Guide',
+                                            'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/event-auditing.html#event-auditing-enabling-auditing'
+                                        }
+                                    },
+                                    'ProductFields': {
+                                        'Product Name': 'ElectricEye'
+                                    },
+                                    'Resources': [
+                                        {
+                                            'Type': 'Other',
+                                            'Id': parameterGroupArn,
+                                            'Partition': 'aws',
+                                            'Region': awsRegion,
+                                            'Details': {
+                                                'Other': { 'ParameterGroupName': parameterGroupName }
                                             }
-                                        ],
-                                        'Compliance': { 'Status': 'PASSED' },
-                                        'RecordState': 'ARCHIVED'
-                                    }
-                                ]
+                                        }
+                                    ],
+                                    'Compliance': { 'Status': 'PASSED' },
+                                    'RecordState': 'ARCHIVED'
+                                }
                             )
-                            print(response)
                         except Exception as e:
                             print(e)
                 else:
@@ -689,6 +662,7 @@ def documentdb_parameter_group_audit_log_check():
             pass
 
 def documentdb_parameter_group_tls_enforcement_check():
+    awsAccountId = accountId.get()
     response = documentdb.describe_db_cluster_parameter_groups()
     dbClusterParameters = response['DBClusterParameterGroups']
     for parametergroup in dbClusterParameters:
@@ -704,48 +678,45 @@ def documentdb_parameter_group_tls_enforcement_check():
                             # ISO Time
                             iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                             # create Sec Hub finding
-                            response = securityhub.batch_import_findings(
-                                Findings=[
-                                    {
-                                        'SchemaVersion': '2018-10-08',
-                                        'Id': parameterGroupArn + '/docdb-cluster-parameter-tls-connections-check',
-                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                        'GeneratorId': parameterGroupArn,
-                                        'AwsAccountId': awsAccountId,
-                                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                        'FirstObservedAt': iso8601Time,
-                                        'CreatedAt': iso8601Time,
-                                        'UpdatedAt': iso8601Time,
-                                        'Severity': { 'Normalized': 60 },
-                                        'Confidence': 99,
-                                        'Title': '[DocDb.7] DocumentDB cluster parameter groups should enforce TLS connections to DocumentDB databases',
-                                        'Description': 'DocumentDB cluster parameter group ' + parameterGroupName + ' does not enforce TLS connections. Refer to the remediation instructions to remediate this behavior',
-                                        'Remediation': {
-                                            'Recommendation': {
-                                                'Text': 'If your DocumentDB cluster should have encryption in transit enforced refer to the Managing Amazon DocumentDB Cluster TLS Settings section in the Amazon DocumentDB Developer Guide',
-                                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/security.encryption.ssl.html'
-                                            }
-                                        },
-                                        'ProductFields': {
-                                            'Product Name': 'ElectricEye'
-                                        },
-                                        'Resources': [
-                                            {
-                                                'Type': 'Other',
-                                                'Id': parameterGroupArn,
-                                                'Partition': 'aws',
-                                                'Region': awsRegion,
-                                                'Details': {
-                                                    'Other': { 'ParameterGroupName': parameterGroupName }
-                                                }
+                            findingSink.put(
+                                {
+                                    'SchemaVersion': '2018-10-08',
+                                    'Id': parameterGroupArn + '/docdb-cluster-parameter-tls-connections-check',
+                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                    'GeneratorId': parameterGroupArn,
+                                    'AwsAccountId': awsAccountId,
+                                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                    'FirstObservedAt': iso8601Time,
+                                    'CreatedAt': iso8601Time,
+                                    'UpdatedAt': iso8601Time,
+                                    'Severity': { 'Normalized': 60 },
+                                    'Confidence': 99,
+                                    'Title': '[DocDb.7] DocumentDB cluster parameter groups should enforce TLS connections to DocumentDB databases',
+                                    'Description': 'DocumentDB cluster parameter group ' + parameterGroupName + ' does not enforce TLS connections. Refer to the remediation instructions to remediate this behavior',
+                                    'Remediation': {
+                                        'Recommendation': {
+                                            'Text': 'If your DocumentDB cluster should have encryption in transit enforced refer to the Managing Amazon DocumentDB Cluster TLS Settings section in the Amazon DocumentDB Developer Guide',
+                                            'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/security.encryption.ssl.html'
+                                        }
+                                    },
+                                    'ProductFields': {
+                                        'Product Name': 'ElectricEye'
+                                    },
+                                    'Resources': [
+                                        {
+                                            'Type': 'Other',
+                                            'Id': parameterGroupArn,
+                                            'Partition': 'aws',
+                                            'Region': awsRegion,
+                                            'Details': {
+                                                'Other': { 'ParameterGroupName': parameterGroupName }
                                             }
-                                        ],
-                                        'Compliance': { 'Status': 'FAILED' },
-                                        'RecordState': 'ACTIVE'
-                                    }
-                                ]
+                                        }
+                                    ],
+                                    'Compliance': { 'Status': 'FAILED' },
+                                    'RecordState': 'ACTIVE'
+                                }
                             )
-                            print(response)
                         except Exception as e:
                             print(e)
                     else:
@@ -753,48 +724,45 @@ def documentdb_parameter_group_tls_enforcement_check():
                             # ISO Time
                             iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                             # create Sec Hub finding
-                            response = securityhub.batch_import_findings(
-                                Findings=[
-                                    {
-                                        'SchemaVersion': '2018-10-08',
-                                        'Id': parameterGroupArn + '/docdb-cluster-parameter-tls-connections-check',
-                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                        'GeneratorId': parameterGroupArn,
-                                        'AwsAccountId': awsAccountId,
-                                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                        'FirstObservedAt': iso8601Time,
-                                        'CreatedAt': iso8601Time,
-                                        'UpdatedAt': iso8601Time,
-                                        'Severity': { 'Normalized': 0 },
-                                        'Confidence': 99,
-                                        'Title': '[DocDb.7] DocumentDB cluster parameter groups should enforce TLS connections to DocumentDB databases',
-                                        'Description': 'DocumentDB cluster parameter group ' + parameterGroupName + ' enforces TLS connections.',
-                                        'Remediation': {
-                                            'Recommendation': {
-                                                'Text': 'If your DocumentDB cluster should have encryption in transit enforced refer to the Managing Amazon DocumentDB Cluster TLS Settings section in the Amazon DocumentDB Developer Guide',
-                                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/security.encryption.ssl.html'
-                                            }
-                                        },
-                                        'ProductFields': {
-                                            'Product Name': 'ElectricEye'
-                                        },
-                                        'Resources': [
-                                            {
-                                                'Type': 'Other',
-                                                'Id': parameterGroupArn,
-                                                'Partition': 'aws',
-                                                'Region': awsRegion,
-                                                'Details': {
-                                                    'Other': { 'ParameterGroupName': parameterGroupName }
-                                                }
+                            findingSink.put(
+                                {
+                                    'SchemaVersion': '2018-10-08',
+                                    'Id': parameterGroupArn + '/docdb-cluster-parameter-tls-connections-check',
+                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                    'GeneratorId': parameterGroupArn,
+                                    'AwsAccountId': awsAccountId,
+                                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                    'FirstObservedAt': iso8601Time,
+                                    'CreatedAt': iso8601Time,
+                                    'UpdatedAt': iso8601Time,
+                                    'Severity': { 'Normalized': 0 },
+                                    'Confidence': 99,
+                                    'Title': '[DocDb.7] DocumentDB cluster parameter groups should enforce TLS connections to DocumentDB databases',
+                                    'Description': 'DocumentDB cluster parameter group ' + parameterGroupName + ' enforces TLS connections.',
+                                    'Remediation': {
+                                        'Recommendation': {
+                                            'Text': 'If your DocumentDB cluster should have encryption in transit enforced refer to the Managing Amazon DocumentDB Cluster TLS Settings section in the Amazon DocumentDB Developer Guide',
+                                            'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/security.encryption.ssl.html'
+                                        }
+                                    },
+                                    'ProductFields': {
+                                        'Product Name': 'ElectricEye'
+                                    },
+                                    'Resources': [
+                                        {
+                                            'Type': 'Other',
+                                            'Id': parameterGroupArn,
+                                            'Partition': 'aws',
+                                            'Region': awsRegion,
+                                            'Details': {
+                                                'Other': { 'ParameterGroupName': parameterGroupName }
                                             }
-                                        ],
-                                        'Compliance': { 'Status': 'PASSED' },
-                                        'RecordState': 'ARCHIVED'
-                                    }
-                                ]
+                                        }
+                                    ],
+                                    'Compliance': { 'Status': 'PASSED' },
+                                    'RecordState': 'ARCHIVED'
+                                }
                             )
-                            print(response)
                         except Exception as e:
                             print(e)
                 else:
@@ -803,6 +771,7 @@ def documentdb_parameter_group_tls_enforcement_check():
             pass
 
 def documentdb_cluster_snapshot_encryption_check():
+    awsAccountId = accountId.get()
     response = documentdb.describe_db_clusters(Filters=[ { 'Name': 'engine','Values': [ 'docdb' ] } ])
     for clusters in response['DBClusters']:
         clusterId = str(clusters['DBClusterIdentifier'])
@@ -816,51 +785,48 @@ def documentdb_cluster_snapshot_encryption_check():
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                     # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': clusterSnapshotArn + '/docdb-cluster-snapshot-encryption-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': clusterSnapshotArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 80 },
-                                'Confidence': 99,
-                                'Title': '[DocDb.8] DocumentDB cluster snapshots should be encrypted',
-                                'Description': 'DocumentDB cluster snapshot ' + clusterSnapshotId + ' is not encrypted. Refer to the remediation instructions to remediate this behavior',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your DocumentDB cluster snapshot should be encrypted refer to the Limitations for Amazon DocumentDB Encrypted Clusters section in the Amazon DocumentDB Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/encryption-at-rest.html#encryption-at-rest-limits'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'Other',
-                                        'Id': clusterSnapshotArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 'SnapshotId': clusterSnapshotId }
-                                        }
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': clusterSnapshotArn + '/docdb-cluster-snapshot-encryption-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': clusterSnapshotArn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [
+                                'Software and Configuration Checks/AWS Security Best Practices',
+                                'Effects/Data Exposure'
+                            ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 80 },
+                            'Confidence': 99,
+                            'Title': '[DocDb.8] DocumentDB cluster snapshots should be encrypted',
+                            'Description': 'DocumentDB cluster snapshot ' + clusterSnapshotId + ' is not encrypted. Refer to the remediation instructions to remediate this behavior',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'If your DocumentDB cluster snapshot should be encrypted refer to the Limitations for Amazon DocumentDB Encrypted Clusters section in the Amazon DocumentDB Developer Guide',
+                                    'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/encryption-at-rest.html#encryption-at-rest-limits'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'Other',
+                                    'Id': clusterSnapshotArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 'SnapshotId': clusterSnapshotId }
                                     }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'FAILED' },
+                            'RecordState': 'ACTIVE'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
             else:
@@ -868,55 +834,53 @@ def documentdb_cluster_snapshot_encryption_check():
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                     # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': clusterSnapshotArn + '/docdb-cluster-snapshot-encryption-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': clusterSnapshotArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[DocDb.8] DocumentDB cluster snapshots should be encrypted',
-                                'Description': 'DocumentDB cluster snapshot ' + clusterSnapshotId + ' is encrypted.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your DocumentDB cluster snapshot should be encrypted refer to the Limitations for Amazon DocumentDB Encrypted Clusters section in the Amazon DocumentDB Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/encryption-at-rest.html#encryption-at-rest-limits'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'Other',
-                                        'Id': clusterSnapshotArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 'SnapshotId': clusterSnapshotId }
-                                        }
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': clusterSnapshotArn + '/docdb-cluster-snapshot-encryption-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': clusterSnapshotArn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [
+                                'Software and Configuration Checks/AWS Security Best Practices',
+                                'Effects/Data Exposure'
+                            ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 0 },
+                            'Confidence': 99,
+                            'Title': '[DocDb.8] DocumentDB cluster snapshots should be encrypted',
+                            'Description': 'DocumentDB cluster snapshot ' + clusterSnapshotId + ' is encrypted.',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'If your DocumentDB cluster snapshot should be encrypted refer to the Limitations for Amazon DocumentDB Encrypted Clusters section in the Amazon DocumentDB Developer Guide',
+                                    'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/encryption-at-rest.html#encryption-at-rest-limits'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'Other',
+                                    'Id': clusterSnapshotArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 'SnapshotId': clusterSnapshotId }
                                     }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'PASSED' },
+                            'RecordState': 'ARCHIVED'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
 
 def documentdb_cluster_snapshot_public_share_check():
+    awsAccountId = accountId.get()
     response = documentdb.describe_db_clusters(Filters=[ { 'Name': 'engine','Values': [ 'docdb' ] } ])
     for clusters in response['DBClusters']:
         clusterId = str(clusters['DBClusterIdentifier'])
@@ -933,51 +897,48 @@ def documentdb_cluster_snapshot_public_share_check():
                             # ISO Time
                             iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                             # create Sec Hub finding
-                            response = securityhub.batch_import_findings(
-                                Findings=[
-                                    {
-                                        'SchemaVersion': '2018-10-08',
-                                        'Id': clusterSnapshotArn + '/docdb-cluster-snapshot-public-share-check',
-                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                        'GeneratorId': clusterSnapshotArn,
-                                        'AwsAccountId': awsAccountId,
-                                        'Types': [
-                                            'Software and Configuration Checks/AWS Security Best Practices',
-                                            'Effects/Data Exposure'
-                                        ],
-                                        'FirstObservedAt': iso8601Time,
-                                        'CreatedAt': iso8601Time,
-                                        'UpdatedAt': iso8601Time,
-                                        'Severity': { 'Normalized': 90 },
-                                        'Confidence': 99,
-                                        'Title': '[DocDb.9] DocumentDB cluster snapshots should not be publicly shared',
-                                        'Description': 'DocumentDB cluster snapshot ' + clusterSnapshotId + ' is publicly shared. Refer to the remediation instructions to remediate this behavior',
-                                        'Remediation': {
-                                            'Recommendation': {
-                                                'Text': 'If your DocumentDB cluster snapshot should not be publicly shared refer to the Sharing Amazon DocumentDB Cluster Snapshots section in the Amazon DocumentDB Developer Guide',
-                                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/backup-restore.db-cluster-snapshot-share.html'
-                                            }
-                                        },
-                                        'ProductFields': {
-                                            'Product Name': 'ElectricEye'
-                                        },
-                                        'Resources': [
-                                            {
-                                                'Type': 'Other',
-                                                'Id': clusterSnapshotArn,
-                                                'Partition': 'aws',
-                                                'Region': awsRegion,
-                                                'Details': {
-                                                    'Other': { 'SnapshotId': clusterSnapshotId }
-                                                }
+                            findingSink.put(
+                                {
+                                    'SchemaVersion': '2018-10-08',
+                                    'Id': clusterSnapshotArn + '/docdb-cluster-snapshot-public-share-check',
+                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                    'GeneratorId': clusterSnapshotArn,
+                                    'AwsAccountId': awsAccountId,
+                                    'Types': [
+                                        'Software and Configuration Checks/AWS Security Best Practices',
+                                        'Effects/Data Exposure'
+                                    ],
+                                    'FirstObservedAt': iso8601Time,
+                                    'CreatedAt': iso8601Time,
+                                    'UpdatedAt': iso8601Time,
+                                    'Severity': { 'Normalized': 90 },
+                                    'Confidence': 99,
+                                    'Title': '[DocDb.9] DocumentDB cluster snapshots should not be publicly shared',
+                                    'Description': 'DocumentDB cluster snapshot ' + clusterSnapshotId + ' is publicly shared. Refer to the remediation instructions to remediate this behavior',
+                                    'Remediation': {
+                                        'Recommendation': {
+                                            'Text': 'If your DocumentDB cluster snapshot should not be publicly shared refer to the Sharing Amazon DocumentDB Cluster Snapshots section in the Amazon DocumentDB Developer Guide',
+                                            'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/backup-restore.db-cluster-snapshot-share.html'
+                                        }
+                                    },
+                                    'ProductFields': {
+                                        'Product Name': 'ElectricEye'
+                                    },
+                                    'Resources': [
+                                        {
+                                            'Type': 'Other',
+                                            'Id': clusterSnapshotArn,
+                                            'Partition': 'aws',
+                                            'Region': awsRegion,
+                                            'Details': {
+                                                'Other': { 'SnapshotId': clusterSnapshotId }
                                             }
-                                        ],
-                                        'Compliance': { 'Status': 'FAILED' },
-                                        'RecordState': 'ACTIVE'
-                                    }
-                                ]
+                                        }
+                                    ],
+                                    'Compliance': { 'Status': 'FAILED' },
+                                    'RecordState': 'ACTIVE'
+                                }
                             )
-                            print(response)
                         except Exception as e:
                             print(e)
                     else:
@@ -985,51 +946,48 @@ def documentdb_cluster_snapshot_public_share_check():
                             # ISO Time
                             iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                             # create Sec Hub finding
-                            response = securityhub.batch_import_findings(
-                                Findings=[
-                                    {
-                                        'SchemaVersion': '2018-10-08',
-                                        'Id': clusterSnapshotArn + '/docdb-cluster-snapshot-public-share-check',
-                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                        'GeneratorId': clusterSnapshotArn,
-                                        'AwsAccountId': awsAccountId,
-                                        'Types': [
-                                            'Software and Configuration Checks/AWS Security Best Practices',
-                                            'Effects/Data Exposure'
-                                        ],
-                                        'FirstObservedAt': iso8601Time,
-                                        'CreatedAt': iso8601Time,
-                                        'UpdatedAt': iso8601Time,
-                                        'Severity': { 'Normalized': 0 },
-                                        'Confidence': 99,
-                                        'Title': '[DocDb.9] DocumentDB cluster snapshots should not be publicly shared',
-                                        'Description': 'DocumentDB cluster snapshot ' + clusterSnapshotId + ' is not publicly shared, however, it may be shared with other accounts. You should periodically review who has snapshots shared with them to ensure they are still authorized',
-                                        'Remediation': {
-                                            'Recommendation': {
-                                                'Text': 'If your DocumentDB cluster snapshot should not be publicly shared refer to the Sharing Amazon DocumentDB Cluster Snapshots section in the Amazon DocumentDB Developer Guide',
-                                                'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/backup-restore.db-cluster-snapshot-share.html'
-                                            }
-                                        },
-                                        'ProductFields': {
-                                            'Product Name': 'ElectricEye'
-                                        },
-                                        'Resources': [
-                                            {
-                                                'Type': 'Other',
-                                                'Id': clusterSnapshotArn,
-                                                'Partition': 'aws',
-                                                'Region': awsRegion,
-                                                'Details': {
-                                                    'Other': { 'SnapshotId': clusterSnapshotId }
-                                                }
+                            findingSink.put(
+                                {
+                                    'SchemaVersion': '2018-10-08',
+                                    'Id': clusterSnapshotArn + '/docdb-cluster-snapshot-public-share-check',
+                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                    'GeneratorId': clusterSnapshotArn,
+                                    'AwsAccountId': awsAccountId,
+                                    'Types': [
+                                        'Software and Configuration Checks/AWS Security Best Practices',
+                                        'Effects/Data Exposure'
+                                    ],
+                                    'FirstObservedAt': iso8601Time,
+                                    'CreatedAt': iso8601Time,
+                                    'UpdatedAt': iso8601Time,
+                                    'Severity': { 'Normalized': 0 },
+                                    'Confidence': 99,
+                                    'Title': '[DocDb.9] DocumentDB cluster snapshots should not be publicly shared',
+                                    'Description': 'DocumentDB cluster snapshot ' + clusterSnapshotId + ' is not publicly shared, however, it may be shared with other accounts. You should periodically review who has snapshots shared with them to ensure they are still authorized',
+                                    'Remediation': {
+                                        'Recommendation': {
+                                            'Text': 'If your DocumentDB cluster snapshot should not be publicly shared refer to the Sharing Amazon DocumentDB Cluster Snapshots section in the Amazon DocumentDB Developer Guide',
+                                            'Url': 'https://docs.aws.amazon.com/documentdb/latest/developerguide/backup-restore.db-cluster-snapshot-share.html'
+                                        }
+                                    },
+                                    'ProductFields': {
+                                        'Product Name': 'ElectricEye'
+                                    },
+                                    'Resources': [
+                                        {
+                                            'Type': 'Other',
+                                            'Id': clusterSnapshotArn,
+                                            'Partition': 'aws',
+                                            'Region': awsRegion,
+                                            'Details': {
+                                                'Other': { 'SnapshotId': clusterSnapshotId }
                                             }
-                                        ],
-                                        'Compliance': { 'Status': 'PASSED' },
-                                        'RecordState': 'ARCHIVED'
-                                    }
-                                ]
+                                        }
+                                    ],
+                                    'Compliance': { 'Status': 'PASSED' },
+                                    'RecordState': 'ARCHIVED'
+                                }
                             )
-                            print(response)
                         except Exception as e:
                             print(e)
                 else:
@@ -1046,4 +1004,5 @@ def documentdb_auditor():
     documentdb_cluster_snapshot_encryption_check()
     documentdb_cluster_snapshot_public_share_check()
 
-documentdb_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    documentdb_auditor()
\ No newline at end of file
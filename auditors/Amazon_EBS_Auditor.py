@@ -13,290 +13,129 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import os
 import datetime
+from finding_sink import default_sink
+from rate_limiter import map_rate_limited
+from resource_inventory import default_inventory, lazy_value
+from scan_scope import lazy_account_id, lazy_client
+from state_store import default_state_store
 # import boto3 clients
-sts = boto3.client('sts')
-ec2 = boto3.client('ec2')
-securityhub = boto3.client('securityhub')
+ec2 = lazy_client('ec2')
+findingSink = default_sink()
+inventory = default_inventory()
 # create env vars
 awsRegion = os.environ['AWS_REGION']
-awsAccountId = sts.get_caller_identity()['Account']
-# loop through EBS volumes
-response = ec2.describe_volumes(DryRun=False,MaxResults=500)
-myEbsVolumes = response['Volumes']
-# loop through EBS snapshots
-response = ec2.describe_snapshots(OwnerIds=[ awsAccountId ],DryRun=False)
-myEbsSnapshots = response['Snapshots']
+accountId = lazy_account_id()
+# EBS volumes and snapshots are streamed page by page and every check for a volume or
+# snapshot runs as soon as it arrives, memory stays flat however many the account has
+myEbsVolumes = inventory.stream('ec2', 'describe_volumes', 'Volumes')
+myEbsSnapshots = inventory.stream('ec2', 'describe_snapshots', 'Snapshots', OwnerIds=[ 'self' ])
+# public snapshots come from one paginated query, only the rest need DescribeSnapshotAttribute
+# and those lookups run a chunk of snapshots at a time on a small rate limited pool
+snapshotChunkSize = 200
+snapshotAttributeRequestsPerSecond = 20
+snapshotAttributeBurst = 40
+snapshotAttributeWorkers = 8
+# with incremental scanning the account shares of private snapshots are reused for this long, a snapshot
+# newly shared with another account can be reported as unshared until its cached lookup expires
+snapshotShareCacheSeconds = float(os.environ.get('ELECTRICEYE_SNAPSHOT_SHARE_CACHE_HOURS', '4')) * 3600
 
-def ebs_volume_attachment_check():
-    for volumes in myEbsVolumes:
-        ebsVolumeId = str(volumes['VolumeId'])
-        ebsVolumeArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + '/' + ebsVolumeId
-        ebsAttachments = volumes['Attachments']
-        for attachments in ebsAttachments:
-            ebsAttachmentState = str(attachments['State'])
-            if ebsAttachmentState != 'attached':
-                try:
-                    # ISO Time
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': ebsVolumeArn + '/ebs-volume-attachment-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': ebsVolumeArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 20 },
-                                'Confidence': 99,
-                                'Title': '[EBS.1] EBS Volumes should be in an attached state',
-                                'Description': 'EBS Volume ' + ebsVolumeId + ' is not in an attached state. Refer to the remediation instructions if this configuration is not intended',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your EBS volume should be attached refer to the Attaching an Amazon EBS Volume to an Instance section of the Amazon Elastic Compute Cloud User Guide',
-                                        'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/ebs-attaching-volume.html'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsEc2Volume',
-                                        'Id': ebsVolumeArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 'VolumeId': ebsVolumeId }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-            else:
-                try:
-                    # ISO Time
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': ebsVolumeArn + '/ebs-volume-attachment-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': ebsVolumeArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[EBS.1] EBS Volumes should be in an attached state',
-                                'Description': 'EBS Volume ' + ebsVolumeId + ' is in an attached state.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your EBS volume should be attached refer to the Attaching an Amazon EBS Volume to an Instance section of the Amazon Elastic Compute Cloud User Guide',
-                                        'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/ebs-attaching-volume.html'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsEc2Volume',
-                                        'Id': ebsVolumeArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 'VolumeId': ebsVolumeId }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
+def public_snapshot_ids():
+    return set(
+        str(snapshots['SnapshotId']) for snapshots in inventory.iterate(
+            'ec2', 'describe_snapshots', 'Snapshots', OwnerIds=[ 'self' ], RestorableByUserIds=[ 'all' ]
+        )
+    )
 
-def ebs_volume_delete_on_termination_check():
-    for volumes in myEbsVolumes:
-        ebsVolumeId = str(volumes['VolumeId'])
-        ebsVolumeArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + '/' + ebsVolumeId
-        ebsAttachments = volumes['Attachments']
-        for attachments in ebsAttachments:
-            ebsDeleteOnTerminationCheck = str(attachments['DeleteOnTermination'])
-            if ebsDeleteOnTerminationCheck == 'False':
-                try:
-                    # ISO Time
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': ebsVolumeArn + '/ebs-volume-delete-on-termination-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': ebsVolumeArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 20 },
-                                'Confidence': 99,
-                                'Title': '[EBS.2] EBS Volumes should be configured to be deleted on termination',
-                                'Description': 'EBS Volume ' + ebsVolumeId + ' is not configured to be deleted on termination. Refer to the remediation instructions if this configuration is not intended',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your EBS volume should be deleted on instance termination refer to the Preserving Amazon EBS Volumes on Instance Termination section of the Amazon Elastic Compute Cloud User Guide',
-                                        'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/terminating-instances.html#preserving-volumes-on-termination'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsEc2Volume',
-                                        'Id': ebsVolumeArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 'VolumeId': ebsVolumeId }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-            else:
-                try:
-                    # ISO Time
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': ebsVolumeArn + '/ebs-volume-delete-on-termination-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': ebsVolumeArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[EBS.2] EBS Volumes should be configured to be deleted on termination',
-                                'Description': 'EBS Volume ' + ebsVolumeId + ' is configured to be deleted on termination.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your EBS volume should be deleted on instance termination refer to the Preserving Amazon EBS Volumes on Instance Termination section of the Amazon Elastic Compute Cloud User Guide',
-                                        'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/terminating-instances.html#preserving-volumes-on-termination'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsEc2Volume',
-                                        'Id': ebsVolumeArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 'VolumeId': ebsVolumeId }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
+myPublicSnapshotIds = lazy_value(public_snapshot_ids)
 
-def ebs_volume_encryption_check():
-    for volumes in myEbsVolumes:
-        ebsVolumeId = str(volumes['VolumeId'])
-        ebsVolumeArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + '/' + ebsVolumeId
-        ebsEncryptionCheck = str(volumes['Encrypted'])
-        if ebsEncryptionCheck == 'False':
+def snapshot_volume_permissions(snapshotId):
+    response = ec2.describe_snapshot_attribute(Attribute='createVolumePermission',SnapshotId=snapshotId,DryRun=False)
+    return response['CreateVolumePermissions']
+
+def resolve_volume_permissions(snapshotIds):
+    # {snapshotId: CreateVolumePermissions}, public status always comes from this run's bulk query,
+    # with incremental scanning the account shares of the other snapshots are reused from recent runs
+    awsAccountId = accountId.get()
+    volumePermissions = {}
+    privateSnapshotIds = []
+    for snapshotId in snapshotIds:
+        if snapshotId in myPublicSnapshotIds:
+            volumePermissions[snapshotId] = [ { 'Group': 'all' } ]
+        else:
+            privateSnapshotIds.append(snapshotId)
+    stateStore = default_state_store()
+    stateScope = awsAccountId + '/' + awsRegion
+    if stateStore is not None:
+        volumePermissions.update(stateStore.cached_lookups(stateScope, privateSnapshotIds, snapshotShareCacheSeconds))
+    fetchedPermissions = map_rate_limited(
+        snapshot_volume_permissions,
+        [snapshotId for snapshotId in privateSnapshotIds if snapshotId not in volumePermissions],
+        snapshotAttributeRequestsPerSecond,
+        snapshotAttributeBurst,
+        snapshotAttributeWorkers
+    )
+    if stateStore is not None:
+        # a snapshot found public since it was cached is caught by the bulk query above
+        stateStore.record_lookups(
+            stateScope,
+            {snapshotId: permissions for snapshotId, permissions in fetchedPermissions.items() if { 'Group': 'all' } not in permissions}
+        )
+    volumePermissions.update(fetchedPermissions)
+    return volumePermissions
+
+def ebs_volume_attachment_check(volumes):
+    awsAccountId = accountId.get()
+    ebsVolumeId = str(volumes['VolumeId'])
+    ebsVolumeArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + '/' + ebsVolumeId
+    ebsAttachments = volumes['Attachments']
+    for attachments in ebsAttachments:
+        ebsAttachmentState = str(attachments['State'])
+        if ebsAttachmentState != 'attached':
             try:
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': ebsVolumeArn + '/ebs-volume-encryption-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': ebsVolumeArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 80 },
-                            'Confidence': 99,
-                            'Title': '[EBS.3] EBS Volumes should be encrypted',
-                            'Description': 'EBS Volume ' + ebsVolumeId + ' is not encrypted. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your EBS volume should be encrypted refer to the Amazon EBS Encryption section of the Amazon Elastic Compute Cloud User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/EBSEncryption.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsEc2Volume',
-                                    'Id': ebsVolumeArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'VolumeId': ebsVolumeId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': ebsVolumeArn + '/ebs-volume-attachment-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': ebsVolumeArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 20 },
+                        'Confidence': 99,
+                        'Title': '[EBS.1] EBS Volumes should be in an attached state',
+                        'Description': 'EBS Volume ' + ebsVolumeId + ' is not in an attached state. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your EBS volume should be attached refer to the Attaching an Amazon EBS Volume to an Instance section of the Amazon Elastic Compute Cloud User Guide',
+                                'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/ebs-attaching-volume.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEc2Volume',
+                                'Id': ebsVolumeArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'VolumeId': ebsVolumeId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
@@ -304,109 +143,99 @@ def ebs_volume_encryption_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': ebsVolumeArn + '/ebs-volume-encryption-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': ebsVolumeArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[EBS.3] EBS Volumes should be encrypted',
-                            'Description': 'EBS Volume ' + ebsVolumeId + ' is encrypted.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your EBS volume should be encrypted refer to the Amazon EBS Encryption section of the Amazon Elastic Compute Cloud User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/EBSEncryption.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsEc2Volume',
-                                    'Id': ebsVolumeArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'VolumeId': ebsVolumeId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': ebsVolumeArn + '/ebs-volume-attachment-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': ebsVolumeArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[EBS.1] EBS Volumes should be in an attached state',
+                        'Description': 'EBS Volume ' + ebsVolumeId + ' is in an attached state.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your EBS volume should be attached refer to the Attaching an Amazon EBS Volume to an Instance section of the Amazon Elastic Compute Cloud User Guide',
+                                'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/ebs-attaching-volume.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEc2Volume',
+                                'Id': ebsVolumeArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'VolumeId': ebsVolumeId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
-def ebs_snapshot_encryption_check():
-    for snapshots in myEbsSnapshots:
-        snapshotId = str(snapshots['SnapshotId'])
-        snapshotArn = 'arn:aws:ec2:' + awsRegion + '::snapshot/' + snapshotId
-        snapshotEncryptionCheck = str(snapshots['Encrypted'])
-        if snapshotEncryptionCheck == 'False':
+def ebs_volume_delete_on_termination_check(volumes):
+    awsAccountId = accountId.get()
+    ebsVolumeId = str(volumes['VolumeId'])
+    ebsVolumeArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + '/' + ebsVolumeId
+    ebsAttachments = volumes['Attachments']
+    for attachments in ebsAttachments:
+        ebsDeleteOnTerminationCheck = str(attachments['DeleteOnTermination'])
+        if ebsDeleteOnTerminationCheck == 'False':
             try:
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': snapshotArn + '/ebs-snapshot-encryption-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': snapshotArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 80 },
-                            'Confidence': 99,
-                            'Title': '[EBS.4] EBS Snapshots should be encrypted',
-                            'Description': 'EBS Snapshot ' + snapshotId + ' is not encrypted. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your EBS snapshot should be encrypted refer to the Encryption Support for Snapshots section of the Amazon Elastic Compute Cloud User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/WindowsGuide/EBSSnapshots.html#encryption-support'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsEc2Snapshot',
-                                    'Id': snapshotArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'SnapshotId': snapshotId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': ebsVolumeArn + '/ebs-volume-delete-on-termination-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': ebsVolumeArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 20 },
+                        'Confidence': 99,
+                        'Title': '[EBS.2] EBS Volumes should be configured to be deleted on termination',
+                        'Description': 'EBS Volume ' + ebsVolumeId + ' is not configured to be deleted on termination. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your EBS volume should be deleted on instance termination refer to the Preserving Amazon EBS Volumes on Instance Termination section of the Amazon Elastic Compute Cloud User Guide',
+                                'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/terminating-instances.html#preserving-volumes-on-termination'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEc2Volume',
+                                'Id': ebsVolumeArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'VolumeId': ebsVolumeId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
@@ -414,11 +243,322 @@ def ebs_snapshot_encryption_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': ebsVolumeArn + '/ebs-volume-delete-on-termination-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': ebsVolumeArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[EBS.2] EBS Volumes should be configured to be deleted on termination',
+                        'Description': 'EBS Volume ' + ebsVolumeId + ' is configured to be deleted on termination.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your EBS volume should be deleted on instance termination refer to the Preserving Amazon EBS Volumes on Instance Termination section of the Amazon Elastic Compute Cloud User Guide',
+                                'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/terminating-instances.html#preserving-volumes-on-termination'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEc2Volume',
+                                'Id': ebsVolumeArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'VolumeId': ebsVolumeId }
+                                }
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
+                )
+            except Exception as e:
+                print(e)
+
+def ebs_volume_encryption_check(volumes):
+    awsAccountId = accountId.get()
+    ebsVolumeId = str(volumes['VolumeId'])
+    ebsVolumeArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + '/' + ebsVolumeId
+    ebsEncryptionCheck = str(volumes['Encrypted'])
+    if ebsEncryptionCheck == 'False':
+        try:
+            # ISO Time
+            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+            # create Sec Hub finding
+            findingSink.put(
+                {
+                    'SchemaVersion': '2018-10-08',
+                    'Id': ebsVolumeArn + '/ebs-volume-encryption-check',
+                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                    'GeneratorId': ebsVolumeArn,
+                    'AwsAccountId': awsAccountId,
+                    'Types': [ 
+                        'Software and Configuration Checks/AWS Security Best Practices',
+                        'Effects/Data Exposure'
+                    ],
+                    'FirstObservedAt': iso8601Time,
+                    'CreatedAt': iso8601Time,
+                    'UpdatedAt': iso8601Time,
+                    'Severity': { 'Normalized': 80 },
+                    'Confidence': 99,
+                    'Title': '[EBS.3] EBS Volumes should be encrypted',
+                    'Description': 'EBS Volume ' + ebsVolumeId + ' is not encrypted. Refer to the remediation instructions if this configuration is not intended',
+                    'Remediation': {
+                        'Recommendation': {
+                            'Text': 'If your EBS volume should be encrypted refer to the Amazon EBS Encryption section of the Amazon Elastic Compute Cloud User Guide',
+                            'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/EBSEncryption.html'
+                        }
+                    },
+                    'ProductFields': {
+                        'Product Name': 'ElectricEye'
+                    },
+                    'Resources': [
+                        {
+                            'Type': 'AwsEc2Volume',
+                            'Id': ebsVolumeArn,
+                            'Partition': 'aws',
+                            'Region': awsRegion,
+                            'Details': {
+                                'Other': { 'VolumeId': ebsVolumeId }
+                            }
+                        }
+                    ],
+                    'Compliance': { 'Status': 'FAILED' },
+                    'RecordState': 'ACTIVE'
+                }
+            )
+        except Exception as e:
+            print(e)
+    else:
+        try:
+            # ISO Time
+            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+            # create Sec Hub finding
+            findingSink.put(
+                {
+                    'SchemaVersion': '2018-10-08',
+                    'Id': ebsVolumeArn + '/ebs-volume-encryption-check',
+                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                    'GeneratorId': ebsVolumeArn,
+                    'AwsAccountId': awsAccountId,
+                    'Types': [ 
+                        'Software and Configuration Checks/AWS Security Best Practices',
+                        'Effects/Data Exposure'
+                    ],
+                    'FirstObservedAt': iso8601Time,
+                    'CreatedAt': iso8601Time,
+                    'UpdatedAt': iso8601Time,
+                    'Severity': { 'Normalized': 0 },
+                    'Confidence': 99,
+                    'Title': '[EBS.3] EBS Volumes should be encrypted',
+                    'Description': 'EBS Volume ' + ebsVolumeId + ' is encrypted.',
+                    'Remediation': {
+                        'Recommendation': {
+                            'Text': 'If your EBS volume should be encrypted refer to the Amazon EBS Encryption section of the Amazon Elastic Compute Cloud User Guide',
+                            'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/EBSEncryption.html'
+                        }
+                    },
+                    'ProductFields': {
+                        'Product Name': 'ElectricEye'
+                    },
+                    'Resources': [
+                        {
+                            'Type': 'AwsEc2Volume',
+                            'Id': ebsVolumeArn,
+                            'Partition': 'aws',
+                            'Region': awsRegion,
+                            'Details': {
+                                'Other': { 'VolumeId': ebsVolumeId }
+                            }
+                        }
+                    ],
+                    'Compliance': { 'Status': 'PASSED' },
+                    'RecordState': 'ARCHIVED'
+                }
+            )
+        except Exception as e:
+            print(e)
+
+def ebs_snapshot_encryption_check(snapshots):
+    awsAccountId = accountId.get()
+    snapshotId = str(snapshots['SnapshotId'])
+    snapshotArn = 'arn:aws:ec2:' + awsRegion + '::snapshot/' + snapshotId
+    snapshotEncryptionCheck = str(snapshots['Encrypted'])
+    if snapshotEncryptionCheck == 'False':
+        try:
+            # ISO Time
+            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+            # create Sec Hub finding
+            findingSink.put(
+                {
+                    'SchemaVersion': '2018-10-08',
+                    'Id': snapshotArn + '/ebs-snapshot-encryption-check',
+                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                    'GeneratorId': snapshotArn,
+                    'AwsAccountId': awsAccountId,
+                    'Types': [ 
+                        'Software and Configuration Checks/AWS Security Best Practices',
+                        'Effects/Data Exposure'
+                    ],
+                    'FirstObservedAt': iso8601Time,
+                    'CreatedAt': iso8601Time,
+                    'UpdatedAt': iso8601Time,
+                    'Severity': { 'Normalized': 80 },
+                    'Confidence': 99,
+                    'Title': '[EBS.4] EBS Snapshots should be encrypted',
+                    'Description': 'EBS Snapshot ' + snapshotId + ' is not encrypted. Refer to the remediation instructions if this configuration is not intended',
+                    'Remediation': {
+                        'Recommendation': {
+                            'Text': 'If your EBS snapshot should be encrypted refer to the Encryption Support for Snapshots section of the Amazon Elastic Compute Cloud User Guide',
+                            'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/WindowsGuide/EBSSnapshots.html#encryption-support'
+                        }
+                    },
+                    'ProductFields': {
+                        'Product Name': 'ElectricEye'
+                    },
+                    'Resources': [
+                        {
+                            'Type': 'AwsEc2Snapshot',
+                            'Id': snapshotArn,
+                            'Partition': 'aws',
+                            'Region': awsRegion,
+                            'Details': {
+                                'Other': { 'SnapshotId': snapshotId }
+                            }
+                        }
+                    ],
+                    'Compliance': { 'Status': 'FAILED' },
+                    'RecordState': 'ACTIVE'
+                }
+            )
+        except Exception as e:
+            print(e)
+    else:
+        try:
+            # ISO Time
+            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+            # create Sec Hub finding
+            findingSink.put(
+                {
+                    'SchemaVersion': '2018-10-08',
+                    'Id': snapshotArn + '/ebs-snapshot-encryption-check',
+                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                    'GeneratorId': snapshotArn,
+                    'AwsAccountId': awsAccountId,
+                    'Types': [ 
+                        'Software and Configuration Checks/AWS Security Best Practices',
+                        'Effects/Data Exposure'
+                    ],
+                    'FirstObservedAt': iso8601Time,
+                    'CreatedAt': iso8601Time,
+                    'UpdatedAt': iso8601Time,
+                    'Severity': { 'Normalized': 0 },
+                    'Confidence': 99,
+                    'Title': '[EBS.4] EBS Snapshots should be encrypted',
+                    'Description': 'EBS Snapshot ' + snapshotId + ' is encrypted.',
+                    'Remediation': {
+                        'Recommendation': {
+                            'Text': 'If your EBS snapshot should be encrypted refer to the Encryption Support for Snapshots section of the Amazon Elastic Compute Cloud User Guide',
+                            'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/WindowsGuide/EBSSnapshots.html#encryption-support'
+                        }
+                    },
+                    'ProductFields': {
+                        'Product Name': 'ElectricEye'
+                    },
+                    'Resources': [
+                        {
+                            'Type': 'AwsEc2Snapshot',
+                            'Id': snapshotArn,
+                            'Partition': 'aws',
+                            'Region': awsRegion,
+                            'Details': {
+                                'Other': { 'SnapshotId': snapshotId }
+                            }
+                        }
+                    ],
+                    'Compliance': { 'Status': 'PASSED' },
+                    'RecordState': 'ARCHIVED'
+                }
+            )
+        except Exception as e:
+            print(e)
+
+def ebs_snapshot_public_check(snapshots, createVolumePermissions):
+    awsAccountId = accountId.get()
+    snapshotId = str(snapshots['SnapshotId'])
+    snapshotArn = 'arn:aws:ec2:' + awsRegion + '::snapshot/' + snapshotId
+    if str(createVolumePermissions) == '[]':
+        try:
+            # ISO Time
+            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+            # create Sec Hub finding
+            findingSink.put(
+                {
+                    'SchemaVersion': '2018-10-08',
+                    'Id': snapshotArn + '/ebs-snapshot-public-share-check',
+                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                    'GeneratorId': snapshotArn,
+                    'AwsAccountId': awsAccountId,
+                    'Types': [ 
+                        'Software and Configuration Checks/AWS Security Best Practices',
+                        'Effects/Data Exposure'
+                    ],
+                    'FirstObservedAt': iso8601Time,
+                    'CreatedAt': iso8601Time,
+                    'UpdatedAt': iso8601Time,
+                    'Severity': { 'Normalized': 0 },
+                    'Confidence': 99,
+                    'Title': '[EBS.5] EBS Snapshots should not be public',
+                    'Description': 'EBS Snapshot ' + snapshotId + ' is private.',
+                    'Remediation': {
+                        'Recommendation': {
+                            'Text': 'If your EBS snapshot should not be public refer to the Sharing an Amazon EBS Snapshot section of the Amazon Elastic Compute Cloud User Guide',
+                            'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/WindowsGuide/ebs-modifying-snapshot-permissions.html'
+                        }
+                    },
+                    'ProductFields': {
+                        'Product Name': 'ElectricEye'
+                    },
+                    'Resources': [
+                        {
+                            'Type': 'AwsEc2Snapshot',
+                            'Id': snapshotArn,
+                            'Partition': 'aws',
+                            'Region': awsRegion,
+                            'Details': {
+                                'Other': { 'SnapshotId': snapshotId }
+                            }
+                        }
+                    ],
+                    'Compliance': { 'Status': 'PASSED' },
+                    'RecordState': 'ARCHIVED'
+                }
+            )
+        except Exception as e:
+            print(e)
+    else:
+        for permissions in createVolumePermissions:
+            # {'Group': 'all'} denotes public
+            # you should still audit accounts you have shared
+            if str(permissions) == "{'Group': 'all'}":
+                try:
+                    # ISO Time
+                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                    # create Sec Hub finding
+                    findingSink.put(
                         {
                             'SchemaVersion': '2018-10-08',
-                            'Id': snapshotArn + '/ebs-snapshot-encryption-check',
+                            'Id': snapshotArn + '/ebs-snapshot-public-share-check',
                             'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
                             'GeneratorId': snapshotArn,
                             'AwsAccountId': awsAccountId,
@@ -429,14 +569,14 @@ def ebs_snapshot_encryption_check():
                             'FirstObservedAt': iso8601Time,
                             'CreatedAt': iso8601Time,
                             'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
+                            'Severity': { 'Normalized': 90 },
                             'Confidence': 99,
-                            'Title': '[EBS.4] EBS Snapshots should be encrypted',
-                            'Description': 'EBS Snapshot ' + snapshotId + ' is encrypted.',
+                            'Title': '[EBS.5] EBS Snapshots should not be public',
+                            'Description': 'EBS Snapshot ' + snapshotId + ' is public. Refer to the remediation instructions to remediate this behavior',
                             'Remediation': {
                                 'Recommendation': {
-                                    'Text': 'If your EBS snapshot should be encrypted refer to the Encryption Support for Snapshots section of the Amazon Elastic Compute Cloud User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/WindowsGuide/EBSSnapshots.html#encryption-support'
+                                    'Text': 'If your EBS snapshot should not be public refer to the Sharing an Amazon EBS Snapshot section of the Amazon Elastic Compute Cloud User Guide',
+                                    'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/WindowsGuide/ebs-modifying-snapshot-permissions.html'
                                 }
                             },
                             'ProductFields': {
@@ -453,27 +593,18 @@ def ebs_snapshot_encryption_check():
                                     }
                                 }
                             ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
+                            'Compliance': { 'Status': 'FAILED' },
+                            'RecordState': 'ACTIVE'
                         }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-
-def ebs_snapshot_public_check():
-    for snapshots in myEbsSnapshots:
-        snapshotId = str(snapshots['SnapshotId'])
-        snapshotArn = 'arn:aws:ec2:' + awsRegion + '::snapshot/' + snapshotId
-        response = ec2.describe_snapshot_attribute(Attribute='createVolumePermission',SnapshotId=snapshotId,DryRun=False)
-        if str(response['CreateVolumePermissions']) == '[]':
-            try:
-                # ISO Time
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
+                    )
+                except Exception as e:
+                    print(e)
+            else:
+                try:
+                    # ISO Time
+                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                    # create Sec Hub finding
+                    findingSink.put(
                         {
                             'SchemaVersion': '2018-10-08',
                             'Id': snapshotArn + '/ebs-snapshot-public-share-check',
@@ -490,7 +621,7 @@ def ebs_snapshot_public_check():
                             'Severity': { 'Normalized': 0 },
                             'Confidence': 99,
                             'Title': '[EBS.5] EBS Snapshots should not be public',
-                            'Description': 'EBS Snapshot ' + snapshotId + ' is private.',
+                            'Description': 'EBS Snapshot ' + snapshotId + ' is private, however, this snapshot has been identified as being shared with other accounts. You should audit these accounts to ensure they are still authorized to have this snapshot shared with them.',
                             'Remediation': {
                                 'Recommendation': {
                                     'Text': 'If your EBS snapshot should not be public refer to the Sharing an Amazon EBS Snapshot section of the Amazon Elastic Compute Cloud User Guide',
@@ -512,168 +643,56 @@ def ebs_snapshot_public_check():
                                 }
                             ],
                             'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
+                            'RecordState': 'ACTIVE'
                         }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        else:
-            for permissions in response['CreateVolumePermissions']:
-                # {'Group': 'all'} denotes public
-                # you should still audit accounts you have shared
-                if str(permissions) == "{'Group': 'all'}":
-                    try:
-                        # ISO Time
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        # create Sec Hub finding
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': snapshotArn + '/ebs-snapshot-public-share-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': snapshotArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 90 },
-                                    'Confidence': 99,
-                                    'Title': '[EBS.5] EBS Snapshots should not be public',
-                                    'Description': 'EBS Snapshot ' + snapshotId + ' is public. Refer to the remediation instructions to remediate this behavior',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'If your EBS snapshot should not be public refer to the Sharing an Amazon EBS Snapshot section of the Amazon Elastic Compute Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/WindowsGuide/ebs-modifying-snapshot-permissions.html'
-                                        }
-                                    },
-                                    'ProductFields': {
-                                        'Product Name': 'ElectricEye'
-                                    },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2Snapshot',
-                                            'Id': snapshotArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'Other': { 'SnapshotId': snapshotId }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    try:
-                        # ISO Time
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        # create Sec Hub finding
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': snapshotArn + '/ebs-snapshot-public-share-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': snapshotArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[EBS.5] EBS Snapshots should not be public',
-                                    'Description': 'EBS Snapshot ' + snapshotId + ' is private, however, this snapshot has been identified as being shared with other accounts. You should audit these accounts to ensure they are still authorized to have this snapshot shared with them.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'If your EBS snapshot should not be public refer to the Sharing an Amazon EBS Snapshot section of the Amazon Elastic Compute Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/WindowsGuide/ebs-modifying-snapshot-permissions.html'
-                                        }
-                                    },
-                                    'ProductFields': {
-                                        'Product Name': 'ElectricEye'
-                                    },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2Snapshot',
-                                            'Id': snapshotArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'Other': { 'SnapshotId': snapshotId }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
+                    )
+                except Exception as e:
+                    print(e)
 
 def ebs_account_encryption_by_default_check():
+    awsAccountId = accountId.get()
     response = ec2.get_ebs_encryption_by_default(DryRun=False)
     if str(response['EbsEncryptionByDefault']) == 'False':
         try:
             # ISO Time
             iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
             # create Sec Hub finding
-            response = securityhub.batch_import_findings(
-                Findings=[
-                    {
-                        'SchemaVersion': '2018-10-08',
-                        'Id': awsAccountId + awsRegion + '/ebs-account-encryption-check',
-                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                        'GeneratorId': awsAccountId + '/' + awsRegion,
-                        'AwsAccountId': awsAccountId,
-                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                        'FirstObservedAt': iso8601Time,
-                        'CreatedAt': iso8601Time,
-                        'UpdatedAt': iso8601Time,
-                        'Severity': { 'Normalized': 40 },
-                        'Confidence': 99,
-                        'Title': '[EBS.6] Account-level EBS Volume encryption should be enabled',
-                        'Description': 'Account-level EBS volume encryption is not enabled for AWS Account ' + awsAccountId + ' in ' + awsRegion + '. Refer to the remediation instructions if this configuration is not intended',
-                        'Remediation': {
-                            'Recommendation': {
-                                'Text': 'For information on Account-level encryption refer to the Encryption by Default to an Instance section of the Amazon Elastic Compute Cloud User Guide',
-                                'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/EBSEncryption.html#encryption-by-default'
-                            }
-                        },
-                        'ProductFields': {
-                            'Product Name': 'ElectricEye'
-                        },
-                        'Resources': [
-                            {
-                                'Type': 'AwsAccount',
-                                'Id': 'AWS::::Account:' + awsAccountId,
-                                'Partition': 'aws',
-                                'Region': awsRegion
-                            }
-                        ],
-                        'Compliance': { 'Status': 'FAILED' },
-                        'RecordState': 'ACTIVE'
-                    }
-                ]
+            findingSink.put(
+                {
+                    'SchemaVersion': '2018-10-08',
+                    'Id': awsAccountId + awsRegion + '/ebs-account-encryption-check',
+                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                    'GeneratorId': awsAccountId + '/' + awsRegion,
+                    'AwsAccountId': awsAccountId,
+                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                    'FirstObservedAt': iso8601Time,
+                    'CreatedAt': iso8601Time,
+                    'UpdatedAt': iso8601Time,
+                    'Severity': { 'Normalized': 40 },
+                    'Confidence': 99,
+                    'Title': '[EBS.6] Account-level EBS Volume encryption should be enabled',
+                    'Description': 'Account-level EBS volume encryption is not enabled for AWS Account ' + awsAccountId + ' in ' + awsRegion + '. Refer to the remediation instructions if this configuration is not intended',
+                    'Remediation': {
+                        'Recommendation': {
+                            'Text': 'For information on Account-level encryption refer to the Encryption by Default to an Instance section of the Amazon Elastic Compute Cloud User Guide',
+                            'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/EBSEncryption.html#encryption-by-default'
+                        }
+                    },
+                    'ProductFields': {
+                        'Product Name': 'ElectricEye'
+                    },
+                    'Resources': [
+                        {
+                            'Type': 'AwsAccount',
+                            'Id': 'AWS::::Account:' + awsAccountId,
+                            'Partition': 'aws',
+                            'Region': awsRegion
+                        }
+                    ],
+                    'Compliance': { 'Status': 'FAILED' },
+                    'RecordState': 'ACTIVE'
+                }
             )
-            print(response)
         except Exception as e:
             print(e)
     else:
@@ -681,54 +700,85 @@ def ebs_account_encryption_by_default_check():
             # ISO Time
             iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
             # create Sec Hub finding
-            response = securityhub.batch_import_findings(
-                Findings=[
-                    {
-                        'SchemaVersion': '2018-10-08',
-                        'Id': awsAccountId + awsRegion + '/ebs-account-encryption-check',
-                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                        'GeneratorId': awsAccountId + '/' + awsRegion,
-                        'AwsAccountId': awsAccountId,
-                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                        'FirstObservedAt': iso8601Time,
-                        'CreatedAt': iso8601Time,
-                        'UpdatedAt': iso8601Time,
-                        'Severity': { 'Normalized': 0 },
-                        'Confidence': 99,
-                        'Title': '[EBS.6] Account-level EBS Volume encryption should be enabled',
-                        'Description': 'Account-level EBS volume encryption is enabled for AWS Account ' + awsAccountId + ' in ' + awsRegion + '.',
-                        'Remediation': {
-                            'Recommendation': {
-                                'Text': 'For information on Account-level encryption refer to the Encryption by Default to an Instance section of the Amazon Elastic Compute Cloud User Guide',
-                                'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/EBSEncryption.html#encryption-by-default'
-                            }
-                        },
-                        'ProductFields': {
-                            'Product Name': 'ElectricEye'
-                        },
-                        'Resources': [
-                            {
-                                'Type': 'AwsAccount',
-                                'Id': 'AWS::::Account:' + awsAccountId,
-                                'Partition': 'aws',
-                                'Region': awsRegion
-                            }
-                        ],
-                        'Compliance': { 'Status': 'PASSED' },
-                        'RecordState': 'ARCHIVED'
-                    }
-                ]
+            findingSink.put(
+                {
+                    'SchemaVersion': '2018-10-08',
+                    'Id': awsAccountId + awsRegion + '/ebs-account-encryption-check',
+                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                    'GeneratorId': awsAccountId + '/' + awsRegion,
+                    'AwsAccountId': awsAccountId,
+                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                    'FirstObservedAt': iso8601Time,
+                    'CreatedAt': iso8601Time,
+                    'UpdatedAt': iso8601Time,
+                    'Severity': { 'Normalized': 0 },
+                    'Confidence': 99,
+                    'Title': '[EBS.6] Account-level EBS Volume encryption should be enabled',
+                    'Description': 'Account-level EBS volume encryption is enabled for AWS Account ' + awsAccountId + ' in ' + awsRegion + '.',
+                    'Remediation': {
+                        'Recommendation': {
+                            'Text': 'For information on Account-level encryption refer to the Encryption by Default to an Instance section of the Amazon Elastic Compute Cloud User Guide',
+                            'Url': 'https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/EBSEncryption.html#encryption-by-default'
+                        }
+                    },
+                    'ProductFields': {
+                        'Product Name': 'ElectricEye'
+                    },
+                    'Resources': [
+                        {
+                            'Type': 'AwsAccount',
+                            'Id': 'AWS::::Account:' + awsAccountId,
+                            'Partition': 'aws',
+                            'Region': awsRegion
+                        }
+                    ],
+                    'Compliance': { 'Status': 'PASSED' },
+                    'RecordState': 'ARCHIVED'
+                }
             )
-            print(response)
         except Exception as e:
             print(e)
 
+def run_item_checks(checks, item):
+    # each check is isolated as if it ran on its own, one that fails on an item doesn't stop the others
+    for check in checks:
+        try:
+            check(item)
+        except Exception as e:
+            print(e)
+
+def ebs_volume_checks():
+    for volumes in myEbsVolumes:
+        run_item_checks((ebs_volume_attachment_check, ebs_volume_delete_on_termination_check, ebs_volume_encryption_check), volumes)
+
+def ebs_snapshot_chunk_checks(snapshotChunk):
+    volumePermissions = resolve_volume_permissions([str(snapshots['SnapshotId']) for snapshots in snapshotChunk])
+    for snapshots in snapshotChunk:
+        run_item_checks((ebs_snapshot_encryption_check,), snapshots)
+        snapshotId = str(snapshots['SnapshotId'])
+        if snapshotId in volumePermissions:
+            try:
+                ebs_snapshot_public_check(snapshots, volumePermissions[snapshotId])
+            except Exception as e:
+                print(e)
+
+def ebs_snapshot_checks():
+    snapshotChunk = []
+    for snapshots in myEbsSnapshots:
+        snapshotChunk.append(snapshots)
+        if len(snapshotChunk) >= snapshotChunkSize:
+            ebs_snapshot_chunk_checks(snapshotChunk)
+            snapshotChunk = []
+    if snapshotChunk:
+        ebs_snapshot_chunk_checks(snapshotChunk)
+
 def ebs_volume_auditor():
-    ebs_volume_attachment_check()
-    ebs_volume_delete_on_termination_check()
-    ebs_volume_encryption_check()
-    ebs_snapshot_encryption_check()
-    ebs_snapshot_public_check()
-    ebs_account_encryption_by_default_check()
+    # volumes, snapshots and the account setting are listed separately, a failed listing only skips its own checks
+    for checks in (ebs_volume_checks, ebs_snapshot_checks, ebs_account_encryption_by_default_check):
+        try:
+            checks()
+        except Exception as e:
+            print(e)
 
-ebs_volume_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    ebs_volume_auditor()
\ No newline at end of file
@@ -13,22 +13,49 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import datetime
 import os
+from finding_sink import default_sink
+from resource_inventory import default_inventory, lazy_value
+from scan_scope import lazy_account_id
 # create boto3 clients
-sts = boto3.client('sts')
-ec2 = boto3.client('ec2')
-ssm = boto3.client('ssm')
-securityhub = boto3.client('securityhub')
+findingSink = default_sink()
+inventory = default_inventory()
 # create env vars
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 awsRegion = os.environ['AWS_REGION']
 # loop through ec2 instances
-response = ec2.describe_instances(DryRun=False,MaxResults=1000)
-myEc2InstanceReservations = response['Reservations']
+myEc2InstanceReservations = inventory.lazy('ec2', 'describe_instances', 'Reservations')
+# index every SSM managed instance by its instance ID, the whole fleet is paginated once
+# so each check does a single dict lookup per EC2 instance
+def managed_instances():
+    managedInstances = {}
+    for instanceInfo in inventory.get('ssm', 'describe_instance_information', 'InstanceInformationList'):
+        managedInstances[instanceInfo['InstanceId']] = instanceInfo
+    return managedInstances
+
+myManagedInstances = lazy_value(managed_instances)
+
+def instance_patch_states():
+    # DescribeInstancePatchStates accepts up to 50 instance IDs per call
+    instanceIds = []
+    for reservations in myEc2InstanceReservations:
+        for instances in reservations['Instances']:
+            instanceIds.append(str(instances['InstanceId']))
+    patchStates = {}
+    for start in range(0, len(instanceIds), 50):
+        batchPatchStates = inventory.get(
+            'ssm',
+            'describe_instance_patch_states',
+            'InstancePatchStates',
+            InstanceIds=instanceIds[start:start + 50]
+        )
+        for patchState in batchPatchStates:
+            patchStates.setdefault(patchState['InstanceId'], []).append(patchState)
+    return patchStates
 
 def ec2_instance_ssm_managed_check():
+    awsAccountId = accountId.get()
     for reservations in myEc2InstanceReservations:
         for instances in reservations['Instances']:
             instanceId = str(instances['InstanceId'])
@@ -39,67 +66,56 @@ def ec2_instance_ssm_managed_check():
             instanceSubnet = str(instances['SubnetId'])
             instanceLaunchedAt = str(instances['LaunchTime'])
             try:
-                response = ssm.describe_instance_information(
-                    InstanceInformationFilterList=[
-                        {
-                            'key': 'InstanceIds',
-                            'valueSet': [instanceId]
-                        },
-                    ]
-                )
-                if str(response['InstanceInformationList']) == '[]':
+                if instanceId not in myManagedInstances:
                     try:
                         # ISO Time
                         iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                         # create Sec Hub finding
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': instanceArn + '/ec2-managed-by-ssm-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': instanceArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 20 },
-                                    'Confidence': 99,
-                                    'Title': '[EC2-SSM.1] EC2 Instances should be managed by Systems Manager',
-                                    'Description': 'EC2 Instance ' + instanceId + ' is not managed by Systems Manager. Refer to the remediation instructions if this configuration is not intended',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'To learn how to configure Systems Manager and associated instances refer to the Setting Up AWS Systems Manager section of the AWS Systems Manager User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/en_us/systems-manager/latest/userguide/systems-manager-setting-up.html'
-                                        }
-                                    },
-                                    'ProductFields': {
-                                        'Product Name': 'ElectricEye'
-                                    },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2Instance',
-                                            'Id': instanceArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2Instance': {
-                                                    'Type': instanceType,
-                                                    'ImageId': instanceImage,
-                                                    'VpcId': instanceVpc,
-                                                    'SubnetId': instanceSubnet,
-                                                    'LaunchedAt': instanceLaunchedAt
-                                                }
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': instanceArn + '/ec2-managed-by-ssm-check',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': instanceArn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                'FirstObservedAt': iso8601Time,
+                                'CreatedAt': iso8601Time,
+                                'UpdatedAt': iso8601Time,
+                                'Severity': { 'Normalized': 20 },
+                                'Confidence': 99,
+                                'Title': '[EC2-SSM.1] EC2 Instances should be managed by Systems Manager',
+                                'Description': 'EC2 Instance ' + instanceId + ' is not managed by Systems Manager. Refer to the remediation instructions if this configuration is not intended',
+                                'Remediation': {
+                                    'Recommendation': {
+                                        'Text': 'To learn how to configure Systems Manager and associated instances refer to the Setting Up AWS Systems Manager section of the AWS Systems Manager User Guide',
+                                        'Url': 'https://docs.aws.amazon.com/en_us/systems-manager/latest/userguide/systems-manager-setting-up.html'
+                                    }
+                                },
+                                'ProductFields': {
+                                    'Product Name': 'ElectricEye'
+                                },
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsEc2Instance',
+                                        'Id': instanceArn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsEc2Instance': {
+                                                'Type': instanceType,
+                                                'ImageId': instanceImage,
+                                                'VpcId': instanceVpc,
+                                                'SubnetId': instanceSubnet,
+                                                'LaunchedAt': instanceLaunchedAt
                                             }
                                         }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'FAILED' },
+                                'RecordState': 'ACTIVE'
+                            }
                         )
-                        print(response)
                     except Exception as e:
                         print(e)
                 else:
@@ -107,60 +123,58 @@ def ec2_instance_ssm_managed_check():
                         # ISO Time
                         iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                         # create Sec Hub finding
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': instanceArn + '/ec2-managed-by-ssm-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': instanceArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[EC2-SSM.1] EC2 Instances should be managed by Systems Manager',
-                                    'Description': 'EC2 Instance ' + instanceId + ' is managed by Systems Manager.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'To learn how to configure Systems Manager and associated instances refer to the Setting Up AWS Systems Manager section of the AWS Systems Manager User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/en_us/systems-manager/latest/userguide/systems-manager-setting-up.html'
-                                        }
-                                    },
-                                    'ProductFields': {
-                                        'Product Name': 'ElectricEye'
-                                    },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2Instance',
-                                            'Id': instanceArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2Instance': {
-                                                    'Type': instanceType,
-                                                    'ImageId': instanceImage,
-                                                    'VpcId': instanceVpc,
-                                                    'SubnetId': instanceSubnet,
-                                                    'LaunchedAt': instanceLaunchedAt
-                                                }
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': instanceArn + '/ec2-managed-by-ssm-check',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': instanceArn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                'FirstObservedAt': iso8601Time,
+                                'CreatedAt': iso8601Time,
+                                'UpdatedAt': iso8601Time,
+                                'Severity': { 'Normalized': 0 },
+                                'Confidence': 99,
+                                'Title': '[EC2-SSM.1] EC2 Instances should be managed by Systems Manager',
+                                'Description': 'EC2 Instance ' + instanceId + ' is managed by Systems Manager.',
+                                'Remediation': {
+                                    'Recommendation': {
+                                        'Text': 'To learn how to configure Systems Manager and associated instances refer to the Setting Up AWS Systems Manager section of the AWS Systems Manager User Guide',
+                                        'Url': 'https://docs.aws.amazon.com/en_us/systems-manager/latest/userguide/systems-manager-setting-up.html'
+                                    }
+                                },
+                                'ProductFields': {
+                                    'Product Name': 'ElectricEye'
+                                },
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsEc2Instance',
+                                        'Id': instanceArn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsEc2Instance': {
+                                                'Type': instanceType,
+                                                'ImageId': instanceImage,
+                                                'VpcId': instanceVpc,
+                                                'SubnetId': instanceSubnet,
+                                                'LaunchedAt': instanceLaunchedAt
                                             }
                                         }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'PASSED' },
+                                'RecordState': 'ARCHIVED'
+                            }
                         )
-                        print(response)
                     except Exception as e:
                         print(e)
             except Exception as e:
                 print(e)
 
 def ssm_instace_agent_update_check(): 
+    awsAccountId = accountId.get()
     for reservations in myEc2InstanceReservations:
         for instances in reservations['Instances']:
             instanceId = str(instances['InstanceId'])
@@ -170,63 +184,60 @@ def ssm_instace_agent_update_check():
             instanceVpc = str(instances['VpcId'])
             instanceSubnet = str(instances['SubnetId'])
             instanceLaunchedAt = str(instances['LaunchTime'])
-            response = ssm.describe_instance_information()
-            myManagedInstances = response['InstanceInformationList']
-            for instances in myManagedInstances:
-                latestVersionCheck = str(instances['IsLatestVersion'])
+            # unmanaged instances are reported by the EC2-SSM.1 check
+            managedInstance = myManagedInstances.get(instanceId)
+            if managedInstance is not None:
+                latestVersionCheck = str(managedInstance['IsLatestVersion'])
                 if latestVersionCheck == 'False':
                     try:
                         # ISO Time
                         iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                         # create Sec Hub finding
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': instanceArn + '/ec2-ssm-agent-latest-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': instanceArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[EC2-SSM.2] EC2 Instances managed by Systems Manager should have the latest SSM Agent installed',
-                                    'Description': 'EC2 Instance ' + instanceId + ' does not have the latest SSM Agent installed. Refer to the remediation instructions if this configuration is not intended',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For information on automating updates to the SSM Agent refer to the Automate Updates to SSM Agent section of the AWS Systems Manager User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-agent-automatic-updates.html'
-                                        }
-                                    },
-                                    'ProductFields': {
-                                        'Product Name': 'ElectricEye'
-                                    },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2Instance',
-                                            'Id': instanceArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2Instance': {
-                                                    'Type': instanceType,
-                                                    'ImageId': instanceImage,
-                                                    'VpcId': instanceVpc,
-                                                    'SubnetId': instanceSubnet,
-                                                    'LaunchedAt': instanceLaunchedAt
-                                                }
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': instanceArn + '/ec2-ssm-agent-latest-check',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': instanceArn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                'FirstObservedAt': iso8601Time,
+                                'CreatedAt': iso8601Time,
+                                'UpdatedAt': iso8601Time,
+                                'Severity': { 'Normalized': 40 },
+                                'Confidence': 99,
+                                'Title': '[EC2-SSM.2] EC2 Instances managed by Systems Manager should have the latest SSM Agent installed',
+                                'Description': 'EC2 Instance ' + instanceId + ' does not have the latest SSM Agent installed. Refer to the remediation instructions if this configuration is not intended',
+                                'Remediation': {
+                                    'Recommendation': {
+                                        'Text': 'For information on automating updates to the SSM Agent refer to the Automate Updates to SSM Agent section of the AWS Systems Manager User Guide',
+                                        'Url': 'https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-agent-automatic-updates.html'
+                                    }
+                                },
+                                'ProductFields': {
+                                    'Product Name': 'ElectricEye'
+                                },
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsEc2Instance',
+                                        'Id': instanceArn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsEc2Instance': {
+                                                'Type': instanceType,
+                                                'ImageId': instanceImage,
+                                                'VpcId': instanceVpc,
+                                                'SubnetId': instanceSubnet,
+                                                'LaunchedAt': instanceLaunchedAt
                                             }
                                         }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'FAILED' },
+                                'RecordState': 'ACTIVE'
+                            }
                         )
-                        print(response)
                     except Exception as e:
                         print(e)
                 else:
@@ -234,58 +245,56 @@ def ssm_instace_agent_update_check():
                         # ISO Time
                         iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                         # create Sec Hub finding
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': instanceArn + '/ec2-ssm-agent-latest-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': instanceArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[EC2-SSM.2] EC2 Instances managed by Systems Manager should have the latest SSM Agent installed',
-                                    'Description': 'EC2 Instance ' + instanceId + ' has the latest SSM Agent installed.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For information on automating updates to the SSM Agent refer to the Automate Updates to SSM Agent section of the AWS Systems Manager User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-agent-automatic-updates.html'
-                                        }
-                                    },
-                                    'ProductFields': {
-                                        'Product Name': 'ElectricEye'
-                                    },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2Instance',
-                                            'Id': instanceArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2Instance': {
-                                                    'Type': instanceType,
-                                                    'ImageId': instanceImage,
-                                                    'VpcId': instanceVpc,
-                                                    'SubnetId': instanceSubnet,
-                                                    'LaunchedAt': instanceLaunchedAt
-                                                }
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': instanceArn + '/ec2-ssm-agent-latest-check',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': instanceArn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                'FirstObservedAt': iso8601Time,
+                                'CreatedAt': iso8601Time,
+                                'UpdatedAt': iso8601Time,
+                                'Severity': { 'Normalized': 0 },
+                                'Confidence': 99,
+                                'Title': '[EC2-SSM.2] EC2 Instances managed by Systems Manager should have the latest SSM Agent installed',
+                                'Description': 'EC2 Instance ' + instanceId + ' has the latest SSM Agent installed.',
+                                'Remediation': {
+                                    'Recommendation': {
+                                        'Text': 'For information on automating updates to the SSM Agent refer to the Automate Updates to SSM Agent section of the AWS Systems Manager User Guide',
+                                        'Url': 'https://docs.aws.amazon.com/systems-manager/latest/userguide/ssm-agent-automatic-updates.html'
+                                    }
+                                },
+                                'ProductFields': {
+                                    'Product Name': 'ElectricEye'
+                                },
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsEc2Instance',
+                                        'Id': instanceArn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsEc2Instance': {
+                                                'Type': instanceType,
+                                                'ImageId': instanceImage,
+                                                'VpcId': instanceVpc,
+                                                'SubnetId': instanceSubnet,
+                                                'LaunchedAt': instanceLaunchedAt
                                             }
                                         }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'PASSED' },
+                                'RecordState': 'ARCHIVED'
+                            }
                         )
-                        print(response)
                     except Exception as e:
                         print(e)
 
 def ssm_instance_association_check():
+    awsAccountId = accountId.get()
     for reservations in myEc2InstanceReservations:
         for instances in reservations['Instances']:
             instanceId = str(instances['InstanceId'])
@@ -295,63 +304,60 @@ def ssm_instance_association_check():
             instanceVpc = str(instances['VpcId'])
             instanceSubnet = str(instances['SubnetId'])
             instanceLaunchedAt = str(instances['LaunchTime'])
-            response = ssm.describe_instance_information()
-            myManagedInstances = response['InstanceInformationList']
-            for instances in myManagedInstances:
-                associationStatusCheck = str(instances['AssociationStatus'])
+            # unmanaged instances are reported by the EC2-SSM.1 check
+            managedInstance = myManagedInstances.get(instanceId)
+            if managedInstance is not None:
+                associationStatusCheck = str(managedInstance.get('AssociationStatus'))
                 if associationStatusCheck != 'Success':
                     try:
                         # ISO Time
                         iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                         # create Sec Hub finding
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': instanceArn + '/ec2-ssm-association-success-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': instanceArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 20 },
-                                    'Confidence': 99,
-                                    'Title': '[EC2-SSM.3] EC2 Instances managed by Systems Manager should have a successful Association status',
-                                    'Description': 'EC2 Instance ' + instanceId + ' does not have a successful Association status. Refer to the remediation instructions if this configuration is not intended',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For information on Systems Manager Associations refer to the Working with Associations in Systems Manager section of the AWS Systems Manager User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/systems-manager/latest/userguide/systems-manager-associations.html'
-                                        }
-                                    },
-                                    'ProductFields': {
-                                        'Product Name': 'ElectricEye'
-                                    },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2Instance',
-                                            'Id': instanceArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2Instance': {
-                                                    'Type': instanceType,
-                                                    'ImageId': instanceImage,
-                                                    'VpcId': instanceVpc,
-                                                    'SubnetId': instanceSubnet,
-                                                    'LaunchedAt': instanceLaunchedAt
-                                                }
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': instanceArn + '/ec2-ssm-association-success-check',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': instanceArn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                'FirstObservedAt': iso8601Time,
+                                'CreatedAt': iso8601Time,
+                                'UpdatedAt': iso8601Time,
+                                'Severity': { 'Normalized': 20 },
+                                'Confidence': 99,
+                                'Title': '[EC2-SSM.3] EC2 Instances managed by Systems Manager should have a successful Association status',
+                                'Description': 'EC2 Instance ' + instanceId + ' does not have a successful Association status. Refer to the remediation instructions if this configuration is not intended',
+                                'Remediation': {
+                                    'Recommendation': {
+                                        'Text': 'For information on Systems Manager Associations refer to the Working with Associations in Systems Manager section of the AWS Systems Manager User Guide',
+                                        'Url': 'https://docs.aws.amazon.com/systems-manager/latest/userguide/systems-manager-associations.html'
+                                    }
+                                },
+                                'ProductFields': {
+                                    'Product Name': 'ElectricEye'
+                                },
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsEc2Instance',
+                                        'Id': instanceArn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsEc2Instance': {
+                                                'Type': instanceType,
+                                                'ImageId': instanceImage,
+                                                'VpcId': instanceVpc,
+                                                'SubnetId': instanceSubnet,
+                                                'LaunchedAt': instanceLaunchedAt
                                             }
                                         }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'FAILED' },
+                                'RecordState': 'ACTIVE'
+                            }
                         )
-                        print(response)
                     except Exception as e:
                         print(e)
                 else:
@@ -359,58 +365,61 @@ def ssm_instance_association_check():
                         # ISO Time
                         iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                         # create Sec Hub finding
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': instanceArn + '/ec2-ssm-association-success-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': instanceArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[EC2-SSM.3] EC2 Instances managed by Systems Manager should have a successful Association status',
-                                    'Description': 'EC2 Instance ' + instanceId + ' has a successful Association status.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For information on Systems Manager Associations refer to the Working with Associations in Systems Manager section of the AWS Systems Manager User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/systems-manager/latest/userguide/systems-manager-associations.html'
-                                        }
-                                    },
-                                    'ProductFields': {
-                                        'Product Name': 'ElectricEye'
-                                    },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2Instance',
-                                            'Id': instanceArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2Instance': {
-                                                    'Type': instanceType,
-                                                    'ImageId': instanceImage,
-                                                    'VpcId': instanceVpc,
-                                                    'SubnetId': instanceSubnet,
-                                                    'LaunchedAt': instanceLaunchedAt
-                                                }
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': instanceArn + '/ec2-ssm-association-success-check',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': instanceArn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                'FirstObservedAt': iso8601Time,
+                                'CreatedAt': iso8601Time,
+                                'UpdatedAt': iso8601Time,
+                                'Severity': { 'Normalized': 0 },
+                                'Confidence': 99,
+                                'Title': '[EC2-SSM.3] EC2 Instances managed by Systems Manager should have a successful Association status',
+                                'Description': 'EC2 Instance ' + instanceId + ' has a successful Association status.',
+                                'Remediation': {
+                                    'Recommendation': {
+                                        'Text': 'For information on Systems Manager Associations refer to the Working with Associations in Systems Manager section of the AWS Systems Manager User Guide',
+                                        'Url': 'https://docs.aws.amazon.com/systems-manager/latest/userguide/systems-manager-associations.html'
+                                    }
+                                },
+                                'ProductFields': {
+                                    'Product Name': 'ElectricEye'
+                                },
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsEc2Instance',
+                                        'Id': instanceArn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsEc2Instance': {
+                                                'Type': instanceType,
+                                                'ImageId': instanceImage,
+                                                'VpcId': instanceVpc,
+                                                'SubnetId': instanceSubnet,
+                                                'LaunchedAt': instanceLaunchedAt
                                             }
                                         }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'PASSED' },
+                                'RecordState': 'ARCHIVED'
+                            }
                         )
-                        print(response)
                     except Exception as e:
                         print(e)
 
 def ssm_instance_patch_state_state():
+    awsAccountId = accountId.get()
+    try:
+        myPatchStates = instance_patch_states()
+    except Exception as e:
+        print(e)
+        return
     for reservations in myEc2InstanceReservations:
         for instances in reservations['Instances']:
             instanceId = str(instances['InstanceId'])
@@ -420,68 +429,62 @@ def ssm_instance_patch_state_state():
             instanceVpc = str(instances['VpcId'])
             instanceSubnet = str(instances['SubnetId'])
             instanceLaunchedAt = str(instances['LaunchTime'])
-            response = ssm.describe_instance_information()
             try:
-                response = ssm.describe_instance_patch_states(InstanceIds=[instanceId] )
-                patchStatesCheck = str(response['InstancePatchStates'])
-                if patchStatesCheck == '[]':
+                patchStates = myPatchStates.get(instanceId, [])
+                if not patchStates:
                     print('no patch info')
                     try:
                         # ISO Time
                         iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                         # create Sec Hub finding
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': instanceArn + '/ec2-patch-manager-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': instanceArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 20 },
-                                    'Confidence': 99,
-                                    'Title': '[EC2-SSM.4] EC2 Instances managed by Systems Manager should have the latest patches installed by Patch Manager',
-                                    'Description': 'EC2 Instance ' + instanceId + ' does not have any patch information recorded and is likely not managed by Patch Manager. Refer to the remediation instructions if this configuration is not intended',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For information on Patch Manager refer to the AWS Systems Manager Patch Manager section of the AWS Systems Manager User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/systems-manager/latest/userguide/systems-manager-patch.html'
-                                        }
-                                    },
-                                    'ProductFields': {
-                                        'Product Name': 'ElectricEye'
-                                    },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2Instance',
-                                            'Id': instanceArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2Instance': {
-                                                    'Type': instanceType,
-                                                    'ImageId': instanceImage,
-                                                    'VpcId': instanceVpc,
-                                                    'SubnetId': instanceSubnet,
-                                                    'LaunchedAt': instanceLaunchedAt
-                                                }
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': instanceArn + '/ec2-patch-manager-check',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': instanceArn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                'FirstObservedAt': iso8601Time,
+                                'CreatedAt': iso8601Time,
+                                'UpdatedAt': iso8601Time,
+                                'Severity': { 'Normalized': 20 },
+                                'Confidence': 99,
+                                'Title': '[EC2-SSM.4] EC2 Instances managed by Systems Manager should have the latest patches installed by Patch Manager',
+                                'Description': 'EC2 Instance ' + instanceId + ' does not have any patch information recorded and is likely not managed by Patch Manager. Refer to the remediation instructions if this configuration is not intended',
+                                'Remediation': {
+                                    'Recommendation': {
+                                        'Text': 'For information on Patch Manager refer to the AWS Systems Manager Patch Manager section of the AWS Systems Manager User Guide',
+                                        'Url': 'https://docs.aws.amazon.com/systems-manager/latest/userguide/systems-manager-patch.html'
+                                    }
+                                },
+                                'ProductFields': {
+                                    'Product Name': 'ElectricEye'
+                                },
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsEc2Instance',
+                                        'Id': instanceArn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsEc2Instance': {
+                                                'Type': instanceType,
+                                                'ImageId': instanceImage,
+                                                'VpcId': instanceVpc,
+                                                'SubnetId': instanceSubnet,
+                                                'LaunchedAt': instanceLaunchedAt
                                             }
                                         }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'FAILED' },
+                                'RecordState': 'ACTIVE'
+                            }
                         )
-                        print(response)
                     except Exception as e:
                         print(e)
                 else:
-                    patchStates = response['InstancePatchStates']
                     for patches in patchStates:
                         failedPatchCheck = str(patches['FailedCount'])
                         missingPatchCheck = str(patches['MissingCount'])
@@ -490,54 +493,51 @@ def ssm_instance_patch_state_state():
                                 # ISO Time
                                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                                 # create Sec Hub finding
-                                response = securityhub.batch_import_findings(
-                                    Findings=[
-                                        {
-                                            'SchemaVersion': '2018-10-08',
-                                            'Id': instanceArn + '/ec2-patch-manager-check',
-                                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                            'GeneratorId': instanceArn,
-                                            'AwsAccountId': awsAccountId,
-                                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                            'FirstObservedAt': iso8601Time,
-                                            'CreatedAt': iso8601Time,
-                                            'UpdatedAt': iso8601Time,
-                                            'Severity': { 'Normalized': 40 },
-                                            'Confidence': 99,
-                                            'Title': '[EC2-SSM.4] EC2 Instances managed by Systems Manager should have the latest patches installed by Patch Manager',
-                                            'Description': 'EC2 Instance ' + instanceId + ' is missing patches or has patches that failed to apply. Refer to the remediation instructions if this configuration is not intended',
-                                            'Remediation': {
-                                                'Recommendation': {
-                                                    'Text': 'For information on Patch Manager refer to the AWS Systems Manager Patch Manager section of the AWS Systems Manager User Guide',
-                                                    'Url': 'https://docs.aws.amazon.com/systems-manager/latest/userguide/systems-manager-patch.html'
-                                                }
-                                            },
-                                            'ProductFields': {
-                                                'Product Name': 'ElectricEye'
-                                            },
-                                            'Resources': [
-                                                {
-                                                    'Type': 'AwsEc2Instance',
-                                                    'Id': instanceArn,
-                                                    'Partition': 'aws',
-                                                    'Region': awsRegion,
-                                                    'Details': {
-                                                        'AwsEc2Instance': {
-                                                            'Type': instanceType,
-                                                            'ImageId': instanceImage,
-                                                            'VpcId': instanceVpc,
-                                                            'SubnetId': instanceSubnet,
-                                                            'LaunchedAt': instanceLaunchedAt
-                                                        }
+                                findingSink.put(
+                                    {
+                                        'SchemaVersion': '2018-10-08',
+                                        'Id': instanceArn + '/ec2-patch-manager-check',
+                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                        'GeneratorId': instanceArn,
+                                        'AwsAccountId': awsAccountId,
+                                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                        'FirstObservedAt': iso8601Time,
+                                        'CreatedAt': iso8601Time,
+                                        'UpdatedAt': iso8601Time,
+                                        'Severity': { 'Normalized': 40 },
+                                        'Confidence': 99,
+                                        'Title': '[EC2-SSM.4] EC2 Instances managed by Systems Manager should have the latest patches installed by Patch Manager',
+                                        'Description': 'EC2 Instance ' + instanceId + ' is missing patches or has patches that failed to apply. Refer to the remediation instructions if this configuration is not intended',
+                                        'Remediation': {
+                                            'Recommendation': {
+                                                'Text': 'For information on Patch Manager refer to the AWS Systems Manager Patch Manager section of the AWS Systems Manager User Guide',
+                                                'Url': 'https://docs.aws.amazon.com/systems-manager/latest/userguide/systems-manager-patch.html'
+                                            }
+                                        },
+                                        'ProductFields': {
+                                            'Product Name': 'ElectricEye'
+                                        },
+                                        'Resources': [
+                                            {
+                                                'Type': 'AwsEc2Instance',
+                                                'Id': instanceArn,
+                                                'Partition': 'aws',
+                                                'Region': awsRegion,
+                                                'Details': {
+                                                    'AwsEc2Instance': {
+                                                        'Type': instanceType,
+                                                        'ImageId': instanceImage,
+                                                        'VpcId': instanceVpc,
+                                                        'SubnetId': instanceSubnet,
+                                                        'LaunchedAt': instanceLaunchedAt
                                                     }
                                                 }
-                                            ],
-                                            'Compliance': { 'Status': 'FAILED' },
-                                            'RecordState': 'ACTIVE'
-                                        }
-                                    ]
+                                            }
+                                        ],
+                                        'Compliance': { 'Status': 'FAILED' },
+                                        'RecordState': 'ACTIVE'
+                                    }
                                 )
-                                print(response)
                             except Exception as e:
                                 print(e)
                         else:
@@ -545,54 +545,51 @@ def ssm_instance_patch_state_state():
                                 # ISO Time
                                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                                 # create Sec Hub finding
-                                response = securityhub.batch_import_findings(
-                                    Findings=[
-                                        {
-                                            'SchemaVersion': '2018-10-08',
-                                            'Id': instanceArn + '/ec2-patch-manager-check',
-                                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                            'GeneratorId': instanceArn,
-                                            'AwsAccountId': awsAccountId,
-                                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                            'FirstObservedAt': iso8601Time,
-                                            'CreatedAt': iso8601Time,
-                                            'UpdatedAt': iso8601Time,
-                                            'Severity': { 'Normalized': 0 },
-                                            'Confidence': 99,
-                                            'Title': '[EC2-SSM.4] EC2 Instances managed by Systems Manager should have the latest patches installed by Patch Manager',
-                                            'Description': 'EC2 Instance ' + instanceId + ' has the latest patches installed by Patch Manager.',
-                                            'Remediation': {
-                                                'Recommendation': {
-                                                    'Text': 'For information on Patch Manager refer to the AWS Systems Manager Patch Manager section of the AWS Systems Manager User Guide',
-                                                    'Url': 'https://docs.aws.amazon.com/systems-manager/latest/userguide/systems-manager-patch.html'
-                                                }
-                                            },
-                                            'ProductFields': {
-                                                'Product Name': 'ElectricEye'
-                                            },
-                                            'Resources': [
-                                                {
-                                                    'Type': 'AwsEc2Instance',
-                                                    'Id': instanceArn,
-                                                    'Partition': 'aws',
-                                                    'Region': awsRegion,
-                                                    'Details': {
-                                                        'AwsEc2Instance': {
-                                                            'Type': instanceType,
-                                                            'ImageId': instanceImage,
-                                                            'VpcId': instanceVpc,
-                                                            'SubnetId': instanceSubnet,
-                                                            'LaunchedAt': instanceLaunchedAt
-                                                        }
+                                findingSink.put(
+                                    {
+                                        'SchemaVersion': '2018-10-08',
+                                        'Id': instanceArn + '/ec2-patch-manager-check',
+                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                        'GeneratorId': instanceArn,
+                                        'AwsAccountId': awsAccountId,
+                                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                        'FirstObservedAt': iso8601Time,
+                                        'CreatedAt': iso8601Time,
+                                        'UpdatedAt': iso8601Time,
+                                        'Severity': { 'Normalized': 0 },
+                                        'Confidence': 99,
+                                        'Title': '[EC2-SSM.4] EC2 Instances managed by Systems Manager should have the latest patches installed by Patch Manager',
+                                        'Description': 'EC2 Instance ' + instanceId + ' has the latest patches installed by Patch Manager.',
+                                        'Remediation': {
+                                            'Recommendation': {
+                                                'Text': 'For information on Patch Manager refer to the AWS Systems Manager Patch Manager section of the AWS Systems Manager User Guide',
+                                                'Url': 'https://docs.aws.amazon.com/systems-manager/latest/userguide/systems-manager-patch.html'
+                                            }
+                                        },
+                                        'ProductFields': {
+                                            'Product Name': 'ElectricEye'
+                                        },
+                                        'Resources': [
+                                            {
+                                                'Type': 'AwsEc2Instance',
+                                                'Id': instanceArn,
+                                                'Partition': 'aws',
+                                                'Region': awsRegion,
+                                                'Details': {
+                                                    'AwsEc2Instance': {
+                                                        'Type': instanceType,
+                                                        'ImageId': instanceImage,
+                                                        'VpcId': instanceVpc,
+                                                        'SubnetId': instanceSubnet,
+                                                        'LaunchedAt': instanceLaunchedAt
                                                     }
                                                 }
-                                            ],
-                                            'Compliance': { 'Status': 'PASSED' },
-                                            'RecordState': 'ARCHIVED'
-                                        }
-                                    ]
+                                            }
+                                        ],
+                                        'Compliance': { 'Status': 'PASSED' },
+                                        'RecordState': 'ARCHIVED'
+                                    }
                                 )
-                                print(response)
                             except Exception as e:
                                 print(e)
             except Exception as e:
@@ -604,4 +601,5 @@ def systems_manager_managed_instance_auditor():
     ssm_instace_agent_update_check()
     ssm_instance_patch_state_state()
 
-systems_manager_managed_instance_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    systems_manager_managed_instance_auditor()
\ No newline at end of file
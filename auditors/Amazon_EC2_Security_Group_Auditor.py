@@ -13,2638 +13,531 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
+import bisect
 import os
 import datetime
+from finding_sink import default_sink
+from resource_inventory import default_inventory
+from scan_scope import lazy_account_id
 # import boto3 clients
-sts = boto3.client('sts')
-ec2 = boto3.client('ec2')
-securityhub = boto3.client('securityhub')
+findingSink = default_sink()
+inventory = default_inventory()
 # create env vars
 awsRegion = os.environ['AWS_REGION']
-awsAccountId = sts.get_caller_identity()['Account']
-# loop through security groups
-response = ec2.describe_security_groups()
-mySgs = response['SecurityGroups']
+accountId = lazy_account_id()
+# security groups are streamed page by page and both checks run on each group as it arrives
+mySgs = inventory.stream('ec2', 'describe_security_groups', 'SecurityGroups')
 
-def security_group_all_open_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if ipProtocol == '-1' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-all-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 90 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.1] Security groups should not allow unrestricted access to all ports and protocols',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted access to all ports and protocols. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif ipProtocol == '-1' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-all-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.1] Security groups should not allow unrestricted access to all ports and protocols',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted access to all ports and protocols. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
-
-def security_group_open_ftp_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort =='20' and fromPort == '21' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-ftp-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.2] Security groups should not allow unrestricted File Transfer Protocol (FTP) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted File Transfer Protocol (FTP) access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif toPort =='20' and fromPort == '21' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-ftp-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.2] Security groups should not allow unrestricted File Transfer Protocol (FTP) access',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted File Transfer Protocol (FTP) access on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
-
-def security_group_open_telnet_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '23' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-telnet-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.3] Security groups should not allow unrestricted TelNet access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted TelNet access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif toPort and fromPort == '23' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-telnet-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.3] Security groups should not allow unrestricted TelNet access',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted TelNet access on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'ACTIVE' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
-
-def security_group_open_dcom_rpc_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '135' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-telnet-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.4] Security groups should not allow unrestricted Windows RPC DCOM access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted Windows RPC DCOM access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Attack signature information, refer to Threatl Intel Source URL',
-                                            'Source': 'Symantec Security Center',
-                                            'SourceUrl': 'https://www.symantec.com/security_response/attacksignatures/detail.jsp?asid=20387'
-                                        }
-                                    ],
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                if toPort and fromPort == '135' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-wsrpc-dcom-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.4] Security groups should not allow unrestricted Windows RPC DCOM access',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted Windows RPC DCOM access on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Attack signature information, refer to Threatl Intel Source URL',
-                                            'Source': 'Symantec Security Center',
-                                            'SourceUrl': 'https://www.symantec.com/security_response/attacksignatures/detail.jsp?asid=20387'
-                                        }
-                                    ],
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
-
-def security_group_open_smb_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '445' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-smb-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.5] Security groups should not allow unrestricted Server Message Blocks (SMB) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted Server Message Blocks (SMB) access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'MS17-010 EternalBlue SMB Remote Windows Kernel Pool Corruption',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/modules/exploit/windows/smb/ms17_010_eternalblue'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'How to use EternalBlue to Exploit SMB Port using Public Wi-Fi',
-                                            'Source': 'Medium',
-                                            'SourceUrl': 'https://medium.com/@melvinshb/how-to-use-eternalblue-to-exploit-smb-port-using-public-wi-fi-79a996821767'
-                                        }
-                                    ],
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif toPort and fromPort == '445' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-smb-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.5] Security groups should not allow unrestricted Server Message Blocks (SMB) access',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted Server Message Blocks (SMB) access on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'MS17-010 EternalBlue SMB Remote Windows Kernel Pool Corruption',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/modules/exploit/windows/smb/ms17_010_eternalblue'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'How to use EternalBlue to Exploit SMB Port using Public Wi-Fi',
-                                            'Source': 'Medium',
-                                            'SourceUrl': 'https://medium.com/@melvinshb/how-to-use-eternalblue-to-exploit-smb-port-using-public-wi-fi-79a996821767'
-                                        }
-                                    ],
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
-
-def security_group_open_mssql_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '1433' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-mssql-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.6] Security groups should not allow unrestricted Microsoft SQL Server (MSSQL) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted Microsoft SQL Server (MSSQL) access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Microsoft CVE-2020-0618: Microsoft SQL Server Reporting Services Remote Code Execution Vulnerability',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2020-0618'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Microsoft CVE-2019-0819: Microsoft SQL Server Analysis Services Information Disclosure Vulnerability',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2019-0819'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Microsoft CVE-2018-8273: Microsoft SQL Server Remote Code Execution Vulnerability',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2018-8273'
-                                        }
-                                    ],
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif toPort and fromPort == '1433' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-mssql-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.6] Security groups should not allow unrestricted Microsoft SQL Server (MSSQL) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted Microsoft SQL Server (MSSQL) access on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Microsoft CVE-2020-0618: Microsoft SQL Server Reporting Services Remote Code Execution Vulnerability',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2020-0618'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Microsoft CVE-2019-0819: Microsoft SQL Server Analysis Services Information Disclosure Vulnerability',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2019-0819'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Microsoft CVE-2018-8273: Microsoft SQL Server Remote Code Execution Vulnerability',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2018-8273'
-                                        }
-                                    ],
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
-
-def security_group_open_oracle_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '1521' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-oracledb-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.7] Security groups should not allow unrestricted Oracle database (TCP 1521) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted Oracle database (TCP 1521) access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif toPort and fromPort == '1521' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-oracledb-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.7] Security groups should not allow unrestricted Oracle database (TCP 1521) access',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted Oracle database (TCP 1521) access on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
-
-def security_group_open_mysql_mariadb_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '3306' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-mysql-mariadb-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.8] Security groups should not allow unrestricted MySQL or MariaDB database (TCP 3306) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted MySQL or MariaDB database (TCP 3306) access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                if toPort and fromPort == '3306' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-mysql-mariadb-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.8] Security groups should not allow unrestricted MySQL or MariaDB database (TCP 3306) access',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted MySQL or MariaDB database (TCP 3306) access on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
-
-def security_group_open_rdp_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '3389' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-rdp-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 90 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.9] Security groups should not allow unrestricted Remote Desktop Protocol (RDP) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted Remote Desktop Protocol (RDP) access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Microsoft CVE-2020-0660: Windows Remote Desktop Protocol (RDP) Denial of Service Vulnerability',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2020-0660'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Microsoft CVE-2020-0610: Windows Remote Desktop Gateway (RD Gateway) Remote Code Execution Vulnerability',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2020-0610'
-                                        }
-                                    ],
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif toPort and fromPort == '3389' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-rdp-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.9] Security groups should not allow unrestricted Remote Desktop Protocol (RDP) access',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted Remote Desktop Protocol (RDP) access on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Microsoft CVE-2020-0660: Windows Remote Desktop Protocol (RDP) Denial of Service Vulnerability',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2020-0660'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Microsoft CVE-2020-0610: Windows Remote Desktop Gateway (RD Gateway) Remote Code Execution Vulnerability',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2020-0610'
-                                        }
-                                    ],
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
-
-def security_group_open_postgresql_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
+def security_group_all_open_check(secgroup):
+    awsAccountId = accountId.get()
+    sgName = str(secgroup['GroupName'])
+    sgId = str(secgroup['GroupId'])
+    sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
+    for permissions in secgroup['IpPermissions']:
+        try:
+            fromPort = str(permissions['FromPort'])
+        except Exception as e:
+            if str(e) == "'FromPort'":
+                pass
+            else:
                 print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '5432' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-postgresql-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.10] Security groups should not allow unrestricted PostgreSQL datbase (TCP 5432) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted PostgreSQL datbase (TCP 5432) access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif toPort and fromPort == '5432' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-postgresql-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.10] Security groups should not allow unrestricted PostgreSQL datbase (TCP 5432) access',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted PostgreSQL datbase (TCP 5432) access on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
-
-def security_group_open_kibana_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
+        try:
+            toPort = str(permissions['ToPort'])
+        except Exception as e:
+            if str(e) == "'ToPort'":
+                pass
+            else:
                 print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '5601' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-kibana-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.11] Security groups should not allow unrestricted access to Kibana (TCP 5601)',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted access to Kibana (TCP 5601) on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'CVE-2019-7609: Exploit Script Available for Kibana Remote Code Execution Vulnerability',
-                                            'Source': 'Tenable Blog',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2020-0660'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Red Hat OpenShift: CVE-2019-7608: kibana: Cross-site scripting vulnerability permits perform destructive actions on behalf of other Kibana users',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/redhat-openshift-cve-2019-7608'
-                                        }
-                                    ],
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif toPort and fromPort == '5601' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-kibana-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.11] Security groups should not allow unrestricted access to Kibana (TCP 5601)',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted access to Kibana (TCP 5601) on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'CVE-2019-7609: Exploit Script Available for Kibana Remote Code Execution Vulnerability',
-                                            'Source': 'Tenable Blog',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2020-0660'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Red Hat OpenShift: CVE-2019-7608: kibana: Cross-site scripting vulnerability permits perform destructive actions on behalf of other Kibana users',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/redhat-openshift-cve-2019-7608'
-                                        }
-                                    ],
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
+        try:
+            ipProtocol = str(permissions['IpProtocol'])
+        except Exception as e:
+            print(e)
+        ipRanges = permissions['IpRanges']
+        for cidrs in ipRanges:
+            cidrIpRange = str(cidrs['CidrIp'])
+            if ipProtocol == '-1' and cidrIpRange == '0.0.0.0/0':
+                try:
+                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': sgArn + '/' + ipProtocol + '/security-group-all-open-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': sgArn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [ 
+                                'Software and Configuration Checks/AWS Security Best Practices',
+                                'Effects/Data Exposure'
+                            ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 90 },
+                            'Confidence': 99,
+                            'Title': '[SecurityGroup.1] Security groups should not allow unrestricted access to all ports and protocols',
+                            'Description': 'Security group ' + sgName + ' allows unrestricted access to all ports and protocols. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
+                                    'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
+                                }
+                            },
+                            'ProductFields': { 'Product Name': 'ElectricEye' },
+                            'Resources': [
+                                {
+                                    'Type': 'AwsEc2SecurityGroup',
+                                    'Id': sgArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'AwsEc2SecurityGroup': {
+                                            'GroupName': sgName,
+                                            'GroupId': sgId
+                                        }
+                                    }
+                                }
+                            ],
+                            'Compliance': { 'Status': 'FAILED' },
+                            'RecordState': 'ACTIVE'
+                        }
+                    )
+                except Exception as e:
+                    print(e)
+            elif ipProtocol == '-1' and cidrIpRange != '0.0.0.0/0':
+                try:
+                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': sgArn + '/' + ipProtocol + '/security-group-all-open-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': sgArn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [ 
+                                'Software and Configuration Checks/AWS Security Best Practices',
+                                'Effects/Data Exposure'
+                            ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 0 },
+                            'Confidence': 99,
+                            'Title': '[SecurityGroup.1] Security groups should not allow unrestricted access to all ports and protocols',
+                            'Description': 'Security group ' + sgName + ' does not allow unrestricted access to all ports and protocols. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
+                                    'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
+                                }
+                            },
+                            'ProductFields': { 'Product Name': 'ElectricEye' },
+                            'Resources': [
+                                {
+                                    'Type': 'AwsEc2SecurityGroup',
+                                    'Id': sgArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'AwsEc2SecurityGroup': {
+                                            'GroupName': sgName,
+                                            'GroupId': sgId
+                                        }
+                                    }
+                                }
+                            ],
+                            'Compliance': { 'Status': 'PASSED' },
+                            'RecordState': 'ARCHIVED'
+                        }
+                    )
+                except Exception as e:
+                    print(e)
+            else:
+                pass
 
-def security_group_open_redis_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '6379' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-redis-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.12] Security groups should not allow unrestricted Redis (TCP 6379) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted Redis (TCP 6379) access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Redis 4.x / 5.x - Unauthenticated Code Execution (Metasploit)',
-                                            'Source': 'ExploitDB',
-                                            'SourceUrl': 'https://www.exploit-db.com/exploits/47195'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Redis: Improper Input Validation (CVE-2013-0178)',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/redislabs-redis-cve-2013-0178'
-                                        }
-                                    ],
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif toPort and fromPort == '6379' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-redis-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.12] Security groups should not allow unrestricted Redis (TCP 6379) access',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted Redis (TCP 6379) access on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Redis 4.x / 5.x - Unauthenticated Code Execution (Metasploit)',
-                                            'Source': 'ExploitDB',
-                                            'SourceUrl': 'https://www.exploit-db.com/exploits/47195'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Redis: Improper Input Validation (CVE-2013-0178)',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/redislabs-redis-cve-2013-0178'
-                                        }
-                                    ],
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
+# sensitive ports checked against every security group, add new ports here instead of writing a new check
+sensitivePorts = [
+    {
+        'Ports': [20, 21],
+        'Protocol': 'tcp',
+        'CheckSlug': 'ftp',
+        'Title': '[SecurityGroup.2] Security groups should not allow unrestricted File Transfer Protocol (FTP) access',
+        'Exposure': 'File Transfer Protocol (FTP) access',
+        'Severity': 40
+    },
+    {
+        'Ports': [23],
+        'Protocol': 'tcp',
+        'CheckSlug': 'telnet',
+        'Title': '[SecurityGroup.3] Security groups should not allow unrestricted TelNet access',
+        'Exposure': 'TelNet access',
+        'Severity': 40
+    },
+    {
+        'Ports': [135],
+        'Protocol': 'tcp',
+        'CheckSlug': 'wsrpc-dcom',
+        'Title': '[SecurityGroup.4] Security groups should not allow unrestricted Windows RPC DCOM access',
+        'Exposure': 'Windows RPC DCOM access',
+        'Severity': 40,
+        'ThreatIntelIndicators': [
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'Attack signature information, refer to Threatl Intel Source URL',
+                'Source': 'Symantec Security Center',
+                'SourceUrl': 'https://www.symantec.com/security_response/attacksignatures/detail.jsp?asid=20387'
+            }
+        ]
+    },
+    {
+        'Ports': [445],
+        'Protocol': 'tcp',
+        'CheckSlug': 'smb',
+        'Title': '[SecurityGroup.5] Security groups should not allow unrestricted Server Message Blocks (SMB) access',
+        'Exposure': 'Server Message Blocks (SMB) access',
+        'Severity': 40,
+        'ThreatIntelIndicators': [
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'MS17-010 EternalBlue SMB Remote Windows Kernel Pool Corruption',
+                'Source': 'Rapid7 Vulnerability & Exploit Database',
+                'SourceUrl': 'https://www.rapid7.com/db/modules/exploit/windows/smb/ms17_010_eternalblue'
+            },
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'How to use EternalBlue to Exploit SMB Port using Public Wi-Fi',
+                'Source': 'Medium',
+                'SourceUrl': 'https://medium.com/@melvinshb/how-to-use-eternalblue-to-exploit-smb-port-using-public-wi-fi-79a996821767'
+            }
+        ]
+    },
+    {
+        'Ports': [1433],
+        'Protocol': 'tcp',
+        'CheckSlug': 'mssql',
+        'Title': '[SecurityGroup.6] Security groups should not allow unrestricted Microsoft SQL Server (MSSQL) access',
+        'Exposure': 'Microsoft SQL Server (MSSQL) access',
+        'Severity': 40,
+        'ThreatIntelIndicators': [
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'Microsoft CVE-2020-0618: Microsoft SQL Server Reporting Services Remote Code Execution Vulnerability',
+                'Source': 'Rapid7 Vulnerability & Exploit Database',
+                'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2020-0618'
+            },
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'Microsoft CVE-2019-0819: Microsoft SQL Server Analysis Services Information Disclosure Vulnerability',
+                'Source': 'Rapid7 Vulnerability & Exploit Database',
+                'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2019-0819'
+            },
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'Microsoft CVE-2018-8273: Microsoft SQL Server Remote Code Execution Vulnerability',
+                'Source': 'Rapid7 Vulnerability & Exploit Database',
+                'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2018-8273'
+            }
+        ]
+    },
+    {
+        'Ports': [1521],
+        'Protocol': 'tcp',
+        'CheckSlug': 'oracledb',
+        'Title': '[SecurityGroup.7] Security groups should not allow unrestricted Oracle database (TCP 1521) access',
+        'Exposure': 'Oracle database (TCP 1521) access',
+        'Severity': 40
+    },
+    {
+        'Ports': [3306],
+        'Protocol': 'tcp',
+        'CheckSlug': 'mysql-mariadb',
+        'Title': '[SecurityGroup.8] Security groups should not allow unrestricted MySQL or MariaDB database (TCP 3306) access',
+        'Exposure': 'MySQL or MariaDB database (TCP 3306) access',
+        'Severity': 40
+    },
+    {
+        'Ports': [3389],
+        'Protocol': 'tcp',
+        'CheckSlug': 'rdp',
+        'Title': '[SecurityGroup.9] Security groups should not allow unrestricted Remote Desktop Protocol (RDP) access',
+        'Exposure': 'Remote Desktop Protocol (RDP) access',
+        'Severity': 90,
+        'ThreatIntelIndicators': [
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'Microsoft CVE-2020-0660: Windows Remote Desktop Protocol (RDP) Denial of Service Vulnerability',
+                'Source': 'Rapid7 Vulnerability & Exploit Database',
+                'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2020-0660'
+            },
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'Microsoft CVE-2020-0610: Windows Remote Desktop Gateway (RD Gateway) Remote Code Execution Vulnerability',
+                'Source': 'Rapid7 Vulnerability & Exploit Database',
+                'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2020-0610'
+            }
+        ]
+    },
+    {
+        'Ports': [5432],
+        'Protocol': 'tcp',
+        'CheckSlug': 'postgresql',
+        'Title': '[SecurityGroup.10] Security groups should not allow unrestricted PostgreSQL datbase (TCP 5432) access',
+        'Exposure': 'PostgreSQL datbase (TCP 5432) access',
+        'Severity': 40
+    },
+    {
+        'Ports': [5601],
+        'Protocol': 'tcp',
+        'CheckSlug': 'kibana',
+        'Title': '[SecurityGroup.11] Security groups should not allow unrestricted access to Kibana (TCP 5601)',
+        'Exposure': 'access to Kibana (TCP 5601)',
+        'Severity': 40,
+        'ThreatIntelIndicators': [
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'CVE-2019-7609: Exploit Script Available for Kibana Remote Code Execution Vulnerability',
+                'Source': 'Tenable Blog',
+                'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/msft-cve-2020-0660'
+            },
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'Red Hat OpenShift: CVE-2019-7608: kibana: Cross-site scripting vulnerability permits perform destructive actions on behalf of other Kibana users',
+                'Source': 'Rapid7 Vulnerability & Exploit Database',
+                'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/redhat-openshift-cve-2019-7608'
+            }
+        ]
+    },
+    {
+        'Ports': [6379],
+        'Protocol': 'tcp',
+        'CheckSlug': 'redis',
+        'Title': '[SecurityGroup.12] Security groups should not allow unrestricted Redis (TCP 6379) access',
+        'Exposure': 'Redis (TCP 6379) access',
+        'Severity': 40,
+        'ThreatIntelIndicators': [
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'Redis 4.x / 5.x - Unauthenticated Code Execution (Metasploit)',
+                'Source': 'ExploitDB',
+                'SourceUrl': 'https://www.exploit-db.com/exploits/47195'
+            },
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'Redis: Improper Input Validation (CVE-2013-0178)',
+                'Source': 'Rapid7 Vulnerability & Exploit Database',
+                'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/redislabs-redis-cve-2013-0178'
+            }
+        ]
+    },
+    {
+        'Ports': [8089],
+        'Protocol': 'tcp',
+        'CheckSlug': 'splunkd',
+        'Title': '[SecurityGroup.13] Security groups should not allow unrestricted Splunkd (TCP 8089) access',
+        'Exposure': 'Splunkd (TCP 8089) access',
+        'Severity': 40,
+        'ThreatIntelIndicators': [
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'Splunk - Remote Command Execution',
+                'Source': 'ExploitDB',
+                'SourceUrl': 'https://www.exploit-db.com/exploits/18245'
+            },
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'Splunk Web Interface Login Utility',
+                'Source': 'Rapid7 Vulnerability & Exploit Database',
+                'SourceUrl': 'https://www.rapid7.com/db/modules/auxiliary/scanner/http/splunk_web_login'
+            }
+        ]
+    },
+    {
+        'Ports': [9200],
+        'Protocol': 'tcp',
+        'CheckSlug': 'elasticsearch-9200',
+        'Title': '[SecurityGroup.14] Security groups should not allow unrestricted Elasticsearch (TCP 9200) access',
+        'Exposure': 'Elasticsearch (TCP 9200) access',
+        'Severity': 40
+    },
+    {
+        'Ports': [9300],
+        'Protocol': 'tcp',
+        'CheckSlug': 'elasticsearch-9300',
+        'Title': '[SecurityGroup.15] Security groups should not allow unrestricted Elasticsearch (TCP 9300) access',
+        'Exposure': 'Elasticsearch (TCP 9300) access',
+        'Severity': 40
+    },
+    {
+        'Ports': [11211],
+        'Protocol': 'udp',
+        'CheckSlug': 'memcached',
+        'Title': '[SecurityGroup.16] Security groups should not allow unrestricted Memcached (UDP 11211) access',
+        'Exposure': 'Memcached (UDP 11211) access',
+        'Severity': 40,
+        'ThreatIntelIndicators': [
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'memcached 1.4.2 - Memory Consumption Remote Denial of Service',
+                'Source': 'ExploitDB',
+                'SourceUrl': 'https://www.exploit-db.com/exploits/33850'
+            },
+            {
+                'Category': 'BACKDOOR',
+                'Value': 'Ubuntu: USN-4125-1 (CVE-2019-15026): Memcached vulnerability',
+                'Source': 'Rapid7 Vulnerability & Exploit Database',
+                'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/ubuntu-cve-2019-15026'
+            }
+        ]
+    },
+    {
+        'Ports': [5439],
+        'Protocol': 'tcp',
+        'CheckSlug': 'redshift',
+        'Title': '[SecurityGroup.18] Security groups should not allow unrestricted Redshift (TCP 5439) access',
+        'Exposure': 'Redshift (TCP 5439) access',
+        'Severity': 40
+    },
+    {
+        'Ports': [27017],
+        'Protocol': 'tcp',
+        'CheckSlug': 'documentdb',
+        'Title': '[SecurityGroup.19] Security groups should not allow unrestricted DocumentDB (TCP 27017) access',
+        'Exposure': 'DocumentDB (TCP 27017) access',
+        'Severity': 40
+    }
+]
+# IpProtocol can be a name or an IANA protocol number, -1 means every protocol and port
+protocolNames = {'6': 'tcp', '17': 'udp'}
+openCidrs = ('0.0.0.0/0', '::/0')
 
-def security_group_open_splunkd_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '8089' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-splunkd-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.13] Security groups should not allow unrestricted Splunkd (TCP 8089) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted Splunkd (TCP 8089) access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Splunk - Remote Command Execution',
-                                            'Source': 'ExploitDB',
-                                            'SourceUrl': 'https://www.exploit-db.com/exploits/18245'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Splunk Web Interface Login Utility',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/modules/auxiliary/scanner/http/splunk_web_login'
-                                        }
-                                    ],
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif toPort and fromPort == '8089' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-splunkd-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.13] Security groups should not allow unrestricted Splunkd (TCP 8089) access',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted Splunkd (TCP 8089) access on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Splunk - Remote Command Execution',
-                                            'Source': 'ExploitDB',
-                                            'SourceUrl': 'https://www.exploit-db.com/exploits/18245'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Splunk Web Interface Login Utility',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/modules/auxiliary/scanner/http/splunk_web_login'
-                                        }
-                                    ],
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
+class PortIntervalIndex(object):
+    # ingress port ranges for one protocol, sorted by FromPort with a running max of ToPort
+    # so "does any rule cover this port" is a single binary search
+    def __init__(self, intervals):
+        intervals.sort()
+        self.fromPorts = [fromPort for fromPort, toPort in intervals]
+        self.reachPorts = []
+        reach = -1
+        for fromPort, toPort in intervals:
+            reach = max(reach, toPort)
+            self.reachPorts.append(reach)
 
-def security_group_open_elasticsearch1_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '9200' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-elasticsearch-9200-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.14] Security groups should not allow unrestricted Elasticsearch (TCP 9200) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted Elasticsearch (TCP 9200) access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif toPort and fromPort == '9200' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-elasticsearch-9200-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.14] Security groups should not allow unrestricted Elasticsearch (TCP 9200) access',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted Elasticsearch (TCP 9200) access on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
-
-def security_group_open_elasticsearch2_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '9300' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-elasticsearch-9300-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.15] Security groups should not allow unrestricted Elasticsearch (TCP 9300) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted Elasticsearch (TCP 9300) access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif toPort and fromPort == '9300' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-elasticsearch-9300-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.15] Security groups should not allow unrestricted Elasticsearch (TCP 9300) access',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted Elasticsearch (TCP 9300) access on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
+    def covers(self, port):
+        position = bisect.bisect_right(self.fromPorts, port)
+        return position > 0 and self.reachPorts[position - 1] >= port
 
-def security_group_open_memcached_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '11211' and ipProtocol == 'udp' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-memcached-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.16] Security groups should not allow unrestricted Memcached (UDP 11211) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted Memcached (UDP 11211) access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'memcached 1.4.2 - Memory Consumption Remote Denial of Service',
-                                            'Source': 'ExploitDB',
-                                            'SourceUrl': 'https://www.exploit-db.com/exploits/33850'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Ubuntu: USN-4125-1 (CVE-2019-15026): Memcached vulnerability',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/ubuntu-cve-2019-15026'
-                                        }
-                                    ],
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif toPort and fromPort == '11211' and ipProtocol == 'udp' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-memcached-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.16] Security groups should not allow unrestricted Memcached (UDP 11211) access',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted Memcached (UDP 11211) access on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'memcached 1.4.2 - Memory Consumption Remote Denial of Service',
-                                            'Source': 'ExploitDB',
-                                            'SourceUrl': 'https://www.exploit-db.com/exploits/33850'
-                                        },
-                                        {
-                                            'Category': 'BACKDOOR',
-                                            'Value': 'Ubuntu: USN-4125-1 (CVE-2019-15026): Memcached vulnerability',
-                                            'Source': 'Rapid7 Vulnerability & Exploit Database',
-                                            'SourceUrl': 'https://www.rapid7.com/db/vulnerabilities/ubuntu-cve-2019-15026'
-                                        }
-                                    ],
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
+def index_ingress_rules(secgroup):
+    # normalize every ingress rule of a security group once into per protocol intervals,
+    # split by whether the source is open to the internet or restricted
+    intervals = {}
+    for permissions in secgroup['IpPermissions']:
+        ipProtocol = str(permissions.get('IpProtocol', '')).lower()
+        ipProtocol = protocolNames.get(ipProtocol, ipProtocol)
+        if ipProtocol == '-1':
+            protocols = ('tcp', 'udp')
+            fromPort, toPort = 0, 65535
+        else:
+            protocols = (ipProtocol,)
+            fromPort = permissions.get('FromPort', 0)
+            toPort = permissions.get('ToPort', 65535)
+            if fromPort == -1 or toPort == -1:
+                fromPort, toPort = 0, 65535
+        cidrs = [str(cidr['CidrIp']) for cidr in permissions.get('IpRanges', [])]
+        cidrs.extend([str(cidr['CidrIpv6']) for cidr in permissions.get('Ipv6Ranges', [])])
+        for cidrIpRange in cidrs:
+            exposure = 'open' if cidrIpRange in openCidrs else 'restricted'
+            for protocol in protocols:
+                intervals.setdefault((protocol, exposure), []).append((fromPort, toPort))
+    return {key: PortIntervalIndex(value) for key, value in intervals.items()}
 
-def security_group_open_redshift_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '5439' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-redshift-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.18] Security groups should not allow unrestricted Redshift (TCP 5439) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted Redshift (TCP 5439) access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif toPort and fromPort == '5439' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-redshift-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.18] Security groups should not allow unrestricted Redshift (TCP 5439) access',
-                                    'Description': 'Security group ' + sgName + ' does not allow unrestricted Redshift (TCP 5439) access on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
+def sensitive_port_exposure(ruleIndex, sensitivePort):
+    # OPEN if any port is reachable from the internet, RESTRICTED if only from specific ranges
+    for exposure in ('open', 'restricted'):
+        portIndex = ruleIndex.get((sensitivePort['Protocol'], exposure))
+        if portIndex is None:
+            continue
+        for port in sensitivePort['Ports']:
+            if portIndex.covers(port):
+                return exposure
+    return None
 
-def security_group_open_documentdb_check():
-    for secgroup in mySgs:
-        sgName = str(secgroup['GroupName'])
-        sgId = str(secgroup['GroupId'])
-        sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
-        for permissions in secgroup['IpPermissions']:
-            try:
-                fromPort = str(permissions['FromPort'])
-            except Exception as e:
-                if str(e) == "'FromPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                toPort = str(permissions['ToPort'])
-            except Exception as e:
-                if str(e) == "'ToPort'":
-                    pass
-                else:
-                    print(e)
-            try:
-                ipProtocol = str(permissions['IpProtocol'])
-            except Exception as e:
-                print(e)
-            ipRanges = permissions['IpRanges']
-            for cidrs in ipRanges:
-                cidrIpRange = str(cidrs['CidrIp'])
-                if toPort and fromPort == '27017' and cidrIpRange == '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-documentdb-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.19] Security groups should not allow unrestricted DocumentDB (TCP 27017) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted DocumentDB (TCP 27017) access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                elif toPort and fromPort == '27017' and cidrIpRange != '0.0.0.0/0':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': sgArn + '/' + ipProtocol + '/security-group-documentdb-open-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': sgArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[SecurityGroup.19] Security groups should not allow unrestricted DocumentDB (TCP 27017) access',
-                                    'Description': 'Security group ' + sgName + ' allows unrestricted DocumentDB (TCP 27017) access on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsEc2SecurityGroup',
-                                            'Id': sgArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsEc2SecurityGroup': {
-                                                    'GroupName': sgName,
-                                                    'GroupId': sgId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    pass
+def security_group_sensitive_port_check(secgroup):
+    awsAccountId = accountId.get()
+    sgName = str(secgroup['GroupName'])
+    sgId = str(secgroup['GroupId'])
+    sgArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + ':security-group/' + sgId
+    try:
+        ruleIndex = index_ingress_rules(secgroup)
+    except Exception as e:
+        print(e)
+        return
+    for sensitivePort in sensitivePorts:
+        exposure = sensitive_port_exposure(ruleIndex, sensitivePort)
+        if exposure is None:
+            continue
+        ipProtocol = sensitivePort['Protocol']
+        if exposure == 'open':
+            description = 'Security group ' + sgName + ' allows unrestricted ' + sensitivePort['Exposure'] + ' on ' + ipProtocol + '. Refer to the remediation instructions to remediate this behavior. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.'
+            severity = sensitivePort['Severity']
+            complianceStatus = 'FAILED'
+            recordState = 'ACTIVE'
+        else:
+            description = 'Security group ' + sgName + ' does not allow unrestricted ' + sensitivePort['Exposure'] + ' on ' + ipProtocol + '. Your security group should still be audited to ensure any other rules are compliant with organizational or regulatory requirements.'
+            severity = 0
+            complianceStatus = 'PASSED'
+            recordState = 'ARCHIVED'
+        try:
+            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+            finding = {
+                'SchemaVersion': '2018-10-08',
+                'Id': sgArn + '/' + ipProtocol + '/security-group-' + sensitivePort['CheckSlug'] + '-open-check',
+                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                'GeneratorId': sgArn,
+                'AwsAccountId': awsAccountId,
+                'Types': [
+                    'Software and Configuration Checks/AWS Security Best Practices',
+                    'Effects/Data Exposure'
+                ],
+                'FirstObservedAt': iso8601Time,
+                'CreatedAt': iso8601Time,
+                'UpdatedAt': iso8601Time,
+                'Severity': { 'Normalized': severity },
+                'Confidence': 99,
+                'Title': sensitivePort['Title'],
+                'Description': description,
+                'Remediation': {
+                    'Recommendation': {
+                        'Text': 'For more information on modifying security group rules refer to the Adding, Removing, and Updating Rules section of the Amazon Virtual Private Cloud User Guide',
+                        'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/VPC_SecurityGroups.html#AddRemoveRules'
+                    }
+                },
+                'ProductFields': { 'Product Name': 'ElectricEye' },
+                'Resources': [
+                    {
+                        'Type': 'AwsEc2SecurityGroup',
+                        'Id': sgArn,
+                        'Partition': 'aws',
+                        'Region': awsRegion,
+                        'Details': {
+                            'AwsEc2SecurityGroup': {
+                                'GroupName': sgName,
+                                'GroupId': sgId
+                            }
+                        }
+                    }
+                ],
+                'Compliance': { 'Status': complianceStatus },
+                'RecordState': recordState
+            }
+            if 'ThreatIntelIndicators' in sensitivePort:
+                finding['ThreatIntelIndicators'] = sensitivePort['ThreatIntelIndicators']
+            findingSink.put(finding)
+        except Exception as e:
+            print(e)
 
 def security_group_auditor():
-    security_group_all_open_check()
-    security_group_open_ftp_check()
-    security_group_open_telnet_check()
-    security_group_open_dcom_rpc_check()
-    security_group_open_smb_check()
-    security_group_open_mssql_check()
-    security_group_open_oracle_check()
-    security_group_open_mysql_mariadb_check()
-    security_group_open_rdp_check()
-    security_group_open_postgresql_check()
-    security_group_open_kibana_check()
-    security_group_open_redis_check()
-    security_group_open_splunkd_check()
-    security_group_open_elasticsearch1_check()
-    security_group_open_elasticsearch2_check()
-    security_group_open_memcached_check()
-    security_group_open_redshift_check()
-    security_group_open_documentdb_check()
+    for secgroup in mySgs:
+        security_group_all_open_check(secgroup)
+        security_group_sensitive_port_check(secgroup)
 
-security_group_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    security_group_auditor()
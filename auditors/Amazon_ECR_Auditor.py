@@ -13,21 +13,23 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import datetime
 import os
+from finding_sink import default_sink
+from resource_inventory import default_inventory
+from scan_scope import lazy_account_id, lazy_client
 # import boto3 clients
-securityhub = boto3.client('securityhub')
-ecr = boto3.client('ecr')
-sts = boto3.client('sts')
+findingSink = default_sink()
+inventory = default_inventory()
+ecr = lazy_client('ecr')
 # create account id & region variables
-awsAccount = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 awsRegion = os.environ['AWS_REGION']
 # loop through ECR repos
-response = ecr.describe_repositories(maxResults=1000)
-myRepos = response['repositories']
+myRepos = inventory.lazy('ecr', 'describe_repositories', 'repositories')
 
 def ecr_repo_vuln_scan_check():
+    awsAccount = accountId.get()
     for repo in myRepos:
         repoArn = str(repo['repositoryArn'])
         repoName = str(repo['repositoryName'])
@@ -37,48 +39,45 @@ def ecr_repo_vuln_scan_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': repoArn + '/ecr-no-scan',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
-                            'GeneratorId': repoArn,
-                            'AwsAccountId': awsAccount,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 40 },
-                            'Confidence': 99,
-                            'Title': '[ECR.1] ECR repositories should be configured to scan images on push',
-                            'Description': 'ECR repository ' + repoName + ' is not configured to scan images on push. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your repository should be configured to scan on push refer to the Image Scanning section in the Amazon ECR User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonECR/latest/userguide/image-scanning.html'
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': repoArn + '/ecr-no-scan',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
+                        'GeneratorId': repoArn,
+                        'AwsAccountId': awsAccount,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 40 },
+                        'Confidence': 99,
+                        'Title': '[ECR.1] ECR repositories should be configured to scan images on push',
+                        'Description': 'ECR repository ' + repoName + ' is not configured to scan images on push. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your repository should be configured to scan on push refer to the Image Scanning section in the Amazon ECR User Guide',
+                                'Url': 'https://docs.aws.amazon.com/AmazonECR/latest/userguide/image-scanning.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEcrRepository',
+                                'Id': repoArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'RepositoryName': repoName }
                                 }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsEcrRepository',
-                                    'Id': repoArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'RepositoryName': repoName }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
@@ -86,104 +85,99 @@ def ecr_repo_vuln_scan_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': repoArn + '/ecr-no-scan',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
-                            'GeneratorId': repoArn,
-                            'AwsAccountId': awsAccount,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[ECR.1] ECR repositories should be configured to scan images on push',
-                            'Description': 'ECR repository ' + repoName + ' is configured to scan images on push.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your repository should be configured to scan on push refer to the Image Scanning section in the Amazon ECR User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonECR/latest/userguide/image-scanning.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsEcrRepository',
-                                    'Id': repoArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'RepositoryName': repoName }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': repoArn + '/ecr-no-scan',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
+                        'GeneratorId': repoArn,
+                        'AwsAccountId': awsAccount,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[ECR.1] ECR repositories should be configured to scan images on push',
+                        'Description': 'ECR repository ' + repoName + ' is configured to scan images on push.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your repository should be configured to scan on push refer to the Image Scanning section in the Amazon ECR User Guide',
+                                'Url': 'https://docs.aws.amazon.com/AmazonECR/latest/userguide/image-scanning.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEcrRepository',
+                                'Id': repoArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'RepositoryName': repoName }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def ecr_repo_image_lifecycle_policy_check():
+    awsAccount = accountId.get()
     for repo in myRepos:
         repoArn = str(repo['repositoryArn'])
         repoName = str(repo['repositoryName'])
         try:
-            # this is a passing finding
-            response = ecr.get_lifecycle_policy(repositoryName=repoName)
+            # raises when the repository has no policy, this is a passing finding
+            ecr.get_lifecycle_policy(repositoryName=repoName)
             try:
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': repoArn + '/ecr-lifecycle-policy-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
-                            'GeneratorId': repoArn,
-                            'AwsAccountId': awsAccount,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[ECR.2] ECR repositories should be have an image lifecycle policy configured',
-                            'Description': 'ECR repository ' + repoName + ' does not have an image lifecycle policy configured. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your repository should be configured to have an image lifecycle policy refer to the Amazon ECR Lifecycle Policies section in the Amazon ECR User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonECR/latest/userguide/LifecyclePolicies.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsEcrRepository',
-                                    'Id': repoArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'RepositoryName': repoName }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': repoArn + '/ecr-lifecycle-policy-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
+                        'GeneratorId': repoArn,
+                        'AwsAccountId': awsAccount,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[ECR.2] ECR repositories should be have an image lifecycle policy configured',
+                        'Description': 'ECR repository ' + repoName + ' does not have an image lifecycle policy configured. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your repository should be configured to have an image lifecycle policy refer to the Amazon ECR Lifecycle Policies section in the Amazon ECR User Guide',
+                                'Url': 'https://docs.aws.amazon.com/AmazonECR/latest/userguide/LifecyclePolicies.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEcrRepository',
+                                'Id': repoArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'RepositoryName': repoName }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         except:
@@ -191,104 +185,99 @@ def ecr_repo_image_lifecycle_policy_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': repoArn + '/ecr-lifecycle-policy-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
-                            'GeneratorId': repoArn,
-                            'AwsAccountId': awsAccount,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 40 },
-                            'Confidence': 99,
-                            'Title': '[ECR.2] ECR repositories should be have an image lifecycle policy configured',
-                            'Description': 'ECR repository ' + repoName + ' does not have an image lifecycle policy configured. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your repository should be configured to have an image lifecycle policy refer to the Amazon ECR Lifecycle Policies section in the Amazon ECR User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonECR/latest/userguide/LifecyclePolicies.html'
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': repoArn + '/ecr-lifecycle-policy-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
+                        'GeneratorId': repoArn,
+                        'AwsAccountId': awsAccount,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 40 },
+                        'Confidence': 99,
+                        'Title': '[ECR.2] ECR repositories should be have an image lifecycle policy configured',
+                        'Description': 'ECR repository ' + repoName + ' does not have an image lifecycle policy configured. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your repository should be configured to have an image lifecycle policy refer to the Amazon ECR Lifecycle Policies section in the Amazon ECR User Guide',
+                                'Url': 'https://docs.aws.amazon.com/AmazonECR/latest/userguide/LifecyclePolicies.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEcrRepository',
+                                'Id': repoArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'RepositoryName': repoName }
                                 }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsEcrRepository',
-                                    'Id': repoArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'RepositoryName': repoName }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def ecr_repo_permission_policy():
+    awsAccount = accountId.get()
     for repo in myRepos:
         repoArn = str(repo['repositoryArn'])
         repoName = str(repo['repositoryName'])
         try:
-            # this is a passing finding
-            response = ecr.get_repository_policy(repositoryName=repoName)
+            # raises when the repository has no policy, this is a passing finding
+            ecr.get_repository_policy(repositoryName=repoName)
             try:
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': repoArn + '/ecr-repo-access-policy-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
-                            'GeneratorId': repoArn,
-                            'AwsAccountId': awsAccount,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[ECR.3] ECR repositories should be have a repository policy configured',
-                            'Description': 'ECR repository ' + repoName + ' has a repository policy configured.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your repository should be configured to have a repository policy refer to the Amazon ECR Repository Policies section in the Amazon ECR User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonECR/latest/userguide/repository-policies.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsEcrRepository',
-                                    'Id': repoArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'RepositoryName': repoName }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': repoArn + '/ecr-repo-access-policy-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
+                        'GeneratorId': repoArn,
+                        'AwsAccountId': awsAccount,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[ECR.3] ECR repositories should be have a repository policy configured',
+                        'Description': 'ECR repository ' + repoName + ' has a repository policy configured.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your repository should be configured to have a repository policy refer to the Amazon ECR Repository Policies section in the Amazon ECR User Guide',
+                                'Url': 'https://docs.aws.amazon.com/AmazonECR/latest/userguide/repository-policies.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEcrRepository',
+                                'Id': repoArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'RepositoryName': repoName }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         except:
@@ -296,48 +285,45 @@ def ecr_repo_permission_policy():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': repoArn + '/ecr-repo-access-policy-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
-                            'GeneratorId': repoArn,
-                            'AwsAccountId': awsAccount,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 40 },
-                            'Confidence': 99,
-                            'Title': '[ECR.3] ECR repositories should be have a repository policy configured',
-                            'Description': 'ECR repository ' + repoName + ' does not have a repository policy configured. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'If your repository should be configured to have a repository policy refer to the Amazon ECR Repository Policies section in the Amazon ECR User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonECR/latest/userguide/repository-policies.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsEcrRepository',
-                                    'Id': repoArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'RepositoryName': repoName }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': repoArn + '/ecr-repo-access-policy-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccount + ':product/' + awsAccount + '/default',
+                        'GeneratorId': repoArn,
+                        'AwsAccountId': awsAccount,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 40 },
+                        'Confidence': 99,
+                        'Title': '[ECR.3] ECR repositories should be have a repository policy configured',
+                        'Description': 'ECR repository ' + repoName + ' does not have a repository policy configured. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'If your repository should be configured to have a repository policy refer to the Amazon ECR Repository Policies section in the Amazon ECR User Guide',
+                                'Url': 'https://docs.aws.amazon.com/AmazonECR/latest/userguide/repository-policies.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEcrRepository',
+                                'Id': repoArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'RepositoryName': repoName }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
@@ -346,4 +332,5 @@ def ecr_auditor():
     ecr_repo_image_lifecycle_policy_check()
     ecr_repo_permission_policy()
 
-ecr_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    ecr_auditor()
\ No newline at end of file
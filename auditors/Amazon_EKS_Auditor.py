@@ -13,18 +13,19 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import os
 import datetime
+from finding_sink import default_sink
+from scan_scope import lazy_account_id, lazy_client
 # import boto3 clients
-sts = boto3.client('sts')
-eks = boto3.client('eks')
-securityhub = boto3.client('securityhub')
+eks = lazy_client('eks')
+findingSink = default_sink()
 # create region & account variables
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 awsRegion = os.environ['AWS_REGION']
 
 def eks_public_endpoint_access_check():
+    awsAccountId = accountId.get()
     # loop through EKS clusters
     response = eks.list_clusters(maxResults=100)
     myEksClusters = response['clusters']
@@ -40,51 +41,48 @@ def eks_public_endpoint_access_check():
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                     # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': clusterArn + '/public-endpoint-access-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': clusterName,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 80 },
-                                'Confidence': 99,
-                                'Title': '[EKS.1] Elastic Kubernetes Service (EKS) cluster API servers should not be accessible from the internet',
-                                'Description': 'Elastic Kubernetes Service (EKS) cluster ' + clusterName + ' API server is accessible from the internet. Refer to the remediation instructions if this configuration is not intended',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your EKS cluster is not intended to be public refer to the Amazon EKS Cluster Endpoint Access Control section of the EKS user guide',
-                                        'Url': 'https://docs.aws.amazon.com/eks/latest/userguide/cluster-endpoint.html'
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': clusterArn + '/public-endpoint-access-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': clusterName,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [
+                                'Software and Configuration Checks/AWS Security Best Practices',
+                                'Effects/Data Exposure'
+                            ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 80 },
+                            'Confidence': 99,
+                            'Title': '[EKS.1] Elastic Kubernetes Service (EKS) cluster API servers should not be accessible from the internet',
+                            'Description': 'Elastic Kubernetes Service (EKS) cluster ' + clusterName + ' API server is accessible from the internet. Refer to the remediation instructions if this configuration is not intended',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'If your EKS cluster is not intended to be public refer to the Amazon EKS Cluster Endpoint Access Control section of the EKS user guide',
+                                    'Url': 'https://docs.aws.amazon.com/eks/latest/userguide/cluster-endpoint.html'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'AwsEksCluster',
+                                    'Id': clusterArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 'Cluster Name': clusterName }
                                     }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsEksCluster',
-                                        'Id': clusterArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 'Cluster Name': clusterName }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'FAILED' },
+                            'RecordState': 'ACTIVE'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
             else:
@@ -92,57 +90,55 @@ def eks_public_endpoint_access_check():
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                     # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': clusterArn + '/public-endpoint-access-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': clusterName,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[EKS.1] Elastic Kubernetes Service (EKS) cluster API servers should not be accessible from the internet',
-                                'Description': 'Elastic Kubernetes Service (EKS) cluster ' + clusterName + ' API server is not accessible from the internet.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'If your EKS cluster is not intended to be public refer to the Amazon EKS Cluster Endpoint Access Control section of the EKS user guide',
-                                        'Url': 'https://docs.aws.amazon.com/eks/latest/userguide/cluster-endpoint.html'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsEksCluster',
-                                        'Id': clusterArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 'Cluster Name': clusterName }
-                                        }
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': clusterArn + '/public-endpoint-access-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': clusterName,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [
+                                'Software and Configuration Checks/AWS Security Best Practices',
+                                'Effects/Data Exposure'
+                            ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 0 },
+                            'Confidence': 99,
+                            'Title': '[EKS.1] Elastic Kubernetes Service (EKS) cluster API servers should not be accessible from the internet',
+                            'Description': 'Elastic Kubernetes Service (EKS) cluster ' + clusterName + ' API server is not accessible from the internet.',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'If your EKS cluster is not intended to be public refer to the Amazon EKS Cluster Endpoint Access Control section of the EKS user guide',
+                                    'Url': 'https://docs.aws.amazon.com/eks/latest/userguide/cluster-endpoint.html'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'AwsEksCluster',
+                                    'Id': clusterArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 'Cluster Name': clusterName }
                                     }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'PASSED' },
+                            'RecordState': 'ARCHIVED'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
         except Exception as e:
             print(e)
 
 def eks_latest_k8s_version_check():
+    awsAccountId = accountId.get()
     # loop through EKS clusters
     response = eks.list_clusters(maxResults=100)
     myEksClusters = response['clusters']
@@ -158,48 +154,45 @@ def eks_latest_k8s_version_check():
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                     # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': clusterArn + '/eks-latest-k8s-version-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': clusterName,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices', ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 40 },
-                                'Confidence': 99,
-                                'Title': '[EKS.2] Elastic Kubernetes Service (EKS) clusters should use the latest Kubernetes version',
-                                'Description': 'Elastic Kubernetes Service (EKS) cluster ' + clusterName + ' is using Kubernetes version ' + k8sVersionCheck + '. Refer to the remediation instructions if this configuration is not intended',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'Unless your application requires a specific version of Kubernetes, AWS recommends you choose the latest available Kubernetes version supported by Amazon EKS for your clusters. For upgrade information refer to the Updating an Amazon EKS Cluster Kubernetes Version section of the EKS user guide',
-                                        'Url': 'https://docs.aws.amazon.com/eks/latest/userguide/update-cluster.html'
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': clusterArn + '/eks-latest-k8s-version-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': clusterName,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices', ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 40 },
+                            'Confidence': 99,
+                            'Title': '[EKS.2] Elastic Kubernetes Service (EKS) clusters should use the latest Kubernetes version',
+                            'Description': 'Elastic Kubernetes Service (EKS) cluster ' + clusterName + ' is using Kubernetes version ' + k8sVersionCheck + '. Refer to the remediation instructions if this configuration is not intended',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'Unless your application requires a specific version of Kubernetes, AWS recommends you choose the latest available Kubernetes version supported by Amazon EKS for your clusters. For upgrade information refer to the Updating an Amazon EKS Cluster Kubernetes Version section of the EKS user guide',
+                                    'Url': 'https://docs.aws.amazon.com/eks/latest/userguide/update-cluster.html'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'AwsEksCluster',
+                                    'Id': clusterArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 'Cluster Name': clusterName }
                                     }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsEksCluster',
-                                        'Id': clusterArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 'Cluster Name': clusterName }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'FAILED' },
+                            'RecordState': 'ACTIVE'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
             else:
@@ -207,54 +200,52 @@ def eks_latest_k8s_version_check():
                     # ISO Time
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                     # create Sec Hub finding
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': clusterArn + '/eks-latest-k8s-version-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': clusterName,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices', ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[EKS.2] Elastic Kubernetes Service (EKS) clusters should use the latest Kubernetes version',
-                                'Description': 'Elastic Kubernetes Service (EKS) cluster ' + clusterName + ' is using Kubernetes version ' + k8sVersionCheck,
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'Unless your application requires a specific version of Kubernetes, AWS recommends you choose the latest available Kubernetes version supported by Amazon EKS for your clusters. For upgrade information refer to the Updating an Amazon EKS Cluster Kubernetes Version section of the EKS user guide',
-                                        'Url': 'https://docs.aws.amazon.com/eks/latest/userguide/update-cluster.html'
-                                    }
-                                },
-                                'ProductFields': {
-                                    'Product Name': 'ElectricEye'
-                                },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsEksCluster',
-                                        'Id': clusterArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': { 'Cluster Name': clusterName }
-                                        }
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': clusterArn + '/eks-latest-k8s-version-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': clusterName,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices', ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 0 },
+                            'Confidence': 99,
+                            'Title': '[EKS.2] Elastic Kubernetes Service (EKS) clusters should use the latest Kubernetes version',
+                            'Description': 'Elastic Kubernetes Service (EKS) cluster ' + clusterName + ' is using Kubernetes version ' + k8sVersionCheck,
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'Unless your application requires a specific version of Kubernetes, AWS recommends you choose the latest available Kubernetes version supported by Amazon EKS for your clusters. For upgrade information refer to the Updating an Amazon EKS Cluster Kubernetes Version section of the EKS user guide',
+                                    'Url': 'https://docs.aws.amazon.com/eks/latest/userguide/update-cluster.html'
+                                }
+                            },
+                            'ProductFields': {
+                                'Product Name': 'ElectricEye'
+                            },
+                            'Resources': [
+                                {
+                                    'Type': 'AwsEksCluster',
+                                    'Id': clusterArn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion,
+                                    'Details': {
+                                        'Other': { 'Cluster Name': clusterName }
                                     }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
+                                }
+                            ],
+                            'Compliance': { 'Status': 'PASSED' },
+                            'RecordState': 'ARCHIVED'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
         except Exception as e:
             print(e)
 
 def eks_logging_audit_auth_check():
+    awsAccountId = accountId.get()
     # loop through EKS clusters
     response = eks.list_clusters(maxResults=100)
     myEksClusters = response['clusters']
@@ -275,48 +266,45 @@ def eks_logging_audit_auth_check():
                                 # ISO Time
                                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                                 # create Sec Hub finding
-                                response = securityhub.batch_import_findings(
-                                    Findings=[
-                                        {
-                                            'SchemaVersion': '2018-10-08',
-                                            'Id': clusterArn + '/eks-logging-audit-auth-check',
-                                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                            'GeneratorId': clusterName,
-                                            'AwsAccountId': awsAccountId,
-                                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices', ],
-                                            'FirstObservedAt': iso8601Time,
-                                            'CreatedAt': iso8601Time,
-                                            'UpdatedAt': iso8601Time,
-                                            'Severity': { 'Normalized': 40 },
-                                            'Confidence': 99,
-                                            'Title': '[EKS.3] Elastic Kubernetes Service (EKS) clusters should have authenticator and/or audit logging enabled',
-                                            'Description': 'Elastic Kubernetes Service (EKS) cluster ' + clusterName + ' does not have authenticator or audit logging enabled. Refer to the remediation instructions if this configuration is not intended',
-                                            'Remediation': {
-                                                'Recommendation': {
-                                                    'Text': 'To enable logging for your cluster refer to the Amazon EKS Control Plane Logging section of the EKS user guide',
-                                                    'Url': 'https://docs.aws.amazon.com/eks/latest/userguide/control-plane-logs.html'
-                                                }
-                                            },
-                                            'ProductFields': {
-                                                'Product Name': 'ElectricEye'
-                                            },
-                                            'Resources': [
-                                                {
-                                                    'Type': 'AwsEksCluster',
-                                                    'Id': clusterArn,
-                                                    'Partition': 'aws',
-                                                    'Region': awsRegion,
-                                                    'Details': {
-                                                        'Other': { 'Cluster Name': clusterName }
-                                                    }
+                                findingSink.put(
+                                    {
+                                        'SchemaVersion': '2018-10-08',
+                                        'Id': clusterArn + '/eks-logging-audit-auth-check',
+                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                        'GeneratorId': clusterName,
+                                        'AwsAccountId': awsAccountId,
+                                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices', ],
+                                        'FirstObservedAt': iso8601Time,
+                                        'CreatedAt': iso8601Time,
+                                        'UpdatedAt': iso8601Time,
+                                        'Severity': { 'Normalized': 40 },
+                                        'Confidence': 99,
+                                        'Title': '[EKS.3] Elastic Kubernetes Service (EKS) clusters should have authenticator and/or audit logging enabled',
+                                        'Description': 'Elastic Kubernetes Service (EKS) cluster ' + clusterName + ' does not have authenticator or audit logging enabled. Refer to the remediation instructions if this configuration is not intended',
+                                        'Remediation': {
+                                            'Recommendation': {
+                                                'Text': 'To enable logging for your cluster refer to the Amazon EKS Control Plane Logging section of the EKS user guide',
+                                                'Url': 'https://docs.aws.amazon.com/eks/latest/userguide/control-plane-logs.html'
+                                            }
+                                        },
+                                        'ProductFields': {
+                                            'Product Name': 'ElectricEye'
+                                        },
+                                        'Resources': [
+                                            {
+                                                'Type': 'AwsEksCluster',
+                                                'Id': clusterArn,
+                                                'Partition': 'aws',
+                                                'Region': awsRegion,
+                                                'Details': {
+                                                    'Other': { 'Cluster Name': clusterName }
                                                 }
-                                            ],
-                                            'Compliance': { 'Status': 'FAILED' },
-                                            'RecordState': 'ACTIVE'
-                                        }
-                                    ]
+                                            }
+                                        ],
+                                        'Compliance': { 'Status': 'FAILED' },
+                                        'RecordState': 'ACTIVE'
+                                    }
                                 )
-                                print(response)
                             except Exception as e:
                                 print(e)
                         else:
@@ -324,48 +312,45 @@ def eks_logging_audit_auth_check():
                                 # ISO Time
                                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                                 # create Sec Hub finding
-                                response = securityhub.batch_import_findings(
-                                    Findings=[
-                                        {
-                                            'SchemaVersion': '2018-10-08',
-                                            'Id': clusterArn + '/eks-logging-audit-auth-check',
-                                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                            'GeneratorId': clusterName,
-                                            'AwsAccountId': awsAccountId,
-                                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices', ],
-                                            'FirstObservedAt': iso8601Time,
-                                            'CreatedAt': iso8601Time,
-                                            'UpdatedAt': iso8601Time,
-                                            'Severity': { 'Normalized': 40 },
-                                            'Confidence': 99,
-                                            'Title': '[EKS.3] Elastic Kubernetes Service (EKS) clusters should have authenticator and/or audit logging enabled',
-                                            'Description': 'Elastic Kubernetes Service (EKS) cluster ' + clusterName + ' does not have authenticator or audit logging enabled. Refer to the remediation instructions if this configuration is not intended',
-                                            'Remediation': {
-                                                'Recommendation': {
-                                                    'Text': 'To enable logging for your cluster refer to the Amazon EKS Control Plane Logging section of the EKS user guide',
-                                                    'Url': 'https://docs.aws.amazon.com/eks/latest/userguide/control-plane-logs.html'
-                                                }
-                                            },
-                                            'ProductFields': {
-                                                'Product Name': 'ElectricEye'
-                                            },
-                                            'Resources': [
-                                                {
-                                                    'Type': 'AwsEksCluster',
-                                                    'Id': clusterArn,
-                                                    'Partition': 'aws',
-                                                    'Region': awsRegion,
-                                                    'Details': {
-                                                        'Other': { 'Cluster Name': clusterName }
-                                                    }
+                                findingSink.put(
+                                    {
+                                        'SchemaVersion': '2018-10-08',
+                                        'Id': clusterArn + '/eks-logging-audit-auth-check',
+                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                        'GeneratorId': clusterName,
+                                        'AwsAccountId': awsAccountId,
+                                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices', ],
+                                        'FirstObservedAt': iso8601Time,
+                                        'CreatedAt': iso8601Time,
+                                        'UpdatedAt': iso8601Time,
+                                        'Severity': { 'Normalized': 40 },
+                                        'Confidence': 99,
+                                        'Title': '[EKS.3] Elastic Kubernetes Service (EKS) clusters should have authenticator and/or audit logging enabled',
+                                        'Description': 'Elastic Kubernetes Service (EKS) cluster ' + clusterName + ' does not have authenticator or audit logging enabled. Refer to the remediation instructions if this configuration is not intended',
+                                        'Remediation': {
+                                            'Recommendation': {
+                                                'Text': 'To enable logging for your cluster refer to the Amazon EKS Control Plane Logging section of the EKS user guide',
+                                                'Url': 'https://docs.aws.amazon.com/eks/latest/userguide/control-plane-logs.html'
+                                            }
+                                        },
+                                        'ProductFields': {
+                                            'Product Name': 'ElectricEye'
+                                        },
+                                        'Resources': [
+                                            {
+                                                'Type': 'AwsEksCluster',
+                                                'Id': clusterArn,
+                                                'Partition': 'aws',
+                                                'Region': awsRegion,
+                                                'Details': {
+                                                    'Other': { 'Cluster Name': clusterName }
                                                 }
-                                            ],
-                                            'Compliance': { 'Status': 'FAILED' },
-                                            'RecordState': 'ACTIVE'
-                                        }
-                                    ]
+                                            }
+                                        ],
+                                        'Compliance': { 'Status': 'FAILED' },
+                                        'RecordState': 'ACTIVE'
+                                    }
                                 )
-                                print(response)
                             except Exception as e:
                                 print(e)
         except Exception as e:
@@ -376,4 +361,5 @@ def eks_auditor():
     eks_latest_k8s_version_check()
     eks_logging_audit_auth_check()
 
-eks_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    eks_auditor()
\ No newline at end of file
@@ -13,18 +13,19 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import os
 import datetime
+from finding_sink import default_sink
+from scan_scope import lazy_account_id, lazy_client
 # create boto3 clients
-sts = boto3.client('sts')
-elb = boto3.client('elb')
-securityhub = boto3.client('securityhub')
+elb = lazy_client('elb')
+findingSink = default_sink()
 # creat env vars
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 awsRegion = os.environ['AWS_REGION']
 
 def internet_facing_clb_https_listener_check():
+    awsAccountId = accountId.get()
     # loop through classic load balancers
     response = elb.describe_load_balancers()
     for classicbalancer in response['LoadBalancerDescriptions']:
@@ -37,116 +38,10 @@ def internet_facing_clb_https_listener_check():
                 if listenerProtocol != 'HTTPS' or 'SSL':
                     try:
                         iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': clbArn + '/classic-loadbalancer-secure-listener-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': clbArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 60 },
-                                    'Confidence': 99,
-                                    'Title': '[ELB.1] Classic load balancers that are internet-facing should use secure listeners',
-                                    'Description': 'Classic load balancer ' + clbName + ' does not use a secure listener (HTTPS or SSL). Refer to the remediation instructions to remediate this behavior',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on classic load balancer HTTPS listeners refer to the Create a Classic Load Balancer with an HTTPS Listener section of the Classic Load Balancers User Guide.',
-                                            'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/elb-create-https-ssl-load-balancer.html'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'Other',
-                                            'Id': clbArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'Other': { 'LoadBalancerName': clbName }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': clbArn + '/classic-loadbalancer-secure-listener-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': clbArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[ELB.1] Classic load balancers that are internet-facing should use secure listeners',
-                                    'Description': 'Classic load balancer ' + clbName + ' uses a secure listener (HTTPS or SSL).',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on classic load balancer HTTPS listeners refer to the Create a Classic Load Balancer with an HTTPS Listener section of the Classic Load Balancers User Guide.',
-                                            'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/elb-create-https-ssl-load-balancer.html'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'Other',
-                                            'Id': clbArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'Other': { 'LoadBalancerName': clbName }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'ARCHIVED' },
-                                    'RecordState': 'PASSED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-        else:
-            print('Ignoring internal CLB')
-            pass
-
-def clb_https_listener_tls12_policy_check():
-    # loop through classic load balancers
-    response = elb.describe_load_balancers()
-    for classicbalancer in response['LoadBalancerDescriptions']:
-        clbName = str(classicbalancer['LoadBalancerName'])
-        clbArn = 'arn:aws:elasticloadbalancing:' + awsRegion + ':' + awsAccountId + ':loadbalancer/' + clbName
-        for listeners in classicbalancer['ListenerDescriptions']:
-            listenerPolicies = str(listeners['PolicyNames'])
-            if listenerPolicies == '[]':
-                print('No policies identified, likely no SSL or HTTPS listener')
-            elif listenerPolicies == 'ELBSecurityPolicy-TLS-1-2-2017-01':
-                try:
-                    # This is a passing finding
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
+                        findingSink.put(
                             {
                                 'SchemaVersion': '2018-10-08',
-                                'Id': clbArn + '/classic-loadbalancer-tls12-policy-check',
+                                'Id': clbArn + '/classic-loadbalancer-secure-listener-check',
                                 'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
                                 'GeneratorId': clbArn,
                                 'AwsAccountId': awsAccountId,
@@ -154,14 +49,14 @@ def clb_https_listener_tls12_policy_check():
                                 'FirstObservedAt': iso8601Time,
                                 'CreatedAt': iso8601Time,
                                 'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
+                                'Severity': { 'Normalized': 60 },
                                 'Confidence': 99,
-                                'Title': '[ELB.2] Classic load balancers should use TLS 1.2 listener policies',
-                                'Description': 'Classic load balancer ' + clbName + ' does not use a TLS 1.2 listener policy.',
+                                'Title': '[ELB.1] Classic load balancers that are internet-facing should use secure listeners',
+                                'Description': 'Classic load balancer ' + clbName + ' does not use a secure listener (HTTPS or SSL). Refer to the remediation instructions to remediate this behavior',
                                 'Remediation': {
                                     'Recommendation': {
-                                        'Text': 'For more information on classic load balancer listener policies refer to the Predefined SSL Security Policies for Classic Load Balancers section of the Classic Load Balancers User Guide.',
-                                        'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/elb-security-policy-table.html'
+                                        'Text': 'For more information on classic load balancer HTTPS listeners refer to the Create a Classic Load Balancer with an HTTPS Listener section of the Classic Load Balancers User Guide.',
+                                        'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/elb-create-https-ssl-load-balancer.html'
                                     }
                                 },
                                 'ProductFields': { 'Product Name': 'ElectricEye' },
@@ -176,22 +71,19 @@ def clb_https_listener_tls12_policy_check():
                                         }
                                     }
                                 ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
+                                'Compliance': { 'Status': 'FAILED' },
+                                'RecordState': 'ACTIVE'
                             }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-            else:
-                try:
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
+                        )
+                    except Exception as e:
+                        print(e)
+                else:
+                    try:
+                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                        findingSink.put(
                             {
                                 'SchemaVersion': '2018-10-08',
-                                'Id': clbArn + '/classic-loadbalancer-tls12-policy-check',
+                                'Id': clbArn + '/classic-loadbalancer-secure-listener-check',
                                 'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
                                 'GeneratorId': clbArn,
                                 'AwsAccountId': awsAccountId,
@@ -199,14 +91,14 @@ def clb_https_listener_tls12_policy_check():
                                 'FirstObservedAt': iso8601Time,
                                 'CreatedAt': iso8601Time,
                                 'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 60 },
+                                'Severity': { 'Normalized': 0 },
                                 'Confidence': 99,
-                                'Title': '[ELB.2] Classic load balancers should use TLS 1.2 listener policies',
-                                'Description': 'Classic load balancer ' + clbName + ' does not use a TLS 1.2 listener policy. Refer to the remediation instructions to remediate this behavior',
+                                'Title': '[ELB.1] Classic load balancers that are internet-facing should use secure listeners',
+                                'Description': 'Classic load balancer ' + clbName + ' uses a secure listener (HTTPS or SSL).',
                                 'Remediation': {
                                     'Recommendation': {
-                                        'Text': 'For more information on classic load balancer listener policies refer to the Predefined SSL Security Policies for Classic Load Balancers section of the Classic Load Balancers User Guide.',
-                                        'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/elb-security-policy-table.html'
+                                        'Text': 'For more information on classic load balancer HTTPS listeners refer to the Create a Classic Load Balancer with an HTTPS Listener section of the Classic Load Balancers User Guide.',
+                                        'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/elb-create-https-ssl-load-balancer.html'
                                     }
                                 },
                                 'ProductFields': { 'Product Name': 'ElectricEye' },
@@ -221,31 +113,35 @@ def clb_https_listener_tls12_policy_check():
                                         }
                                     }
                                 ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
+                                'Compliance': { 'Status': 'ARCHIVED' },
+                                'RecordState': 'PASSED'
                             }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
+                        )
+                    except Exception as e:
+                        print(e)
+        else:
+            print('Ignoring internal CLB')
+            pass
 
-def clb_cross_zone_balancing_check():
+def clb_https_listener_tls12_policy_check():
+    awsAccountId = accountId.get()
     # loop through classic load balancers
     response = elb.describe_load_balancers()
     for classicbalancer in response['LoadBalancerDescriptions']:
         clbName = str(classicbalancer['LoadBalancerName'])
         clbArn = 'arn:aws:elasticloadbalancing:' + awsRegion + ':' + awsAccountId + ':loadbalancer/' + clbName
-        response = elb.describe_load_balancer_attributes(LoadBalancerName=clbName)
-        crossZoneCheck = str(response['LoadBalancerAttributes']['CrossZoneLoadBalancing']['Enabled'])
-        if crossZoneCheck == 'False':
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
+        for listeners in classicbalancer['ListenerDescriptions']:
+            listenerPolicies = str(listeners['PolicyNames'])
+            if listenerPolicies == '[]':
+                print('No policies identified, likely no SSL or HTTPS listener')
+            elif listenerPolicies == 'ELBSecurityPolicy-TLS-1-2-2017-01':
+                try:
+                    # This is a passing finding
+                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                    findingSink.put(
                         {
                             'SchemaVersion': '2018-10-08',
-                            'Id': clbArn + '/classic-loadbalancer-cross-zone-check',
+                            'Id': clbArn + '/classic-loadbalancer-tls12-policy-check',
                             'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
                             'GeneratorId': clbArn,
                             'AwsAccountId': awsAccountId,
@@ -253,14 +149,14 @@ def clb_cross_zone_balancing_check():
                             'FirstObservedAt': iso8601Time,
                             'CreatedAt': iso8601Time,
                             'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 20 },
+                            'Severity': { 'Normalized': 0 },
                             'Confidence': 99,
-                            'Title': '[ELB.3] Classic load balancers should have cross-zone load balancing configured',
-                            'Description': 'Classic load balancer ' + clbName + ' does not have cross-zone load balancing configured. Refer to the remediation instructions to remediate this behavior',
+                            'Title': '[ELB.2] Classic load balancers should use TLS 1.2 listener policies',
+                            'Description': 'Classic load balancer ' + clbName + ' does not use a TLS 1.2 listener policy.',
                             'Remediation': {
                                 'Recommendation': {
-                                    'Text': 'For more information on cross-zone load balancing refer to the Configure Cross-Zone Load Balancing for Your Classic Load Balancer section of the Classic Load Balancers User Guide.',
-                                    'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/enable-disable-crosszone-lb.html'
+                                    'Text': 'For more information on classic load balancer listener policies refer to the Predefined SSL Security Policies for Classic Load Balancers section of the Classic Load Balancers User Guide.',
+                                    'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/elb-security-policy-table.html'
                                 }
                             },
                             'ProductFields': { 'Product Name': 'ElectricEye' },
@@ -275,22 +171,19 @@ def clb_cross_zone_balancing_check():
                                     }
                                 }
                             ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
+                            'Compliance': { 'Status': 'PASSED' },
+                            'RecordState': 'ARCHIVED'
                         }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        else:
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
+                    )
+                except Exception as e:
+                    print(e)
+            else:
+                try:
+                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                    findingSink.put(
                         {
                             'SchemaVersion': '2018-10-08',
-                            'Id': clbArn + '/classic-loadbalancer-cross-zone-check',
+                            'Id': clbArn + '/classic-loadbalancer-tls12-policy-check',
                             'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
                             'GeneratorId': clbArn,
                             'AwsAccountId': awsAccountId,
@@ -298,14 +191,14 @@ def clb_cross_zone_balancing_check():
                             'FirstObservedAt': iso8601Time,
                             'CreatedAt': iso8601Time,
                             'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
+                            'Severity': { 'Normalized': 60 },
                             'Confidence': 99,
-                            'Title': '[ELB.3] Classic load balancers should have cross-zone load balancing configured',
-                            'Description': 'Classic load balancer ' + clbName + ' has cross-zone load balancing configured.',
+                            'Title': '[ELB.2] Classic load balancers should use TLS 1.2 listener policies',
+                            'Description': 'Classic load balancer ' + clbName + ' does not use a TLS 1.2 listener policy. Refer to the remediation instructions to remediate this behavior',
                             'Remediation': {
                                 'Recommendation': {
-                                    'Text': 'For more information on cross-zone load balancing refer to the Configure Cross-Zone Load Balancing for Your Classic Load Balancer section of the Classic Load Balancers User Guide.',
-                                    'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/enable-disable-crosszone-lb.html'
+                                    'Text': 'For more information on classic load balancer listener policies refer to the Predefined SSL Security Policies for Classic Load Balancers section of the Classic Load Balancers User Guide.',
+                                    'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/elb-security-policy-table.html'
                                 }
                             },
                             'ProductFields': { 'Product Name': 'ElectricEye' },
@@ -320,16 +213,109 @@ def clb_cross_zone_balancing_check():
                                     }
                                 }
                             ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
+                            'Compliance': { 'Status': 'FAILED' },
+                            'RecordState': 'ACTIVE'
                         }
-                    ]
+                    )
+                except Exception as e:
+                    print(e)
+
+def clb_cross_zone_balancing_check():
+    awsAccountId = accountId.get()
+    # loop through classic load balancers
+    response = elb.describe_load_balancers()
+    for classicbalancer in response['LoadBalancerDescriptions']:
+        clbName = str(classicbalancer['LoadBalancerName'])
+        clbArn = 'arn:aws:elasticloadbalancing:' + awsRegion + ':' + awsAccountId + ':loadbalancer/' + clbName
+        response = elb.describe_load_balancer_attributes(LoadBalancerName=clbName)
+        crossZoneCheck = str(response['LoadBalancerAttributes']['CrossZoneLoadBalancing']['Enabled'])
+        if crossZoneCheck == 'False':
+            try:
+                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': clbArn + '/classic-loadbalancer-cross-zone-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': clbArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 20 },
+                        'Confidence': 99,
+                        'Title': '[ELB.3] Classic load balancers should have cross-zone load balancing configured',
+                        'Description': 'Classic load balancer ' + clbName + ' does not have cross-zone load balancing configured. Refer to the remediation instructions to remediate this behavior',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on cross-zone load balancing refer to the Configure Cross-Zone Load Balancing for Your Classic Load Balancer section of the Classic Load Balancers User Guide.',
+                                'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/enable-disable-crosszone-lb.html'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': clbArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'LoadBalancerName': clbName }
+                                }
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
+                )
+            except Exception as e:
+                print(e)
+        else:
+            try:
+                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': clbArn + '/classic-loadbalancer-cross-zone-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': clbArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[ELB.3] Classic load balancers should have cross-zone load balancing configured',
+                        'Description': 'Classic load balancer ' + clbName + ' has cross-zone load balancing configured.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on cross-zone load balancing refer to the Configure Cross-Zone Load Balancing for Your Classic Load Balancer section of the Classic Load Balancers User Guide.',
+                                'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/enable-disable-crosszone-lb.html'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': clbArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'LoadBalancerName': clbName }
+                                }
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def clb_connection_draining_check():
+    awsAccountId = accountId.get()
     # loop through classic load balancers
     response = elb.describe_load_balancers()
     for classicbalancer in response['LoadBalancerDescriptions']:
@@ -340,95 +326,90 @@ def clb_connection_draining_check():
         if connectionDrainCheck == 'False':
             try:
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': clbArn + '/classic-loadbalancer-connection-draining-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': clbArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 20 },
-                            'Confidence': 99,
-                            'Title': '[ELB.4] Classic load balancers should have connection draining configured',
-                            'Description': 'Classic load balancer ' + clbName + ' does not have connection draining configured. Refer to the remediation instructions to remediate this behavior',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on connection draining refer to the Configure Connection Draining for Your Classic Load Balancer section of the Classic Load Balancers User Guide.',
-                                    'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/config-conn-drain.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': clbArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'LoadBalancerName': clbName }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': clbArn + '/classic-loadbalancer-connection-draining-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': clbArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 20 },
+                        'Confidence': 99,
+                        'Title': '[ELB.4] Classic load balancers should have connection draining configured',
+                        'Description': 'Classic load balancer ' + clbName + ' does not have connection draining configured. Refer to the remediation instructions to remediate this behavior',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on connection draining refer to the Configure Connection Draining for Your Classic Load Balancer section of the Classic Load Balancers User Guide.',
+                                'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/config-conn-drain.html'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': clbArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'LoadBalancerName': clbName }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
             try:
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': clbArn + '/classic-loadbalancer-connection-draining-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': clbArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[ELB.4] Classic load balancers should have connection draining configured',
-                            'Description': 'Classic load balancer ' + clbName + ' does not have connection draining configured.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on connection draining refer to the Configure Connection Draining for Your Classic Load Balancer section of the Classic Load Balancers User Guide.',
-                                    'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/config-conn-drain.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': clbArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'LoadBalancerName': clbName }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': clbArn + '/classic-loadbalancer-connection-draining-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': clbArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[ELB.4] Classic load balancers should have connection draining configured',
+                        'Description': 'Classic load balancer ' + clbName + ' does not have connection draining configured.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on connection draining refer to the Configure Connection Draining for Your Classic Load Balancer section of the Classic Load Balancers User Guide.',
+                                'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/config-conn-drain.html'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': clbArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'LoadBalancerName': clbName }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def clb_access_logging_check():
+    awsAccountId = accountId.get()
     # loop through classic load balancers
     response = elb.describe_load_balancers()
     for classicbalancer in response['LoadBalancerDescriptions']:
@@ -439,91 +420,85 @@ def clb_access_logging_check():
         if accessLogCheck == 'False':
             try:
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': clbArn + '/classic-loadbalancer-access-logging-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': clbArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 40 },
-                            'Confidence': 99,
-                            'Title': '[ELB.5] Classic load balancers should enable access logging',
-                            'Description': 'Classic load balancer ' + clbName + ' does not have access logging enabled. Refer to the remediation instructions to remediate this behavior',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on access logging refer to the Access Logs for Your Classic Load Balancer section of the Classic Load Balancers User Guide.',
-                                    'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/access-log-collection.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': clbArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'LoadBalancerName': clbName }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': clbArn + '/classic-loadbalancer-access-logging-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': clbArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 40 },
+                        'Confidence': 99,
+                        'Title': '[ELB.5] Classic load balancers should enable access logging',
+                        'Description': 'Classic load balancer ' + clbName + ' does not have access logging enabled. Refer to the remediation instructions to remediate this behavior',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on access logging refer to the Access Logs for Your Classic Load Balancer section of the Classic Load Balancers User Guide.',
+                                'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/access-log-collection.html'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': clbArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'LoadBalancerName': clbName }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
             try:
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': clbArn + '/classic-loadbalancer-access-logging-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': clbArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[ELB.5] Classic load balancers should enable access logging',
-                            'Description': 'Classic load balancer ' + clbName + ' does not have access logging enabled.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on access logging refer to the Access Logs for Your Classic Load Balancer section of the Classic Load Balancers User Guide.',
-                                    'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/access-log-collection.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'Other',
-                                    'Id': clbArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'LoadBalancerName': clbName }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': clbArn + '/classic-loadbalancer-access-logging-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': clbArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[ELB.5] Classic load balancers should enable access logging',
+                        'Description': 'Classic load balancer ' + clbName + ' does not have access logging enabled.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on access logging refer to the Access Logs for Your Classic Load Balancer section of the Classic Load Balancers User Guide.',
+                                'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/classic/access-log-collection.html'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': clbArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'LoadBalancerName': clbName }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
@@ -534,4 +509,5 @@ def classic_load_balancer_auditor():
     clb_connection_draining_check()
     clb_access_logging_check()
 
-classic_load_balancer_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    classic_load_balancer_auditor()
\ No newline at end of file
@@ -13,21 +13,23 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import os
 import datetime
+from finding_sink import default_sink
+from resource_inventory import default_inventory
+from scan_scope import lazy_account_id, lazy_client
 # import boto3 clients
-sts = boto3.client('sts')
-elbv2 = boto3.client('elbv2')
-securityhub = boto3.client('securityhub')
+elbv2 = lazy_client('elbv2')
+findingSink = default_sink()
+inventory = default_inventory()
 # create env vars
 awsRegion = os.environ['AWS_REGION']
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 # loop through ELBv2 load balancers
-response = elbv2.describe_load_balancers()
-myElbv2LoadBalancers = response['LoadBalancers']
+myElbv2LoadBalancers = inventory.lazy('elbv2', 'describe_load_balancers', 'LoadBalancers')
 
 def elbv2_alb_logging_check():
+    awsAccountId = accountId.get()
     for loadbalancers in myElbv2LoadBalancers:
         elbv2Arn = str(loadbalancers['LoadBalancerArn'])
         elbv2Name = str(loadbalancers['LoadBalancerName'])
@@ -46,135 +48,10 @@ def elbv2_alb_logging_check():
                         if elbv2LoggingCheck == 'false':
                             try:
                                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                                response = securityhub.batch_import_findings(
-                                    Findings=[
-                                        {
-                                            'SchemaVersion': '2018-10-08',
-                                            'Id': elbv2Arn + '/elbv2-logging-check',
-                                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                            'GeneratorId': elbv2Arn,
-                                            'AwsAccountId': awsAccountId,
-                                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                            'FirstObservedAt': iso8601Time,
-                                            'CreatedAt': iso8601Time,
-                                            'UpdatedAt': iso8601Time,
-                                            'Severity': { 'Normalized': 20 },
-                                            'Confidence': 99,
-                                            'Title': '[ELBv2.1] Application Load Balancers should have access logging enabled',
-                                            'Description': 'Application load balancer ' + elbv2Name + ' does not have access logging enabled. Refer to the remediation instructions to remediate this behavior',
-                                            'Remediation': {
-                                                'Recommendation': {
-                                                    'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Access Logs for Your Application Load Balancer section of the Application Load Balancers User Guide.',
-                                                    'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/load-balancer-access-logs.html'
-                                                }
-                                            },
-                                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                                            'Resources': [
-                                                {
-                                                    'Type': 'AwsElbv2LoadBalancer',
-                                                    'Id': elbv2Arn,
-                                                    'Partition': 'aws',
-                                                    'Region': awsRegion,
-                                                    'Details': {
-                                                        'AwsElbv2LoadBalancer': {
-                                                            'DNSName': elbv2DnsName,
-                                                            'IpAddressType': elbv2IpAddressType,
-                                                            'Scheme': elbv2Scheme,
-                                                            'Type': elbv2LbType,
-                                                            'VpcId': elbv2VpcId
-                                                        }
-                                                    }
-                                                }
-                                            ],
-                                            'Compliance': { 'Status': 'FAILED' },
-                                            'RecordState': 'ACTIVE'
-                                        }
-                                    ]
-                                )
-                                print(response)
-                            except Exception as e:
-                                print(e)
-                        else:
-                            try:
-                                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                                response = securityhub.batch_import_findings(
-                                    Findings=[
-                                        {
-                                            'SchemaVersion': '2018-10-08',
-                                            'Id': elbv2Arn + '/elbv2-logging-check',
-                                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                            'GeneratorId': elbv2Arn,
-                                            'AwsAccountId': awsAccountId,
-                                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                            'FirstObservedAt': iso8601Time,
-                                            'CreatedAt': iso8601Time,
-                                            'UpdatedAt': iso8601Time,
-                                            'Severity': { 'Normalized': 0 },
-                                            'Confidence': 99,
-                                            'Title': '[ELBv2.1] Application and Network Load Balancers should have access logging enabled',
-                                            'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' has access logging enabled.',
-                                            'Remediation': {
-                                                'Recommendation': {
-                                                    'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Access Logs for Your Application Load Balancer section of the Application Load Balancers User Guide.',
-                                                    'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/load-balancer-access-logs.html'
-                                                }
-                                            },
-                                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                                            'Resources': [
-                                                {
-                                                    'Type': 'AwsElbv2LoadBalancer',
-                                                    'Id': elbv2Arn,
-                                                    'Partition': 'aws',
-                                                    'Region': awsRegion,
-                                                    'Details': {
-                                                        'AwsElbv2LoadBalancer': {
-                                                            'DNSName': elbv2DnsName,
-                                                            'IpAddressType': elbv2IpAddressType,
-                                                            'Scheme': elbv2Scheme,
-                                                            'Type': elbv2LbType,
-                                                            'VpcId': elbv2VpcId
-                                                        },
-                                                    }
-                                                }
-                                            ],
-                                            'Compliance': { 'Status': 'PASSED' },
-                                            'RecordState': 'ARCHIVED'
-                                        }
-                                    ]
-                                )
-                                print(response)
-                            except Exception as e:
-                                print(e)
-                    else:
-                        pass
-            except Exception as e:
-                print(e)
-        else:
-            pass
-
-def elbv2_deletion_protection_check():
-    for loadbalancers in myElbv2LoadBalancers:
-        elbv2Arn = str(loadbalancers['LoadBalancerArn'])
-        elbv2Name = str(loadbalancers['LoadBalancerName'])
-        elbv2DnsName = str(loadbalancers['DNSName'])
-        elbv2LbType = str(loadbalancers['Type']) 
-        elbv2Scheme = str(loadbalancers['Scheme']) 
-        elbv2VpcId = str(loadbalancers['VpcId'])
-        elbv2IpAddressType = str(loadbalancers['IpAddressType'])
-        try:
-            response = elbv2.describe_load_balancer_attributes(LoadBalancerArn=elbv2Arn)
-            elbv2Attributes = response['Attributes']
-            for attributes in elbv2Attributes:
-                if str(attributes['Key']) == 'deletion_protection.enabled':
-                    elbv2LoggingCheck = str(attributes['Value'])
-                    if elbv2LoggingCheck == 'false':
-                        try:
-                            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                            response = securityhub.batch_import_findings(
-                                Findings=[
+                                findingSink.put(
                                     {
                                         'SchemaVersion': '2018-10-08',
-                                        'Id': elbv2Arn + '/elbv2-deletion-protection-check',
+                                        'Id': elbv2Arn + '/elbv2-logging-check',
                                         'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
                                         'GeneratorId': elbv2Arn,
                                         'AwsAccountId': awsAccountId,
@@ -184,12 +61,12 @@ def elbv2_deletion_protection_check():
                                         'UpdatedAt': iso8601Time,
                                         'Severity': { 'Normalized': 20 },
                                         'Confidence': 99,
-                                        'Title': '[ELBv2.2] Application and Network Load Balancers should have deletion protection enabled',
-                                        'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' does not have deletion protection enabled. Refer to the remediation instructions to remediate this behavior',
+                                        'Title': '[ELBv2.1] Application Load Balancers should have access logging enabled',
+                                        'Description': 'Application load balancer ' + elbv2Name + ' does not have access logging enabled. Refer to the remediation instructions to remediate this behavior',
                                         'Remediation': {
                                             'Recommendation': {
-                                                'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Deletion Protection section of the Application Load Balancers User Guide. For Network Load Balancer logging please refer to the NLB User Guide',
-                                                'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/application-load-balancers.html#deletion-protection'
+                                                'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Access Logs for Your Application Load Balancer section of the Application Load Balancers User Guide.',
+                                                'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/load-balancer-access-logs.html'
                                             }
                                         },
                                         'ProductFields': { 'Product Name': 'ElectricEye' },
@@ -206,26 +83,23 @@ def elbv2_deletion_protection_check():
                                                         'Scheme': elbv2Scheme,
                                                         'Type': elbv2LbType,
                                                         'VpcId': elbv2VpcId
-                                                    },
+                                                    }
                                                 }
                                             }
                                         ],
                                         'Compliance': { 'Status': 'FAILED' },
                                         'RecordState': 'ACTIVE'
                                     }
-                                ]
-                            )
-                            print(response)
-                        except Exception as e:
-                            print(e)
-                    else:
-                        try:
-                            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                            response = securityhub.batch_import_findings(
-                                Findings=[
+                                )
+                            except Exception as e:
+                                print(e)
+                        else:
+                            try:
+                                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                                findingSink.put(
                                     {
                                         'SchemaVersion': '2018-10-08',
-                                        'Id': elbv2Arn + '/elbv2-deletion-protection-check',
+                                        'Id': elbv2Arn + '/elbv2-logging-check',
                                         'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
                                         'GeneratorId': elbv2Arn,
                                         'AwsAccountId': awsAccountId,
@@ -235,12 +109,12 @@ def elbv2_deletion_protection_check():
                                         'UpdatedAt': iso8601Time,
                                         'Severity': { 'Normalized': 0 },
                                         'Confidence': 99,
-                                        'Title': '[ELBv2.2] Application and Network Load Balancers should have deletion protection enabled',
-                                        'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' has deletion protection enabled.',
+                                        'Title': '[ELBv2.1] Application and Network Load Balancers should have access logging enabled',
+                                        'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' has access logging enabled.',
                                         'Remediation': {
                                             'Recommendation': {
-                                                'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Deletion Protection section of the Application Load Balancers User Guide. For Network Load Balancer logging please refer to the NLB User Guide',
-                                                'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/application-load-balancers.html#deletion-protection'
+                                                'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Access Logs for Your Application Load Balancer section of the Application Load Balancers User Guide.',
+                                                'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/load-balancer-access-logs.html'
                                             }
                                         },
                                         'ProductFields': { 'Product Name': 'ElectricEye' },
@@ -264,17 +138,18 @@ def elbv2_deletion_protection_check():
                                         'Compliance': { 'Status': 'PASSED' },
                                         'RecordState': 'ARCHIVED'
                                     }
-                                ]
-                            )
-                            print(response)
-                        except Exception as e:
-                            print(e)
-                else:
-                    pass
-        except Exception as e:
-            print(e)
+                                )
+                            except Exception as e:
+                                print(e)
+                    else:
+                        pass
+            except Exception as e:
+                print(e)
+        else:
+            pass
 
-def elbv2_internet_facing_secure_listeners_check():
+def elbv2_deletion_protection_check():
+    awsAccountId = accountId.get()
     for loadbalancers in myElbv2LoadBalancers:
         elbv2Arn = str(loadbalancers['LoadBalancerArn'])
         elbv2Name = str(loadbalancers['LoadBalancerName'])
@@ -284,18 +159,18 @@ def elbv2_internet_facing_secure_listeners_check():
         elbv2VpcId = str(loadbalancers['VpcId'])
         elbv2IpAddressType = str(loadbalancers['IpAddressType'])
         try:
-            response = elbv2.describe_listeners(LoadBalancerArn=elbv2Arn)
-            myElbv2Listeners = response['Listeners']
-            for listeners in myElbv2Listeners:
-                listenerProtocol = str(listeners['Protocol'])
-                if elbv2Scheme == 'internet-facing' and listenerProtocol != 'HTTPS' or 'TLS':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
+            response = elbv2.describe_load_balancer_attributes(LoadBalancerArn=elbv2Arn)
+            elbv2Attributes = response['Attributes']
+            for attributes in elbv2Attributes:
+                if str(attributes['Key']) == 'deletion_protection.enabled':
+                    elbv2LoggingCheck = str(attributes['Value'])
+                    if elbv2LoggingCheck == 'false':
+                        try:
+                            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                            findingSink.put(
                                 {
                                     'SchemaVersion': '2018-10-08',
-                                    'Id': elbv2Arn + '/internet-facing-secure-listeners-check',
+                                    'Id': elbv2Arn + '/elbv2-deletion-protection-check',
                                     'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
                                     'GeneratorId': elbv2Arn,
                                     'AwsAccountId': awsAccountId,
@@ -303,14 +178,14 @@ def elbv2_internet_facing_secure_listeners_check():
                                     'FirstObservedAt': iso8601Time,
                                     'CreatedAt': iso8601Time,
                                     'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 70 },
+                                    'Severity': { 'Normalized': 20 },
                                     'Confidence': 99,
-                                    'Title': '[ELBv2.3] Internet-facing Application and Network Load Balancers should have secure listeners configured',
-                                    'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' does not have a secure listener configured. Refer to the remediation instructions to remediate this behavior',
+                                    'Title': '[ELBv2.2] Application and Network Load Balancers should have deletion protection enabled',
+                                    'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' does not have deletion protection enabled. Refer to the remediation instructions to remediate this behavior',
                                     'Remediation': {
                                         'Recommendation': {
-                                            'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Create an HTTPS Listener for Your Application Load Balancer section of the Application Load Balancers User Guide. For Network Load Balancer logging please refer to the NLB User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/create-https-listener.html'
+                                            'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Deletion Protection section of the Application Load Balancers User Guide. For Network Load Balancer logging please refer to the NLB User Guide',
+                                            'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/application-load-balancers.html#deletion-protection'
                                         }
                                     },
                                     'ProductFields': { 'Product Name': 'ElectricEye' },
@@ -334,19 +209,16 @@ def elbv2_internet_facing_secure_listeners_check():
                                     'Compliance': { 'Status': 'FAILED' },
                                     'RecordState': 'ACTIVE'
                                 }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
+                            )
+                        except Exception as e:
+                            print(e)
+                    else:
+                        try:
+                            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                            findingSink.put(
                                 {
                                     'SchemaVersion': '2018-10-08',
-                                    'Id': elbv2Arn + '/internet-facing-secure-listeners-check',
+                                    'Id': elbv2Arn + '/elbv2-deletion-protection-check',
                                     'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
                                     'GeneratorId': elbv2Arn,
                                     'AwsAccountId': awsAccountId,
@@ -356,12 +228,12 @@ def elbv2_internet_facing_secure_listeners_check():
                                     'UpdatedAt': iso8601Time,
                                     'Severity': { 'Normalized': 0 },
                                     'Confidence': 99,
-                                    'Title': '[ELBv2.3] Internet-facing Application and Network Load Balancers should have secure listeners configured',
-                                    'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' has a secure listener configured.',
+                                    'Title': '[ELBv2.2] Application and Network Load Balancers should have deletion protection enabled',
+                                    'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' has deletion protection enabled.',
                                     'Remediation': {
                                         'Recommendation': {
-                                            'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Create an HTTPS Listener for Your Application Load Balancer section of the Application Load Balancers User Guide. For Network Load Balancer logging please refer to the NLB User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/create-https-listener.html'
+                                            'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Deletion Protection section of the Application Load Balancers User Guide. For Network Load Balancer logging please refer to the NLB User Guide',
+                                            'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/application-load-balancers.html#deletion-protection'
                                         }
                                     },
                                     'ProductFields': { 'Product Name': 'ElectricEye' },
@@ -385,15 +257,16 @@ def elbv2_internet_facing_secure_listeners_check():
                                     'Compliance': { 'Status': 'PASSED' },
                                     'RecordState': 'ARCHIVED'
                                 }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
+                            )
+                        except Exception as e:
+                            print(e)
+                else:
+                    pass
         except Exception as e:
             print(e)
 
-def elbv2_tls12_listener_policy_check():
+def elbv2_internet_facing_secure_listeners_check():
+    awsAccountId = accountId.get()
     for loadbalancers in myElbv2LoadBalancers:
         elbv2Arn = str(loadbalancers['LoadBalancerArn'])
         elbv2Name = str(loadbalancers['LoadBalancerName'])
@@ -407,116 +280,107 @@ def elbv2_tls12_listener_policy_check():
             myElbv2Listeners = response['Listeners']
             for listeners in myElbv2Listeners:
                 listenerProtocol = str(listeners['Protocol'])
-                if listenerProtocol == 'HTTPS' or 'TLS':
-                    listenerTlsPolicyCheck = str(listeners['SslPolicy'])
-                    if listenerTlsPolicyCheck != 'ELBSecurityPolicy-TLS-1-2-2017-01' or 'ELBSecurityPolicy-TLS-1-2-Ext-2018-06' or 'ELBSecurityPolicy-FS-1-2-2019-08' or 'ELBSecurityPolicy-FS-1-2-Res-2019-08':
-                        try:
-                            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                            response = securityhub.batch_import_findings(
-                                Findings=[
-                                    {
-                                        'SchemaVersion': '2018-10-08',
-                                        'Id': elbv2Arn + '/secure-listener-tls12-check',
-                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                        'GeneratorId': elbv2Arn,
-                                        'AwsAccountId': awsAccountId,
-                                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                        'FirstObservedAt': iso8601Time,
-                                        'CreatedAt': iso8601Time,
-                                        'UpdatedAt': iso8601Time,
-                                        'Severity': { 'Normalized': 70 },
-                                        'Confidence': 99,
-                                        'Title': '[ELBv2.4] Application and Network Load Balancers with HTTPS or TLS listeners should enforce TLS 1.2 policies',
-                                        'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' does not enforce a TLS 1.2 policy. Refer to the remediation instructions to remediate this behavior',
-                                        'Remediation': {
-                                            'Recommendation': {
-                                                'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Security Policies section of the Application Load Balancers User Guide. For Network Load Balancer logging please refer to the NLB User Guide',
-                                                'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/create-https-listener.html#describe-ssl-policies'
-                                            }
-                                        },
-                                        'ProductFields': { 'Product Name': 'ElectricEye' },
-                                        'Resources': [
-                                            {
-                                                'Type': 'AwsElbv2LoadBalancer',
-                                                'Id': elbv2Arn,
-                                                'Partition': 'aws',
-                                                'Region': awsRegion,
-                                                'Details': {
-                                                    'AwsElbv2LoadBalancer': {
-                                                        'DNSName': elbv2DnsName,
-                                                        'IpAddressType': elbv2IpAddressType,
-                                                        'Scheme': elbv2Scheme,
-                                                        'Type': elbv2LbType,
-                                                        'VpcId': elbv2VpcId
-                                                    },
-                                                }
-                                            }
-                                        ],
-                                        'Compliance': { 'Status': 'FAILED' },
-                                        'RecordState': 'ACTIVE'
+                if elbv2Scheme == 'internet-facing' and listenerProtocol != 'HTTPS' or 'TLS':
+                    try:
+                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': elbv2Arn + '/internet-facing-secure-listeners-check',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': elbv2Arn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                'FirstObservedAt': iso8601Time,
+                                'CreatedAt': iso8601Time,
+                                'UpdatedAt': iso8601Time,
+                                'Severity': { 'Normalized': 70 },
+                                'Confidence': 99,
+                                'Title': '[ELBv2.3] Internet-facing Application and Network Load Balancers should have secure listeners configured',
+                                'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' does not have a secure listener configured. Refer to the remediation instructions to remediate this behavior',
+                                'Remediation': {
+                                    'Recommendation': {
+                                        'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Create an HTTPS Listener for Your Application Load Balancer section of the Application Load Balancers User Guide. For Network Load Balancer logging please refer to the NLB User Guide',
+                                        'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/create-https-listener.html'
                                     }
-                                ]
-                            )
-                            print(response)
-                        except Exception as e:
-                            print(e)
-                    else: 
-                        try:
-                            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                            response = securityhub.batch_import_findings(
-                                Findings=[
+                                },
+                                'ProductFields': { 'Product Name': 'ElectricEye' },
+                                'Resources': [
                                     {
-                                        'SchemaVersion': '2018-10-08',
-                                        'Id': elbv2Arn + '/secure-listener-tls12-check',
-                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                        'GeneratorId': elbv2Arn,
-                                        'AwsAccountId': awsAccountId,
-                                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                        'FirstObservedAt': iso8601Time,
-                                        'CreatedAt': iso8601Time,
-                                        'UpdatedAt': iso8601Time,
-                                        'Severity': { 'Normalized': 0 },
-                                        'Confidence': 99,
-                                        'Title': '[ELBv2.4] Application and Network Load Balancers with HTTPS or TLS listeners should enforce TLS 1.2 policies',
-                                        'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' enforces a TLS 1.2 policy.',
-                                        'Remediation': {
-                                            'Recommendation': {
-                                                'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Security Policies section of the Application Load Balancers User Guide. For Network Load Balancer logging please refer to the NLB User Guide',
-                                                'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/create-https-listener.html#describe-ssl-policies'
-                                            }
-                                        },
-                                        'ProductFields': { 'Product Name': 'ElectricEye' },
-                                        'Resources': [
-                                            {
-                                                'Type': 'AwsElbv2LoadBalancer',
-                                                'Id': elbv2Arn,
-                                                'Partition': 'aws',
-                                                'Region': awsRegion,
-                                                'Details': {
-                                                    'AwsElbv2LoadBalancer': {
-                                                        'DNSName': elbv2DnsName,
-                                                        'IpAddressType': elbv2IpAddressType,
-                                                        'Scheme': elbv2Scheme,
-                                                        'Type': elbv2LbType,
-                                                        'VpcId': elbv2VpcId
-                                                    },
-                                                }
-                                            }
-                                        ],
-                                        'Compliance': { 'Status': 'PASSED' },
-                                        'RecordState': 'ARCHIVED'
+                                        'Type': 'AwsElbv2LoadBalancer',
+                                        'Id': elbv2Arn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsElbv2LoadBalancer': {
+                                                'DNSName': elbv2DnsName,
+                                                'IpAddressType': elbv2IpAddressType,
+                                                'Scheme': elbv2Scheme,
+                                                'Type': elbv2LbType,
+                                                'VpcId': elbv2VpcId
+                                            },
+                                        }
                                     }
-                                ]
-                            )
-                            print(response)
-                        except Exception as e:
-                            print(e)
+                                ],
+                                'Compliance': { 'Status': 'FAILED' },
+                                'RecordState': 'ACTIVE'
+                            }
+                        )
+                    except Exception as e:
+                        print(e)
                 else:
-                    pass
+                    try:
+                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': elbv2Arn + '/internet-facing-secure-listeners-check',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': elbv2Arn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                'FirstObservedAt': iso8601Time,
+                                'CreatedAt': iso8601Time,
+                                'UpdatedAt': iso8601Time,
+                                'Severity': { 'Normalized': 0 },
+                                'Confidence': 99,
+                                'Title': '[ELBv2.3] Internet-facing Application and Network Load Balancers should have secure listeners configured',
+                                'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' has a secure listener configured.',
+                                'Remediation': {
+                                    'Recommendation': {
+                                        'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Create an HTTPS Listener for Your Application Load Balancer section of the Application Load Balancers User Guide. For Network Load Balancer logging please refer to the NLB User Guide',
+                                        'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/create-https-listener.html'
+                                    }
+                                },
+                                'ProductFields': { 'Product Name': 'ElectricEye' },
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsElbv2LoadBalancer',
+                                        'Id': elbv2Arn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsElbv2LoadBalancer': {
+                                                'DNSName': elbv2DnsName,
+                                                'IpAddressType': elbv2IpAddressType,
+                                                'Scheme': elbv2Scheme,
+                                                'Type': elbv2LbType,
+                                                'VpcId': elbv2VpcId
+                                            },
+                                        }
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'PASSED' },
+                                'RecordState': 'ARCHIVED'
+                            }
+                        )
+                    except Exception as e:
+                        print(e)
         except Exception as e:
             print(e)
 
-def elbv2_drop_invalid_header_check():
+def elbv2_tls12_listener_policy_check():
+    awsAccountId = accountId.get()
     for loadbalancers in myElbv2LoadBalancers:
         elbv2Arn = str(loadbalancers['LoadBalancerArn'])
         elbv2Name = str(loadbalancers['LoadBalancerName'])
@@ -525,19 +389,20 @@ def elbv2_drop_invalid_header_check():
         elbv2Scheme = str(loadbalancers['Scheme']) 
         elbv2VpcId = str(loadbalancers['VpcId'])
         elbv2IpAddressType = str(loadbalancers['IpAddressType'])
-        response = elbv2.describe_load_balancer_attributes(LoadBalancerArn=elbv2Arn)
-        elbv2Attributes = response['Attributes']
-        for attributes in elbv2Attributes:
-            if str(attributes['Key']) == 'routing.http.drop_invalid_header_fields.enabled':
-                elbv2DropInvalidHeaderCheck = str(attributes['Value'])
-                if elbv2DropInvalidHeaderCheck == 'false':
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
+        try:
+            response = elbv2.describe_listeners(LoadBalancerArn=elbv2Arn)
+            myElbv2Listeners = response['Listeners']
+            for listeners in myElbv2Listeners:
+                listenerProtocol = str(listeners['Protocol'])
+                if listenerProtocol == 'HTTPS' or 'TLS':
+                    listenerTlsPolicyCheck = str(listeners['SslPolicy'])
+                    if listenerTlsPolicyCheck != 'ELBSecurityPolicy-TLS-1-2-2017-01' or 'ELBSecurityPolicy-TLS-1-2-Ext-2018-06' or 'ELBSecurityPolicy-FS-1-2-2019-08' or 'ELBSecurityPolicy-FS-1-2-Res-2019-08':
+                        try:
+                            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                            findingSink.put(
                                 {
                                     'SchemaVersion': '2018-10-08',
-                                    'Id': elbv2Arn + '/elbv2-drop-invalid-header-fields-check',
+                                    'Id': elbv2Arn + '/secure-listener-tls12-check',
                                     'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
                                     'GeneratorId': elbv2Arn,
                                     'AwsAccountId': awsAccountId,
@@ -545,14 +410,14 @@ def elbv2_drop_invalid_header_check():
                                     'FirstObservedAt': iso8601Time,
                                     'CreatedAt': iso8601Time,
                                     'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 60 },
+                                    'Severity': { 'Normalized': 70 },
                                     'Confidence': 99,
-                                    'Title': '[ELBv2.5] Application Load Balancers should drop invalid HTTP header fields',
-                                    'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' does not drop invalid HTTP header fields. Refer to the remediation instructions to remediate this behavior',
+                                    'Title': '[ELBv2.4] Application and Network Load Balancers with HTTPS or TLS listeners should enforce TLS 1.2 policies',
+                                    'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' does not enforce a TLS 1.2 policy. Refer to the remediation instructions to remediate this behavior',
                                     'Remediation': {
                                         'Recommendation': {
-                                            'Text': 'For more information on dropping invalid HTTP headers refer to the routing.http.drop_invalid_header_fields.enabled section of the Application Load Balancers User Guide.',
-                                            'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/application-load-balancers.html#load-balancer-attributes'
+                                            'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Security Policies section of the Application Load Balancers User Guide. For Network Load Balancer logging please refer to the NLB User Guide',
+                                            'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/create-https-listener.html#describe-ssl-policies'
                                         }
                                     },
                                     'ProductFields': { 'Product Name': 'ElectricEye' },
@@ -576,19 +441,16 @@ def elbv2_drop_invalid_header_check():
                                     'Compliance': { 'Status': 'FAILED' },
                                     'RecordState': 'ACTIVE'
                                 }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
+                            )
+                        except Exception as e:
+                            print(e)
+                    else: 
+                        try:
+                            iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                            findingSink.put(
                                 {
                                     'SchemaVersion': '2018-10-08',
-                                    'Id': elbv2Arn + '/elbv2-drop-invalid-header-fields-check',
+                                    'Id': elbv2Arn + '/secure-listener-tls12-check',
                                     'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
                                     'GeneratorId': elbv2Arn,
                                     'AwsAccountId': awsAccountId,
@@ -598,12 +460,12 @@ def elbv2_drop_invalid_header_check():
                                     'UpdatedAt': iso8601Time,
                                     'Severity': { 'Normalized': 0 },
                                     'Confidence': 99,
-                                    'Title': '[ELBv2.5] Application Load Balancers should drop invalid HTTP header fields',
-                                    'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' drops invalid HTTP header fields.',
+                                    'Title': '[ELBv2.4] Application and Network Load Balancers with HTTPS or TLS listeners should enforce TLS 1.2 policies',
+                                    'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' enforces a TLS 1.2 policy.',
                                     'Remediation': {
                                         'Recommendation': {
-                                            'Text': 'For more information on dropping invalid HTTP headers refer to the routing.http.drop_invalid_header_fields.enabled section of the Application Load Balancers User Guide.',
-                                            'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/application-load-balancers.html#load-balancer-attributes'
+                                            'Text': 'For more information on ELBv2 Access Logging and how to configure it refer to the Security Policies section of the Application Load Balancers User Guide. For Network Load Balancer logging please refer to the NLB User Guide',
+                                            'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/create-https-listener.html#describe-ssl-policies'
                                         }
                                     },
                                     'ProductFields': { 'Product Name': 'ElectricEye' },
@@ -627,15 +489,130 @@ def elbv2_drop_invalid_header_check():
                                     'Compliance': { 'Status': 'PASSED' },
                                     'RecordState': 'ARCHIVED'
                                 }
-                            ]
+                            )
+                        except Exception as e:
+                            print(e)
+                else:
+                    pass
+        except Exception as e:
+            print(e)
+
+def elbv2_drop_invalid_header_check():
+    awsAccountId = accountId.get()
+    for loadbalancers in myElbv2LoadBalancers:
+        elbv2Arn = str(loadbalancers['LoadBalancerArn'])
+        elbv2Name = str(loadbalancers['LoadBalancerName'])
+        elbv2DnsName = str(loadbalancers['DNSName'])
+        elbv2LbType = str(loadbalancers['Type']) 
+        elbv2Scheme = str(loadbalancers['Scheme']) 
+        elbv2VpcId = str(loadbalancers['VpcId'])
+        elbv2IpAddressType = str(loadbalancers['IpAddressType'])
+        response = elbv2.describe_load_balancer_attributes(LoadBalancerArn=elbv2Arn)
+        elbv2Attributes = response['Attributes']
+        for attributes in elbv2Attributes:
+            if str(attributes['Key']) == 'routing.http.drop_invalid_header_fields.enabled':
+                elbv2DropInvalidHeaderCheck = str(attributes['Value'])
+                if elbv2DropInvalidHeaderCheck == 'false':
+                    try:
+                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': elbv2Arn + '/elbv2-drop-invalid-header-fields-check',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': elbv2Arn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                'FirstObservedAt': iso8601Time,
+                                'CreatedAt': iso8601Time,
+                                'UpdatedAt': iso8601Time,
+                                'Severity': { 'Normalized': 60 },
+                                'Confidence': 99,
+                                'Title': '[ELBv2.5] Application Load Balancers should drop invalid HTTP header fields',
+                                'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' does not drop invalid HTTP header fields. Refer to the remediation instructions to remediate this behavior',
+                                'Remediation': {
+                                    'Recommendation': {
+                                        'Text': 'For more information on dropping invalid HTTP headers refer to the routing.http.drop_invalid_header_fields.enabled section of the Application Load Balancers User Guide.',
+                                        'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/application-load-balancers.html#load-balancer-attributes'
+                                    }
+                                },
+                                'ProductFields': { 'Product Name': 'ElectricEye' },
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsElbv2LoadBalancer',
+                                        'Id': elbv2Arn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsElbv2LoadBalancer': {
+                                                'DNSName': elbv2DnsName,
+                                                'IpAddressType': elbv2IpAddressType,
+                                                'Scheme': elbv2Scheme,
+                                                'Type': elbv2LbType,
+                                                'VpcId': elbv2VpcId
+                                            },
+                                        }
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'FAILED' },
+                                'RecordState': 'ACTIVE'
+                            }
+                        )
+                    except Exception as e:
+                        print(e)
+                else:
+                    try:
+                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': elbv2Arn + '/elbv2-drop-invalid-header-fields-check',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': elbv2Arn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                'FirstObservedAt': iso8601Time,
+                                'CreatedAt': iso8601Time,
+                                'UpdatedAt': iso8601Time,
+                                'Severity': { 'Normalized': 0 },
+                                'Confidence': 99,
+                                'Title': '[ELBv2.5] Application Load Balancers should drop invalid HTTP header fields',
+                                'Description': 'ELB ' + elbv2LbType + ' load balancer ' + elbv2Name + ' drops invalid HTTP header fields.',
+                                'Remediation': {
+                                    'Recommendation': {
+                                        'Text': 'For more information on dropping invalid HTTP headers refer to the routing.http.drop_invalid_header_fields.enabled section of the Application Load Balancers User Guide.',
+                                        'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/application/application-load-balancers.html#load-balancer-attributes'
+                                    }
+                                },
+                                'ProductFields': { 'Product Name': 'ElectricEye' },
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsElbv2LoadBalancer',
+                                        'Id': elbv2Arn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsElbv2LoadBalancer': {
+                                                'DNSName': elbv2DnsName,
+                                                'IpAddressType': elbv2IpAddressType,
+                                                'Scheme': elbv2Scheme,
+                                                'Type': elbv2LbType,
+                                                'VpcId': elbv2VpcId
+                                            },
+                                        }
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'PASSED' },
+                                'RecordState': 'ARCHIVED'
+                            }
                         )
-                        print(response)
                     except Exception as e:
                         print(e)
             else:
                 pass
 
 def elbv2_nlb_tls_logging_check():
+    awsAccountId = accountId.get()
     for loadbalancers in myElbv2LoadBalancers:
         elbv2Arn = str(loadbalancers['LoadBalancerArn'])
         elbv2Name = str(loadbalancers['LoadBalancerName'])
@@ -659,103 +636,97 @@ def elbv2_nlb_tls_logging_check():
                                     if elbv2LoggingCheck == 'false':
                                         try:
                                             iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                                            response = securityhub.batch_import_findings(
-                                                Findings=[
-                                                    {
-                                                        'SchemaVersion': '2018-10-08',
-                                                        'Id': elbv2Arn + '/tls-nlb-logging-check',
-                                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                                        'GeneratorId': elbv2Arn,
-                                                        'AwsAccountId': awsAccountId,
-                                                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                                        'FirstObservedAt': iso8601Time,
-                                                        'CreatedAt': iso8601Time,
-                                                        'UpdatedAt': iso8601Time,
-                                                        'Severity': { 'Normalized': 20 },
-                                                        'Confidence': 99,
-                                                        'Title': '[ELBv2.6] Network Load Balancers with TLS listeners should have access logging enabled',
-                                                        'Description': 'Network load balancer ' + elbv2Name + ' does not have access logging enabled. Refer to the remediation instructions to remediate this behavior',
-                                                        'Remediation': {
-                                                            'Recommendation': {
-                                                                'Text': 'For more information on Network Load Balancer Access Logging and how to configure it refer to the Access Logs for Your Network Load Balancer section of the Network Load Balancers User Guide.',
-                                                                'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/network/load-balancer-access-logs.html'
-                                                            }
-                                                        },
-                                                        'ProductFields': { 'Product Name': 'ElectricEye' },
-                                                        'Resources': [
-                                                            {
-                                                                'Type': 'AwsElbv2LoadBalancer',
-                                                                'Id': elbv2Arn,
-                                                                'Partition': 'aws',
-                                                                'Region': awsRegion,
-                                                                'Details': {
-                                                                    'AwsElbv2LoadBalancer': {
-                                                                        'DNSName': elbv2DnsName,
-                                                                        'IpAddressType': elbv2IpAddressType,
-                                                                        'Scheme': elbv2Scheme,
-                                                                        'Type': elbv2LbType,
-                                                                        'VpcId': elbv2VpcId
-                                                                    }
+                                            findingSink.put(
+                                                {
+                                                    'SchemaVersion': '2018-10-08',
+                                                    'Id': elbv2Arn + '/tls-nlb-logging-check',
+                                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                                    'GeneratorId': elbv2Arn,
+                                                    'AwsAccountId': awsAccountId,
+                                                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                                    'FirstObservedAt': iso8601Time,
+                                                    'CreatedAt': iso8601Time,
+                                                    'UpdatedAt': iso8601Time,
+                                                    'Severity': { 'Normalized': 20 },
+                                                    'Confidence': 99,
+                                                    'Title': '[ELBv2.6] Network Load Balancers with TLS listeners should have access logging enabled',
+                                                    'Description': 'Network load balancer ' + elbv2Name + ' does not have access logging enabled. Refer to the remediation instructions to remediate this behavior',
+                                                    'Remediation': {
+                                                        'Recommendation': {
+                                                            'Text': 'For more information on Network Load Balancer Access Logging and how to configure it refer to the Access Logs for Your Network Load Balancer section of the Network Load Balancers User Guide.',
+                                                            'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/network/load-balancer-access-logs.html'
+                                                        }
+                                                    },
+                                                    'ProductFields': { 'Product Name': 'ElectricEye' },
+                                                    'Resources': [
+                                                        {
+                                                            'Type': 'AwsElbv2LoadBalancer',
+                                                            'Id': elbv2Arn,
+                                                            'Partition': 'aws',
+                                                            'Region': awsRegion,
+                                                            'Details': {
+                                                                'AwsElbv2LoadBalancer': {
+                                                                    'DNSName': elbv2DnsName,
+                                                                    'IpAddressType': elbv2IpAddressType,
+                                                                    'Scheme': elbv2Scheme,
+                                                                    'Type': elbv2LbType,
+                                                                    'VpcId': elbv2VpcId
                                                                 }
                                                             }
-                                                        ],
-                                                        'Compliance': { 'Status': 'FAILED' },
-                                                        'RecordState': 'ACTIVE'
-                                                    }
-                                                ]
+                                                        }
+                                                    ],
+                                                    'Compliance': { 'Status': 'FAILED' },
+                                                    'RecordState': 'ACTIVE'
+                                                }
                                             )
-                                            print(response)
                                         except Exception as e:
                                             print(e)
                                     else:
                                         try:
                                             iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                                            response = securityhub.batch_import_findings(
-                                                Findings=[
-                                                    {
-                                                        'SchemaVersion': '2018-10-08',
-                                                        'Id': elbv2Arn + '/tls-nlb-logging-check',
-                                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                                        'GeneratorId': elbv2Arn,
-                                                        'AwsAccountId': awsAccountId,
-                                                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                                        'FirstObservedAt': iso8601Time,
-                                                        'CreatedAt': iso8601Time,
-                                                        'UpdatedAt': iso8601Time,
-                                                        'Severity': { 'Normalized': 0 },
-                                                        'Confidence': 99,
-                                                        'Title': '[ELBv2.6] Network Load Balancers with TLS listeners should have access logging enabled',
-                                                        'Description': 'Network load balancer ' + elbv2Name + ' has access logging enabled.',
-                                                        'Remediation': {
-                                                            'Recommendation': {
-                                                                'Text': 'For more information on Network Load Balancer Access Logging and how to configure it refer to the Access Logs for Your Network Load Balancer section of the Network Load Balancers User Guide.',
-                                                                'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/network/load-balancer-access-logs.html'
-                                                            }
-                                                        },
-                                                        'ProductFields': { 'Product Name': 'ElectricEye' },
-                                                        'Resources': [
-                                                            {
-                                                                'Type': 'AwsElbv2LoadBalancer',
-                                                                'Id': elbv2Arn,
-                                                                'Partition': 'aws',
-                                                                'Region': awsRegion,
-                                                                'Details': {
-                                                                    'AwsElbv2LoadBalancer': {
-                                                                        'DNSName': elbv2DnsName,
-                                                                        'IpAddressType': elbv2IpAddressType,
-                                                                        'Scheme': elbv2Scheme,
-                                                                        'Type': elbv2LbType,
-                                                                        'VpcId': elbv2VpcId
-                                                                    }
+                                            findingSink.put(
+                                                {
+                                                    'SchemaVersion': '2018-10-08',
+                                                    'Id': elbv2Arn + '/tls-nlb-logging-check',
+                                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                                    'GeneratorId': elbv2Arn,
+                                                    'AwsAccountId': awsAccountId,
+                                                    'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                                                    'FirstObservedAt': iso8601Time,
+                                                    'CreatedAt': iso8601Time,
+                                                    'UpdatedAt': iso8601Time,
+                                                    'Severity': { 'Normalized': 0 },
+                                                    'Confidence': 99,
+                                                    'Title': '[ELBv2.6] Network Load Balancers with TLS listeners should have access logging enabled',
+                                                    'Description': 'Network load balancer ' + elbv2Name + ' has access logging enabled.',
+                                                    'Remediation': {
+                                                        'Recommendation': {
+                                                            'Text': 'For more information on Network Load Balancer Access Logging and how to configure it refer to the Access Logs for Your Network Load Balancer section of the Network Load Balancers User Guide.',
+                                                            'Url': 'https://docs.aws.amazon.com/elasticloadbalancing/latest/network/load-balancer-access-logs.html'
+                                                        }
+                                                    },
+                                                    'ProductFields': { 'Product Name': 'ElectricEye' },
+                                                    'Resources': [
+                                                        {
+                                                            'Type': 'AwsElbv2LoadBalancer',
+                                                            'Id': elbv2Arn,
+                                                            'Partition': 'aws',
+                                                            'Region': awsRegion,
+                                                            'Details': {
+                                                                'AwsElbv2LoadBalancer': {
+                                                                    'DNSName': elbv2DnsName,
+                                                                    'IpAddressType': elbv2IpAddressType,
+                                                                    'Scheme': elbv2Scheme,
+                                                                    'Type': elbv2LbType,
+                                                                    'VpcId': elbv2VpcId
                                                                 }
                                                             }
-                                                        ],
-                                                        'Compliance': { 'Status': 'PASSED' },
-                                                        'RecordState': 'ARCHIVED'
-                                                    }
-                                                ]
+                                                        }
+                                                    ],
+                                                    'Compliance': { 'Status': 'PASSED' },
+                                                    'RecordState': 'ARCHIVED'
+                                                }
                                             )
-                                            print(response)
                                         except Exception as e:
                                             print(e)
                                 else:
@@ -777,4 +748,5 @@ def elbv2_auditor():
     elbv2_drop_invalid_header_check()
     elbv2_nlb_tls_logging_check()
 
-elbv2_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    elbv2_auditor()
\ No newline at end of file
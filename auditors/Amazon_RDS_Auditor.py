@@ -13,18 +13,24 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import os
-import datetime
+from check_registry import CheckRegistry
+from finding_sink import default_sink
+from resource_inventory import default_inventory
+from scan_scope import lazy_account_id, lazy_client
 # import boto3 clients
-sts = boto3.client('sts')
-rds = boto3.client('rds')
-securityhub = boto3.client('securityhub')
+rds = lazy_client('rds')
+findingSink = default_sink()
+inventory = default_inventory()
+registry = CheckRegistry()
 # create env vars
 awsRegion = os.environ['AWS_REGION']
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 # loop through all RDS DB instances
-response = rds.describe_db_instances(
+myRdsInstances = inventory.lazy(
+    'rds',
+    'describe_db_instances',
+    'DBInstances',
     Filters=[
         {
             'Name': 'engine',
@@ -42,1173 +48,240 @@ response = rds.describe_db_instances(
                 'sqlserver-web'
             ]
         }
-    ],
-    MaxRecords=100
+    ]
+)
+# stream RDS DB snapshots page by page, accounts can have far too many to hold in memory
+myRdsSnapshots = inventory.stream('rds', 'describe_db_snapshots', 'DBSnapshots')
+# engines that support IAM Database Authentication and Kerberos Authentication
+iamAuthEngines = ('aurora', 'aurora-mysql', 'aurora-postgresql', 'mysql', 'postgres')
+kerberosAuthEngines = (
+    'mysql',
+    'oracle-ee',
+    'oracle-se1',
+    'oracle-se2',
+    'oracle-se',
+    'postgres',
+    'sqlserver-ee',
+    'sqlserver-se',
+    'sqlserver-ex',
+    'sqlserver-web'
 )
-myRdsInstances = response['DBInstances']
-# loop through all RDS DB snapshots
-response = rds.describe_db_snapshots()
-myRdsSnapshots = response['DBSnapshots']
+dataExposureTypes = [
+    'Software and Configuration Checks/AWS Security Best Practices',
+    'Effects/Data Exposure'
+]
+
+def rds_instance_resource(dbinstances):
+    instanceId = str(dbinstances['DBInstanceIdentifier'])
+    return {
+        'Type': 'AwsRdsDbInstance',
+        'Id': str(dbinstances['DBInstanceArn']),
+        'Details': {
+            'AwsRdsDbInstance': {
+                'DBInstanceIdentifier': instanceId,
+                'DBInstanceClass': str(dbinstances['DBInstanceClass']),
+                'DbInstancePort': int(dbinstances['Endpoint']['Port']),
+                'Engine': str(dbinstances['Engine']),
+                'EngineVersion': str(dbinstances['EngineVersion'])
+            }
+        },
+        'Fields': {
+            'InstanceId': instanceId,
+            'LogExports': str(dbinstances.get('EnabledCloudwatchLogsExports', []))
+        }
+    }
 
-def rds_instance_ha_check():
-    for dbinstances in myRdsInstances:
-        instanceArn = str(dbinstances['DBInstanceArn'])
-        instanceId = str(dbinstances['DBInstanceIdentifier'])
-        instanceClass = str(dbinstances['DBInstanceClass'])
-        instancePort = int(dbinstances['Endpoint']['Port'])
-        instanceEngine = str(dbinstances['Engine'])
-        instanceEngineVersion = str(dbinstances['EngineVersion'])
-        highAvailabilityCheck = str(dbinstances['MultiAZ'])
-        if highAvailabilityCheck == 'False':
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': instanceArn + '/instance-ha-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': instanceArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 20 },
-                            'Confidence': 99,
-                            'Title': '[RDS.1] RDS instances should be configured for high availability',
-                            'Description': 'RDS DB instance ' + instanceId + ' is not configured for high availability. Refer to the remediation instructions to remediate this behavior',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on RDS instance high availability and how to configure it refer to the High Availability (Multi-AZ) for Amazon RDS section of the Amazon Relational Database Service User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/Concepts.MultiAZ.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbInstance',
-                                    'Id': instanceArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsRdsDbInstance': {
-                                            'DBInstanceIdentifier': instanceId,
-                                            'DBInstanceClass': instanceClass,
-                                            'DbInstancePort': instancePort,
-                                            'Engine': instanceEngine,
-                                            'EngineVersion': instanceEngineVersion
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        else:
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': instanceArn + '/instance-ha-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': instanceArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 20 },
-                            'Confidence': 99,
-                            'Title': '[RDS.1] RDS instances should be configured for high availability',
-                            'Description': 'RDS DB instance ' + instanceId + ' is configured for high availability.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on RDS instance high availability and how to configure it refer to the High Availability (Multi-AZ) for Amazon RDS section of the Amazon Relational Database Service User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/Concepts.MultiAZ.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbInstance',
-                                    'Id': instanceArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsRdsDbInstance': {
-                                            'DBInstanceIdentifier': instanceId,
-                                            'DBInstanceClass': instanceClass,
-                                            'DbInstancePort': instancePort,
-                                            'Engine': instanceEngine,
-                                            'EngineVersion': instanceEngineVersion
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
+def rds_instance_details(field):
+    # per check ASFF details, each check reports the instance setting it evaluated
+    def details(dbinstances):
+        return { 'AwsRdsDbInstance': { field: bool(dbinstances.get(field, False)) } }
+    return details
 
-def rds_instance_public_access_check():
-    for dbinstances in myRdsInstances:
-        instanceArn = str(dbinstances['DBInstanceArn'])
-        instanceId = str(dbinstances['DBInstanceIdentifier'])
-        instanceClass = str(dbinstances['DBInstanceClass'])
-        instancePort = int(dbinstances['Endpoint']['Port'])
-        instanceEngine = str(dbinstances['Engine'])
-        instanceEngineVersion = str(dbinstances['EngineVersion'])
-        publicAccessibleCheck = str(dbinstances['PubliclyAccessible'])
-        if publicAccessibleCheck == 'True':
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': instanceArn + '/instance-public-access-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': instanceArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 90 },
-                            'Confidence': 99,
-                            'Title': '[RDS.2] RDS instances should not be publicly accessible',
-                            'Description': 'RDS DB instance ' + instanceId + ' is publicly accessible. Refer to the remediation instructions to remediate this behavior',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on RDS instance publicly access and how to change it refer to the Hiding a DB Instance in a VPC from the Internet section of the Amazon Relational Database Service User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/USER_VPC.WorkingWithRDSInstanceinaVPC.html#USER_VPC.Hiding'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbInstance',
-                                    'Id': instanceArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsRdsDbInstance': {
-                                            'DBInstanceIdentifier': instanceId,
-                                            'DBInstanceClass': instanceClass,
-                                            'DbInstancePort': instancePort,
-                                            'Engine': instanceEngine,
-                                            'EngineVersion': instanceEngineVersion,
-                                            'PubliclyAccessible': True
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        else:
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': instanceArn + '/instance-public-access-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': instanceArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[RDS.2] RDS instances should not be publicly accessible',
-                            'Description': 'RDS DB instance ' + instanceId + ' is not publicly accessible. Refer to the remediation instructions to remediate this behavior',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on RDS instance publicly access and how to change it refer to the Hiding a DB Instance in a VPC from the Internet section of the Amazon Relational Database Service User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/USER_VPC.WorkingWithRDSInstanceinaVPC.html#USER_VPC.Hiding'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbInstance',
-                                    'Id': instanceArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsRdsDbInstance': {
-                                            'DBInstanceIdentifier': instanceId,
-                                            'DBInstanceClass': instanceClass,
-                                            'DbInstancePort': instancePort,
-                                            'Engine': instanceEngine,
-                                            'EngineVersion': instanceEngineVersion,
-                                            'PubliclyAccessible': False
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
+rds_public_access_details = rds_instance_details('PubliclyAccessible')
+rds_storage_encryption_details = rds_instance_details('StorageEncrypted')
+rds_iam_auth_details = rds_instance_details('IAMDatabaseAuthenticationEnabled')
+rds_deletion_protection_details = rds_instance_details('DeletionProtection')
 
-def rds_instance_storage_encryption_check():
-    for dbinstances in myRdsInstances:
-        instanceArn = str(dbinstances['DBInstanceArn'])
-        instanceId = str(dbinstances['DBInstanceIdentifier'])
-        instanceClass = str(dbinstances['DBInstanceClass'])
-        instancePort = int(dbinstances['Endpoint']['Port'])
-        instanceEngine = str(dbinstances['Engine'])
-        instanceEngineVersion = str(dbinstances['EngineVersion'])
-        rdsStorageEncryptionCheck = str(dbinstances['StorageEncrypted'])
-        if rdsStorageEncryptionCheck == 'False':
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': instanceArn + '/instance-storage-encryption-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': instanceArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 80 },
-                            'Confidence': 99,
-                            'Title': '[RDS.3] RDS instances should have encrypted storage',
-                            'Description': 'RDS DB instance ' + instanceId + ' does not have encrypted storage. Refer to the remediation instructions to remediate this behavior',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on RDS storage encryption refer to the Enabling Amazon RDS Encryption for a DB Instance section of the Amazon Relational Database Service User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/Overview.Encryption.html#Overview.Encryption.Enabling'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbInstance',
-                                    'Id': instanceArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsRdsDbInstance': {
-                                            'DBInstanceIdentifier': instanceId,
-                                            'DBInstanceClass': instanceClass,
-                                            'DbInstancePort': instancePort,
-                                            'Engine': instanceEngine,
-                                            'EngineVersion': instanceEngineVersion,
-                                            'StorageEncrypted': False
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        else:
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': instanceArn + '/instance-storage-encryption-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': instanceArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[RDS.3] RDS instances should have encrypted storage',
-                            'Description': 'RDS DB instance ' + instanceId + ' has encrypted storage.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on RDS storage encryption refer to the Enabling Amazon RDS Encryption for a DB Instance section of the Amazon Relational Database Service User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/Overview.Encryption.html#Overview.Encryption.Enabling'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbInstance',
-                                    'Id': instanceArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsRdsDbInstance': {
-                                            'DBInstanceIdentifier': instanceId,
-                                            'DBInstanceClass': instanceClass,
-                                            'DbInstancePort': instancePort,
-                                            'Engine': instanceEngine,
-                                            'EngineVersion': instanceEngineVersion,
-                                            'StorageEncrypted': True
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
+def rds_snapshot_resource(snapshot):
+    snapshotId = str(snapshot['DBSnapshotIdentifier'])
+    return {
+        'Type': 'AwsRdsDbSnapshot',
+        'Id': str(snapshot['DBSnapshotArn']),
+        'Details': {
+            'Other': {
+                'SnapshotId': snapshotId
+            }
+        },
+        'Fields': { 'SnapshotId': snapshotId }
+    }
 
-def rds_instance_iam_auth_check():
-    for dbinstances in myRdsInstances:
-        instanceArn = str(dbinstances['DBInstanceArn'])
-        instanceId = str(dbinstances['DBInstanceIdentifier'])
-        instanceClass = str(dbinstances['DBInstanceClass'])
-        instancePort = int(dbinstances['Endpoint']['Port'])
-        instanceEngine = str(dbinstances['Engine'])
-        instanceEngineVersion = str(dbinstances['EngineVersion'])
-        iamDbAuthCheck = str(dbinstances['IAMDatabaseAuthenticationEnabled'])
-        if instanceEngine == 'mysql' or 'postgres':
-            if iamDbAuthCheck == 'False':
-                try:
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': instanceArn + '/instance-iam-auth-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': instanceArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 50 },
-                                'Confidence': 99,
-                                'Title': '[RDS.4] RDS instances that support IAM Authentication should use IAM Authentication',
-                                'Description': 'RDS DB instance ' + instanceId + ' does not support IAM Authentication. Refer to the remediation instructions to remediate this behavior',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'For more information on RDS IAM Database Authentication and how to configure it refer to the IAM Database Authentication for MySQL and PostgreSQL section of the Amazon Relational Database Service User Guide',
-                                        'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/UsingWithRDS.IAMDBAuth.html'
-                                    }
-                                },
-                                'ProductFields': { 'Product Name': 'ElectricEye' },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsRdsDbInstance',
-                                        'Id': instanceArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'AwsRdsDbInstance': {
-                                                'DBInstanceIdentifier': instanceId,
-                                                'DBInstanceClass': instanceClass,
-                                                'DbInstancePort': instancePort,
-                                                'Engine': instanceEngine,
-                                                'EngineVersion': instanceEngineVersion,
-                                                'IAMDatabaseAuthenticationEnabled': False
-                                            }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-            else:
-                try:
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': instanceArn + '/instance-iam-auth-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': instanceArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[RDS.4] RDS instances that support IAM Authentication should use IAM Authentication',
-                                'Description': 'RDS DB instance ' + instanceId + ' supports IAM Authentication.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'For more information on RDS IAM Database Authentication and how to configure it refer to the IAM Database Authentication for MySQL and PostgreSQL section of the Amazon Relational Database Service User Guide',
-                                        'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/UsingWithRDS.IAMDBAuth.html'
-                                    }
-                                },
-                                'ProductFields': { 'Product Name': 'ElectricEye' },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsRdsDbInstance',
-                                        'Id': instanceArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'AwsRdsDbInstance': {
-                                                'DBInstanceIdentifier': instanceId,
-                                                'DBInstanceClass': instanceClass,
-                                                'DbInstancePort': instancePort,
-                                                'Engine': instanceEngine,
-                                                'EngineVersion': instanceEngineVersion,
-                                                'IAMDatabaseAuthenticationEnabled': True
-                                            }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-        else:
-            print('This DB does not support IAM auth')
-            pass
+@registry.collection('instances', rds_instance_resource)
+def rds_instances():
+    return myRdsInstances
 
-def rds_instance_domain_join_check(): 
-    for dbinstances in myRdsInstances:
-        instanceArn = str(dbinstances['DBInstanceArn'])
-        instanceId = str(dbinstances['DBInstanceIdentifier'])
-        instanceClass = str(dbinstances['DBInstanceClass'])
-        instancePort = int(dbinstances['Endpoint']['Port'])
-        instanceEngine = str(dbinstances['Engine'])
-        instanceEngineVersion = str(dbinstances['EngineVersion'])
-        activeDirectoryDomainCheck = str(dbinstances['DomainMemberships'])
-        if instanceEngine == 'mysql' or 'oracle-ee' or 'oracle-se1' or 'oracle-se2' or 'oracle-se' or 'postgres' or 'sqlserver-ee' or 'sqlserver-se' or 'sqlserver-ex' or 'sqlserver-web':
-            if activeDirectoryDomainCheck == '[]':
-                try:
-                    # this one doesn't have a domain so likely doesnt have kerberos
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': instanceArn + '/instance-domain-join-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': instanceArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 50 },
-                                'Confidence': 99,
-                                'Title': '[RDS.5] RDS instances that support Kerberos Authentication should be joined to a domain',
-                                'Description': 'RDS DB instance ' + instanceId + ' is not joined to a domain, and likely does not support Kerberos Authentication because of it. Refer to the remediation instructions to remediate this behavior',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'For more information on RDS instances that support Kerberos Authentication and how to configure it refer to the Kerberos Authentication section of the Amazon Relational Database Service User Guide',
-                                        'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/kerberos-authentication.html'
-                                    }
-                                },
-                                'ProductFields': { 'Product Name': 'ElectricEye' },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsRdsDbInstance',
-                                        'Id': instanceArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'AwsRdsDbInstance': {
-                                                'DBInstanceIdentifier': instanceId,
-                                                'DBInstanceClass': instanceClass,
-                                                'DbInstancePort': instancePort,
-                                                'Engine': instanceEngine,
-                                                'EngineVersion': instanceEngineVersion
-                                            }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-            else:
-                try:
-                    # this one doesn't have a domain so likely doesnt have kerberos
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': instanceArn + '/instance-domain-join-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': instanceArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[RDS.5] RDS instances that support Kerberos Authentication should be joined to a domain',
-                                'Description': 'RDS DB instance ' + instanceId + ' is joined to a domain, and likely supports Kerberos Authentication because of it.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'For more information on RDS instances that support Kerberos Authentication and how to configure it refer to the Kerberos Authentication section of the Amazon Relational Database Service User Guide',
-                                        'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/kerberos-authentication.html'
-                                    }
-                                },
-                                'ProductFields': { 'Product Name': 'ElectricEye' },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsRdsDbInstance',
-                                        'Id': instanceArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'AwsRdsDbInstance': {
-                                                'DBInstanceIdentifier': instanceId,
-                                                'DBInstanceClass': instanceClass,
-                                                'DbInstancePort': instancePort,
-                                                'Engine': instanceEngine,
-                                                'EngineVersion': instanceEngineVersion
-                                            }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'PASSED', },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-        else:
-            print('This DB does not support Kerberos auth')
-            pass
+def rds_snapshot_attributes(snapshot):
+    # snapshot attributes are fetched once per snapshot and shared by every snapshot check
+    response = rds.describe_db_snapshot_attributes(DBSnapshotIdentifier=str(snapshot['DBSnapshotIdentifier']))
+    snapshot = dict(snapshot)
+    snapshot['DBSnapshotAttributes'] = response['DBSnapshotAttributesResult']['DBSnapshotAttributes']
+    return snapshot
 
-def rds_instance_performance_insights_check():
-    for dbinstances in myRdsInstances:
-        instanceArn = str(dbinstances['DBInstanceArn'])
-        instanceId = str(dbinstances['DBInstanceIdentifier'])
-        instanceClass = str(dbinstances['DBInstanceClass'])
-        instancePort = int(dbinstances['Endpoint']['Port'])
-        instanceEngine = str(dbinstances['Engine'])
-        instanceEngineVersion = str(dbinstances['EngineVersion'])
-        perfInsightsCheck = str(dbinstances['PerformanceInsightsEnabled'])
-        if perfInsightsCheck == 'False':
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': instanceArn + '/instance-perf-insights-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': instanceArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 20 },
-                            'Confidence': 99,
-                            'Title': '[RDS.6] RDS instances should have performance insights enabled',
-                            'Description': 'RDS DB instance ' + instanceId + ' does not have performance insights enabled. Refer to the remediation instructions to remediate this behavior',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on RDS performance insights and how to configure it refer to the Using Amazon RDS Performance Insights section of the Amazon Relational Database Service User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/USER_PerfInsights.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbInstance',
-                                    'Id': instanceArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsRdsDbInstance': {
-                                            'DBInstanceIdentifier': instanceId,
-                                            'DBInstanceClass': instanceClass,
-                                            'DbInstancePort': instancePort,
-                                            'Engine': instanceEngine,
-                                            'EngineVersion': instanceEngineVersion
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        else:
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': instanceArn + '/instance-perf-insights-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': instanceArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[RDS.6] RDS instances should have performance insights enabled',
-                            'Description': 'RDS DB instance ' + instanceId + ' has performance insights enabled.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on RDS performance insights and how to configure it refer to the Using Amazon RDS Performance Insights section of the Amazon Relational Database Service User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/USER_PerfInsights.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbInstance',
-                                    'Id': instanceArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsRdsDbInstance': {
-                                            'DBInstanceIdentifier': instanceId,
-                                            'DBInstanceClass': instanceClass,
-                                            'DbInstancePort': instancePort,
-                                            'Engine': instanceEngine,
-                                            'EngineVersion': instanceEngineVersion
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
+@registry.collection('snapshots', rds_snapshot_resource, rds_snapshot_attributes)
+def rds_snapshots():
+    return myRdsSnapshots
 
-def rds_instance_deletion_protection_check():
-    for dbinstances in myRdsInstances:
-        instanceArn = str(dbinstances['DBInstanceArn'])
-        instanceId = str(dbinstances['DBInstanceIdentifier'])
-        instanceClass = str(dbinstances['DBInstanceClass'])
-        instancePort = int(dbinstances['Endpoint']['Port'])
-        instanceEngine = str(dbinstances['Engine'])
-        instanceEngineVersion = str(dbinstances['EngineVersion'])
-        deletionProtectionCheck = str(dbinstances['DeletionProtection'])
-        if deletionProtectionCheck == 'False':
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': instanceArn + '/instance-deletion-prot-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': instanceArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 20 },
-                            'Confidence': 99,
-                            'Title': '[RDS.7] RDS instances should have deletion protection enabled',
-                            'Description': 'RDS DB instance ' + instanceId + ' does not have deletion protection enabled. Refer to the remediation instructions to remediate this behavior',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on RDS deletion protection and how to configure it refer to the Deletion Protection section of the Amazon Relational Database Service User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/USER_DeleteInstance.html#USER_DeleteInstance.DeletionProtection'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbInstance',
-                                    'Id': instanceArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsRdsDbInstance': {
-                                            'DBInstanceIdentifier': instanceId,
-                                            'DBInstanceClass': instanceClass,
-                                            'DbInstancePort': instancePort,
-                                            'DeletionProtection': False,
-                                            'Engine': instanceEngine,
-                                            'EngineVersion': instanceEngineVersion
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        else:
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': instanceArn + '/instance-database-cloudwatch-logs-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': instanceArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[RDS.7] RDS instances should have deletion protection enabled',
-                            'Description': 'RDS DB instance ' + instanceId + ' has deletion protection enabled.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on RDS deletion protection and how to configure it refer to the Deletion Protection section of the Amazon Relational Database Service User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/USER_DeleteInstance.html#USER_DeleteInstance.DeletionProtection'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbInstance',
-                                    'Id': instanceArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsRdsDbInstance': {
-                                            'DBInstanceIdentifier': instanceId,
-                                            'DBInstanceClass': instanceClass,
-                                            'DbInstancePort': instancePort,
-                                            'DeletionProtection': False,
-                                            'Engine': instanceEngine,
-                                            'EngineVersion': instanceEngineVersion
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
+@registry.check(
+    'instances',
+    findingId='instance-ha-check',
+    title='[RDS.1] RDS instances should be configured for high availability',
+    severity=20,
+    failedDescription='RDS DB instance {InstanceId} is not configured for high availability. Refer to the remediation instructions to remediate this behavior',
+    passedDescription='RDS DB instance {InstanceId} is configured for high availability.',
+    remediationText='For more information on RDS instance high availability and how to configure it refer to the High Availability (Multi-AZ) for Amazon RDS section of the Amazon Relational Database Service User Guide',
+    remediationUrl='https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/Concepts.MultiAZ.html'
+)
+def rds_instance_ha_check(dbinstances):
+    return bool(dbinstances['MultiAZ'])
 
-def rds_instance_cloudwatch_logging_check():
-    for dbinstances in myRdsInstances:
-        instanceArn = str(dbinstances['DBInstanceArn'])
-        instanceId = str(dbinstances['DBInstanceIdentifier'])
-        instanceClass = str(dbinstances['DBInstanceClass'])
-        instancePort = int(dbinstances['Endpoint']['Port'])
-        instanceEngine = str(dbinstances['Engine'])
-        instanceEngineVersion = str(dbinstances['EngineVersion'])
-        try:
-            logCheck = str(database['EnabledCloudwatchLogsExports'])
-            # this is a passing check
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': instanceArn + '/instance-database-cloudwatch-logs-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': instanceArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[RDS.8] RDS instances should publish database logs to CloudWatch Logs',
-                            'Description': 'RDS DB instance ' + instanceId + ' publishes ' + logCheck + ' logs to CloudWatch Logs. Review the types of logs that are published to ensure they fulfill organizational and regulatory requirements as needed.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on database logging with CloudWatch and how to configure it refer to the Publishing Database Logs to Amazon CloudWatch Logs section of the Amazon Relational Database Service User Guide. Aurora does support this but you will need to address another User Guide for information on Aurora database logging with CloudWatch',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/USER_LogAccess.html#USER_LogAccess.Procedural.UploadtoCloudWatch'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbInstance',
-                                    'Id': instanceArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsRdsDbInstance': {
-                                            'DBInstanceIdentifier': instanceId,
-                                            'DBInstanceClass': instanceClass,
-                                            'DbInstancePort': instancePort,
-                                            'Engine': instanceEngine,
-                                            'EngineVersion': instanceEngineVersion
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        except:
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': instanceArn + '/instance-deletion-prot-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': instanceArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 20 },
-                            'Confidence': 99,
-                            'Title': '[RDS.8] RDS instances should publish database logs to CloudWatch Logs',
-                            'Description': 'RDS DB instance ' + instanceId + ' does not publish database logs to CloudWatch Logs. Refer to the remediation instructions to remediate this behavior',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on database logging with CloudWatch and how to configure it refer to the Publishing Database Logs to Amazon CloudWatch Logs section of the Amazon Relational Database Service User Guide. Aurora does support this but you will need to address another User Guide for information on Aurora database logging with CloudWatch',
-                                    'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/USER_LogAccess.html#USER_LogAccess.Procedural.UploadtoCloudWatch'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbInstance',
-                                    'Id': instanceArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsRdsDbInstance': {
-                                            'DBInstanceIdentifier': instanceId,
-                                            'DBInstanceClass': instanceClass,
-                                            'DbInstancePort': instancePort,
-                                            'Engine': instanceEngine,
-                                            'EngineVersion': instanceEngineVersion
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
+@registry.check(
+    'instances',
+    findingId='instance-public-access-check',
+    title='[RDS.2] RDS instances should not be publicly accessible',
+    severity=90,
+    types=dataExposureTypes,
+    failedDescription='RDS DB instance {InstanceId} is publicly accessible. Refer to the remediation instructions to remediate this behavior',
+    passedDescription='RDS DB instance {InstanceId} is not publicly accessible. Refer to the remediation instructions to remediate this behavior',
+    remediationText='For more information on RDS instance publicly access and how to change it refer to the Hiding a DB Instance in a VPC from the Internet section of the Amazon Relational Database Service User Guide',
+    remediationUrl='https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/USER_VPC.WorkingWithRDSInstanceinaVPC.html#USER_VPC.Hiding',
+    details=rds_public_access_details
+)
+def rds_instance_public_access_check(dbinstances):
+    return not dbinstances.get('PubliclyAccessible', False)
 
-def rds_snapshot_encryption_check():
-    for snapshot in myRdsSnapshots:
-        snapshotId = str(snapshot['DBSnapshotIdentifier'])
-        snapshotArn = str(snapshot['DBSnapshotArn'])
-        snapshotEncryptionCheck = str(snapshot['Encrypted'])
-        if snapshotEncryptionCheck == 'False':
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': snapshotArn + '/rds-snapshot-encryption-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': snapshotArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 80 },
-                            'Confidence': 99,
-                            'Title': '[RDS.9] RDS snapshots should be encrypted',
-                            'Description': 'RDS snapshot ' + snapshotId + ' is not encrypted. Refer to the remediation instructions to remediate this behavior',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on encrypting RDS snapshots refer to the AWS Premium Support Knowledge Center Entry How do I encrypt Amazon RDS snapshots?',
-                                    'Url': 'https://aws.amazon.com/premiumsupport/knowledge-center/encrypt-rds-snapshots/'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbSnapshot',
-                                    'Id': snapshotArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': {
-                                            'SnapshotId': snapshotId
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        else:
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': snapshotArn + '/rds-snapshot-encryption-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': snapshotArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[RDS.9] RDS snapshots should be encrypted',
-                            'Description': 'RDS snapshot ' + snapshotId + ' is encrypted.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on encrypting RDS snapshots refer to the AWS Premium Support Knowledge Center Entry How do I encrypt Amazon RDS snapshots?',
-                                    'Url': 'https://aws.amazon.com/premiumsupport/knowledge-center/encrypt-rds-snapshots/'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRdsDbSnapshot',
-                                    'Id': snapshotArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': {
-                                            'SnapshotId': snapshotId
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
+@registry.check(
+    'instances',
+    findingId='instance-storage-encryption-check',
+    title='[RDS.3] RDS instances should have encrypted storage',
+    severity=80,
+    types=dataExposureTypes,
+    failedDescription='RDS DB instance {InstanceId} does not have encrypted storage. Refer to the remediation instructions to remediate this behavior',
+    passedDescription='RDS DB instance {InstanceId} has encrypted storage.',
+    remediationText='For more information on RDS storage encryption refer to the Enabling Amazon RDS Encryption for a DB Instance section of the Amazon Relational Database Service User Guide',
+    remediationUrl='https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/Overview.Encryption.html#Overview.Encryption.Enabling',
+    details=rds_storage_encryption_details
+)
+def rds_instance_storage_encryption_check(dbinstances):
+    return bool(dbinstances['StorageEncrypted'])
+
+@registry.check(
+    'instances',
+    findingId='instance-iam-auth-check',
+    title='[RDS.4] RDS instances that support IAM Authentication should use IAM Authentication',
+    severity=50,
+    failedDescription='RDS DB instance {InstanceId} does not support IAM Authentication. Refer to the remediation instructions to remediate this behavior',
+    passedDescription='RDS DB instance {InstanceId} supports IAM Authentication.',
+    remediationText='For more information on RDS IAM Database Authentication and how to configure it refer to the IAM Database Authentication for MySQL and PostgreSQL section of the Amazon Relational Database Service User Guide',
+    remediationUrl='https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/UsingWithRDS.IAMDBAuth.html',
+    details=rds_iam_auth_details
+)
+def rds_instance_iam_auth_check(dbinstances):
+    if str(dbinstances['Engine']) not in iamAuthEngines:
+        return None
+    return bool(dbinstances['IAMDatabaseAuthenticationEnabled'])
+
+@registry.check(
+    'instances',
+    findingId='instance-domain-join-check',
+    title='[RDS.5] RDS instances that support Kerberos Authentication should be joined to a domain',
+    severity=50,
+    failedDescription='RDS DB instance {InstanceId} is not joined to a domain, and likely does not support Kerberos Authentication because of it. Refer to the remediation instructions to remediate this behavior',
+    passedDescription='RDS DB instance {InstanceId} is joined to a domain, and likely supports Kerberos Authentication because of it.',
+    remediationText='For more information on RDS instances that support Kerberos Authentication and how to configure it refer to the Kerberos Authentication section of the Amazon Relational Database Service User Guide',
+    remediationUrl='https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/kerberos-authentication.html'
+)
+def rds_instance_domain_join_check(dbinstances):
+    if str(dbinstances['Engine']) not in kerberosAuthEngines:
+        return None
+    return len(dbinstances['DomainMemberships']) > 0
 
-def rds_snapshot_public_share_check():
-    for snapshot in myRdsSnapshots:
-        snapshotId = str(snapshot['DBSnapshotIdentifier'])
-        snapshotArn = str(snapshot['DBSnapshotArn'])
-        response = rds.describe_db_snapshot_attributes(DBSnapshotIdentifier=snapshotId)
-        rdsSnapshotAttrs = response['DBSnapshotAttributesResult']['DBSnapshotAttributes']
-        for attribute in rdsSnapshotAttrs:
-            attrName = str(attribute['AttributeName'])
-            if attrName == 'restore':
-                attrValue = str(attribute['AttributeValues'])
-                if attrValue == "['all']":
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': snapshotArn + '/rds-snapshot-public-share-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': snapshotArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure',
-                                        'Sensitive Data Identifications'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 90 },
-                                    'Confidence': 99,
-                                    'Title': '[RDS.10] RDS snapshots should not be publicly shared',
-                                    'Description': 'RDS snapshot ' + snapshotId + ' is publicly shared. Refer to the remediation instructions to remediate this behavior',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on sharing RDS snapshots refer to the Sharing a Snapshot section of the Amazon Relational Database Service User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/USER_ShareSnapshot.html#USER_ShareSnapshot.Sharing'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsRdsDbSnapshot',
-                                            'Id': snapshotArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'Other': {
-                                                    'SnapshotId': snapshotId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    try:
-                        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': snapshotArn + '/rds-snapshot-public-share-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': snapshotArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': [
-                                        'Software and Configuration Checks/AWS Security Best Practices',
-                                        'Effects/Data Exposure',
-                                        'Sensitive Data Identifications'
-                                    ],
-                                    'FirstObservedAt': iso8601Time,
-                                    'CreatedAt': iso8601Time,
-                                    'UpdatedAt': iso8601Time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Confidence': 99,
-                                    'Title': '[RDS.10] RDS snapshots should not be publicly shared',
-                                    'Description': 'RDS snapshot ' + snapshotId + ' is not publicly shared.',
-                                    'Remediation': {
-                                        'Recommendation': {
-                                            'Text': 'For more information on sharing RDS snapshots refer to the Sharing a Snapshot section of the Amazon Relational Database Service User Guide',
-                                            'Url': 'https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/USER_ShareSnapshot.html#USER_ShareSnapshot.Sharing'
-                                        }
-                                    },
-                                    'ProductFields': { 'Product Name': 'ElectricEye' },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsRdsDbSnapshot',
-                                            'Id': snapshotArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'Other': {
-                                                    'SnapshotId': snapshotId
-                                                }
-                                            }
-                                        }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-            else:
-                print('non-supported attribute encountered')
-                pass
+@registry.check(
+    'instances',
+    findingId='instance-perf-insights-check',
+    title='[RDS.6] RDS instances should have performance insights enabled',
+    severity=20,
+    failedDescription='RDS DB instance {InstanceId} does not have performance insights enabled. Refer to the remediation instructions to remediate this behavior',
+    passedDescription='RDS DB instance {InstanceId} has performance insights enabled.',
+    remediationText='For more information on RDS performance insights and how to configure it refer to the Using Amazon RDS Performance Insights section of the Amazon Relational Database Service User Guide',
+    remediationUrl='https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/USER_PerfInsights.html'
+)
+def rds_instance_performance_insights_check(dbinstances):
+    return bool(dbinstances.get('PerformanceInsightsEnabled', False))
+
+@registry.check(
+    'instances',
+    findingId='instance-deletion-prot-check',
+    title='[RDS.7] RDS instances should have deletion protection enabled',
+    severity=20,
+    failedDescription='RDS DB instance {InstanceId} does not have deletion protection enabled. Refer to the remediation instructions to remediate this behavior',
+    passedDescription='RDS DB instance {InstanceId} has deletion protection enabled.',
+    remediationText='For more information on RDS deletion protection and how to configure it refer to the Deletion Protection section of the Amazon Relational Database Service User Guide',
+    remediationUrl='https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/USER_DeleteInstance.html#USER_DeleteInstance.DeletionProtection',
+    details=rds_deletion_protection_details
+)
+def rds_instance_deletion_protection_check(dbinstances):
+    return bool(dbinstances['DeletionProtection'])
+
+@registry.check(
+    'instances',
+    findingId='instance-database-cloudwatch-logs-check',
+    title='[RDS.8] RDS instances should publish database logs to CloudWatch Logs',
+    severity=20,
+    failedDescription='RDS DB instance {InstanceId} does not publish database logs to CloudWatch Logs. Refer to the remediation instructions to remediate this behavior',
+    passedDescription='RDS DB instance {InstanceId} publishes {LogExports} logs to CloudWatch Logs. Review the types of logs that are published to ensure they fulfill organizational and regulatory requirements as needed.',
+    remediationText='For more information on database logging with CloudWatch and how to configure it refer to the Publishing Database Logs to Amazon CloudWatch Logs section of the Amazon Relational Database Service User Guide. Aurora does support this but you will need to address another User Guide for information on Aurora database logging with CloudWatch',
+    remediationUrl='https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/USER_LogAccess.html#USER_LogAccess.Procedural.UploadtoCloudWatch'
+)
+def rds_instance_cloudwatch_logging_check(dbinstances):
+    return len(dbinstances.get('EnabledCloudwatchLogsExports', [])) > 0
+
+@registry.check(
+    'snapshots',
+    findingId='rds-snapshot-encryption-check',
+    title='[RDS.9] RDS snapshots should be encrypted',
+    severity=80,
+    types=dataExposureTypes,
+    failedDescription='RDS snapshot {SnapshotId} is not encrypted. Refer to the remediation instructions to remediate this behavior',
+    passedDescription='RDS snapshot {SnapshotId} is encrypted.',
+    remediationText='For more information on encrypting RDS snapshots refer to the AWS Premium Support Knowledge Center Entry How do I encrypt Amazon RDS snapshots?',
+    remediationUrl='https://aws.amazon.com/premiumsupport/knowledge-center/encrypt-rds-snapshots/'
+)
+def rds_snapshot_encryption_check(snapshot):
+    return bool(snapshot['Encrypted'])
+
+@registry.check(
+    'snapshots',
+    findingId='rds-snapshot-public-share-check',
+    title='[RDS.10] RDS snapshots should not be publicly shared',
+    severity=90,
+    types=[
+        'Software and Configuration Checks/AWS Security Best Practices',
+        'Effects/Data Exposure',
+        'Sensitive Data Identifications'
+    ],
+    failedDescription='RDS snapshot {SnapshotId} is publicly shared. Refer to the remediation instructions to remediate this behavior',
+    passedDescription='RDS snapshot {SnapshotId} is not publicly shared.',
+    remediationText='For more information on sharing RDS snapshots refer to the Sharing a Snapshot section of the Amazon Relational Database Service User Guide',
+    remediationUrl='https://docs.aws.amazon.com/AmazonRDS/latest/UserGuide/USER_ShareSnapshot.html#USER_ShareSnapshot.Sharing'
+)
+def rds_snapshot_public_share_check(snapshot):
+    for attribute in snapshot['DBSnapshotAttributes']:
+        if str(attribute['AttributeName']) == 'restore':
+            return 'all' not in attribute['AttributeValues']
+    return None
 
 def rds_instance_auditor():
-    rds_instance_ha_check()
-    rds_instance_public_access_check()
-    rds_instance_storage_encryption_check()
-    rds_instance_iam_auth_check()
-    rds_instance_domain_join_check()
-    rds_instance_performance_insights_check()
-    rds_instance_deletion_protection_check()
-    rds_instance_cloudwatch_logging_check()
-    rds_snapshot_encryption_check()
-    rds_snapshot_public_share_check()
+    awsAccountId = accountId.get()
+    registry.run(findingSink, awsRegion, awsAccountId)
 
-rds_instance_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    rds_instance_auditor()
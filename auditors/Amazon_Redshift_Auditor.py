@@ -13,330 +13,317 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import os
 import datetime
+from finding_sink import default_sink
+from resource_inventory import default_inventory
+from scan_scope import lazy_account_id, lazy_client
 # import boto3 clients
-sts = boto3.client('sts')
-redshift = boto3.client('redshift')
-securityhub = boto3.client('securityhub')
+redshift = lazy_client('redshift')
+findingSink = default_sink()
+inventory = default_inventory()
 # create env vars
 awsRegion = os.environ['AWS_REGION']
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 # loop through redshift clusters
-response = redshift.describe_clusters()
-myRedshiftClusters = response['Clusters']
+myRedshiftClusters = inventory.lazy('redshift', 'describe_clusters', 'Clusters')
 
 def cluster_public_access_check():
+    awsAccountId = accountId.get()
     for cluster in myRedshiftClusters:
         clusterId = str(cluster['ClusterIdentifier'])
         clusterArn = 'arn:aws:redshift:' + awsRegion + ':' + awsAccountId + ':cluster:' + clusterId
         if str(cluster['PubliclyAccessible']) == 'True':
             try:
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': clusterArn + '/redshift-public-access-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': clusterArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 90 },
-                            'Confidence': 99,
-                            'Title': '[Redshift.1] Redshift clusters should not be publicly accessible',
-                            'Description': 'Redshift cluster ' + clusterId + ' is publicly accessible. Refer to the remediation instructions to remediate this behavior',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on modifying Redshift public access refer to the Modifying a Cluster section of the Amazon Redshift Cluster Management Guide',
-                                    'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/managing-clusters-console.html#modify-cluster'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRedshiftCluster',
-                                    'Id': clusterArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': {
-                                            'ClusterId': clusterId
-                                        }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': clusterArn + '/redshift-public-access-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': clusterArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 
+                            'Software and Configuration Checks/AWS Security Best Practices',
+                            'Effects/Data Exposure'
+                        ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 90 },
+                        'Confidence': 99,
+                        'Title': '[Redshift.1] Redshift clusters should not be publicly accessible',
+                        'Description': 'Redshift cluster ' + clusterId + ' is publicly accessible. Refer to the remediation instructions to remediate this behavior',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on modifying Redshift public access refer to the Modifying a Cluster section of the Amazon Redshift Cluster Management Guide',
+                                'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/managing-clusters-console.html#modify-cluster'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'AwsRedshiftCluster',
+                                'Id': clusterArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': {
+                                        'ClusterId': clusterId
                                     }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
             try:
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': clusterArn + '/redshift-public-access-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': clusterArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[Redshift.1] Redshift clusters should not be publicly accessible',
-                            'Description': 'Redshift cluster ' + clusterId + ' is not publicly accessible.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on modifying Redshift public access refer to the Modifying a Cluster section of the Amazon Redshift Cluster Management Guide',
-                                    'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/managing-clusters-console.html#modify-cluster'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRedshiftCluster',
-                                    'Id': clusterArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': {
-                                            'ClusterId': clusterId
-                                        }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': clusterArn + '/redshift-public-access-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': clusterArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 
+                            'Software and Configuration Checks/AWS Security Best Practices',
+                            'Effects/Data Exposure'
+                        ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[Redshift.1] Redshift clusters should not be publicly accessible',
+                        'Description': 'Redshift cluster ' + clusterId + ' is not publicly accessible.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on modifying Redshift public access refer to the Modifying a Cluster section of the Amazon Redshift Cluster Management Guide',
+                                'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/managing-clusters-console.html#modify-cluster'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'AwsRedshiftCluster',
+                                'Id': clusterArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': {
+                                        'ClusterId': clusterId
                                     }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def cluster_encryption_check():
+    awsAccountId = accountId.get()
     for cluster in myRedshiftClusters:
         clusterId = str(cluster['ClusterIdentifier'])
         clusterArn = 'arn:aws:redshift:' + awsRegion + ':' + awsAccountId + ':cluster:' + clusterId
         if str(cluster['Encrypted']) == 'False':
             try:
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': clusterArn + '/redshift-cluster-encryption-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': clusterArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 80 },
-                            'Confidence': 99,
-                            'Title': '[Redshift.2] Redshift clusters should be encrypted',
-                            'Description': 'Redshift cluster ' + clusterId + ' is not encrypted. Refer to the remediation instructions to remediate this behavior',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on Redshift cluster encryption and how to configure it refer to the Amazon Redshift Database Encryption section of the Amazon Redshift Cluster Management Guide',
-                                    'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/working-with-db-encryption.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRedshiftCluster',
-                                    'Id': clusterArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': {
-                                            'ClusterId': clusterId
-                                        }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': clusterArn + '/redshift-cluster-encryption-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': clusterArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 
+                            'Software and Configuration Checks/AWS Security Best Practices',
+                            'Effects/Data Exposure'
+                        ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 80 },
+                        'Confidence': 99,
+                        'Title': '[Redshift.2] Redshift clusters should be encrypted',
+                        'Description': 'Redshift cluster ' + clusterId + ' is not encrypted. Refer to the remediation instructions to remediate this behavior',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on Redshift cluster encryption and how to configure it refer to the Amazon Redshift Database Encryption section of the Amazon Redshift Cluster Management Guide',
+                                'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/working-with-db-encryption.html'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'AwsRedshiftCluster',
+                                'Id': clusterArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': {
+                                        'ClusterId': clusterId
                                     }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
             try:
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': clusterArn + '/redshift-cluster-encryption-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': clusterArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[Redshift.2] Redshift clusters should be encrypted',
-                            'Description': 'Redshift cluster ' + clusterId + ' is encrypted.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on Redshift cluster encryption and how to configure it refer to the Amazon Redshift Database Encryption section of the Amazon Redshift Cluster Management Guide',
-                                    'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/working-with-db-encryption.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRedshiftCluster',
-                                    'Id': clusterArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': {
-                                            'ClusterId': clusterId
-                                        }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': clusterArn + '/redshift-cluster-encryption-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': clusterArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 
+                            'Software and Configuration Checks/AWS Security Best Practices',
+                            'Effects/Data Exposure'
+                        ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[Redshift.2] Redshift clusters should be encrypted',
+                        'Description': 'Redshift cluster ' + clusterId + ' is encrypted.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on Redshift cluster encryption and how to configure it refer to the Amazon Redshift Database Encryption section of the Amazon Redshift Cluster Management Guide',
+                                'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/working-with-db-encryption.html'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'AwsRedshiftCluster',
+                                'Id': clusterArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': {
+                                        'ClusterId': clusterId
                                     }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def cluster_enhanced_vpc_routing_check():
+    awsAccountId = accountId.get()
     for cluster in myRedshiftClusters:
         clusterId = str(cluster['ClusterIdentifier'])
         clusterArn = 'arn:aws:redshift:' + awsRegion + ':' + awsAccountId + ':cluster:' + clusterId
         if str(cluster['EnhancedVpcRouting']) == 'False':
             try:
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': clusterArn + '/redshift-cluster-enhanced-vpc-routing-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': clusterArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 40 },
-                            'Confidence': 99,
-                            'Title': '[Redshift.3] Redshift clusters should utilize enhanced VPC routing',
-                            'Description': 'Redshift cluster ' + clusterId + ' is not utilizing enhanced VPC routing. Refer to the remediation instructions to remediate this behavior',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on Redshift Enhanced VPC routing and how to configure it refer to the Amazon Redshift Enhanced VPC Routing section of the Amazon Redshift Cluster Management Guide',
-                                    'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/enhanced-vpc-routing.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRedshiftCluster',
-                                    'Id': clusterArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': {
-                                            'ClusterId': clusterId
-                                        }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': clusterArn + '/redshift-cluster-enhanced-vpc-routing-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': clusterArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 40 },
+                        'Confidence': 99,
+                        'Title': '[Redshift.3] Redshift clusters should utilize enhanced VPC routing',
+                        'Description': 'Redshift cluster ' + clusterId + ' is not utilizing enhanced VPC routing. Refer to the remediation instructions to remediate this behavior',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on Redshift Enhanced VPC routing and how to configure it refer to the Amazon Redshift Enhanced VPC Routing section of the Amazon Redshift Cluster Management Guide',
+                                'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/enhanced-vpc-routing.html'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'AwsRedshiftCluster',
+                                'Id': clusterArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': {
+                                        'ClusterId': clusterId
                                     }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
             try:
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': clusterArn + '/redshift-enhanced-vpc-routing-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': clusterArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[Redshift.3] Redshift clusters should utilize enhanced VPC routing',
-                            'Description': 'Redshift cluster ' + clusterId + ' is utilizing enhanced VPC routing.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on Redshift Enhanced VPC routing and how to configure it refer to the Amazon Redshift Enhanced VPC Routing section of the Amazon Redshift Cluster Management Guide',
-                                    'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/enhanced-vpc-routing.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRedshiftCluster',
-                                    'Id': clusterArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': {
-                                            'ClusterId': clusterId
-                                        }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': clusterArn + '/redshift-enhanced-vpc-routing-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': clusterArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[Redshift.3] Redshift clusters should utilize enhanced VPC routing',
+                        'Description': 'Redshift cluster ' + clusterId + ' is utilizing enhanced VPC routing.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on Redshift Enhanced VPC routing and how to configure it refer to the Amazon Redshift Enhanced VPC Routing section of the Amazon Redshift Cluster Management Guide',
+                                'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/enhanced-vpc-routing.html'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'AwsRedshiftCluster',
+                                'Id': clusterArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': {
+                                        'ClusterId': clusterId
                                     }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def cluster_logging_check():
+    awsAccountId = accountId.get()
     for cluster in myRedshiftClusters:
         clusterId = str(cluster['ClusterIdentifier'])
         clusterArn = 'arn:aws:redshift:' + awsRegion + ':' + awsAccountId + ':cluster:' + clusterId
@@ -344,95 +331,89 @@ def cluster_logging_check():
         if str(response['LoggingEnabled']) == 'False':
             try:
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': clusterArn + '/redshift-cluster-logging-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': clusterArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 40 },
-                            'Confidence': 99,
-                            'Title': '[Redshift.4] Redshift clusters should have logging enabled',
-                            'Description': 'Redshift cluster ' + clusterId + ' does not have logging enabled. Refer to the remediation instructions to remediate this behavior',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on Redshift logging and how to configure it refer to the Database Audit Logging section of the Amazon Redshift Cluster Management Guide',
-                                    'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/db-auditing.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRedshiftCluster',
-                                    'Id': clusterArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': {
-                                            'ClusterId': clusterId
-                                        }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': clusterArn + '/redshift-cluster-logging-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': clusterArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 40 },
+                        'Confidence': 99,
+                        'Title': '[Redshift.4] Redshift clusters should have logging enabled',
+                        'Description': 'Redshift cluster ' + clusterId + ' does not have logging enabled. Refer to the remediation instructions to remediate this behavior',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on Redshift logging and how to configure it refer to the Database Audit Logging section of the Amazon Redshift Cluster Management Guide',
+                                'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/db-auditing.html'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'AwsRedshiftCluster',
+                                'Id': clusterArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': {
+                                        'ClusterId': clusterId
                                     }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
             try:
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': clusterArn + '/redshift-cluster-logging-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': clusterArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[Redshift.4] Redshift clusters should have logging enabled',
-                            'Description': 'Redshift cluster ' + clusterId + ' has logging enabled.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on Redshift logging and how to configure it refer to the Database Audit Logging section of the Amazon Redshift Cluster Management Guide',
-                                    'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/db-auditing.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsRedshiftCluster',
-                                    'Id': clusterArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': {
-                                            'ClusterId': clusterId
-                                        }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': clusterArn + '/redshift-cluster-logging-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': clusterArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[Redshift.4] Redshift clusters should have logging enabled',
+                        'Description': 'Redshift cluster ' + clusterId + ' has logging enabled.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on Redshift logging and how to configure it refer to the Database Audit Logging section of the Amazon Redshift Cluster Management Guide',
+                                'Url': 'https://docs.aws.amazon.com/redshift/latest/mgmt/db-auditing.html'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'AwsRedshiftCluster',
+                                'Id': clusterArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': {
+                                        'ClusterId': clusterId
                                     }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
@@ -442,4 +423,5 @@ def redshift_auditor():
     cluster_enhanced_vpc_routing_check()
     cluster_logging_check()
 
-redshift_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    redshift_auditor()
\ No newline at end of file
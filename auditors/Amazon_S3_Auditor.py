@@ -13,134 +13,231 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import os
 import datetime
+import threading
+from finding_sink import default_sink
+from rate_limiter import map_rate_limited
+from resource_inventory import default_inventory, lazy_value
+from scan_scope import lazy_account_id, lazy_client
 # import boto3 clients
-sts = boto3.client('sts')
-s3 = boto3.client('s3')
-s3control = boto3.client('s3control')
-securityhub = boto3.client('securityhub')
+s3 = lazy_client('s3')
+s3control = lazy_client('s3control')
+findingSink = default_sink()
+inventory = default_inventory()
 # create env vars
 awsRegion = os.environ['AWS_REGION']
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 # loop through s3 buckets
-response = s3.list_buckets()
-myS3Buckets = response['Buckets']
+myS3Buckets = inventory.lazy('s3', 'list_buckets', 'Buckets')
+# every bucket's configuration is fetched once, from a client in the bucket's own region so
+# there are no redirects, by a bounded pool that the client governor still holds to the S3 rate
+bucketDetailRequestsPerSecond = 100
+bucketDetailBurst = 200
+bucketDetailWorkers = 16
+bucketRegions = {}
+regionalS3Clients = {}
+regionalS3ClientsLock = threading.Lock()
+
+def bucket_region(bucketName):
+    if bucketName not in bucketRegions:
+        # GetBucketLocation returns no constraint for us-east-1 and EU for the oldest eu-west-1 buckets
+        locationConstraint = s3.get_bucket_location(Bucket=bucketName).get('LocationConstraint')
+        bucketRegions[bucketName] = {None: 'us-east-1', '': 'us-east-1', 'EU': 'eu-west-1'}.get(locationConstraint, locationConstraint)
+    return bucketRegions[bucketName]
+
+def regional_s3_client(regionName):
+    with regionalS3ClientsLock:
+        if regionName not in regionalS3Clients:
+            regionalS3Clients[regionName] = s3.for_region(regionName)
+        return regionalS3Clients[regionName]
+
+def fetch_bucket_details(bucketName):
+    # the response of each call, or the error it raised so the checks can tell "not configured" apart
+    try:
+        regionalS3 = regional_s3_client(bucket_region(bucketName))
+    except Exception as e:
+        # without the bucket's location fall back to the scope's own client and let S3 redirect
+        print(e)
+        regionalS3 = s3
+    details = {}
+    for configName, operation in (
+        ('Encryption', regionalS3.get_bucket_encryption),
+        ('Lifecycle', regionalS3.get_bucket_lifecycle_configuration)
+    ):
+        try:
+            details[configName] = operation(Bucket=bucketName)
+        except Exception as e:
+            details[configName] = e
+    return details
+
+def bucket_details():
+    return map_rate_limited(
+        fetch_bucket_details,
+        [str(buckets['Name']) for buckets in myS3Buckets],
+        bucketDetailRequestsPerSecond,
+        bucketDetailBurst,
+        bucketDetailWorkers
+    )
+
+myS3BucketDetails = lazy_value(bucket_details)
+
+def bucket_config(bucketName, configName):
+    # raises the error of the original call so the checks handle it as if they had made it
+    details = myS3BucketDetails[bucketName]
+    if isinstance(details[configName], Exception):
+        raise details[configName]
+    return details[configName]
 
 def bucket_encryption_check():
+    awsAccountId = accountId.get()
     for buckets in myS3Buckets:
         bucketName = str(buckets['Name'])
         s3Arn = 'arn:aws:s3:::' + bucketName
         try:
-            response = s3.get_bucket_encryption(Bucket=bucketName)
+            response = bucket_config(bucketName, 'Encryption')
             for rules in response['ServerSideEncryptionConfiguration']['Rules']:
                 sseType = str(rules['ApplyServerSideEncryptionByDefault']['SSEAlgorithm'])
                 # this is a passing check
                 try:
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': s3Arn + '/s3-bucket-encryption-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': s3Arn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure' 
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[S3.1] S3 Buckets should be encrypted',
-                                'Description': 'S3 bucket ' + bucketName + ' is encrypted using ' + sseType + '.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'For more information on Bucket Encryption and how to configure it refer to the Amazon S3 Default Encryption for S3 Buckets section of the Amazon Simple Storage Service Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/AmazonS3/latest/dev/bucket-encryption.html'
-                                    }
-                                },
-                                'ProductFields': { 'Product Name': 'ElectricEye' },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsS3Bucket',
-                                        'Id': s3Arn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': s3Arn + '/s3-bucket-encryption-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': s3Arn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [ 
+                                'Software and Configuration Checks/AWS Security Best Practices',
+                                'Effects/Data Exposure' 
+                            ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 0 },
+                            'Confidence': 99,
+                            'Title': '[S3.1] S3 Buckets should be encrypted',
+                            'Description': 'S3 bucket ' + bucketName + ' is encrypted using ' + sseType + '.',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'For more information on Bucket Encryption and how to configure it refer to the Amazon S3 Default Encryption for S3 Buckets section of the Amazon Simple Storage Service Developer Guide',
+                                    'Url': 'https://docs.aws.amazon.com/AmazonS3/latest/dev/bucket-encryption.html'
+                                }
+                            },
+                            'ProductFields': { 'Product Name': 'ElectricEye' },
+                            'Resources': [
+                                {
+                                    'Type': 'AwsS3Bucket',
+                                    'Id': s3Arn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion
+                                }
+                            ],
+                            'Compliance': { 'Status': 'PASSED' },
+                            'RecordState': 'ARCHIVED'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
         except Exception as e:
             if str(e) == 'An error occurred (ServerSideEncryptionConfigurationNotFoundError) when calling the GetBucketEncryption operation: The server side encryption configuration was not found':
                 try:
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': s3Arn + '/s3-bucket-encryption-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': s3Arn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure' 
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 80 },
-                                'Confidence': 99,
-                                'Title': '[S3.1] S3 Buckets should be encrypted',
-                                'Description': 'S3 bucket ' + bucketName + ' is not encrypted. Refer to the remediation instructions to remediate this behavior',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'For more information on Bucket Encryption and how to configure it refer to the Amazon S3 Default Encryption for S3 Buckets section of the Amazon Simple Storage Service Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/AmazonS3/latest/dev/bucket-encryption.html'
-                                    }
-                                },
-                                'ProductFields': { 'Product Name': 'ElectricEye' },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsS3Bucket',
-                                        'Id': s3Arn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
+                    findingSink.put(
+                        {
+                            'SchemaVersion': '2018-10-08',
+                            'Id': s3Arn + '/s3-bucket-encryption-check',
+                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                            'GeneratorId': s3Arn,
+                            'AwsAccountId': awsAccountId,
+                            'Types': [ 
+                                'Software and Configuration Checks/AWS Security Best Practices',
+                                'Effects/Data Exposure' 
+                            ],
+                            'FirstObservedAt': iso8601Time,
+                            'CreatedAt': iso8601Time,
+                            'UpdatedAt': iso8601Time,
+                            'Severity': { 'Normalized': 80 },
+                            'Confidence': 99,
+                            'Title': '[S3.1] S3 Buckets should be encrypted',
+                            'Description': 'S3 bucket ' + bucketName + ' is not encrypted. Refer to the remediation instructions to remediate this behavior',
+                            'Remediation': {
+                                'Recommendation': {
+                                    'Text': 'For more information on Bucket Encryption and how to configure it refer to the Amazon S3 Default Encryption for S3 Buckets section of the Amazon Simple Storage Service Developer Guide',
+                                    'Url': 'https://docs.aws.amazon.com/AmazonS3/latest/dev/bucket-encryption.html'
+                                }
+                            },
+                            'ProductFields': { 'Product Name': 'ElectricEye' },
+                            'Resources': [
+                                {
+                                    'Type': 'AwsS3Bucket',
+                                    'Id': s3Arn,
+                                    'Partition': 'aws',
+                                    'Region': awsRegion
+                                }
+                            ],
+                            'Compliance': { 'Status': 'FAILED' },
+                            'RecordState': 'ACTIVE'
+                        }
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
             else:
                 print(e)
 
 def bucket_lifecycle_check():
+    awsAccountId = accountId.get()
     for buckets in myS3Buckets:
         bucketName = str(buckets['Name'])
         s3Arn = 'arn:aws:s3:::' + bucketName
         try:
-            response = s3.get_bucket_lifecycle_configuration(Bucket=bucketName)
+            # raises NoSuchLifecycleConfiguration when there is no policy
+            bucket_config(bucketName, 'Lifecycle')
             # this is a passing check
             try:
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': s3Arn + '/s3-bucket-lifecyle-configuration-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': s3Arn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[S3.2] S3 Buckets should implement lifecycle policies for data archival and recovery operations',
+                        'Description': 'S3 bucket ' + bucketName + ' has a lifecycle policy configured.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on Lifecycle policies and how to configure it refer to the How Do I Create a Lifecycle Policy for an S3 Bucket? section of the Amazon Simple Storage Service Developer Guide',
+                                'Url': 'https://docs.aws.amazon.com/AmazonS3/latest/user-guide/create-lifecycle.html'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'AwsS3Bucket',
+                                'Id': s3Arn,
+                                'Partition': 'aws',
+                                'Region': awsRegion
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
+                )
+            except Exception as e:
+                print(e)
+        except Exception as e:
+            if str(e) == 'An error occurred (NoSuchLifecycleConfiguration) when calling the GetBucketLifecycleConfiguration operation: The lifecycle configuration does not exist':
+                try:
+                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                    findingSink.put(
                         {
                             'SchemaVersion': '2018-10-08',
                             'Id': s3Arn + '/s3-bucket-lifecyle-configuration-check',
@@ -151,10 +248,10 @@ def bucket_lifecycle_check():
                             'FirstObservedAt': iso8601Time,
                             'CreatedAt': iso8601Time,
                             'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
+                            'Severity': { 'Normalized': 20 },
                             'Confidence': 99,
                             'Title': '[S3.2] S3 Buckets should implement lifecycle policies for data archival and recovery operations',
-                            'Description': 'S3 bucket ' + bucketName + ' has a lifecycle policy configured.',
+                            'Description': 'S3 bucket ' + bucketName + ' does not have a lifecycle policy configured. Refer to the remediation instructions to remediate this behavior',
                             'Remediation': {
                                 'Recommendation': {
                                     'Text': 'For more information on Lifecycle policies and how to configure it refer to the How Do I Create a Lifecycle Policy for an S3 Bucket? section of the Amazon Simple Storage Service Developer Guide',
@@ -170,61 +267,17 @@ def bucket_lifecycle_check():
                                     'Region': awsRegion
                                 }
                             ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
+                            'Compliance': { 'Status': 'FAILED' },
+                            'RecordState': 'ACTIVE'
                         }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        except Exception as e:
-            if str(e) == 'An error occurred (NoSuchLifecycleConfiguration) when calling the GetBucketLifecycleConfiguration operation: The lifecycle configuration does not exist':
-                try:
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': s3Arn + '/s3-bucket-lifecyle-configuration-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': s3Arn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 20 },
-                                'Confidence': 99,
-                                'Title': '[S3.2] S3 Buckets should implement lifecycle policies for data archival and recovery operations',
-                                'Description': 'S3 bucket ' + bucketName + ' does not have a lifecycle policy configured. Refer to the remediation instructions to remediate this behavior',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'For more information on Lifecycle policies and how to configure it refer to the How Do I Create a Lifecycle Policy for an S3 Bucket? section of the Amazon Simple Storage Service Developer Guide',
-                                        'Url': 'https://docs.aws.amazon.com/AmazonS3/latest/user-guide/create-lifecycle.html'
-                                    }
-                                },
-                                'ProductFields': { 'Product Name': 'ElectricEye' },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsS3Bucket',
-                                        'Id': s3Arn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
                     )
-                    print(response)
                 except Exception as e:
                     print(e)
             else:
                 print(e)
 
 def s3_account_level_block():
+    awsAccountId = accountId.get()
     response = s3control.get_public_access_block(AccountId=awsAccountId)
     accountBlock = response['PublicAccessBlockConfiguration']
     blockAcl = str(accountBlock['BlockPublicAcls'])
@@ -234,91 +287,85 @@ def s3_account_level_block():
     if blockAcl and ignoreAcl and blockPubPolicy and restrictPubBuckets == 'True':
         try:
             iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-            response = securityhub.batch_import_findings(
-                Findings=[
-                    {
-                        'SchemaVersion': '2018-10-08',
-                        'Id': awsAccountId + '/s3-account-level-public-access-block-check',
-                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                        'GeneratorId': awsAccountId,
-                        'AwsAccountId': awsAccountId,
-                        'Types': [ 
-                            'Software and Configuration Checks/AWS Security Best Practices',
-                            'Effects/Data Exposure' 
-                        ],
-                        'FirstObservedAt': iso8601Time,
-                        'CreatedAt': iso8601Time,
-                        'UpdatedAt': iso8601Time,
-                        'Severity': { 'Normalized': 0 },
-                        'Confidence': 99,
-                        'Title': '[S3.3] Account-level S3 public access block should be configured',
-                        'Description': 'Account-level S3 public access block for account ' + awsAccountId + ' is enabled',
-                        'Remediation': {
-                            'Recommendation': {
-                                'Text': 'For more information on Account level S3 public access block and how to configure it refer to the Using Amazon S3 Block Public Access section of the Amazon Simple Storage Service Developer Guide',
-                                'Url': 'https://docs.aws.amazon.com/AmazonS3/latest/dev/access-control-block-public-access.html'
-                            }
-                        },
-                        'ProductFields': { 'Product Name': 'ElectricEye' },
-                        'Resources': [
-                            {
-                                'Type': 'AwsAccount',
-                                'Id': 'AWS::::Account:' + awsAccountId,
-                                'Partition': 'aws',
-                                'Region': awsRegion
-                            }
-                        ],
-                        'Compliance': { 'Status': 'PASSED' },
-                        'RecordState': 'ARCHIVED'
-                    }
-                ]
+            findingSink.put(
+                {
+                    'SchemaVersion': '2018-10-08',
+                    'Id': awsAccountId + '/s3-account-level-public-access-block-check',
+                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                    'GeneratorId': awsAccountId,
+                    'AwsAccountId': awsAccountId,
+                    'Types': [ 
+                        'Software and Configuration Checks/AWS Security Best Practices',
+                        'Effects/Data Exposure' 
+                    ],
+                    'FirstObservedAt': iso8601Time,
+                    'CreatedAt': iso8601Time,
+                    'UpdatedAt': iso8601Time,
+                    'Severity': { 'Normalized': 0 },
+                    'Confidence': 99,
+                    'Title': '[S3.3] Account-level S3 public access block should be configured',
+                    'Description': 'Account-level S3 public access block for account ' + awsAccountId + ' is enabled',
+                    'Remediation': {
+                        'Recommendation': {
+                            'Text': 'For more information on Account level S3 public access block and how to configure it refer to the Using Amazon S3 Block Public Access section of the Amazon Simple Storage Service Developer Guide',
+                            'Url': 'https://docs.aws.amazon.com/AmazonS3/latest/dev/access-control-block-public-access.html'
+                        }
+                    },
+                    'ProductFields': { 'Product Name': 'ElectricEye' },
+                    'Resources': [
+                        {
+                            'Type': 'AwsAccount',
+                            'Id': 'AWS::::Account:' + awsAccountId,
+                            'Partition': 'aws',
+                            'Region': awsRegion
+                        }
+                    ],
+                    'Compliance': { 'Status': 'PASSED' },
+                    'RecordState': 'ARCHIVED'
+                }
             )
-            print(response)
         except Exception as e:
             print(e)
     else:
         try:
             iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-            response = securityhub.batch_import_findings(
-                Findings=[
-                    {
-                        'SchemaVersion': '2018-10-08',
-                        'Id': awsAccountId + '/s3-account-level-public-access-block-check',
-                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                        'GeneratorId': awsAccountId,
-                        'AwsAccountId': awsAccountId,
-                        'Types': [ 
-                            'Software and Configuration Checks/AWS Security Best Practices',
-                            'Effects/Data Exposure' 
-                        ],
-                        'FirstObservedAt': iso8601Time,
-                        'CreatedAt': iso8601Time,
-                        'UpdatedAt': iso8601Time,
-                        'Severity': { 'Normalized': 40 },
-                        'Confidence': 99,
-                        'Title': '[S3.3] Account-level S3 public access block should be configured',
-                        'Description': 'Account-level S3 public access block for account ' + awsAccountId + ' is either inactive or is not block all possible scenarios. Refer to the remediation instructions to remediate this behavior',
-                        'Remediation': {
-                            'Recommendation': {
-                                'Text': 'For more information on Account level S3 public access block and how to configure it refer to the Using Amazon S3 Block Public Access section of the Amazon Simple Storage Service Developer Guide',
-                                'Url': 'https://docs.aws.amazon.com/AmazonS3/latest/dev/access-control-block-public-access.html'
-                            }
-                        },
-                        'ProductFields': { 'Product Name': 'ElectricEye' },
-                        'Resources': [
-                            {
-                                'Type': 'AwsAccount',
-                                'Id': 'AWS::::Account:' + awsAccountId,
-                                'Partition': 'aws',
-                                'Region': awsRegion
-                            }
-                        ],
-                        'Compliance': { 'Status': 'FAILED' },
-                        'RecordState': 'ACTIVE'
-                    }
-                ]
+            findingSink.put(
+                {
+                    'SchemaVersion': '2018-10-08',
+                    'Id': awsAccountId + '/s3-account-level-public-access-block-check',
+                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                    'GeneratorId': awsAccountId,
+                    'AwsAccountId': awsAccountId,
+                    'Types': [ 
+                        'Software and Configuration Checks/AWS Security Best Practices',
+                        'Effects/Data Exposure' 
+                    ],
+                    'FirstObservedAt': iso8601Time,
+                    'CreatedAt': iso8601Time,
+                    'UpdatedAt': iso8601Time,
+                    'Severity': { 'Normalized': 40 },
+                    'Confidence': 99,
+                    'Title': '[S3.3] Account-level S3 public access block should be configured',
+                    'Description': 'Account-level S3 public access block for account ' + awsAccountId + ' is either inactive or is not block all possible scenarios. Refer to the remediation instructions to remediate this behavior',
+                    'Remediation': {
+                        'Recommendation': {
+                            'Text': 'For more information on Account level S3 public access block and how to configure it refer to the Using Amazon S3 Block Public Access section of the Amazon Simple Storage Service Developer Guide',
+                            'Url': 'https://docs.aws.amazon.com/AmazonS3/latest/dev/access-control-block-public-access.html'
+                        }
+                    },
+                    'ProductFields': { 'Product Name': 'ElectricEye' },
+                    'Resources': [
+                        {
+                            'Type': 'AwsAccount',
+                            'Id': 'AWS::::Account:' + awsAccountId,
+                            'Partition': 'aws',
+                            'Region': awsRegion
+                        }
+                    ],
+                    'Compliance': { 'Status': 'FAILED' },
+                    'RecordState': 'ACTIVE'
+                }
             )
-            print(response)
         except Exception as e:
             print(e)
 
@@ -327,4 +374,5 @@ def s3_bucket_auditor():
     bucket_lifecycle_check()
     s3_account_level_block()
 
-s3_bucket_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    s3_bucket_auditor()
\ No newline at end of file
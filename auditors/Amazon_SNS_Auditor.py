@@ -13,239 +13,93 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
-import datetime
 import os
+from check_registry import CheckRegistry
+from finding_sink import default_sink
+from resource_inventory import default_inventory
+from scan_scope import lazy_account_id, lazy_client
 # import boto3 clients
-securityhub = boto3.client('securityhub')
-sns = boto3.client('sns')
-sts = boto3.client('sts')
+findingSink = default_sink()
+inventory = default_inventory()
+registry = CheckRegistry()
+sns = lazy_client('sns')
 # create account id & region variables
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 awsRegion = os.environ['AWS_REGION']
 # loop through SNS topics
-response = sns.list_topics()
-mySnsTopics = response['Topics']
+mySnsTopics = inventory.lazy('sns', 'list_topics', 'Topics')
 
-def sns_topic_encryption_check():
-    for topic in mySnsTopics:
-        topicarn = str(topic['TopicArn'])
-        topicName = topicarn.replace('arn:aws:sns:' + awsRegion + ':' + awsAccountId + ':', '')
-        response = sns.get_topic_attributes(TopicArn=topicarn)
-        try:
-            # this is a passing check
-            encryptionCheck = str(response['Attributes']['KmsMasterKeyId'])
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': topicarn + '/sns-topic-encryption-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': topicarn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[SNS.1] SNS topics should be encrypted',
-                            'Description': 'SNS topic ' + topicName + ' is encrypted.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on SNS encryption at rest and how to configure it refer to the Encryption at Rest section of the Amazon Simple Notification Service Developer Guide.',
-                                    'Url': 'https://docs.aws.amazon.com/sns/latest/dg/sns-server-side-encryption.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsSnsTopic',
-                                    'Id': topicarn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsSnsTopic': {
-                                            'TopicName': topicName
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        except:
-            try:
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': topicarn + '/sns-topic-encryption-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': topicarn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 
-                                'Software and Configuration Checks/AWS Security Best Practices',
-                                'Effects/Data Exposure'
-                            ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 80 },
-                            'Confidence': 99,
-                            'Title': '[SNS.1] SNS topics should be encrypted',
-                            'Description': 'SNS topic ' + topicName + ' is not encrypted. Refer to the remediation instructions to remediate this behavior',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on SNS encryption at rest and how to configure it refer to the Encryption at Rest section of the Amazon Simple Notification Service Developer Guide.',
-                                    'Url': 'https://docs.aws.amazon.com/sns/latest/dg/sns-server-side-encryption.html'
-                                }
-                            },
-                            'ProductFields': { 'Product Name': 'ElectricEye' },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsSnsTopic',
-                                    'Id': topicarn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'AwsSnsTopic': {
-                                            'TopicName': topicName
-                                        }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
+def sns_topic_resource(topic):
+    awsAccountId = accountId.get()
+    topicarn = str(topic['TopicArn'])
+    topicName = topicarn.replace('arn:aws:sns:' + awsRegion + ':' + awsAccountId + ':', '')
+    return {
+        'Type': 'AwsSnsTopic',
+        'Id': topicarn,
+        'Details': {
+            'AwsSnsTopic': {
+                'TopicName': topicName
+            }
+        },
+        'Fields': { 'TopicName': topicName }
+    }
 
-def sns_http_subscription_check():
-    for topic in mySnsTopics:
-        topicarn = str(topic['TopicArn'])
-        topicName = topicarn.replace('arn:aws:sns:' + awsRegion + ':' + awsAccountId + ':', '')
-        response = sns.list_subscriptions_by_topic(TopicArn=topicarn)
-        mySubs = response['Subscriptions']
-        for subscriptions in mySubs:
-            subProtocol = str(subscriptions['Protocol'])
-            if subProtocol == 'http':
-                try:
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': topicarn + '/sns-http-subscription-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': topicarn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 80 },
-                                'Confidence': 99,
-                                'Title': '[SNS.2] SNS topics should not use HTTP subscriptions',
-                                'Description': 'SNS topic ' + topicName + ' has a HTTP subscriber. Refer to the remediation instructions to remediate this behavior',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'For more information on SNS encryption in transit refer to the Enforce Encryption of Data in Transit section of the Amazon Simple Notification Service Developer Guide.',
-                                        'Url': 'https://docs.aws.amazon.com/sns/latest/dg/sns-security-best-practices.html#enforce-encryption-data-in-transit'
-                                    }
-                                },
-                                'ProductFields': { 'Product Name': 'ElectricEye' },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsSnsTopic',
-                                        'Id': topicarn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'AwsSnsTopic': {
-                                                'TopicName': topicName
-                                            }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-            else:
-                try:
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': topicarn + '/sns-http-subscription-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': topicarn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[SNS.2] SNS topics should not use HTTP subscriptions',
-                                'Description': 'SNS topic ' + topicName + ' does not have a HTTP subscriber.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'For more information on SNS encryption in transit refer to the Enforce Encryption of Data in Transit section of the Amazon Simple Notification Service Developer Guide.',
-                                        'Url': 'https://docs.aws.amazon.com/sns/latest/dg/sns-security-best-practices.html#enforce-encryption-data-in-transit'
-                                    }
-                                },
-                                'ProductFields': { 'Product Name': 'ElectricEye' },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsSnsTopic',
-                                        'Id': topicarn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'AwsSnsTopic': {
-                                                'TopicName': topicName
-                                            }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
+def sns_topic_details(topic):
+    # attributes and subscribers are fetched once per topic and shared by both checks
+    topicarn = str(topic['TopicArn'])
+    return {
+        'TopicArn': topicarn,
+        'Attributes': sns.get_topic_attributes(TopicArn=topicarn)['Attributes'],
+        'Subscriptions': inventory.get('sns', 'list_subscriptions_by_topic', 'Subscriptions', TopicArn=topicarn)
+    }
+
+@registry.collection('topics', sns_topic_resource, sns_topic_details)
+def sns_topics():
+    return mySnsTopics
+
+@registry.check(
+    'topics',
+    findingId='sns-topic-encryption-check',
+    title='[SNS.1] SNS topics should be encrypted',
+    severity=80,
+    types=[
+        'Software and Configuration Checks/AWS Security Best Practices',
+        'Effects/Data Exposure'
+    ],
+    failedDescription='SNS topic {TopicName} is not encrypted. Refer to the remediation instructions to remediate this behavior',
+    passedDescription='SNS topic {TopicName} is encrypted.',
+    remediationText='For more information on SNS encryption at rest and how to configure it refer to the Encryption at Rest section of the Amazon Simple Notification Service Developer Guide.',
+    remediationUrl='https://docs.aws.amazon.com/sns/latest/dg/sns-server-side-encryption.html'
+)
+def sns_topic_encryption_check(topic):
+    return 'KmsMasterKeyId' in topic['Attributes']
+
+@registry.check(
+    'topics',
+    findingId='sns-http-subscription-check',
+    title='[SNS.2] SNS topics should not use HTTP subscriptions',
+    severity=80,
+    types=[
+        'Software and Configuration Checks/AWS Security Best Practices',
+        'Effects/Data Exposure'
+    ],
+    failedDescription='SNS topic {TopicName} has a HTTP subscriber. Refer to the remediation instructions to remediate this behavior',
+    passedDescription='SNS topic {TopicName} does not have a HTTP subscriber.',
+    remediationText='For more information on SNS encryption in transit refer to the Enforce Encryption of Data in Transit section of the Amazon Simple Notification Service Developer Guide.',
+    remediationUrl='https://docs.aws.amazon.com/sns/latest/dg/sns-security-best-practices.html#enforce-encryption-data-in-transit'
+)
+def sns_http_subscription_check(topic):
+    # topics without subscribers have nothing to evaluate
+    if not topic['Subscriptions']:
+        return None
+    for subscriptions in topic['Subscriptions']:
+        if str(subscriptions['Protocol']) == 'http':
+            return False
+    return True
 
 def sns_auditor():
-    sns_topic_encryption_check()
-    sns_http_subscription_check()
+    awsAccountId = accountId.get()
+    registry.run(findingSink, awsRegion, awsAccountId)
 
-sns_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    sns_auditor()
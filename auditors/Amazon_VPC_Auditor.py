@@ -13,22 +13,23 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import datetime
 import os
+from finding_sink import default_sink
+from resource_inventory import default_inventory
+from scan_scope import lazy_account_id, lazy_client
 # create boto3 clients
-sts = boto3.client('sts')
-ec2 = boto3.client('ec2')
-securityhub = boto3.client('securityhub')
+ec2 = lazy_client('ec2')
+findingSink = default_sink()
+inventory = default_inventory()
 # create env vars
-awsAccountId = sts.get_caller_identity()['Account']
-#awsRegion = os.environ['AWS_REGION']
-awsRegion = 'us-east-1'
+accountId = lazy_account_id()
+awsRegion = os.environ['AWS_REGION']
 # loop through vpcs
-response = ec2.describe_vpcs(DryRun=False)
-myVpcs = response['Vpcs']
+myVpcs = inventory.lazy('ec2', 'describe_vpcs', 'Vpcs')
 
 def vpc_default_check():
+    awsAccountId = accountId.get()
     for vpcs in myVpcs:
         vpcId = str(vpcs['VpcId'])
         vpcArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + 'vpc/' + vpcId
@@ -38,48 +39,45 @@ def vpc_default_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': vpcArn + '/vpc-is-default-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': vpcArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 20 },
-                            'Confidence': 99,
-                            'Title': '[VPC.1] Consider deleting the Default VPC if unused',
-                            'Description': 'VPC ' + vpcId + ' has been identified as the Default VPC, consider deleting this VPC if it is not necessary for daily operations. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on the default VPC refer to the Deleting Your Default Subnets and Default VPC section of the Amazon Virtual Private Cloud User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/default-vpc.html#deleting-default-vpc'
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': vpcArn + '/vpc-is-default-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': vpcArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 20 },
+                        'Confidence': 99,
+                        'Title': '[VPC.1] Consider deleting the Default VPC if unused',
+                        'Description': 'VPC ' + vpcId + ' has been identified as the Default VPC, consider deleting this VPC if it is not necessary for daily operations. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on the default VPC refer to the Deleting Your Default Subnets and Default VPC section of the Amazon Virtual Private Cloud User Guide',
+                                'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/default-vpc.html#deleting-default-vpc'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEc2Vpc',
+                                'Id': vpcArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'vpcId': vpcId }
                                 }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsEc2Vpc',
-                                    'Id': vpcArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'vpcId': vpcId }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
@@ -87,52 +85,50 @@ def vpc_default_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': vpcArn + '/vpc-is-default-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': vpcArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[VPC.1] Consider deleting the Default VPC if unused',
-                            'Description': 'VPC ' + vpcId + ' is not the Default VPC',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on the default VPC refer to the Deleting Your Default Subnets and Default VPC section of the Amazon Virtual Private Cloud User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/default-vpc.html#deleting-default-vpc'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsEc2Vpc',
-                                    'Id': vpcArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'vpcId': vpcId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': vpcArn + '/vpc-is-default-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': vpcArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[VPC.1] Consider deleting the Default VPC if unused',
+                        'Description': 'VPC ' + vpcId + ' is not the Default VPC',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on the default VPC refer to the Deleting Your Default Subnets and Default VPC section of the Amazon Virtual Private Cloud User Guide',
+                                'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/default-vpc.html#deleting-default-vpc'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEc2Vpc',
+                                'Id': vpcArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'vpcId': vpcId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
 def vpc_flow_logs_check():
+    awsAccountId = accountId.get()
     for vpcs in myVpcs:
         vpcId = str(vpcs['VpcId'])
         vpcArn = 'arn:aws:ec2:' + awsRegion + ':' + awsAccountId + 'vpc/' + vpcId
@@ -150,48 +146,45 @@ def vpc_flow_logs_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': vpcArn + '/vpc-flow-log-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': vpcArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 20 },
-                            'Confidence': 99,
-                            'Title': '[VPC.2] Flow Logs should be enabled for all VPCs',
-                            'Description': 'VPC ' + vpcId + ' does not have flow logging enabled. Refer to the remediation instructions if this configuration is not intended',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on flow logs refer to the VPC Flow Logs section of the Amazon Virtual Private Cloud User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/flow-logs.html'
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': vpcArn + '/vpc-flow-log-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': vpcArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 20 },
+                        'Confidence': 99,
+                        'Title': '[VPC.2] Flow Logs should be enabled for all VPCs',
+                        'Description': 'VPC ' + vpcId + ' does not have flow logging enabled. Refer to the remediation instructions if this configuration is not intended',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on flow logs refer to the VPC Flow Logs section of the Amazon Virtual Private Cloud User Guide',
+                                'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/flow-logs.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEc2Vpc',
+                                'Id': vpcArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'vpcId': vpcId }
                                 }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsEc2Vpc',
-                                    'Id': vpcArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'vpcId': vpcId }
-                                    }
-                                }
-                            ],
-                            'Compliance': { 'Status': 'FAILED' },
-                            'RecordState': 'ACTIVE'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
         else:
@@ -199,48 +192,45 @@ def vpc_flow_logs_check():
                 # ISO Time
                 iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
                 # create Sec Hub finding
-                response = securityhub.batch_import_findings(
-                    Findings=[
-                        {
-                            'SchemaVersion': '2018-10-08',
-                            'Id': vpcArn + '/vpc-flow-log-check',
-                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': vpcArn,
-                            'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
-                            'FirstObservedAt': iso8601Time,
-                            'CreatedAt': iso8601Time,
-                            'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 0 },
-                            'Confidence': 99,
-                            'Title': '[VPC.2] Flow Logs should be enabled for all VPCs',
-                            'Description': 'VPC ' + vpcId + ' has flow logging enabled.',
-                            'Remediation': {
-                                'Recommendation': {
-                                    'Text': 'For more information on flow logs refer to the VPC Flow Logs section of the Amazon Virtual Private Cloud User Guide',
-                                    'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/flow-logs.html'
-                                }
-                            },
-                            'ProductFields': {
-                                'Product Name': 'ElectricEye'
-                            },
-                            'Resources': [
-                                {
-                                    'Type': 'AwsEc2Vpc',
-                                    'Id': vpcArn,
-                                    'Partition': 'aws',
-                                    'Region': awsRegion,
-                                    'Details': {
-                                        'Other': { 'vpcId': vpcId }
-                                    }
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': vpcArn + '/vpc-flow-log-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': vpcArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[VPC.2] Flow Logs should be enabled for all VPCs',
+                        'Description': 'VPC ' + vpcId + ' has flow logging enabled.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on flow logs refer to the VPC Flow Logs section of the Amazon Virtual Private Cloud User Guide',
+                                'Url': 'https://docs.aws.amazon.com/vpc/latest/userguide/flow-logs.html'
+                            }
+                        },
+                        'ProductFields': {
+                            'Product Name': 'ElectricEye'
+                        },
+                        'Resources': [
+                            {
+                                'Type': 'AwsEc2Vpc',
+                                'Id': vpcArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': { 'vpcId': vpcId }
                                 }
-                            ],
-                            'Compliance': { 'Status': 'PASSED' },
-                            'RecordState': 'ARCHIVED'
-                        }
-                    ]
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
@@ -248,4 +238,5 @@ def vpc_auditor():
     vpc_default_check()
     vpc_flow_logs_check()
 
-vpc_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    vpc_auditor()
\ No newline at end of file
@@ -13,21 +13,23 @@
 # You should have received a copy of the GNU General Public License along with ElectricEye.  
 # If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
 
-import boto3
 import os
 import datetime
+from finding_sink import default_sink
+from resource_inventory import default_inventory
+from scan_scope import lazy_account_id, lazy_client
 # import boto3 clients
-sts = boto3.client('sts')
-workspaces = boto3.client('workspaces')
-securityhub = boto3.client('securityhub')
+workspaces = lazy_client('workspaces')
+findingSink = default_sink()
+inventory = default_inventory()
 # create env vars
 awsRegion = os.environ['AWS_REGION']
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 # loop through workspaces
-response = workspaces.describe_workspaces()
-myWorkSpaces = response['Workspaces']
+myWorkSpaces = inventory.lazy('workspaces', 'describe_workspaces', 'Workspaces')
 
 def workspaces_user_volume_encryption_check():
+    awsAccountId = accountId.get()
     for workspace in myWorkSpaces:
         workspaceId = str(workspace['WorkspaceId'])
         workspaceArn = 'arn:aws:workspaces:' + awsRegion + ':' + awsAccountId + ':workspace/' + workspaceId
@@ -37,247 +39,28 @@ def workspaces_user_volume_encryption_check():
                 try:
                     # this is a passed finding
                     iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': workspaceArn + '/workspaces-user-volume-encryption-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': workspaceArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 80 },
-                                'Confidence': 99,
-                                'Title': '[WorkSpaces.1] WorkSpaces should have user volume encryption enabled',
-                                'Description': 'Workspace ' + workspaceId + ' does not have user volume encryption enabled. Refer to the remediation instructions to remediate this behavior',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'For more information on WorkSpaces encryption and how to configure it refer to the Encrypted WorkSpaces section of the Amazon WorkSpaces Administrator Guide',
-                                        'Url': 'https://docs.aws.amazon.com/workspaces/latest/adminguide/encrypt-workspaces.html'
-                                    }
-                                },
-                                'ProductFields': { 'Product Name': 'ElectricEye' },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsWorkspacesWorkspace',
-                                        'Id': workspaceArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': {
-                                                'WorkspaceId': workspaceId
-                                            }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-            else:
-                try:
-                    # this is a passed finding
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': workspaceArn + '/workspaces-user-volume-encryption-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': workspaceArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[WorkSpaces.1] WorkSpaces should have user volume encryption enabled',
-                                'Description': 'Workspace ' + workspaceId + ' has user volume encryption enabled.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'For more information on WorkSpaces encryption and how to configure it refer to the Encrypted WorkSpaces section of the Amazon WorkSpaces Administrator Guide',
-                                        'Url': 'https://docs.aws.amazon.com/workspaces/latest/adminguide/encrypt-workspaces.html'
-                                    }
-                                },
-                                'ProductFields': { 'Product Name': 'ElectricEye' },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsWorkspacesWorkspace',
-                                        'Id': workspaceArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': {
-                                                'WorkspaceId': workspaceId
-                                            }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-        except Exception as e:
-            print(e)
-        
-def workspaces_root_volume_encryption_check():
-    for workspace in myWorkSpaces:
-        workspaceId = str(workspace['WorkspaceId'])
-        workspaceArn = 'arn:aws:workspaces:' + awsRegion + ':' + awsAccountId + ':workspace/' + workspaceId
-        try:
-            rootVolumeEncryptionCheck = str(workspace['RootVolumeEncryptionEnabled'])
-            if rootVolumeEncryptionCheck == 'False':
-                try:
-                    # this is a passed finding
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': workspaceArn + '/workspaces-root-volume-encryption-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': workspaceArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 80 },
-                                'Confidence': 99,
-                                'Title': '[WorkSpaces.1] WorkSpaces should have root volume encryption enabled',
-                                'Description': 'Workspace ' + workspaceId + ' does not have root volume encryption enabled. Refer to the remediation instructions to remediate this behavior',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'For more information on WorkSpaces encryption and how to configure it refer to the Encrypted WorkSpaces section of the Amazon WorkSpaces Administrator Guide',
-                                        'Url': 'https://docs.aws.amazon.com/workspaces/latest/adminguide/encrypt-workspaces.html'
-                                    }
-                                },
-                                'ProductFields': { 'Product Name': 'ElectricEye' },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsWorkspacesWorkspace',
-                                        'Id': workspaceArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': {
-                                                'WorkspaceId': workspaceId
-                                            }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'FAILED' },
-                                'RecordState': 'ACTIVE'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-            else:
-                try:
-                    # this is a passed finding
-                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                    response = securityhub.batch_import_findings(
-                        Findings=[
-                            {
-                                'SchemaVersion': '2018-10-08',
-                                'Id': workspaceArn + '/workspaces-root-volume-encryption-check',
-                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                'GeneratorId': workspaceArn,
-                                'AwsAccountId': awsAccountId,
-                                'Types': [ 
-                                    'Software and Configuration Checks/AWS Security Best Practices',
-                                    'Effects/Data Exposure'
-                                ],
-                                'FirstObservedAt': iso8601Time,
-                                'CreatedAt': iso8601Time,
-                                'UpdatedAt': iso8601Time,
-                                'Severity': { 'Normalized': 0 },
-                                'Confidence': 99,
-                                'Title': '[WorkSpaces.1] WorkSpaces should have root volume encryption enabled',
-                                'Description': 'Workspace ' + workspaceId + ' does not have root volume encryption enabled.',
-                                'Remediation': {
-                                    'Recommendation': {
-                                        'Text': 'For more information on WorkSpaces encryption and how to configure it refer to the Encrypted WorkSpaces section of the Amazon WorkSpaces Administrator Guide',
-                                        'Url': 'https://docs.aws.amazon.com/workspaces/latest/adminguide/encrypt-workspaces.html'
-                                    }
-                                },
-                                'ProductFields': { 'Product Name': 'ElectricEye' },
-                                'Resources': [
-                                    {
-                                        'Type': 'AwsWorkspacesWorkspace',
-                                        'Id': workspaceArn,
-                                        'Partition': 'aws',
-                                        'Region': awsRegion,
-                                        'Details': {
-                                            'Other': {
-                                                'WorkspaceId': workspaceId
-                                            }
-                                        }
-                                    }
-                                ],
-                                'Compliance': { 'Status': 'PASSED' },
-                                'RecordState': 'ARCHIVED'
-                            }
-                        ]
-                    )
-                    print(response)
-                except Exception as e:
-                    print(e)
-        except Exception as e:
-            print(e)
-
-def workspaces_running_mode_check():
-    for workspace in myWorkSpaces:
-        workspaceId = str(workspace['WorkspaceId'])
-        workspaceArn = 'arn:aws:workspaces:' + awsRegion + ':' + awsAccountId + ':workspace/' + workspaceId
-        runningModeCheck = str(workspace['WorkspaceProperties']['RunningMode'])
-        if runningModeCheck != 'AUTO_STOP':
-            try:
-                # this is a passed finding
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
+                    findingSink.put(
                         {
                             'SchemaVersion': '2018-10-08',
-                            'Id': workspaceArn + '/workspaces-auto-stop-running-mode-check',
+                            'Id': workspaceArn + '/workspaces-user-volume-encryption-check',
                             'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
                             'GeneratorId': workspaceArn,
                             'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                            'Types': [ 
+                                'Software and Configuration Checks/AWS Security Best Practices',
+                                'Effects/Data Exposure'
+                            ],
                             'FirstObservedAt': iso8601Time,
                             'CreatedAt': iso8601Time,
                             'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 20 },
+                            'Severity': { 'Normalized': 80 },
                             'Confidence': 99,
-                            'Title': '[WorkSpaces.3] WorkSpaces should be configured to auto stop after inactivity',
-                            'Description': 'Workspace ' + workspaceId + ' does not have its running mode configured to auto-stop. Refer to the remediation instructions to remediate this behavior',
+                            'Title': '[WorkSpaces.1] WorkSpaces should have user volume encryption enabled',
+                            'Description': 'Workspace ' + workspaceId + ' does not have user volume encryption enabled. Refer to the remediation instructions to remediate this behavior',
                             'Remediation': {
                                 'Recommendation': {
-                                    'Text': 'For more information on WorkSpaces running modes and how to auto-stop refer to the Manage the WorkSpace Running Mode section of the Amazon WorkSpaces Administrator Guide',
-                                    'Url': 'https://docs.aws.amazon.com/workspaces/latest/adminguide/running-mode.html#stop-start-workspace'
+                                    'Text': 'For more information on WorkSpaces encryption and how to configure it refer to the Encrypted WorkSpaces section of the Amazon WorkSpaces Administrator Guide',
+                                    'Url': 'https://docs.aws.amazon.com/workspaces/latest/adminguide/encrypt-workspaces.html'
                                 }
                             },
                             'ProductFields': { 'Product Name': 'ElectricEye' },
@@ -297,35 +80,35 @@ def workspaces_running_mode_check():
                             'Compliance': { 'Status': 'FAILED' },
                             'RecordState': 'ACTIVE'
                         }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        else:
-            try:
-                # this is a passed finding
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
+                    )
+                except Exception as e:
+                    print(e)
+            else:
+                try:
+                    # this is a passed finding
+                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                    findingSink.put(
                         {
                             'SchemaVersion': '2018-10-08',
-                            'Id': workspaceArn + '/workspaces-auto-stop-running-mode-check',
+                            'Id': workspaceArn + '/workspaces-user-volume-encryption-check',
                             'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
                             'GeneratorId': workspaceArn,
                             'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                            'Types': [ 
+                                'Software and Configuration Checks/AWS Security Best Practices',
+                                'Effects/Data Exposure'
+                            ],
                             'FirstObservedAt': iso8601Time,
                             'CreatedAt': iso8601Time,
                             'UpdatedAt': iso8601Time,
                             'Severity': { 'Normalized': 0 },
                             'Confidence': 99,
-                            'Title': '[WorkSpaces.3] WorkSpaces should be configured to auto stop after inactivity',
-                            'Description': 'Workspace ' + workspaceId + ' has its running mode configured to auto-stop.',
+                            'Title': '[WorkSpaces.1] WorkSpaces should have user volume encryption enabled',
+                            'Description': 'Workspace ' + workspaceId + ' has user volume encryption enabled.',
                             'Remediation': {
                                 'Recommendation': {
-                                    'Text': 'For more information on WorkSpaces running modes and how to auto-stop refer to the Manage the WorkSpace Running Mode section of the Amazon WorkSpaces Administrator Guide',
-                                    'Url': 'https://docs.aws.amazon.com/workspaces/latest/adminguide/running-mode.html#stop-start-workspace'
+                                    'Text': 'For more information on WorkSpaces encryption and how to configure it refer to the Encrypted WorkSpaces section of the Amazon WorkSpaces Administrator Guide',
+                                    'Url': 'https://docs.aws.amazon.com/workspaces/latest/adminguide/encrypt-workspaces.html'
                                 }
                             },
                             'ProductFields': { 'Product Name': 'ElectricEye' },
@@ -345,54 +128,57 @@ def workspaces_running_mode_check():
                             'Compliance': { 'Status': 'PASSED' },
                             'RecordState': 'ARCHIVED'
                         }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-
-def workspaces_directory_default_internet_check():
-    response = workspaces.describe_workspace_directories()
-    for directory in response['Directories']:
-        workspacesDirectoryId = str(directory['DirectoryId'])
-        workspacesDirectoryArn = 'arn:aws:workspaces:' + awsRegion + ':' + awsAccountId + ':directory/' + workspacesDirectoryId
-        internetAccessCheck = str(directory['WorkspaceCreationProperties']['EnableInternetAccess'])
-        if internetAccessCheck == 'True':
-            try:
-                # this is a passed finding
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
+                    )
+                except Exception as e:
+                    print(e)
+        except Exception as e:
+            print(e)
+        
+def workspaces_root_volume_encryption_check():
+    awsAccountId = accountId.get()
+    for workspace in myWorkSpaces:
+        workspaceId = str(workspace['WorkspaceId'])
+        workspaceArn = 'arn:aws:workspaces:' + awsRegion + ':' + awsAccountId + ':workspace/' + workspaceId
+        try:
+            rootVolumeEncryptionCheck = str(workspace['RootVolumeEncryptionEnabled'])
+            if rootVolumeEncryptionCheck == 'False':
+                try:
+                    # this is a passed finding
+                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                    findingSink.put(
                         {
                             'SchemaVersion': '2018-10-08',
-                            'Id': workspacesDirectoryArn + '/workspaces-directory-default-internet-access-check',
+                            'Id': workspaceArn + '/workspaces-root-volume-encryption-check',
                             'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': workspacesDirectoryArn,
+                            'GeneratorId': workspaceArn,
                             'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                            'Types': [ 
+                                'Software and Configuration Checks/AWS Security Best Practices',
+                                'Effects/Data Exposure'
+                            ],
                             'FirstObservedAt': iso8601Time,
                             'CreatedAt': iso8601Time,
                             'UpdatedAt': iso8601Time,
-                            'Severity': { 'Normalized': 40 },
+                            'Severity': { 'Normalized': 80 },
                             'Confidence': 99,
-                            'Title': '[WorkSpaces.4] WorkSpaces Directories should not be configured to provide default internet access',
-                            'Description': 'Workspace directory ' + workspacesDirectoryId + ' provides default internet access to WorkSpaces. Refer to the remediation instructions to remediate this behavior',
+                            'Title': '[WorkSpaces.1] WorkSpaces should have root volume encryption enabled',
+                            'Description': 'Workspace ' + workspaceId + ' does not have root volume encryption enabled. Refer to the remediation instructions to remediate this behavior',
                             'Remediation': {
                                 'Recommendation': {
-                                    'Text': 'For more information on WorkSpaces internet access refer to the Provide Internet Access from Your WorkSpace section of the Amazon WorkSpaces Administrator Guide',
-                                    'Url': 'https://docs.amazonaws.cn/en_us/workspaces/latest/adminguide/amazon-workspaces-internet-access.html'
+                                    'Text': 'For more information on WorkSpaces encryption and how to configure it refer to the Encrypted WorkSpaces section of the Amazon WorkSpaces Administrator Guide',
+                                    'Url': 'https://docs.aws.amazon.com/workspaces/latest/adminguide/encrypt-workspaces.html'
                                 }
                             },
                             'ProductFields': { 'Product Name': 'ElectricEye' },
                             'Resources': [
                                 {
-                                    'Type': 'Other',
-                                    'Id': workspacesDirectoryArn,
+                                    'Type': 'AwsWorkspacesWorkspace',
+                                    'Id': workspaceArn,
                                     'Partition': 'aws',
                                     'Region': awsRegion,
                                     'Details': {
                                         'Other': {
-                                            'DirectoryId': workspacesDirectoryId
+                                            'WorkspaceId': workspaceId
                                         }
                                     }
                                 }
@@ -400,47 +186,47 @@ def workspaces_directory_default_internet_check():
                             'Compliance': { 'Status': 'FAILED' },
                             'RecordState': 'ACTIVE'
                         }
-                    ]
-                )
-                print(response)
-            except Exception as e:
-                print(e)
-        else:
-            try:
-                # this is a passed finding
-                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                response = securityhub.batch_import_findings(
-                    Findings=[
+                    )
+                except Exception as e:
+                    print(e)
+            else:
+                try:
+                    # this is a passed finding
+                    iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                    findingSink.put(
                         {
                             'SchemaVersion': '2018-10-08',
-                            'Id': workspacesDirectoryArn + '/workspaces-directory-default-internet-access-check',
+                            'Id': workspaceArn + '/workspaces-root-volume-encryption-check',
                             'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                            'GeneratorId': workspacesDirectoryArn,
+                            'GeneratorId': workspaceArn,
                             'AwsAccountId': awsAccountId,
-                            'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                            'Types': [ 
+                                'Software and Configuration Checks/AWS Security Best Practices',
+                                'Effects/Data Exposure'
+                            ],
                             'FirstObservedAt': iso8601Time,
                             'CreatedAt': iso8601Time,
                             'UpdatedAt': iso8601Time,
                             'Severity': { 'Normalized': 0 },
                             'Confidence': 99,
-                            'Title': '[WorkSpaces.4] WorkSpaces Directories should not be configured to provide default internet access',
-                            'Description': 'Workspace directory ' + workspacesDirectoryId + ' does not provide default internet access to WorkSpaces.',
+                            'Title': '[WorkSpaces.1] WorkSpaces should have root volume encryption enabled',
+                            'Description': 'Workspace ' + workspaceId + ' does not have root volume encryption enabled.',
                             'Remediation': {
                                 'Recommendation': {
-                                    'Text': 'For more information on WorkSpaces internet access refer to the Provide Internet Access from Your WorkSpace section of the Amazon WorkSpaces Administrator Guide',
-                                    'Url': 'https://docs.amazonaws.cn/en_us/workspaces/latest/adminguide/amazon-workspaces-internet-access.html'
+                                    'Text': 'For more information on WorkSpaces encryption and how to configure it refer to the Encrypted WorkSpaces section of the Amazon WorkSpaces Administrator Guide',
+                                    'Url': 'https://docs.aws.amazon.com/workspaces/latest/adminguide/encrypt-workspaces.html'
                                 }
                             },
                             'ProductFields': { 'Product Name': 'ElectricEye' },
                             'Resources': [
                                 {
-                                    'Type': 'Other',
-                                    'Id': workspacesDirectoryArn,
+                                    'Type': 'AwsWorkspacesWorkspace',
+                                    'Id': workspaceArn,
                                     'Partition': 'aws',
                                     'Region': awsRegion,
                                     'Details': {
                                         'Other': {
-                                            'DirectoryId': workspacesDirectoryId
+                                            'WorkspaceId': workspaceId
                                         }
                                     }
                                 }
@@ -448,9 +234,204 @@ def workspaces_directory_default_internet_check():
                             'Compliance': { 'Status': 'PASSED' },
                             'RecordState': 'ARCHIVED'
                         }
-                    ]
+                    )
+                except Exception as e:
+                    print(e)
+        except Exception as e:
+            print(e)
+
+def workspaces_running_mode_check():
+    awsAccountId = accountId.get()
+    for workspace in myWorkSpaces:
+        workspaceId = str(workspace['WorkspaceId'])
+        workspaceArn = 'arn:aws:workspaces:' + awsRegion + ':' + awsAccountId + ':workspace/' + workspaceId
+        runningModeCheck = str(workspace['WorkspaceProperties']['RunningMode'])
+        if runningModeCheck != 'AUTO_STOP':
+            try:
+                # this is a passed finding
+                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': workspaceArn + '/workspaces-auto-stop-running-mode-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': workspaceArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 20 },
+                        'Confidence': 99,
+                        'Title': '[WorkSpaces.3] WorkSpaces should be configured to auto stop after inactivity',
+                        'Description': 'Workspace ' + workspaceId + ' does not have its running mode configured to auto-stop. Refer to the remediation instructions to remediate this behavior',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on WorkSpaces running modes and how to auto-stop refer to the Manage the WorkSpace Running Mode section of the Amazon WorkSpaces Administrator Guide',
+                                'Url': 'https://docs.aws.amazon.com/workspaces/latest/adminguide/running-mode.html#stop-start-workspace'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'AwsWorkspacesWorkspace',
+                                'Id': workspaceArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': {
+                                        'WorkspaceId': workspaceId
+                                    }
+                                }
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
+                )
+            except Exception as e:
+                print(e)
+        else:
+            try:
+                # this is a passed finding
+                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': workspaceArn + '/workspaces-auto-stop-running-mode-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': workspaceArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[WorkSpaces.3] WorkSpaces should be configured to auto stop after inactivity',
+                        'Description': 'Workspace ' + workspaceId + ' has its running mode configured to auto-stop.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on WorkSpaces running modes and how to auto-stop refer to the Manage the WorkSpace Running Mode section of the Amazon WorkSpaces Administrator Guide',
+                                'Url': 'https://docs.aws.amazon.com/workspaces/latest/adminguide/running-mode.html#stop-start-workspace'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'AwsWorkspacesWorkspace',
+                                'Id': workspaceArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': {
+                                        'WorkspaceId': workspaceId
+                                    }
+                                }
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
+                )
+            except Exception as e:
+                print(e)
+
+def workspaces_directory_default_internet_check():
+    awsAccountId = accountId.get()
+    response = workspaces.describe_workspace_directories()
+    for directory in response['Directories']:
+        workspacesDirectoryId = str(directory['DirectoryId'])
+        workspacesDirectoryArn = 'arn:aws:workspaces:' + awsRegion + ':' + awsAccountId + ':directory/' + workspacesDirectoryId
+        internetAccessCheck = str(directory['WorkspaceCreationProperties']['EnableInternetAccess'])
+        if internetAccessCheck == 'True':
+            try:
+                # this is a passed finding
+                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': workspacesDirectoryArn + '/workspaces-directory-default-internet-access-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': workspacesDirectoryArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 40 },
+                        'Confidence': 99,
+                        'Title': '[WorkSpaces.4] WorkSpaces Directories should not be configured to provide default internet access',
+                        'Description': 'Workspace directory ' + workspacesDirectoryId + ' provides default internet access to WorkSpaces. Refer to the remediation instructions to remediate this behavior',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on WorkSpaces internet access refer to the Provide Internet Access from Your WorkSpace section of the Amazon WorkSpaces Administrator Guide',
+                                'Url': 'https://docs.amazonaws.cn/en_us/workspaces/latest/adminguide/amazon-workspaces-internet-access.html'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': workspacesDirectoryArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': {
+                                        'DirectoryId': workspacesDirectoryId
+                                    }
+                                }
+                            }
+                        ],
+                        'Compliance': { 'Status': 'FAILED' },
+                        'RecordState': 'ACTIVE'
+                    }
+                )
+            except Exception as e:
+                print(e)
+        else:
+            try:
+                # this is a passed finding
+                iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                findingSink.put(
+                    {
+                        'SchemaVersion': '2018-10-08',
+                        'Id': workspacesDirectoryArn + '/workspaces-directory-default-internet-access-check',
+                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                        'GeneratorId': workspacesDirectoryArn,
+                        'AwsAccountId': awsAccountId,
+                        'Types': [ 'Software and Configuration Checks/AWS Security Best Practices' ],
+                        'FirstObservedAt': iso8601Time,
+                        'CreatedAt': iso8601Time,
+                        'UpdatedAt': iso8601Time,
+                        'Severity': { 'Normalized': 0 },
+                        'Confidence': 99,
+                        'Title': '[WorkSpaces.4] WorkSpaces Directories should not be configured to provide default internet access',
+                        'Description': 'Workspace directory ' + workspacesDirectoryId + ' does not provide default internet access to WorkSpaces.',
+                        'Remediation': {
+                            'Recommendation': {
+                                'Text': 'For more information on WorkSpaces internet access refer to the Provide Internet Access from Your WorkSpace section of the Amazon WorkSpaces Administrator Guide',
+                                'Url': 'https://docs.amazonaws.cn/en_us/workspaces/latest/adminguide/amazon-workspaces-internet-access.html'
+                            }
+                        },
+                        'ProductFields': { 'Product Name': 'ElectricEye' },
+                        'Resources': [
+                            {
+                                'Type': 'Other',
+                                'Id': workspacesDirectoryArn,
+                                'Partition': 'aws',
+                                'Region': awsRegion,
+                                'Details': {
+                                    'Other': {
+                                        'DirectoryId': workspacesDirectoryId
+                                    }
+                                }
+                            }
+                        ],
+                        'Compliance': { 'Status': 'PASSED' },
+                        'RecordState': 'ARCHIVED'
+                    }
                 )
-                print(response)
             except Exception as e:
                 print(e)
 
@@ -460,4 +441,5 @@ def workspaces_auditor():
     workspaces_running_mode_check()
     workspaces_directory_default_internet_check()
 
-workspaces_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    workspaces_auditor()
\ No newline at end of file
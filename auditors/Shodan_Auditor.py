@@ -1,36 +1,40 @@
-import boto3
 import os
 import requests
 import socket
 import json
 import datetime
+from finding_sink import default_sink
+from resource_inventory import default_inventory
+from scan_scope import lazy_account_id, lazy_client
 
 # import boto3 clients
-sts = boto3.client('sts')
-ssm = boto3.client('ssm')
-ec2 = boto3.client('ec2')
-elbv2 = boto3.client('elbv2')
-rds = boto3.client('rds')
-elasticsearch = boto3.client('es')
-securityhub = boto3.client('securityhub')
+ssm = lazy_client('ssm')
+elbv2 = lazy_client('elbv2')
+elasticsearch = lazy_client('es')
+findingSink = default_sink()
+inventory = default_inventory()
 
 # create env vars
-awsAccountId = sts.get_caller_identity()['Account']
+accountId = lazy_account_id()
 awsRegion = os.environ['AWS_REGION']
 apiKeyParam = os.environ['SHODAN_API_KEY_PARAM']
 
 # Shodan information for Requests
 shodanUrl = 'https://api.shodan.io/shodan/host/'
-try:
-    response = ssm.get_parameter(Name=apiKeyParam,WithDecryption=True)
-    shodanApiKey = str(response['Parameter']['Value'])
-except Exception as e:
-    print(e)
+shodanApiKey = None
+
+def shodan_api_key():
+    # read from SSM the first time a check calls Shodan
+    global shodanApiKey
+    if shodanApiKey is None:
+        response = ssm.get_parameter(Name=apiKeyParam,WithDecryption=True)
+        shodanApiKey = str(response['Parameter']['Value'])
+    return shodanApiKey
 
 def public_ec2_shodan_check():
+    awsAccountId = accountId.get()
     try:
-        response = ec2.describe_instances(DryRun=False,MaxResults=500)
-        for res in response['Reservations']:
+        for res in inventory.get('ec2', 'describe_instances', 'Reservations'):
             for inst in res['Instances']:
                 ec2Type = str(inst['InstanceType'])
                 ec2AmiId = str(inst['ImageId'])
@@ -42,172 +46,43 @@ def public_ec2_shodan_check():
                 try:
                     ec2PublicIp = str(inst['PublicIpAddress'])
                     # use requests Library to check the Shodan index for your host
-                    r = requests.get(url = shodanUrl + ec2PublicIp + '?key=' + shodanApiKey)
+                    r = requests.get(url = shodanUrl + ec2PublicIp + '?key=' + shodan_api_key())
                     data = r.json()
                     shodanOutput = str(data)
                     if shodanOutput == "{'error': 'No information available for that IP.'}":
                         # this is a passing check
                         try:
                             iso8601time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                            response = securityhub.batch_import_findings(
-                                Findings=[
-                                    {
-                                        'SchemaVersion': '2018-10-08',
-                                        'Id': ec2Arn + '/' + ec2PublicIp + '/ec2-shodan-index-check',
-                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                        'GeneratorId': ec2Arn,
-                                        'AwsAccountId': awsAccountId,
-                                        'Types': ['Effects/Data Exposure'],
-                                        'CreatedAt': iso8601time,
-                                        'UpdatedAt': iso8601time,
-                                        'Severity': { 'Normalized': 0 },
-                                        'Title': '[Shodan.EC2.1] EC2 instances with public IP addresses should be monitored for being indexed by Shodan',
-                                        'Description': 'EC2 instance ' + ec2Id + ' has not been indexed by Shodan.',
-                                        'SourceUrl': 'https://www.shodan.io/host/' + ec2PublicIp,
-                                        'ProductFields': {
-                                            'Product Name': 'ElectricEye'
-                                        },
-                                        'Resources': [
-                                            {
-                                                'Type': 'AwsEc2Instance',
-                                                'Id': ec2Arn,
-                                                'Partition': 'aws',
-                                                'Region': awsRegion,
-                                                'Details': {
-                                                    'AwsEc2Instance': {
-                                                        'Type': ec2Type,
-                                                        'ImageId': ec2AmiId,
-                                                        'IpV4Addresses': [ec2PublicIp, ec2PrivateIp],
-                                                        'VpcId': ec2VpcId,
-                                                        'SubnetId': ec2SubnetId
-                                                    }
-                                                }
-                                            }
-                                        ],
-                                        'Compliance': { 'Status': 'PASSED' },
-                                        'RecordState': 'ARCHIVED'
-                                    }
-                                ]
-                            )
-                            print(response)
-                        except Exception as e:
-                            print(e)
-                    else:
-                        try:
-                            iso8601time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                            response = securityhub.batch_import_findings(
-                                Findings=[
-                                    {
-                                        'SchemaVersion': '2018-10-08',
-                                        'Id': ec2Arn + '/' + ec2PublicIp + '/ec2-shodan-index-check',
-                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                        'GeneratorId': ec2Arn,
-                                        'AwsAccountId': awsAccountId,
-                                        'Types': ['Effects/Data Exposure'],
-                                        'CreatedAt': iso8601time,
-                                        'UpdatedAt': iso8601time,
-                                        'Severity': { 'Normalized': 40 },
-                                        'Title': '[Shodan.EC2.1] EC2 instances with public IP addresses should be monitored for being indexed by Shodan',
-                                        'Description': 'EC2 instance ' + ec2Id + ' has been indexed by Shodan on IP address ' + ec2PublicIp + '. review the Shodan.io host information in the SourceUrl or ThreatIntelIndicators.SourceUrl fields for information about what ports and services are exposed and then take action to reduce exposure and harden your host.',
-                                        'SourceUrl': 'https://www.shodan.io/host/' + ec2PublicIp,
-                                        'ProductFields': {
-                                            'Product Name': 'ElectricEye'
-                                        },
-                                        'ThreatIntelIndicators': [
-                                            {
-                                                'Type': 'IPV4_ADDRESS',
-                                                'Category': 'EXPLOIT_SITE',
-                                                'Value': ec2PublicIp,
-                                                'LastObservedAt': iso8601time,
-                                                'Source': 'Shodan.io',
-                                                'SourceUrl': 'https://www.shodan.io/host/' + ec2PublicIp
-                                            },
-                                        ],
-                                        'Resources': [
-                                            {
-                                                'Type': 'AwsEc2Instance',
-                                                'Id': ec2Arn,
-                                                'Partition': 'aws',
-                                                'Region': awsRegion,
-                                                'Details': {
-                                                    'AwsEc2Instance': {
-                                                        'Type': ec2Type,
-                                                        'ImageId': ec2AmiId,
-                                                        'IpV4Addresses': [ec2PublicIp, ec2PrivateIp],
-                                                        'VpcId': ec2VpcId,
-                                                        'SubnetId': ec2SubnetId
-                                                    }
-                                                }
-                                            }
-                                        ],
-                                        'Compliance': { 'Status': 'FAILED' },
-                                        'RecordState': 'ACTIVE'
-                                    }
-                                ]
-                            )
-                            print(response)
-                        except Exception as e:
-                            print(e)
-                except Exception as e:
-                    if str(e) == "'PublicIpAddress'":
-                        print(ec2Id + ' does not have a Public IPv4 Address, skipping')
-                        pass
-                    else:
-                        print(e)
-    except Exception as e:
-        print(e)
-
-def public_alb_shodan_check():
-    try:
-        response = elbv2.describe_load_balancers()
-        for lbs in response['LoadBalancers']:
-            elbv2Scheme = str(lbs['Scheme'])
-            elbv2Type = str(lbs['Type'])
-            elbv2Name = str(lbs['LoadBalancerName'])
-            elbv2Arn = str(lbs['LoadBalancerArn'])
-            elbv2Vpc = str(lbs['VpcId'])
-            elbv2Dns = str(lbs['DNSName'])
-            if elbv2Scheme == 'internet-facing' and elbv2Type == 'application':
-                # use Socket to do a DNS lookup and retrieve the IP address
-                elbv2Ip = socket.gethostbyname(elbv2Dns)
-                # use requests Library to check the Shodan index for your host
-                r = requests.get(url = shodanUrl + elbv2Ip + '?key=' + shodanApiKey)
-                data = r.json()
-                shodanOutput = str(data)
-                if shodanOutput == "{'error': 'No information available for that IP.'}":
-                    # this is a passing check
-                    try:
-                        iso8601time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
+                            findingSink.put(
                                 {
                                     'SchemaVersion': '2018-10-08',
-                                    'Id': elbv2Arn + '/' + elbv2Dns + '/alb-shodan-index-check',
+                                    'Id': ec2Arn + '/' + ec2PublicIp + '/ec2-shodan-index-check',
                                     'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': elbv2Arn,
+                                    'GeneratorId': ec2Arn,
                                     'AwsAccountId': awsAccountId,
                                     'Types': ['Effects/Data Exposure'],
                                     'CreatedAt': iso8601time,
                                     'UpdatedAt': iso8601time,
                                     'Severity': { 'Normalized': 0 },
-                                    'Title': '[Shodan.ELBv2.1] Internet-facing Application Load Balancers should be monitored for being indexed by Shodan',
-                                    'Description': 'ALB ' + elbv2Name + ' has not been indexed by Shodan.',
-                                    'SourceUrl': 'https://www.shodan.io/host/' + elbv2Ip,
+                                    'Title': '[Shodan.EC2.1] EC2 instances with public IP addresses should be monitored for being indexed by Shodan',
+                                    'Description': 'EC2 instance ' + ec2Id + ' has not been indexed by Shodan.',
+                                    'SourceUrl': 'https://www.shodan.io/host/' + ec2PublicIp,
                                     'ProductFields': {
                                         'Product Name': 'ElectricEye'
                                     },
                                     'Resources': [
                                         {
-                                            'Type': 'AwsElbv2LoadBalancer',
-                                            'Id': elbv2Arn,
+                                            'Type': 'AwsEc2Instance',
+                                            'Id': ec2Arn,
                                             'Partition': 'aws',
                                             'Region': awsRegion,
                                             'Details': {
-                                                'AwsElbv2LoadBalancer': {
-                                                    'DNSName': elbv2Dns,
-                                                    'Scheme': elbv2Scheme,
-                                                    'Type': elbv2Type,
-                                                    'VpcId': elbv2Vpc
+                                                'AwsEc2Instance': {
+                                                    'Type': ec2Type,
+                                                    'ImageId': ec2AmiId,
+                                                    'IpV4Addresses': [ec2PublicIp, ec2PrivateIp],
+                                                    'VpcId': ec2VpcId,
+                                                    'SubnetId': ec2SubnetId
                                                 }
                                             }
                                         }
@@ -215,29 +90,26 @@ def public_alb_shodan_check():
                                     'Compliance': { 'Status': 'PASSED' },
                                     'RecordState': 'ARCHIVED'
                                 }
-                            ]
-                        )
-                        print(response)
-                    except Exception as e:
-                        print(e)
-                else:
-                    try:
-                        iso8601time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
+                            )
+                        except Exception as e:
+                            print(e)
+                    else:
+                        try:
+                            iso8601time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                            findingSink.put(
                                 {
                                     'SchemaVersion': '2018-10-08',
-                                    'Id': elbv2Arn + '/' + elbv2Dns + '/alb-shodan-index-check',
+                                    'Id': ec2Arn + '/' + ec2PublicIp + '/ec2-shodan-index-check',
                                     'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': elbv2Arn,
+                                    'GeneratorId': ec2Arn,
                                     'AwsAccountId': awsAccountId,
                                     'Types': ['Effects/Data Exposure'],
                                     'CreatedAt': iso8601time,
                                     'UpdatedAt': iso8601time,
                                     'Severity': { 'Normalized': 40 },
-                                    'Title': '[Shodan.ELBv2.1] Internet-facing Application Load Balancers should be monitored for being indexed by Shodan',
-                                    'Description': 'ALB ' + elbv2Name + ' has been indexed by Shodan on IP address ' + elbv2Ip + ' from DNS name ' + elbv2Dns + '. review the Shodan.io host information in the SourceUrl or ThreatIntelIndicators.SourceUrl fields for information about what ports and services are exposed and then take action to reduce exposure and harden your load balancer.',
-                                    'SourceUrl': 'https://www.shodan.io/host/' + elbv2Ip,
+                                    'Title': '[Shodan.EC2.1] EC2 instances with public IP addresses should be monitored for being indexed by Shodan',
+                                    'Description': 'EC2 instance ' + ec2Id + ' has been indexed by Shodan on IP address ' + ec2PublicIp + '. review the Shodan.io host information in the SourceUrl or ThreatIntelIndicators.SourceUrl fields for information about what ports and services are exposed and then take action to reduce exposure and harden your host.',
+                                    'SourceUrl': 'https://www.shodan.io/host/' + ec2PublicIp,
                                     'ProductFields': {
                                         'Product Name': 'ElectricEye'
                                     },
@@ -245,24 +117,25 @@ def public_alb_shodan_check():
                                         {
                                             'Type': 'IPV4_ADDRESS',
                                             'Category': 'EXPLOIT_SITE',
-                                            'Value': elbv2Ip,
+                                            'Value': ec2PublicIp,
                                             'LastObservedAt': iso8601time,
                                             'Source': 'Shodan.io',
-                                            'SourceUrl': 'https://www.shodan.io/host/' + elbv2Ip
+                                            'SourceUrl': 'https://www.shodan.io/host/' + ec2PublicIp
                                         },
                                     ],
                                     'Resources': [
                                         {
-                                            'Type': 'AwsElbv2LoadBalancer',
-                                            'Id': elbv2Arn,
+                                            'Type': 'AwsEc2Instance',
+                                            'Id': ec2Arn,
                                             'Partition': 'aws',
                                             'Region': awsRegion,
                                             'Details': {
-                                                'AwsElbv2LoadBalancer': {
-                                                    'DNSName': elbv2Dns,
-                                                    'Scheme': elbv2Scheme,
-                                                    'Type': elbv2Type,
-                                                    'VpcId': elbv2Vpc
+                                                'AwsEc2Instance': {
+                                                    'Type': ec2Type,
+                                                    'ImageId': ec2AmiId,
+                                                    'IpV4Addresses': [ec2PublicIp, ec2PrivateIp],
+                                                    'VpcId': ec2VpcId,
+                                                    'SubnetId': ec2SubnetId
                                                 }
                                             }
                                         }
@@ -270,9 +143,129 @@ def public_alb_shodan_check():
                                     'Compliance': { 'Status': 'FAILED' },
                                     'RecordState': 'ACTIVE'
                                 }
-                            ]
+                            )
+                        except Exception as e:
+                            print(e)
+                except Exception as e:
+                    if str(e) == "'PublicIpAddress'":
+                        print(ec2Id + ' does not have a Public IPv4 Address, skipping')
+                        pass
+                    else:
+                        print(e)
+    except Exception as e:
+        print(e)
+
+def public_alb_shodan_check():
+    awsAccountId = accountId.get()
+    try:
+        response = elbv2.describe_load_balancers()
+        for lbs in response['LoadBalancers']:
+            elbv2Scheme = str(lbs['Scheme'])
+            elbv2Type = str(lbs['Type'])
+            elbv2Name = str(lbs['LoadBalancerName'])
+            elbv2Arn = str(lbs['LoadBalancerArn'])
+            elbv2Vpc = str(lbs['VpcId'])
+            elbv2Dns = str(lbs['DNSName'])
+            if elbv2Scheme == 'internet-facing' and elbv2Type == 'application':
+                # use Socket to do a DNS lookup and retrieve the IP address
+                elbv2Ip = socket.gethostbyname(elbv2Dns)
+                # use requests Library to check the Shodan index for your host
+                r = requests.get(url = shodanUrl + elbv2Ip + '?key=' + shodan_api_key())
+                data = r.json()
+                shodanOutput = str(data)
+                if shodanOutput == "{'error': 'No information available for that IP.'}":
+                    # this is a passing check
+                    try:
+                        iso8601time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': elbv2Arn + '/' + elbv2Dns + '/alb-shodan-index-check',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': elbv2Arn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': ['Effects/Data Exposure'],
+                                'CreatedAt': iso8601time,
+                                'UpdatedAt': iso8601time,
+                                'Severity': { 'Normalized': 0 },
+                                'Title': '[Shodan.ELBv2.1] Internet-facing Application Load Balancers should be monitored for being indexed by Shodan',
+                                'Description': 'ALB ' + elbv2Name + ' has not been indexed by Shodan.',
+                                'SourceUrl': 'https://www.shodan.io/host/' + elbv2Ip,
+                                'ProductFields': {
+                                    'Product Name': 'ElectricEye'
+                                },
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsElbv2LoadBalancer',
+                                        'Id': elbv2Arn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsElbv2LoadBalancer': {
+                                                'DNSName': elbv2Dns,
+                                                'Scheme': elbv2Scheme,
+                                                'Type': elbv2Type,
+                                                'VpcId': elbv2Vpc
+                                            }
+                                        }
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'PASSED' },
+                                'RecordState': 'ARCHIVED'
+                            }
+                        )
+                    except Exception as e:
+                        print(e)
+                else:
+                    try:
+                        iso8601time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': elbv2Arn + '/' + elbv2Dns + '/alb-shodan-index-check',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': elbv2Arn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': ['Effects/Data Exposure'],
+                                'CreatedAt': iso8601time,
+                                'UpdatedAt': iso8601time,
+                                'Severity': { 'Normalized': 40 },
+                                'Title': '[Shodan.ELBv2.1] Internet-facing Application Load Balancers should be monitored for being indexed by Shodan',
+                                'Description': 'ALB ' + elbv2Name + ' has been indexed by Shodan on IP address ' + elbv2Ip + ' from DNS name ' + elbv2Dns + '. review the Shodan.io host information in the SourceUrl or ThreatIntelIndicators.SourceUrl fields for information about what ports and services are exposed and then take action to reduce exposure and harden your load balancer.',
+                                'SourceUrl': 'https://www.shodan.io/host/' + elbv2Ip,
+                                'ProductFields': {
+                                    'Product Name': 'ElectricEye'
+                                },
+                                'ThreatIntelIndicators': [
+                                    {
+                                        'Type': 'IPV4_ADDRESS',
+                                        'Category': 'EXPLOIT_SITE',
+                                        'Value': elbv2Ip,
+                                        'LastObservedAt': iso8601time,
+                                        'Source': 'Shodan.io',
+                                        'SourceUrl': 'https://www.shodan.io/host/' + elbv2Ip
+                                    },
+                                ],
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsElbv2LoadBalancer',
+                                        'Id': elbv2Arn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsElbv2LoadBalancer': {
+                                                'DNSName': elbv2Dns,
+                                                'Scheme': elbv2Scheme,
+                                                'Type': elbv2Type,
+                                                'VpcId': elbv2Vpc
+                                            }
+                                        }
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'FAILED' },
+                                'RecordState': 'ACTIVE'
+                            }
                         )
-                        print(response)
                     except Exception as e:
                         print(e)
             else:
@@ -281,9 +274,9 @@ def public_alb_shodan_check():
         print(e)
 
 def public_rds_shodan_check():
+    awsAccountId = accountId.get()
     try:
-        response = rds.describe_db_instances()
-        for rdsdb in response['DBInstances']:
+        for rdsdb in inventory.get('rds', 'describe_db_instances', 'DBInstances'):
             rdsInstanceId = str(rdsdb['DBInstanceIdentifier'])
             rdsInstanceArn = str(rdsdb['DBInstanceArn'])
             rdsInstanceClass = str(rdsdb['DBInstanceClass'])
@@ -296,110 +289,104 @@ def public_rds_shodan_check():
                 # use Socket to do a DNS lookup and retrieve the IP address
                 rdsIp = socket.gethostbyname(rdsDns)
                 # use requests Library to check the Shodan index for your host
-                r = requests.get(url = shodanUrl + rdsIp + '?key=' + shodanApiKey)
+                r = requests.get(url = shodanUrl + rdsIp + '?key=' + shodan_api_key())
                 data = r.json()
                 shodanOutput = str(data)
                 if shodanOutput == "{'error': 'No information available for that IP.'}":
                     # this is a passing check
                     try:
                         iso8601time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': rdsInstanceArn + '/' + rdsDns + '/rds-shodan-index-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': rdsInstanceArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': ['Effects/Data Exposure'],
-                                    'CreatedAt': iso8601time,
-                                    'UpdatedAt': iso8601time,
-                                    'Severity': { 'Normalized': 0 },
-                                    'Title': '[Shodan.RDS.1] Public accessible RDS instances should be monitored for being indexed by Shodan',
-                                    'Description': 'RDS instance ' + rdsInstanceId + ' has not been indexed by Shodan.',
-                                    'SourceUrl': 'https://www.shodan.io/host/' + rdsIp,
-                                    'ProductFields': {
-                                        'Product Name': 'ElectricEye'
-                                    },
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsRdsDbInstance',
-                                            'Id': rdsInstanceArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsRdsDbInstance': {
-                                                    'DBInstanceIdentifier': rdsInstanceId,
-                                                    'DBInstanceClass': rdsInstanceClass,
-                                                    'DbiResourceId': rdsDbiRescId,
-                                                    'Engine': rdsEngine,
-                                                    'EngineVersion': rdsEngineVersion
-                                                }
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': rdsInstanceArn + '/' + rdsDns + '/rds-shodan-index-check',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': rdsInstanceArn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': ['Effects/Data Exposure'],
+                                'CreatedAt': iso8601time,
+                                'UpdatedAt': iso8601time,
+                                'Severity': { 'Normalized': 0 },
+                                'Title': '[Shodan.RDS.1] Public accessible RDS instances should be monitored for being indexed by Shodan',
+                                'Description': 'RDS instance ' + rdsInstanceId + ' has not been indexed by Shodan.',
+                                'SourceUrl': 'https://www.shodan.io/host/' + rdsIp,
+                                'ProductFields': {
+                                    'Product Name': 'ElectricEye'
+                                },
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsRdsDbInstance',
+                                        'Id': rdsInstanceArn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsRdsDbInstance': {
+                                                'DBInstanceIdentifier': rdsInstanceId,
+                                                'DBInstanceClass': rdsInstanceClass,
+                                                'DbiResourceId': rdsDbiRescId,
+                                                'Engine': rdsEngine,
+                                                'EngineVersion': rdsEngineVersion
                                             }
                                         }
-                                    ],
-                                    'Compliance': { 'Status': 'PASSED' },
-                                    'RecordState': 'ARCHIVED'
-                                }
-                            ]
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'PASSED' },
+                                'RecordState': 'ARCHIVED'
+                            }
                         )
-                        print(response)
                     except Exception as e:
                         print(e)
                 else:
                     try:
                         iso8601time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                        response = securityhub.batch_import_findings(
-                            Findings=[
-                                {
-                                    'SchemaVersion': '2018-10-08',
-                                    'Id': rdsInstanceArn + '/' + rdsDns + '/rds-shodan-index-check',
-                                    'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                    'GeneratorId': rdsInstanceArn,
-                                    'AwsAccountId': awsAccountId,
-                                    'Types': ['Effects/Data Exposure'],
-                                    'CreatedAt': iso8601time,
-                                    'UpdatedAt': iso8601time,
-                                    'Severity': { 'Normalized': 40 },
-                                    'Title': '[Shodan.RDS.1] Public accessible RDS instances should be monitored for being indexed by Shodan',
-                                    'Description': 'RDS instance ' + rdsInstanceId + ' has been indexed by Shodan on IP address ' + rdsIp + ' from DNS name ' + rdsDns + '. review the Shodan.io host information in the SourceUrl or ThreatIntelIndicators.SourceUrl fields for information about what ports and services are exposed and then take action to reduce exposure and harden your database.',
-                                    'SourceUrl': 'https://www.shodan.io/host/' + rdsIp,
-                                    'ProductFields': {
-                                        'Product Name': 'ElectricEye'
+                        findingSink.put(
+                            {
+                                'SchemaVersion': '2018-10-08',
+                                'Id': rdsInstanceArn + '/' + rdsDns + '/rds-shodan-index-check',
+                                'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                'GeneratorId': rdsInstanceArn,
+                                'AwsAccountId': awsAccountId,
+                                'Types': ['Effects/Data Exposure'],
+                                'CreatedAt': iso8601time,
+                                'UpdatedAt': iso8601time,
+                                'Severity': { 'Normalized': 40 },
+                                'Title': '[Shodan.RDS.1] Public accessible RDS instances should be monitored for being indexed by Shodan',
+                                'Description': 'RDS instance ' + rdsInstanceId + ' has been indexed by Shodan on IP address ' + rdsIp + ' from DNS name ' + rdsDns + '. review the Shodan.io host information in the SourceUrl or ThreatIntelIndicators.SourceUrl fields for information about what ports and services are exposed and then take action to reduce exposure and harden your database.',
+                                'SourceUrl': 'https://www.shodan.io/host/' + rdsIp,
+                                'ProductFields': {
+                                    'Product Name': 'ElectricEye'
+                                },
+                                'ThreatIntelIndicators': [
+                                    {
+                                        'Type': 'IPV4_ADDRESS',
+                                        'Category': 'EXPLOIT_SITE',
+                                        'Value': rdsIp,
+                                        'LastObservedAt': iso8601time,
+                                        'Source': 'Shodan.io',
+                                        'SourceUrl': 'https://www.shodan.io/host/' + rdsIp
                                     },
-                                    'ThreatIntelIndicators': [
-                                        {
-                                            'Type': 'IPV4_ADDRESS',
-                                            'Category': 'EXPLOIT_SITE',
-                                            'Value': rdsIp,
-                                            'LastObservedAt': iso8601time,
-                                            'Source': 'Shodan.io',
-                                            'SourceUrl': 'https://www.shodan.io/host/' + rdsIp
-                                        },
-                                    ],
-                                    'Resources': [
-                                        {
-                                            'Type': 'AwsRdsDbInstance',
-                                            'Id': rdsInstanceArn,
-                                            'Partition': 'aws',
-                                            'Region': awsRegion,
-                                            'Details': {
-                                                'AwsRdsDbInstance': {
-                                                    'DBInstanceIdentifier': rdsInstanceId,
-                                                    'DBInstanceClass': rdsInstanceClass,
-                                                    'DbiResourceId': rdsDbiRescId,
-                                                    'Engine': rdsEngine,
-                                                    'EngineVersion': rdsEngineVersion
-                                                }
+                                ],
+                                'Resources': [
+                                    {
+                                        'Type': 'AwsRdsDbInstance',
+                                        'Id': rdsInstanceArn,
+                                        'Partition': 'aws',
+                                        'Region': awsRegion,
+                                        'Details': {
+                                            'AwsRdsDbInstance': {
+                                                'DBInstanceIdentifier': rdsInstanceId,
+                                                'DBInstanceClass': rdsInstanceClass,
+                                                'DbiResourceId': rdsDbiRescId,
+                                                'Engine': rdsEngine,
+                                                'EngineVersion': rdsEngineVersion
                                             }
                                         }
-                                    ],
-                                    'Compliance': { 'Status': 'FAILED' },
-                                    'RecordState': 'ACTIVE'
-                                }
-                            ]
+                                    }
+                                ],
+                                'Compliance': { 'Status': 'FAILED' },
+                                'RecordState': 'ACTIVE'
+                            }
                         )
-                        print(response)
                     except Exception as e:
                         print(e)
             else:
@@ -408,6 +395,7 @@ def public_rds_shodan_check():
         print(e)
 
 def public_es_domain_shodan_check():
+    awsAccountId = accountId.get()
     try:
         response = elasticsearch.list_domain_names()
         for domain in response['DomainNames']:
@@ -428,108 +416,102 @@ def public_es_domain_shodan_check():
                         # use Socket to do a DNS lookup and retrieve the IP address
                         esDomainIp = socket.gethostbyname(esDomainEndpoint)
                         # use requests Library to check the Shodan index for your host
-                        r = requests.get(url = shodanUrl + esDomainIp + '?key=' + shodanApiKey)
+                        r = requests.get(url = shodanUrl + esDomainIp + '?key=' + shodan_api_key())
                         data = r.json()
                         shodanOutput = str(data)
                         if shodanOutput == "{'error': 'No information available for that IP.'}":
                             # this is a passing check
                             try:
                                 iso8601time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                                response = securityhub.batch_import_findings(
-                                    Findings=[
-                                        {
-                                            'SchemaVersion': '2018-10-08',
-                                            'Id': esDomainArn + '/' + esDomainEndpoint + '/elasticsearch-shodan-index-check',
-                                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                            'GeneratorId': esDomainArn,
-                                            'AwsAccountId': awsAccountId,
-                                            'Types': ['Effects/Data Exposure'],
-                                            'CreatedAt': iso8601time,
-                                            'UpdatedAt': iso8601time,
-                                            'Severity': { 'Normalized': 40 },
-                                            'Title': '[Shodan.Elasticsearch.1] ElasticSearch Service domains outside of a VPC should be monitored for being indexed by Shodan',
-                                            'Description': 'ElasticSearch Service domain ' + esDomainName + ' has not been indexed by Shodan.',
-                                            'SourceUrl': 'https://www.shodan.io/host/' + esDomainIp,
-                                            'ProductFields': {
-                                                'Product Name': 'ElectricEye'
-                                            },
-                                            'Resources': [
-                                                {
-                                                    'Type': 'AwsElasticsearchDomain',
-                                                    'Id': esDomainArn,
-                                                    'Partition': 'aws',
-                                                    'Region': awsRegion,
-                                                    'Details': {
-                                                        'AwsElasticsearchDomain': {
-                                                            'DomainId': esDomainId,
-                                                            'DomainName': esDomainName,
-                                                            'ElasticsearchVersion': esVersion,
-                                                            'Endpoint': esDomainEndpoint
-                                                        }
+                                findingSink.put(
+                                    {
+                                        'SchemaVersion': '2018-10-08',
+                                        'Id': esDomainArn + '/' + esDomainEndpoint + '/elasticsearch-shodan-index-check',
+                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                        'GeneratorId': esDomainArn,
+                                        'AwsAccountId': awsAccountId,
+                                        'Types': ['Effects/Data Exposure'],
+                                        'CreatedAt': iso8601time,
+                                        'UpdatedAt': iso8601time,
+                                        'Severity': { 'Normalized': 40 },
+                                        'Title': '[Shodan.Elasticsearch.1] ElasticSearch Service domains outside of a VPC should be monitored for being indexed by Shodan',
+                                        'Description': 'ElasticSearch Service domain ' + esDomainName + ' has not been indexed by Shodan.',
+                                        'SourceUrl': 'https://www.shodan.io/host/' + esDomainIp,
+                                        'ProductFields': {
+                                            'Product Name': 'ElectricEye'
+                                        },
+                                        'Resources': [
+                                            {
+                                                'Type': 'AwsElasticsearchDomain',
+                                                'Id': esDomainArn,
+                                                'Partition': 'aws',
+                                                'Region': awsRegion,
+                                                'Details': {
+                                                    'AwsElasticsearchDomain': {
+                                                        'DomainId': esDomainId,
+                                                        'DomainName': esDomainName,
+                                                        'ElasticsearchVersion': esVersion,
+                                                        'Endpoint': esDomainEndpoint
                                                     }
                                                 }
-                                            ],
-                                            'Compliance': { 'Status': 'PASSED' },
-                                            'RecordState': 'ARCHIVED'
-                                        }
-                                    ]
+                                            }
+                                        ],
+                                        'Compliance': { 'Status': 'PASSED' },
+                                        'RecordState': 'ARCHIVED'
+                                    }
                                 )
-                                print(response)
                             except Exception as e:
                                 print(e)
                         else:
                             try:
                                 iso8601time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
-                                response = securityhub.batch_import_findings(
-                                    Findings=[
-                                        {
-                                            'SchemaVersion': '2018-10-08',
-                                            'Id': esDomainArn + '/' + esDomainEndpoint + '/elasticsearch-shodan-index-check',
-                                            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
-                                            'GeneratorId': esDomainArn,
-                                            'AwsAccountId': awsAccountId,
-                                            'Types': ['Effects/Data Exposure'],
-                                            'CreatedAt': iso8601time,
-                                            'UpdatedAt': iso8601time,
-                                            'Severity': { 'Normalized': 40 },
-                                            'Title': '[Shodan.Elasticsearch.1] ElasticSearch Service domains outside of a VPC should be monitored for being indexed by Shodan',
-                                            'Description': 'ElasticSearch Service domain ' + esDomainName + ' has been indexed by Shodan on IP address ' + esDomainIp + ' from endpoint DNS name ' + esDomainEndpoint + '. review the Shodan.io host information in the SourceUrl or ThreatIntelIndicators.SourceUrl fields for information about what ports and services are exposed and then take action to reduce exposure and harden your ES domain.',
-                                            'SourceUrl': 'https://www.shodan.io/host/' + esDomainIp,
-                                            'ProductFields': {
-                                                'Product Name': 'ElectricEye'
+                                findingSink.put(
+                                    {
+                                        'SchemaVersion': '2018-10-08',
+                                        'Id': esDomainArn + '/' + esDomainEndpoint + '/elasticsearch-shodan-index-check',
+                                        'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+                                        'GeneratorId': esDomainArn,
+                                        'AwsAccountId': awsAccountId,
+                                        'Types': ['Effects/Data Exposure'],
+                                        'CreatedAt': iso8601time,
+                                        'UpdatedAt': iso8601time,
+                                        'Severity': { 'Normalized': 40 },
+                                        'Title': '[Shodan.Elasticsearch.1] ElasticSearch Service domains outside of a VPC should be monitored for being indexed by Shodan',
+                                        'Description': 'ElasticSearch Service domain ' + esDomainName + ' has been indexed by Shodan on IP address ' + esDomainIp + ' from endpoint DNS name ' + esDomainEndpoint + '. review the Shodan.io host information in the SourceUrl or ThreatIntelIndicators.SourceUrl fields for information about what ports and services are exposed and then take action to reduce exposure and harden your ES domain.',
+                                        'SourceUrl': 'https://www.shodan.io/host/' + esDomainIp,
+                                        'ProductFields': {
+                                            'Product Name': 'ElectricEye'
+                                        },
+                                        'ThreatIntelIndicators': [
+                                            {
+                                                'Type': 'IPV4_ADDRESS',
+                                                'Category': 'EXPLOIT_SITE',
+                                                'Value': esDomainIp,
+                                                'LastObservedAt': iso8601time,
+                                                'Source': 'Shodan.io',
+                                                'SourceUrl': 'https://www.shodan.io/host/' + esDomainIp
                                             },
-                                            'ThreatIntelIndicators': [
-                                                {
-                                                    'Type': 'IPV4_ADDRESS',
-                                                    'Category': 'EXPLOIT_SITE',
-                                                    'Value': esDomainIp,
-                                                    'LastObservedAt': iso8601time,
-                                                    'Source': 'Shodan.io',
-                                                    'SourceUrl': 'https://www.shodan.io/host/' + esDomainIp
-                                                },
-                                            ],
-                                            'Resources': [
-                                                {
-                                                    'Type': 'AwsElasticsearchDomain',
-                                                    'Id': esDomainArn,
-                                                    'Partition': 'aws',
-                                                    'Region': awsRegion,
-                                                    'Details': {
-                                                        'AwsElasticsearchDomain': {
-                                                            'DomainId': esDomainId,
-                                                            'DomainName': esDomainName,
-                                                            'ElasticsearchVersion': esVersion,
-                                                            'Endpoint': esDomainEndpoint
-                                                        }
+                                        ],
+                                        'Resources': [
+                                            {
+                                                'Type': 'AwsElasticsearchDomain',
+                                                'Id': esDomainArn,
+                                                'Partition': 'aws',
+                                                'Region': awsRegion,
+                                                'Details': {
+                                                    'AwsElasticsearchDomain': {
+                                                        'DomainId': esDomainId,
+                                                        'DomainName': esDomainName,
+                                                        'ElasticsearchVersion': esVersion,
+                                                        'Endpoint': esDomainEndpoint
                                                     }
                                                 }
-                                            ],
-                                            'Compliance': { 'Status': 'FAILED' },
-                                            'RecordState': 'ACTIVE'
-                                        }
-                                    ]
+                                            }
+                                        ],
+                                        'Compliance': { 'Status': 'FAILED' },
+                                        'RecordState': 'ACTIVE'
+                                    }
                                 )
-                                print(response)
                             except Exception as e:
                                 print(e)
                     else:
@@ -545,4 +527,5 @@ def electriceye_shodan_auditor():
     public_rds_shodan_check()
     public_es_domain_shodan_check()
 
-electriceye_shodan_auditor()
\ No newline at end of file
+if __name__ == '__main__':
+    electriceye_shodan_auditor()
\ No newline at end of file
@@ -0,0 +1,111 @@
+# This file is part of ElectricEye.
+
+# ElectricEye is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# ElectricEye is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License along with ElectricEye.
+# If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
+
+import concurrent.futures
+import threading
+import boto3
+import botocore.credentials
+import botocore.session
+# role assumed in every member account, it needs the same read permissions as the ElectricEye task role
+defaultRoleName = 'XA-ElectricEye-Auditor'
+# credentials are refreshed by botocore ahead of expiry, so this only bounds how long one set lives
+defaultSessionSeconds = 3600
+
+class AccountSessionPool(object):
+    # one boto3 session per member account, built on its own botocore session with assumed role
+    # credentials that botocore refreshes before they expire, every region and client in that
+    # account reuses it
+    def __init__(self, baseSession, roleName=defaultRoleName, sessionSeconds=defaultSessionSeconds, maxWorkers=8):
+        self.baseSession = baseSession
+        self.roleName = roleName
+        self.sessionSeconds = sessionSeconds
+        self.maxWorkers = maxWorkers
+        self.sts = baseSession.client('sts')
+        self.callerAccountId = self.sts.get_caller_identity()['Account']
+        self.sessions = {}
+        self.lock = threading.Lock()
+
+    def role_arn(self, accountId):
+        return 'arn:aws:iam::' + accountId + ':role/' + self.roleName
+
+    def assume_role(self, accountId):
+        response = self.sts.assume_role(
+            RoleArn=self.role_arn(accountId),
+            RoleSessionName='ElectricEye-' + accountId,
+            DurationSeconds=self.sessionSeconds
+        )
+        credentials = response['Credentials']
+        return {
+            'access_key': credentials['AccessKeyId'],
+            'secret_key': credentials['SecretAccessKey'],
+            'token': credentials['SessionToken'],
+            'expiry_time': credentials['Expiration'].isoformat()
+        }
+
+    def create_session(self, accountId):
+        if accountId == self.callerAccountId:
+            # the account ElectricEye runs in is scanned with its own credentials
+            return self.baseSession, threading.Lock()
+        credentials = botocore.credentials.RefreshableCredentials.create_from_metadata(
+            metadata=self.assume_role(accountId),
+            refresh_using=lambda: self.assume_role(accountId),
+            method='sts-assume-role'
+        )
+        botocoreSession = botocore.session.get_session()
+        botocoreSession._credentials = credentials
+        return boto3.session.Session(botocore_session=botocoreSession), threading.Lock()
+
+    def session(self, accountId):
+        # returns (session, sessionLock), the lock serializes client creation on that session
+        with self.lock:
+            if accountId in self.sessions:
+                return self.sessions[accountId]
+        accountSession = self.create_session(accountId)
+        with self.lock:
+            return self.sessions.setdefault(accountId, accountSession)
+
+    def open_sessions(self, accountIds):
+        # assume the role in every account up front with a bounded pool, accounts that can't be
+        # assumed are reported and left out of the run instead of failing every auditor in them
+        opened = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.maxWorkers) as executor:
+            futures = {executor.submit(self.session, accountId): accountId for accountId in accountIds}
+            for future in concurrent.futures.as_completed(futures):
+                accountId = futures[future]
+                try:
+                    opened[accountId] = future.result()
+                except Exception as e:
+                    print('Could not assume ' + self.role_arn(accountId) + ': ' + str(e))
+        return [(accountId, opened[accountId]) for accountId in accountIds if accountId in opened]
+
+def organization_accounts(session):
+    # every active account in the organization, run from the management or a delegated admin account
+    organizations = session.client('organizations')
+    accountIds = []
+    for page in organizations.get_paginator('list_accounts').paginate():
+        for account in page['Accounts']:
+            if account['Status'] == 'ACTIVE':
+                accountIds.append(str(account['Id']))
+    return accountIds
+
+def read_accounts_file(path):
+    # one account ID per line, blank lines and lines starting with # are ignored
+    accountIds = []
+    with open(path) as accountsFile:
+        for line in accountsFile:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                accountIds.append(line)
+    return accountIds
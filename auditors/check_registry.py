@@ -0,0 +1,204 @@
+# This file is part of ElectricEye.
+
+# ElectricEye is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# ElectricEye is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License along with ElectricEye.
+# If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
+
+import datetime
+from run_metrics import default_metrics
+from state_store import config_hash, default_state_store
+# default ASFF finding types for a best practice check
+bestPracticeTypes = ['Software and Configuration Checks/AWS Security Best Practices']
+
+class ResourceCollection(object):
+    # a list of resources that is fetched once and shared by every check registered against it
+    def __init__(self, name, loader, describer, detailer=None):
+        self.name = name
+        self.loader = loader
+        self.describer = describer
+        self.detailer = detailer
+        self.checks = []
+
+class Check(object):
+    # a predicate plus the ASFF metadata needed to turn its result into a finding,
+    # the predicate returns True (PASSED), False (FAILED) or None (does not apply)
+    def __init__(
+        self, predicate, findingId, title, severity, failedDescription, passedDescription,
+        remediationText, remediationUrl, types=None, passedSeverity=0, threatIntelIndicators=None,
+        timeBased=False, details=None
+    ):
+        self.name = predicate.__name__
+        self.predicate = predicate
+        self.findingId = findingId
+        self.title = title
+        self.severity = severity
+        self.failedDescription = failedDescription
+        self.passedDescription = passedDescription
+        self.remediationText = remediationText
+        self.remediationUrl = remediationUrl
+        self.types = types or bestPracticeTypes
+        self.passedSeverity = passedSeverity
+        self.threatIntelIndicators = threatIntelIndicators
+        # checks that depend on the current time (e.g. age) are evaluated even if the resource is unchanged
+        self.timeBased = timeBased
+        # maps the item to extra ASFF details for this check only, merged into the collection's resource details
+        self.details = details
+
+class CheckRegistry(object):
+    # checks are declared against a resource collection, run() walks every collection once
+    # and evaluates every check against each resource in that single pass
+    def __init__(self):
+        self.collections = {}
+
+    def collection(self, name, describer, detailer=None):
+        # decorator for the loader of a collection, the describer maps one item to its
+        # ASFF resource (Type, Id, Details) plus any fields used in the descriptions,
+        # per item API calls belong in the detailer so one failed item doesn't end the collection
+        def register(loader):
+            self.collections[name] = ResourceCollection(name, loader, describer, detailer)
+            return loader
+        return register
+
+    def check(self, collectionName, **metadata):
+        # decorator for a check predicate, see Check for the metadata it takes
+        def register(predicate):
+            self.collections[collectionName].checks.append(Check(predicate, **metadata))
+            return predicate
+        return register
+
+    def run(self, findingSink, awsRegion, awsAccountId):
+        # in incremental mode unchanged resources are not evaluated again and findings are only
+        # sent when their compliance status changed since the last run
+        stateStore = default_state_store()
+        stateScope = awsAccountId + '/' + awsRegion
+        for collection in self.collections.values():
+            for item in self.load_items(collection):
+                try:
+                    resource = collection.describer(item)
+                    itemHash = config_hash(item) if stateStore is not None else None
+                except Exception as e:
+                    print(e)
+                    continue
+                for check in collection.checks:
+                    try:
+                        with default_metrics().measuring(check.name):
+                            finding = self.evaluate_incremental(
+                                stateStore, stateScope, itemHash, check, item, resource, awsRegion, awsAccountId
+                            )
+                            if finding is not None:
+                                findingSink.put(finding)
+                    except Exception as e:
+                        print(e)
+
+    def load_items(self, collection):
+        # loaders are often generators, so the time and API calls spent producing each
+        # item are charged to the collection rather than to the checks, measuring() counts
+        # an exception raised by the loader or the detailer as an error of the collection
+        metricName = collection.name + ' collection'
+        try:
+            with default_metrics().measuring(metricName):
+                items = iter(collection.loader())
+            while True:
+                with default_metrics().measuring(metricName):
+                    item = next(items, None)
+                if item is None:
+                    return
+                if collection.detailer is not None:
+                    try:
+                        with default_metrics().measuring(metricName):
+                            item = collection.detailer(item)
+                    except Exception as e:
+                        # e.g. the resource was deleted during the scan, the rest are still evaluated
+                        print(collection.name + ' item skipped: ' + str(e))
+                        continue
+                yield item
+        except Exception as e:
+            print(collection.name + ' collection stopped early: ' + str(e))
+
+    def evaluate_incremental(self, stateStore, stateScope, itemHash, check, item, resource, awsRegion, awsAccountId):
+        if stateStore is None:
+            return self.evaluate(check, item, resource, awsRegion, awsAccountId)
+        findingId = resource['Id'] + '/' + check.findingId
+        previousState = stateStore.resource_state(stateScope, findingId)
+        canSkip = previousState is not None and not stateStore.fullRefresh
+        if canSkip and previousState[0] == itemHash and not check.timeBased:
+            stateStore.count('UnchangedResources')
+            return None
+        finding = self.evaluate(check, item, resource, awsRegion, awsAccountId)
+        if finding is None:
+            return None
+        stateStore.count('Evaluated')
+        status = finding['Compliance']['Status']
+        if canSkip and previousState[1] == status:
+            # the recorded status was only written once its finding was imported
+            stateStore.record_resource_state(stateScope, findingId, itemHash, status)
+            stateStore.count('UnchangedStatus')
+            return None
+        # recorded by the sink once Security Hub accepts the finding
+        stateStore.defer_resource_state(finding, stateScope, findingId, itemHash, status)
+        return finding
+
+    def evaluate(self, check, item, resource, awsRegion, awsAccountId):
+        passed = check.predicate(item)
+        if passed is None:
+            return None
+        resourceArn = resource['Id']
+        resourceDetails = resource['Details']
+        if check.details is not None:
+            resourceDetails = merge_details(resourceDetails, check.details(item))
+        iso8601Time = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+        finding = {
+            'SchemaVersion': '2018-10-08',
+            'Id': resourceArn + '/' + check.findingId,
+            'ProductArn': 'arn:aws:securityhub:' + awsRegion + ':' + awsAccountId + ':product/' + awsAccountId + '/default',
+            'GeneratorId': resourceArn,
+            'AwsAccountId': awsAccountId,
+            'Types': check.types,
+            'FirstObservedAt': iso8601Time,
+            'CreatedAt': iso8601Time,
+            'UpdatedAt': iso8601Time,
+            'Severity': { 'Normalized': check.passedSeverity if passed else check.severity },
+            'Confidence': 99,
+            'Title': check.title,
+            'Description': (check.passedDescription if passed else check.failedDescription).format(**resource['Fields']),
+            'Remediation': {
+                'Recommendation': {
+                    'Text': check.remediationText,
+                    'Url': check.remediationUrl
+                }
+            },
+            'ProductFields': { 'Product Name': 'ElectricEye' },
+            'Resources': [
+                {
+                    'Type': resource['Type'],
+                    'Id': resourceArn,
+                    'Partition': 'aws',
+                    'Region': awsRegion,
+                    'Details': resourceDetails
+                }
+            ],
+            'Compliance': { 'Status': 'PASSED' if passed else 'FAILED' },
+            'RecordState': 'ARCHIVED' if passed else 'ACTIVE'
+        }
+        if check.threatIntelIndicators:
+            finding['ThreatIntelIndicators'] = check.threatIntelIndicators
+        return finding
+
+def merge_details(resourceDetails, checkDetails):
+    # e.g. {'AwsRdsDbInstance': {'PubliclyAccessible': True}} adds one field to the shared AwsRdsDbInstance details
+    merged = dict(resourceDetails)
+    for key, value in checkDetails.items():
+        if isinstance(merged.get(key), dict) and isinstance(value, dict):
+            merged[key] = dict(merged[key], **value)
+        else:
+            merged[key] = value
+    return merged
@@ -0,0 +1,166 @@
+# This file is part of ElectricEye.
+
+# ElectricEye is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# ElectricEye is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License along with ElectricEye.
+# If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
+
+import collections
+import os
+import threading
+import botocore.config
+from rate_limiter import TokenBucket
+from run_metrics import default_metrics
+# attempts per API call including the first one, adaptive mode backs off with full jitter
+# between attempts and slows the client down on its own when it gets throttled
+defaultMaxAttempts = int(os.environ.get('ELECTRICEYE_MAX_ATTEMPTS', '10'))
+# requests per second and burst per service in each scope, control planes with low quotas get less
+defaultRateLimit = (20, 40)
+serviceRateLimits = {
+    'apigateway': (5, 10),
+    'cloudformation': (5, 10),
+    'cognito-idp': (5, 10),
+    'organizations': (2, 4),
+    'securityhub': (10, 20),
+    'shield': (2, 4),
+    'sts': (10, 20)
+}
+# error codes counted as throttles
+throttleErrorCodes = (
+    'Throttling',
+    'ThrottlingException',
+    'ThrottledException',
+    'TooManyRequestsException',
+    'RequestLimitExceeded',
+    'RequestThrottled',
+    'RequestThrottledException',
+    'SlowDown',
+    'PriorRequestNotComplete',
+    'ProvisionedThroughputExceededException',
+    'LimitExceededException'
+)
+
+def parse_rate_limits(value):
+    # "apigateway=5,ec2=50:100" sets requests per second and an optional burst per service
+    rateLimits = {}
+    for entry in value.split(','):
+        if '=' not in entry:
+            continue
+        serviceName, limit = entry.strip().split('=', 1)
+        rate, _, burst = limit.partition(':')
+        try:
+            rate = float(rate)
+            burst = float(burst) if burst else max(1.0, rate * 2)
+        except ValueError:
+            raise ValueError('ELECTRICEYE_RATE_LIMITS: ' + entry.strip() + ' is not service=requests-per-second[:burst]')
+        # a zero rate never refills the bucket and a burst below one never holds a whole token
+        if rate <= 0 or burst < 1:
+            raise ValueError('ELECTRICEYE_RATE_LIMITS: ' + entry.strip() + ' needs a rate above 0 and a burst of at least 1')
+        rateLimits[serviceName] = (rate, burst)
+    return rateLimits
+
+class ClientGovernor(object):
+    # builds every boto3 client used in a run with adaptive retries, holds each (scope, service)
+    # to a token bucket and counts calls, retries and throttles per operation
+    def __init__(self, maxAttempts=defaultMaxAttempts, rateLimits=None):
+        self.config = botocore.config.Config(retries={'mode': 'adaptive', 'max_attempts': maxAttempts})
+        self.rateLimits = dict(serviceRateLimits)
+        self.rateLimits.update(rateLimits or {})
+        self.buckets = {}
+        self.counters = collections.Counter()
+        # extra botocore event handlers registered (after the governor's own) on every client built from now on
+        self.eventHandlers = []
+        self.lock = threading.Lock()
+
+    def register(self, eventName, handler):
+        # e.g. the benchmark harness answers operations its local endpoint does not implement
+        with self.lock:
+            self.eventHandlers.append((eventName, handler))
+
+    def bucket(self, bucketKey, serviceName):
+        with self.lock:
+            if (bucketKey, serviceName) not in self.buckets:
+                rate, burst = self.rateLimits.get(serviceName, defaultRateLimit)
+                self.buckets[(bucketKey, serviceName)] = TokenBucket(rate, burst)
+            return self.buckets[(bucketKey, serviceName)]
+
+    def client_config(self, config=None):
+        if config is None:
+            return self.config
+        # settings passed by the caller win over the defaults
+        return self.config.merge(config)
+
+    def client(self, session, serviceName, bucketKey=None, **kwargs):
+        kwargs['config'] = self.client_config(kwargs.get('config'))
+        client = session.client(serviceName, **kwargs)
+        self.instrument(client.meta.events, self.bucket(bucketKey, serviceName))
+        return client
+
+    def resource(self, session, serviceName, bucketKey=None, **kwargs):
+        kwargs['config'] = self.client_config(kwargs.get('config'))
+        resource = session.resource(serviceName, **kwargs)
+        self.instrument(resource.meta.client.meta.events, self.bucket(bucketKey, serviceName))
+        return resource
+
+    def instrument(self, events, bucket):
+        # before-call fires once per API call, before-send once per attempt (so retries wait on the
+        # bucket too) and needs-retry sees the response of every attempt
+        def before_call(event_name, **kwargs):
+            self.count(event_name, 'Calls')
+        def before_send(event_name, **kwargs):
+            bucket.acquire()
+            self.count(event_name, 'Attempts')
+        def needs_retry(event_name, response=None, **kwargs):
+            if response is not None:
+                errorCode = response[1].get('Error', {}).get('Code')
+                if errorCode in throttleErrorCodes:
+                    self.count(event_name, 'Throttles')
+            return None
+        events.register('before-call', before_call)
+        events.register('before-send', before_send)
+        events.register('needs-retry', needs_retry)
+        default_metrics().instrument(events)
+        with self.lock:
+            eventHandlers = list(self.eventHandlers)
+        for eventName, handler in eventHandlers:
+            events.register_last(eventName, handler)
+
+    def count(self, eventName, counterName):
+        # event names look like before-send.ec2.DescribeInstances
+        parts = eventName.split('.')
+        if len(parts) < 3:
+            return
+        with self.lock:
+            self.counters[(parts[1], parts[2], counterName)] += 1
+
+    def stats(self):
+        # one entry per operation, retries are the attempts after the first one of each call
+        operations = {}
+        with self.lock:
+            for (serviceName, operationName, counterName), value in self.counters.items():
+                operation = operations.setdefault(
+                    (serviceName, operationName),
+                    {'Service': serviceName, 'Operation': operationName, 'Calls': 0, 'Attempts': 0, 'Throttles': 0}
+                )
+                operation[counterName] = value
+        for operation in operations.values():
+            operation['Retries'] = max(0, operation.pop('Attempts') - operation['Calls'])
+        return list(operations.values())
+
+defaultGovernor = None
+defaultGovernorLock = threading.Lock()
+
+def default_governor():
+    global defaultGovernor
+    with defaultGovernorLock:
+        if defaultGovernor is None:
+            defaultGovernor = ClientGovernor(rateLimits=parse_rate_limits(os.environ.get('ELECTRICEYE_RATE_LIMITS', '')))
+    return defaultGovernor
@@ -0,0 +1,347 @@
+# This file is part of ElectricEye.
+
+# ElectricEye is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# ElectricEye is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License along with ElectricEye.
+# If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
+
+import argparse
+import collections
+import concurrent.futures
+import datetime
+import glob
+import os
+import sys
+import threading
+import time
+import boto3
+# auditors are downloaded next to this runner by the ElectricEye task
+auditorDir = os.path.dirname(os.path.abspath(__file__))
+if auditorDir not in sys.path:
+    sys.path.insert(0, auditorDir)
+from finding_sink import default_sink
+from resource_inventory import default_inventory
+from client_governor import default_governor
+from run_metrics import default_metrics, print_emf, write_json, write_prometheus
+from account_sessions import AccountSessionPool, defaultRoleName, organization_accounts, read_accounts_file
+from scan_scope import ScanScope, enabled_regions, import_auditor, using_scope
+from state_store import open_state_store
+# default size of the auditor worker pool, can be overridden on the task definition
+defaultMaxWorkers = int(os.environ.get('ELECTRICEYE_MAX_WORKERS', '8'))
+# default number of auditors that may run against one region at the same time
+defaultMaxWorkersPerRegion = int(os.environ.get('ELECTRICEYE_MAX_WORKERS_PER_REGION', '4'))
+
+def discover_auditors(auditorNames=None):
+    # every auditor follows the <Service>_Auditor.py naming convention
+    moduleNames = []
+    for auditorPath in sorted(glob.glob(os.path.join(auditorDir, '*_Auditor.py'))):
+        moduleName = os.path.splitext(os.path.basename(auditorPath))[0]
+        if auditorNames and moduleName not in auditorNames:
+            continue
+        moduleNames.append(moduleName)
+    return moduleNames
+
+def find_auditor_function(module):
+    # the *_auditor() function at the bottom of each module runs all of its checks
+    for attrName, attr in vars(module).items():
+        if not callable(attr) or getattr(attr, '__module__', None) != module.__name__:
+            continue
+        if attrName.endswith('_auditor') or attrName.endswith('_audit'):
+            return attr
+    return None
+
+def build_scopes(regions=None, accountIds=None, roleName=defaultRoleName):
+    # with no regions the run covers the task's own region, 'all' expands to every enabled region
+    session = boto3.session.Session()
+    if regions == ['all']:
+        regions = enabled_regions(session)
+    elif not regions:
+        regions = [os.environ['AWS_REGION']]
+    if not accountIds:
+        # every region shares one session (and its credentials) but gets its own clients
+        sessionLock = threading.Lock()
+        return [ScanScope(session, region, sessionLock=sessionLock) for region in regions]
+    # one session per member account is shared by every region scanned in that account
+    scopes = []
+    for accountId, (accountSession, sessionLock) in AccountSessionPool(session, roleName).open_sessions(accountIds):
+        for region in regions:
+            scopes.append(ScanScope(accountSession, region, accountId=accountId, sessionLock=sessionLock))
+    return scopes
+
+def resolve_accounts(accounts=None, accountsFile=None):
+    # 'organization' lists every active account in the organization
+    if accountsFile:
+        return read_accounts_file(accountsFile)
+    if accounts == ['organization']:
+        return organization_accounts(boto3.session.Session())
+    return accounts or []
+
+def load_auditors(scopes, moduleNames):
+    # import every auditor once per scope, a failed import only removes that auditor from the run
+    auditors = []
+    results = []
+    for scope in scopes:
+        for moduleName in moduleNames:
+            startTime = time.perf_counter()
+            try:
+                with default_metrics().measuring('<import>', moduleName, scope.label()):
+                    module = import_auditor(scope, moduleName, os.path.join(auditorDir, moduleName + '.py'))
+            except Exception as e:
+                print(moduleName + ' failed to import in ' + scope.label() + ': ' + str(e))
+                results.append(auditor_result(moduleName, scope, 'IMPORT_FAILED', startTime))
+                continue
+            # time every *_check function of this copy of the module on its own
+            default_metrics().instrument_module(module)
+            auditorFunction = find_auditor_function(module)
+            if auditorFunction is None:
+                # e.g. Shield Advanced only defines its checks in us-east-1
+                print(moduleName + ' has no auditor function to run in ' + scope.label() + ', skipping')
+                results.append(auditor_result(moduleName, scope, 'SKIPPED', startTime))
+                continue
+            auditors.append((scope, moduleName, auditorFunction, time.perf_counter() - startTime))
+    return auditors, results
+
+def auditor_result(moduleName, scope, status, startTime, importTime=0.0):
+    return {
+        'Auditor': moduleName,
+        'Scope': scope.label(),
+        'Status': status,
+        'ImportSeconds': round(importTime, 3),
+        'WallSeconds': round(time.perf_counter() - startTime, 3)
+    }
+
+def run_auditor(scope, moduleName, auditorFunction, importTime):
+    startTime = time.perf_counter()
+    try:
+        with using_scope(scope), default_metrics().measuring('<auditor>', moduleName, scope.label()):
+            auditorFunction()
+        status = 'SUCCEEDED'
+    except Exception as e:
+        print(moduleName + ' failed in ' + scope.label() + ': ' + str(e))
+        status = 'FAILED'
+    return auditor_result(moduleName, scope, status, startTime, importTime)
+
+def run_auditors(auditors, maxWorkers=defaultMaxWorkers, maxWorkersPerScope=defaultMaxWorkersPerRegion):
+    # auditors are handed to the pool round robin across scopes, a scope never has more than
+    # maxWorkersPerScope auditors in flight so one region can't soak up the whole pool
+    pending = collections.OrderedDict()
+    for auditor in auditors:
+        pending.setdefault(auditor[0].label(), collections.deque()).append(auditor)
+    inFlight = collections.Counter()
+    running = {}
+    results = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+        while pending or running:
+            submitted = True
+            while submitted and len(running) < maxWorkers:
+                submitted = False
+                for scopeLabel in list(pending):
+                    if len(running) >= maxWorkers:
+                        break
+                    if inFlight[scopeLabel] >= maxWorkersPerScope:
+                        continue
+                    future = executor.submit(run_auditor, *pending[scopeLabel].popleft())
+                    running[future] = scopeLabel
+                    inFlight[scopeLabel] += 1
+                    submitted = True
+                    if not pending[scopeLabel]:
+                        del pending[scopeLabel]
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                inFlight[running.pop(future)] -= 1
+                result = future.result()
+                print(result['Auditor'] + ' ' + result['Status'] + ' in ' + result['Scope'] + ' in ' + str(result['WallSeconds']) + ' seconds')
+                results.append(result)
+    return results
+
+def flush_findings(scopes):
+    # send whatever is left in each scope's finding buffer and add up the import stats
+    totals = collections.Counter()
+    for scope in scopes:
+        with using_scope(scope):
+            findingSink = default_sink()
+        findingSink.flush()
+        totals.update(findingSink.stats())
+    return totals
+
+def inventory_stats(scopes):
+    callStats = []
+    for scope in scopes:
+        with using_scope(scope):
+            scopeStats = default_inventory().stats()
+        for call in scopeStats:
+            call['Scope'] = scope.label()
+            callStats.append(call)
+    return callStats
+
+def print_summary(results, totalTime):
+    print('Auditor wall time summary (slowest first)')
+    for result in sorted(results, key=lambda r: r['WallSeconds'], reverse=True):
+        print(
+            '{:<45} {:<28} {:<14} import {:>8.3f}s run {:>8.3f}s'.format(
+                result['Auditor'], result['Scope'], result['Status'], result['ImportSeconds'], result['WallSeconds']
+            )
+        )
+    print('All auditors finished in ' + str(round(totalTime, 3)) + ' seconds')
+
+def write_metrics(path, metricsFormat, runSummary):
+    # the JSON summary is always written, Prometheus text goes next to it as a .prom file
+    try:
+        write_json(path, runSummary)
+        if metricsFormat == 'prometheus':
+            write_prometheus(os.path.splitext(path)[0] + '.prom', runSummary)
+    except Exception as e:
+        print(e)
+    if metricsFormat == 'emf':
+        print_emf(runSummary)
+
+def print_api_stats(operationStats):
+    print('AWS API calls (most throttled first)')
+    for operation in sorted(operationStats, key=lambda o: (o['Throttles'], o['Retries'], o['Calls']), reverse=True):
+        print(
+            '{:<16} {:<40} {:>7} calls {:>6} retries {:>6} throttles'.format(
+                operation['Service'], operation['Operation'], operation['Calls'], operation['Retries'], operation['Throttles']
+            )
+        )
+
+def print_inventory_stats(callStats):
+    print('Shared inventory calls (slowest first)')
+    for call in sorted(callStats, key=lambda c: c['Seconds'], reverse=True):
+        print(
+            '{:<28} {:<16} {:<32} {:>5} pages {:>7} items {:>8.3f}s'.format(
+                call['Scope'], call['Service'], call['Operation'], call['Pages'], call['Items'], call['Seconds']
+            )
+        )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run ElectricEye auditors concurrently in a single process')
+    parser.add_argument(
+        '--auditors',
+        nargs='*',
+        help='Auditor module names to run (e.g. Amazon_RDS_Auditor), defaults to every *_Auditor.py file'
+    )
+    parser.add_argument(
+        '--regions',
+        nargs='*',
+        default=os.environ.get('ELECTRICEYE_REGIONS', '').split(),
+        help='Regions to scan at the same time, or "all" for every enabled region, defaults to AWS_REGION'
+    )
+    parser.add_argument(
+        '--accounts',
+        nargs='*',
+        default=os.environ.get('ELECTRICEYE_ACCOUNTS', '').split(),
+        help='Member account IDs to scan by assuming --role-name in each, or "organization" for every active account'
+    )
+    parser.add_argument(
+        '--accounts-file',
+        default=os.environ.get('ELECTRICEYE_ACCOUNTS_FILE'),
+        help='File with one member account ID per line to scan instead of --accounts'
+    )
+    parser.add_argument(
+        '--role-name',
+        default=os.environ.get('ELECTRICEYE_ROLE_NAME', defaultRoleName),
+        help='IAM role assumed in every member account'
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        default=os.environ.get('ELECTRICEYE_INCREMENTAL', 'false').lower() == 'true',
+        help='Only re-evaluate resources that changed since the last run and only send findings whose status changed'
+    )
+    parser.add_argument(
+        '--state-path',
+        default=os.environ.get('ELECTRICEYE_STATE_PATH', os.path.join(auditorDir, 'electriceye-state.db')),
+        help='SQLite file that keeps the state of the last run for --incremental'
+    )
+    parser.add_argument(
+        '--full-refresh-hours',
+        type=float,
+        default=float(os.environ.get('ELECTRICEYE_FULL_REFRESH_HOURS', '168')),
+        help='With --incremental, evaluate and send every finding again once this many hours passed since the last full refresh'
+    )
+    parser.add_argument(
+        '--metrics-path',
+        default=os.environ.get('ELECTRICEYE_METRICS_PATH', os.path.join(auditorDir, 'electriceye-metrics.json')),
+        help='Where to write the JSON summary of the run (per check timing, API calls, findings and errors)'
+    )
+    parser.add_argument(
+        '--metrics-format',
+        choices=['json', 'prometheus', 'emf'],
+        default=os.environ.get('ELECTRICEYE_METRICS_FORMAT', 'json'),
+        help='Also write the metrics as Prometheus text next to the JSON summary or print them as CloudWatch EMF'
+    )
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=defaultMaxWorkers,
+        help='Maximum number of auditors to run at the same time'
+    )
+    parser.add_argument(
+        '--max-workers-per-region',
+        type=int,
+        default=defaultMaxWorkersPerRegion,
+        help='Maximum number of auditors to run against a single region at the same time'
+    )
+    args = parser.parse_args(argv)
+    try:
+        # ELECTRICEYE_RATE_LIMITS is checked before any auditor runs instead of on the first client
+        default_governor()
+    except ValueError as e:
+        parser.error(str(e))
+
+    startedAt = datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+    startTime = time.perf_counter()
+    stateStore = open_state_store(args.state_path) if args.incremental else None
+    if stateStore is not None and stateStore.begin_run(args.full_refresh_hours * 3600):
+        print('Incremental: running a full refresh, every finding will be sent')
+    scopes = build_scopes(args.regions, resolve_accounts(args.accounts, args.accounts_file), args.role_name)
+    auditors, results = load_auditors(scopes, discover_auditors(args.auditors))
+    results.extend(run_auditors(auditors, max(1, args.max_workers), max(1, args.max_workers_per_region)))
+    sinkStats = flush_findings(scopes)
+    print(
+        'Security Hub: ' + str(sinkStats['SuccessCount']) + ' findings imported, ' +
+        str(sinkStats['FailedCount']) + ' failed, in ' + str(sinkStats['ImportCalls']) + ' BatchImportFindings calls, ' +
+        str(sinkStats['UnchangedCount']) + ' unchanged findings not sent'
+    )
+    stateStats = None
+    if stateStore is not None:
+        stateStats = stateStore.stats()
+        stateStore.close()
+        print(
+            'Incremental: ' + str(stateStats.get('UnchangedResources', 0)) + ' checks skipped for unchanged resources, ' +
+            str(stateStats.get('Evaluated', 0)) + ' evaluated, ' +
+            str(stateStats.get('UnchangedStatus', 0)) + ' findings not sent because their status did not change'
+        )
+    callStats = inventory_stats(scopes)
+    operationStats = default_governor().stats()
+    totalTime = time.perf_counter() - startTime
+    print_inventory_stats(callStats)
+    print_api_stats(operationStats)
+    print_summary(results, totalTime)
+    write_metrics(
+        args.metrics_path,
+        args.metrics_format,
+        {
+            'StartedAt': startedAt,
+            'TotalSeconds': round(totalTime, 3),
+            'SecurityHub': dict(sinkStats),
+            'Incremental': stateStats,
+            'Auditors': results,
+            'Checks': default_metrics().summary(),
+            'ApiOperations': operationStats,
+            'InventoryCalls': callStats
+        }
+    )
+    failed = [r for r in results if r['Status'] in ('FAILED', 'IMPORT_FAILED')]
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+# This file is part of ElectricEye.
+
+# ElectricEye is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# ElectricEye is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License along with ElectricEye.
+# If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
+
+import atexit
+import json
+import random
+import threading
+import time
+from botocore.exceptions import ClientError
+from run_metrics import default_metrics
+from scan_scope import active_scope, lazy_client
+from state_store import default_state_store
+# BatchImportFindings accepts up to 100 findings and a 6 MB request body per call
+maxBatchFindings = 100
+maxBatchBytes = 6 * 1024 * 1024
+# room left in each request for the {"Findings": [...]} envelope
+requestEnvelopeBytes = 1024
+# error codes that are worth backing off and retrying
+throttleErrorCodes = (
+    'ThrottlingException',
+    'TooManyRequestsException',
+    'LimitExceededException',
+    'RequestLimitExceeded',
+    'InternalException',
+    'ServiceUnavailable'
+)
+# failed findings with these codes will be rejected again if they are resent
+nonRetryableErrorCodes = ('InvalidInput', 'AccessDeniedException')
+
+class FindingSink(object):
+    # buffers ASFF findings and sends them to Security Hub in full batches
+    def __init__(self, securityhub, batchSize=maxBatchFindings, maxRetries=5, baseDelay=0.5, maxDelay=20.0, stateStore=None):
+        self.securityhub = securityhub
+        # with a state store, findings identical to the last imported version are not sent again
+        self.stateStore = stateStore
+        self.batchSize = min(batchSize, maxBatchFindings)
+        self.maxRetries = maxRetries
+        self.baseDelay = baseDelay
+        self.maxDelay = maxDelay
+        self.lock = threading.Lock()
+        self.buffer = []
+        self.bufferBytes = 0
+        self.importCalls = 0
+        self.successCount = 0
+        self.failedCount = 0
+        self.unchangedCount = 0
+
+    def put(self, finding):
+        default_metrics().add(findings=1)
+        if self.stateStore is not None and not self.stateStore.fullRefresh and not self.stateStore.finding_changed(finding):
+            # Security Hub already has this exact finding
+            self.stateStore.release_resource_states([finding])
+            self.record(unchanged=1)
+            return
+        findingBytes = len(json.dumps(finding, default=str))
+        batches = []
+        with self.lock:
+            if self.buffer and self.bufferBytes + findingBytes + requestEnvelopeBytes > maxBatchBytes:
+                batches.append(self.swap_buffer())
+            self.buffer.append(finding)
+            self.bufferBytes += findingBytes + 1
+            if len(self.buffer) >= self.batchSize:
+                batches.append(self.swap_buffer())
+        # network calls happen outside of the lock so other auditors can keep buffering
+        for batch in batches:
+            self.import_batch(batch)
+
+    def flush(self):
+        with self.lock:
+            batch = self.swap_buffer()
+        if batch:
+            self.import_batch(batch)
+
+    def swap_buffer(self):
+        batch = self.buffer
+        self.buffer = []
+        self.bufferBytes = 0
+        return batch
+
+    def backoff(self, attempt):
+        # full jitter exponential backoff
+        time.sleep(random.uniform(0, min(self.maxDelay, self.baseDelay * (2 ** attempt))))
+
+    def import_batch(self, findings):
+        pending = findings
+        attempt = 0
+        while pending:
+            try:
+                self.record(importCalls=1)
+                response = self.securityhub.batch_import_findings(Findings=pending)
+            except ClientError as e:
+                errorCode = e.response['Error']['Code']
+                if errorCode in throttleErrorCodes and attempt < self.maxRetries:
+                    self.backoff(attempt)
+                    attempt += 1
+                    continue
+                print(e)
+                self.give_up(pending)
+                return
+            except Exception as e:
+                print(e)
+                self.give_up(pending)
+                return
+            self.record(success=response['SuccessCount'])
+            failedFindings = response['FailedFindings']
+            if self.stateStore is not None:
+                failedIds = set(failed['Id'] for failed in failedFindings)
+                self.stateStore.record_findings([finding for finding in pending if finding['Id'] not in failedIds])
+            if not failedFindings:
+                return
+            retryIds = set()
+            rejectedIds = set()
+            for failed in failedFindings:
+                print('Finding ' + failed['Id'] + ' failed to import: ' + failed['ErrorCode'] + ' ' + failed['ErrorMessage'])
+                if failed['ErrorCode'] in nonRetryableErrorCodes:
+                    rejectedIds.add(failed['Id'])
+                else:
+                    retryIds.add(failed['Id'])
+            self.give_up([finding for finding in pending if finding['Id'] in rejectedIds])
+            pending = [finding for finding in pending if finding['Id'] in retryIds]
+            if pending and attempt >= self.maxRetries:
+                self.give_up(pending)
+                return
+            if pending:
+                self.backoff(attempt)
+                attempt += 1
+
+    def give_up(self, findings):
+        # findings that were not imported leave no resource state behind, the next run sends them again
+        if self.stateStore is not None:
+            self.stateStore.discard_resource_states(findings)
+        self.record(failed=len(findings))
+
+    def record(self, importCalls=0, success=0, failed=0, unchanged=0):
+        with self.lock:
+            self.importCalls += importCalls
+            self.successCount += success
+            self.failedCount += failed
+            self.unchangedCount += unchanged
+
+    def stats(self):
+        return {
+            'ImportCalls': self.importCalls,
+            'SuccessCount': self.successCount,
+            'FailedCount': self.failedCount,
+            'UnchangedCount': self.unchangedCount
+        }
+
+defaultSink = None
+defaultSinkLock = threading.Lock()
+
+def default_sink():
+    # one sink is shared by every auditor running in this process, or in the active scope
+    # when the runner scans several regions so findings are imported into their own region
+    global defaultSink
+    scope = active_scope()
+    if scope is not None:
+        return scope.get_shared('findingSink', lambda: FindingSink(lazy_client('securityhub'), stateStore=default_state_store()))
+    with defaultSinkLock:
+        if defaultSink is None:
+            defaultSink = FindingSink(lazy_client('securityhub'), stateStore=default_state_store())
+            atexit.register(defaultSink.flush)
+    return defaultSink
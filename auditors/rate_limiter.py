@@ -0,0 +1,63 @@
+# This file is part of ElectricEye.
+
+# ElectricEye is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# ElectricEye is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License along with ElectricEye.
+# If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
+
+import concurrent.futures
+import threading
+import time
+from run_metrics import default_metrics
+
+class TokenBucket(object):
+    # allows `rate` calls per second on average with bursts of up to `burst` calls,
+    # acquire() blocks the calling thread until a token is available
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.lastRefill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.lastRefill) * self.rate)
+                self.lastRefill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                waitSeconds = (1 - self.tokens) / self.rate
+            time.sleep(waitSeconds)
+
+def map_rate_limited(function, keys, rate, burst, maxWorkers=4):
+    # calls function(key) for every key from a small thread pool without going over the
+    # bucket's rate, returns {key: result} and leaves out keys whose call failed, with no rate
+    # the pool only bounds concurrency and the calls are held to the client governor's limits
+    bucket = TokenBucket(rate, burst) if rate is not None else None
+    # calls made by the pool are charged to whatever the calling thread is measuring
+    callerKey = default_metrics().current()
+    def call(key):
+        if bucket is not None:
+            bucket.acquire()
+        with default_metrics().charging(callerKey):
+            return function(key)
+    results = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+        futures = {executor.submit(call, key): key for key in keys}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                print(e)
+    return results
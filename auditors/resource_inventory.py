@@ -0,0 +1,178 @@
+# This file is part of ElectricEye.
+
+# ElectricEye is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# ElectricEye is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License along with ElectricEye.
+# If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
+
+import json
+import threading
+import time
+import boto3
+from scan_scope import active_scope
+
+class ResourceInventory(object):
+    # fetches each (service, operation, params) once per run, following every page,
+    # and serves the result to every auditor from memory
+    def __init__(self, clientFactory=boto3.client):
+        self.clientFactory = clientFactory
+        self.clients = {}
+        self.cache = {}
+        self.keyLocks = {}
+        self.lock = threading.Lock()
+        self.callStats = []
+
+    def client(self, service):
+        with self.lock:
+            if service not in self.clients:
+                self.clients[service] = self.clientFactory(service)
+            return self.clients[service]
+
+    def get(self, service, operation, resultKey, **params):
+        cacheKey = (service, operation, resultKey, json.dumps(params, sort_keys=True, default=str))
+        with self.lock:
+            if cacheKey in self.cache:
+                return self.cache[cacheKey]
+            keyLock = self.keyLocks.setdefault(cacheKey, threading.Lock())
+        # auditors asking for the same inventory at the same time wait on a single fetch
+        with keyLock:
+            with self.lock:
+                if cacheKey in self.cache:
+                    return self.cache[cacheKey]
+            items = self.fetch(service, operation, resultKey, params)
+            with self.lock:
+                self.cache[cacheKey] = items
+            return items
+
+    def lazy(self, service, operation, resultKey, **params):
+        # for module level inventory, nothing is fetched until a check first reads it
+        return lazy_value(lambda: self.get(service, operation, resultKey, **params))
+
+    def stream(self, service, operation, resultKey, **params):
+        # for module level inventory that is too large to hold in memory, every pass over
+        # it pages through the API again and yields items as each page arrives
+        return StreamedValue(lambda: self.iterate(service, operation, resultKey, **params))
+
+    def iterate(self, service, operation, resultKey, **params):
+        # a list another auditor already fetched is reused, otherwise nothing is cached
+        cacheKey = (service, operation, resultKey, json.dumps(params, sort_keys=True, default=str))
+        with self.lock:
+            cachedItems = self.cache.get(cacheKey)
+        if cachedItems is not None:
+            yield from cachedItems
+            return
+        startTime = time.perf_counter()
+        pages = 0
+        itemCount = 0
+        try:
+            for page in self.pages(service, operation, params):
+                pages += 1
+                for item in page.get(resultKey, []):
+                    itemCount += 1
+                    yield item
+        finally:
+            self.record(service, operation, params, pages, itemCount, time.perf_counter() - startTime)
+
+    def fetch(self, service, operation, resultKey, params):
+        startTime = time.perf_counter()
+        items = []
+        pages = 0
+        for page in self.pages(service, operation, params):
+            pages += 1
+            items.extend(page.get(resultKey, []))
+        self.record(service, operation, params, pages, len(items), time.perf_counter() - startTime)
+        return items
+
+    def pages(self, service, operation, params):
+        client = self.client(service)
+        if client.can_paginate(operation):
+            yield from client.get_paginator(operation).paginate(**params)
+        else:
+            yield getattr(client, operation)(**params)
+
+    def record(self, service, operation, params, pages, itemCount, seconds):
+        with self.lock:
+            self.callStats.append(
+                {
+                    'Service': service,
+                    'Operation': operation,
+                    'Params': json.dumps(params, sort_keys=True, default=str),
+                    'Pages': pages,
+                    'Items': itemCount,
+                    'Seconds': round(seconds, 3)
+                }
+            )
+
+    def stats(self):
+        with self.lock:
+            return list(self.callStats)
+
+class LazyValue(object):
+    # a list or dict that is only built the first time it is read
+    def __init__(self, factory):
+        self._factory = factory
+        self._value = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _resolve(self):
+        with self._lock:
+            if not self._loaded:
+                self._value = self._factory()
+                self._loaded = True
+            return self._value
+
+    def get(self):
+        return self._resolve()
+
+    def __iter__(self):
+        return iter(self._resolve())
+
+    def __len__(self):
+        return len(self._resolve())
+
+    def __getitem__(self, key):
+        return self._resolve()[key]
+
+    def __contains__(self, key):
+        return key in self._resolve()
+
+    def __bool__(self):
+        return bool(self._resolve())
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+class StreamedValue(object):
+    # an iterable that calls its generator function again for every pass, so only the
+    # current page is ever held in memory
+    def __init__(self, generatorFunction):
+        self._generatorFunction = generatorFunction
+
+    def __iter__(self):
+        return iter(self._generatorFunction())
+
+def lazy_value(factory):
+    return LazyValue(factory)
+
+defaultInventory = None
+defaultInventoryLock = threading.Lock()
+
+def default_inventory():
+    # one inventory is shared by every auditor running in this process, or in the active scope
+    global defaultInventory
+    scope = active_scope()
+    if scope is not None:
+        return scope.get_shared('inventory', lambda: ResourceInventory(clientFactory=scope.client))
+    with defaultInventoryLock:
+        if defaultInventory is None:
+            defaultInventory = ResourceInventory()
+    return defaultInventory
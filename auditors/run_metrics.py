@@ -0,0 +1,231 @@
+# This file is part of ElectricEye.
+
+# ElectricEye is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# ElectricEye is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License along with ElectricEye.
+# If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
+
+import collections
+import contextlib
+import functools
+import json
+import threading
+import time
+# namespace and dimensions used for CloudWatch embedded metric format output
+emfNamespace = 'ElectricEye'
+emfDimensions = [['Auditor', 'Check']]
+
+class CheckMetrics(object):
+    def __init__(self):
+        self.wallSeconds = 0.0
+        self.invocations = 0
+        self.apiCalls = collections.Counter()
+        self.bytesReceived = 0
+        self.findings = 0
+        self.errors = 0
+
+class RunMetrics(object):
+    # everything measured while a check runs on a thread is charged to that check: wall time,
+    # AWS API calls by operation, response bytes, findings sent and errors
+    def __init__(self):
+        self.checks = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.state = threading.local()
+
+    def current(self):
+        stack = getattr(self.state, 'stack', None)
+        return stack[-1] if stack else None
+
+    def check_metrics(self, key):
+        with self.lock:
+            if key not in self.checks:
+                self.checks[key] = CheckMetrics()
+            return self.checks[key]
+
+    @contextlib.contextmanager
+    def measuring(self, checkName, auditorName=None, scopeLabel=None):
+        # the auditor and scope are inherited from the unit this one runs inside of
+        outer = self.current()
+        if auditorName is None and outer is not None:
+            auditorName, scopeLabel = outer[0], outer[1]
+        key = (auditorName, scopeLabel, checkName)
+        metrics = self.check_metrics(key)
+        if not hasattr(self.state, 'stack'):
+            self.state.stack = []
+        self.state.stack.append(key)
+        startTime = time.perf_counter()
+        try:
+            yield key
+        except Exception as e:
+            # only the innermost unit counts an exception that propagates through several
+            if not getattr(e, 'electriceyeCounted', False):
+                e.electriceyeCounted = True
+                self.add(key, errors=1)
+            raise
+        finally:
+            self.state.stack.pop()
+            with self.lock:
+                metrics.wallSeconds += time.perf_counter() - startTime
+                metrics.invocations += 1
+
+    def add(self, key=None, operation=None, bytesReceived=0, findings=0, errors=0):
+        key = key or self.current()
+        if key is None:
+            return
+        metrics = self.check_metrics(key)
+        with self.lock:
+            if operation is not None:
+                metrics.apiCalls[operation] += 1
+            metrics.bytesReceived += bytesReceived
+            metrics.findings += findings
+            metrics.errors += errors
+
+    def instrument(self, events):
+        # botocore hooks on a client's event emitter, before-call fires once per API call and
+        # after-call carries the raw HTTP response of the last attempt
+        def before_call(event_name, **kwargs):
+            self.add(operation='.'.join(event_name.split('.')[1:3]))
+        def after_call(http_response=None, model=None, **kwargs):
+            if http_response is None:
+                return
+            # streaming bodies (e.g. S3 GetObject) are left for the caller to read, stubbed
+            # responses have no body at all
+            bytesReceived = http_response.headers.get('Content-Length')
+            streaming = model is not None and model.has_streaming_output
+            if bytesReceived is None and not streaming and http_response.raw is not None:
+                bytesReceived = len(http_response.content or b'')
+            self.add(
+                bytesReceived=int(bytesReceived or 0),
+                errors=1 if http_response.status_code >= 400 else 0
+            )
+        events.register('before-call', before_call)
+        events.register('after-call', after_call)
+
+    def instrument_module(self, module):
+        # every module level *_check function is wrapped so the auditor function picks up the
+        # wrapper when it looks the check up in the module globals
+        for name, value in list(vars(module).items()):
+            if name.endswith('_check') and callable(value) and getattr(value, '__module__', None) == module.__name__:
+                setattr(module, name, self.measured(value))
+
+    @contextlib.contextmanager
+    def charging(self, key):
+        # charges work done on a helper thread to a unit that is running on another thread
+        if key is None:
+            yield key
+            return
+        if not hasattr(self.state, 'stack'):
+            self.state.stack = []
+        self.state.stack.append(key)
+        try:
+            yield key
+        finally:
+            self.state.stack.pop()
+
+    def measured(self, function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.measuring(function.__name__):
+                return function(*args, **kwargs)
+        return wrapper
+
+    def summary(self):
+        with self.lock:
+            return [
+                {
+                    'Auditor': key[0],
+                    'Scope': key[1],
+                    'Check': key[2],
+                    'Invocations': metrics.invocations,
+                    'WallSeconds': round(metrics.wallSeconds, 3),
+                    'ApiCalls': sum(metrics.apiCalls.values()),
+                    'ApiCallsByOperation': dict(metrics.apiCalls),
+                    'BytesReceived': metrics.bytesReceived,
+                    'Findings': metrics.findings,
+                    'Errors': metrics.errors
+                }
+                for key, metrics in self.checks.items()
+            ]
+
+def write_json(path, runSummary):
+    with open(path, 'w') as summaryFile:
+        json.dump(runSummary, summaryFile, indent=2, default=str)
+
+def prometheus_labels(**labels):
+    return '{' + ','.join(
+        name + '="' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"' for name, value in labels.items()
+    ) + '}'
+
+def write_prometheus(path, runSummary):
+    # text exposition format, e.g. for the node_exporter textfile collector
+    lines = []
+    def metric(name, metricType, helpText, samples):
+        lines.append('# HELP ' + name + ' ' + helpText)
+        lines.append('# TYPE ' + name + ' ' + metricType)
+        for labels, value in samples:
+            lines.append(name + prometheus_labels(**labels) + ' ' + str(value))
+    checks = runSummary['Checks']
+    checkLabels = lambda c: {'auditor': c['Auditor'], 'scope': c['Scope'], 'check': c['Check']}
+    metric('electriceye_check_seconds', 'gauge', 'Wall time spent in the check', [(checkLabels(c), c['WallSeconds']) for c in checks])
+    metric('electriceye_check_findings', 'gauge', 'Findings sent by the check', [(checkLabels(c), c['Findings']) for c in checks])
+    metric('electriceye_check_errors', 'gauge', 'Errors raised or returned to the check', [(checkLabels(c), c['Errors']) for c in checks])
+    metric('electriceye_check_bytes_received', 'gauge', 'AWS API response bytes received by the check', [(checkLabels(c), c['BytesReceived']) for c in checks])
+    metric(
+        'electriceye_check_api_calls', 'gauge', 'AWS API calls made by the check',
+        [(dict(checkLabels(c), operation=operation), count) for c in checks for operation, count in c['ApiCallsByOperation'].items()]
+    )
+    metric(
+        'electriceye_auditor_seconds', 'gauge', 'Wall time of the auditor run',
+        [({'auditor': a['Auditor'], 'scope': a['Scope'], 'status': a['Status']}, a['WallSeconds']) for a in runSummary['Auditors']]
+    )
+    operations = runSummary['ApiOperations']
+    operationLabels = lambda o: {'service': o['Service'], 'operation': o['Operation']}
+    metric('electriceye_api_retries', 'gauge', 'Retried AWS API attempts', [(operationLabels(o), o['Retries']) for o in operations])
+    metric('electriceye_api_throttles', 'gauge', 'Throttled AWS API attempts', [(operationLabels(o), o['Throttles']) for o in operations])
+    metric('electriceye_run_seconds', 'gauge', 'Wall time of the whole run', [({}, runSummary['TotalSeconds'])])
+    with open(path, 'w') as promFile:
+        promFile.write('\n'.join(lines) + '\n')
+
+def print_emf(runSummary):
+    # one embedded metric format line per check, CloudWatch Logs turns them into metrics
+    timestamp = int(time.time() * 1000)
+    for check in runSummary['Checks']:
+        print(json.dumps({
+            '_aws': {
+                'Timestamp': timestamp,
+                'CloudWatchMetrics': [
+                    {
+                        'Namespace': emfNamespace,
+                        'Dimensions': emfDimensions,
+                        'Metrics': [
+                            {'Name': 'WallSeconds', 'Unit': 'Seconds'},
+                            {'Name': 'ApiCalls', 'Unit': 'Count'},
+                            {'Name': 'BytesReceived', 'Unit': 'Bytes'},
+                            {'Name': 'Findings', 'Unit': 'Count'},
+                            {'Name': 'Errors', 'Unit': 'Count'}
+                        ]
+                    }
+                ]
+            },
+            'Auditor': check['Auditor'],
+            'Check': check['Check'],
+            'Scope': check['Scope'],
+            'WallSeconds': check['WallSeconds'],
+            'ApiCalls': check['ApiCalls'],
+            'BytesReceived': check['BytesReceived'],
+            'Findings': check['Findings'],
+            'Errors': check['Errors']
+        }))
+
+defaultMetrics = RunMetrics()
+
+def default_metrics():
+    return defaultMetrics
@@ -0,0 +1,190 @@
+# This file is part of ElectricEye.
+
+# ElectricEye is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# ElectricEye is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License along with ElectricEye.
+# If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
+
+import contextlib
+import importlib.util
+import os
+import sys
+import threading
+import boto3
+from client_governor import default_governor
+
+class ScanScope(object):
+    # one region (and later account) that auditors are loaded and run against, it owns
+    # the boto3 clients, finding sink and inventory used by every auditor in that scope
+    def __init__(self, session, region, accountId=None, sessionLock=None):
+        self.session = session
+        self.region = region
+        self.accountId = accountId
+        # scopes built from the same boto3 session share its lock, client creation is not thread safe
+        self.sessionLock = sessionLock or threading.Lock()
+        self.clients = {}
+        self.shared = {}
+        # reentrant, shared factories create their clients through this scope
+        self.lock = threading.RLock()
+
+    def label(self):
+        if self.accountId:
+            return self.accountId + '/' + self.region
+        return self.region
+
+    def client(self, serviceName, **kwargs):
+        # boto3.client() inside an auditor lands here while the scope is active, every client is
+        # pinned to the scope's region and built by the governor (adaptive retries, per service limits)
+        # clients that only pick a region (e.g. for S3 buckets homed elsewhere) are cached per region
+        kwargs.setdefault('region_name', self.region)
+        if list(kwargs) != ['region_name']:
+            with self.sessionLock:
+                return default_governor().client(self.session, serviceName, bucketKey=self.label(), **kwargs)
+        clientKey = (serviceName, kwargs['region_name'])
+        with self.lock:
+            if clientKey not in self.clients:
+                with self.sessionLock:
+                    self.clients[clientKey] = default_governor().client(
+                        self.session, serviceName, bucketKey=self.label(), region_name=kwargs['region_name']
+                    )
+            return self.clients[clientKey]
+
+    def resource(self, serviceName, **kwargs):
+        kwargs.setdefault('region_name', self.region)
+        with self.sessionLock:
+            return default_governor().resource(self.session, serviceName, bucketKey=self.label(), **kwargs)
+
+    def account_id(self):
+        # member account scopes know their account, otherwise it is looked up once per session
+        if self.accountId:
+            return self.accountId
+        with sessionAccountIdsLock:
+            if id(self.session) not in sessionAccountIds:
+                sessionAccountIds[id(self.session)] = self.client('sts').get_caller_identity()['Account']
+            return sessionAccountIds[id(self.session)]
+
+    def get_shared(self, name, factory):
+        # per scope singletons such as the finding sink and resource inventory
+        with self.lock:
+            if name not in self.shared:
+                self.shared[name] = factory()
+            return self.shared[name]
+
+# account IDs of the sessions scopes were built from, keyed by id(session)
+sessionAccountIds = {}
+sessionAccountIdsLock = threading.Lock()
+scopeState = threading.local()
+
+def active_scope():
+    return getattr(scopeState, 'scope', None)
+
+@contextlib.contextmanager
+def using_scope(scope):
+    previousScope = active_scope()
+    scopeState.scope = scope
+    try:
+        yield scope
+    finally:
+        scopeState.scope = previousScope
+
+class LazyClient(object):
+    # stands in for a boto3 client at module level, the client is only built on first use
+    # from the scope that was active when the auditor was imported
+    def __init__(self, serviceName, scope, regionName=None):
+        self._serviceName = serviceName
+        self._scope = scope
+        self._regionName = regionName
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _resolve(self):
+        with self._lock:
+            if self._client is None:
+                kwargs = {'region_name': self._regionName} if self._regionName else {}
+                if self._scope is not None:
+                    self._client = self._scope.client(self._serviceName, **kwargs)
+                else:
+                    self._client = boto3.client(self._serviceName, **kwargs)
+            return self._client
+
+    def for_region(self, regionName):
+        # the same service in another region, built from the same scope even on a worker thread
+        return LazyClient(self._serviceName, self._scope, regionName)
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+def lazy_client(serviceName):
+    return LazyClient(serviceName, active_scope())
+
+processAccountId = None
+processAccountIdLock = threading.Lock()
+
+def aws_account_id():
+    # resolved once per process (or once per session when scanning through scopes)
+    global processAccountId
+    scope = active_scope()
+    if scope is not None:
+        return scope.account_id()
+    with processAccountIdLock:
+        if processAccountId is None:
+            processAccountId = boto3.client('sts').get_caller_identity()['Account']
+    return processAccountId
+
+class LazyAccountId(object):
+    # stands in for the account ID at module level, like LazyClient STS is only called on first use
+    # and from the scope that was active when the auditor was imported
+    def __init__(self, scope):
+        self._scope = scope
+
+    def get(self):
+        if self._scope is not None:
+            return self._scope.account_id()
+        return aws_account_id()
+
+def lazy_account_id():
+    return LazyAccountId(active_scope())
+
+importLock = threading.Lock()
+
+def import_auditor(scope, moduleName, auditorPath):
+    # auditors build their clients and read AWS_REGION at import time, so each scope gets its own
+    # copy of the module imported while boto3's default session and AWS_REGION point at the scope
+    with importLock, using_scope(scope):
+        previousSession = boto3.DEFAULT_SESSION
+        previousRegion = os.environ.get('AWS_REGION')
+        boto3.DEFAULT_SESSION = scope
+        os.environ['AWS_REGION'] = scope.region
+        scopedName = moduleName + '__' + scope.label().replace('/', '_').replace('-', '_')
+        try:
+            spec = importlib.util.spec_from_file_location(scopedName, auditorPath)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[scopedName] = module
+            try:
+                spec.loader.exec_module(module)
+            except Exception:
+                del sys.modules[scopedName]
+                raise
+            return module
+        finally:
+            boto3.DEFAULT_SESSION = previousSession
+            if previousRegion is None:
+                os.environ.pop('AWS_REGION', None)
+            else:
+                os.environ['AWS_REGION'] = previousRegion
+
+def enabled_regions(session):
+    # regions that are enabled for the account, opt-in regions only once they are opted in
+    ec2 = session.client('ec2')
+    response = ec2.describe_regions(
+        Filters=[{'Name': 'opt-in-status', 'Values': ['opt-in-not-required', 'opted-in']}]
+    )
+    return sorted(region['RegionName'] for region in response['Regions'])
@@ -15,76 +15,24 @@
 
 #!/bin/bash
 echo "Executing security checks"
-python3 Amazon_APIGW_Auditor.py
-sleep 2
-python3 Amazon_AppStream_Auditor.py
-sleep 2
-python3 Amazon_CognitoIdP_Auditor.py
-sleep 2
-python3 Amazon_DocumentDB_Auditor.py
-sleep 2
-python3 Amazon_EBS_Auditor.py
-sleep 2
-python3 Amazon_EC2_Security_Group_Auditor.py
-sleep 2
-python3 Amazon_EC2_SSM_Auditor.py
-sleep 2
-python3 Amazon_ECR_Auditor.py
-sleep 2
-python3 Amazon_ECS_Auditor.py
-sleep 2
-python3 Amazon_EFS_Auditor.py
-sleep 2
-python3 Amazon_EKS_Auditor.py
-sleep 2
-python3 Amazon_Elasticache_Redis_Auditor.py
-sleep 2
-python3 Amazon_ElasticsearchService_Auditor.py
-sleep 2
-python3 Amazon_ELB_Auditor.py
-sleep 2
-python3 Amazon_ELBv2_Auditor.py
-sleep 2
-python3 Amazon_Kinesis_Data_Streams_Auditor.py
-sleep 2
-python3 Amazon_MSK_Auditor.py
-sleep 2
-python3 Amazon_Neptune_Auditor.py
-sleep 2
-python3 Amazon_RDS_Auditor.py
-sleep 2
-python3 Amazon_Redshift_Auditor.py
-sleep 2
-python3 Amazon_S3_Auditor.py
-sleep 2
-python3 Amazon_SageMaker_Auditor.py
-sleep 2
-python3 Amazon_Shield_Advanced_Auditor.py
-sleep 2
-python3 Amazon_SNS_Auditor.py
-sleep 2
-python3 Amazon_VPC_Auditor.py
-sleep 2
-python3 Amazon_WorkSpaces_Auditor.py
-sleep 2
-python3 AMI_Auditor.py
-sleep 2
-python3 AWS_Backup_Auditor.py
-sleep 2
-python3 AWS_CloudFormation_Auditor.py
-sleep 2
-python3 AWS_CodeBuild_Auditor.py
-sleep 2
-python3 AWS_Directory_Service_Auditor.py
-sleep 2
-python3 AWS_DMS_Auditor.py
-sleep 2
-python3 AWS_Secrets_Manager_Auditor.py
-sleep 2
-python3 AWS_Security_Services_Auditor.py
-sleep 2
-python3 Shodan_Auditor.py
-sleep 2
-python3 AWS_Security_Hub_Auditor.py
+# all auditors are imported once and run concurrently by the runner, set
+# ELECTRICEYE_MAX_WORKERS on the task definition to change the pool size, set
+# ELECTRICEYE_REGIONS (e.g. "us-east-1 eu-west-1" or "all") to scan several regions
+# from this task, ELECTRICEYE_MAX_WORKERS_PER_REGION caps auditors per region, set
+# ELECTRICEYE_ACCOUNTS (account IDs or "organization") or ELECTRICEYE_ACCOUNTS_FILE
+# to scan member accounts through ELECTRICEYE_ROLE_NAME
+# ELECTRICEYE_MAX_ATTEMPTS and ELECTRICEYE_RATE_LIMITS (e.g. "apigateway=5,ec2=50:100")
+# tune retries and per service request rates, ELECTRICEYE_METRICS_FORMAT (json, prometheus
+# or emf) picks how per check timing and API call metrics are reported
+# ELECTRICEYE_INCREMENTAL=true keeps the state of the last run in electriceye-state.db,
+# the task is ephemeral so the file is kept in ELECTRICEYE_STATE_BUCKET between runs,
+# every ELECTRICEYE_FULL_REFRESH_HOURS (default 168) all findings are sent again
+if [ "$ELECTRICEYE_INCREMENTAL" = "true" ] && [ -n "$ELECTRICEYE_STATE_BUCKET" ]; then
+    aws s3 cp s3://${ELECTRICEYE_STATE_BUCKET}/electriceye-state.db ./electriceye-state.db || echo "No previous state found, running a full scan"
+fi
+python3 electriceye_runner.py
+if [ "$ELECTRICEYE_INCREMENTAL" = "true" ] && [ -n "$ELECTRICEYE_STATE_BUCKET" ]; then
+    aws s3 cp ./electriceye-state.db s3://${ELECTRICEYE_STATE_BUCKET}/electriceye-state.db
+fi
 echo "All scans complete, exiting"
 exit 1
\ No newline at end of file
@@ -0,0 +1,190 @@
+# This file is part of ElectricEye.
+
+# ElectricEye is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# ElectricEye is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License along with ElectricEye.
+# If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
+
+import collections
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+# fields that change on every describe call without the resource configuration changing
+volatileKeys = ('LatestRestorableTime', 'ResponseMetadata')
+# finding timestamps are new on every run, they are left out of the finding content hash
+findingTimestampKeys = ('FirstObservedAt', 'CreatedAt', 'UpdatedAt')
+
+class StateStore(object):
+    # SQLite snapshot of the previous run, for every finding Id it keeps the hash of the
+    # resource configuration it was evaluated against and the compliance status it produced,
+    # plus a hash of the last finding that was actually imported into Security Hub
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.counters = collections.Counter()
+        # during a full refresh everything is evaluated and sent, the snapshot is still updated
+        self.fullRefresh = False
+        # resource states waiting for their finding to be imported, {(productArn, findingId): row}
+        self.pendingResourceStates = {}
+        with self.lock:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS resource_state ('
+                'scope TEXT NOT NULL, '
+                'finding_id TEXT NOT NULL, '
+                'config_hash TEXT NOT NULL, '
+                'status TEXT NOT NULL, '
+                'PRIMARY KEY (scope, finding_id))'
+            )
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS finding_state ('
+                'product_arn TEXT NOT NULL, '
+                'finding_id TEXT NOT NULL, '
+                'content_hash TEXT NOT NULL, '
+                'PRIMARY KEY (product_arn, finding_id))'
+            )
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS run_state (name TEXT PRIMARY KEY, value TEXT NOT NULL)'
+            )
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS lookup_cache ('
+                'scope TEXT NOT NULL, '
+                'cache_key TEXT NOT NULL, '
+                'value TEXT NOT NULL, '
+                'recorded_at REAL NOT NULL DEFAULT 0, '
+                'PRIMARY KEY (scope, cache_key))'
+            )
+            # snapshots written before lookups had an age are treated as expired
+            lookupColumns = [row[1] for row in self.connection.execute('PRAGMA table_info(lookup_cache)')]
+            if 'recorded_at' not in lookupColumns:
+                self.connection.execute('ALTER TABLE lookup_cache ADD COLUMN recorded_at REAL NOT NULL DEFAULT 0')
+            self.connection.commit()
+
+    def begin_run(self, refreshSeconds):
+        # a run is a full refresh when there is no snapshot yet or the last full refresh is too old,
+        # this keeps UpdatedAt fresh on findings that never change
+        with self.lock:
+            row = self.connection.execute("SELECT value FROM run_state WHERE name = 'last_full_refresh'").fetchone()
+        self.fullRefresh = row is None or time.time() - float(row[0]) >= refreshSeconds
+        return self.fullRefresh
+
+    def resource_state(self, scope, findingId):
+        # returns (configHash, status) from the last run or None
+        with self.lock:
+            return self.connection.execute(
+                'SELECT config_hash, status FROM resource_state WHERE scope = ? AND finding_id = ?',
+                (scope, findingId)
+            ).fetchone()
+
+    def record_resource_state(self, scope, findingId, configHash, status):
+        with self.lock:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO resource_state (scope, finding_id, config_hash, status) VALUES (?, ?, ?, ?)',
+                (scope, findingId, configHash, status)
+            )
+
+    def defer_resource_state(self, finding, scope, findingId, configHash, status):
+        # written by release_resource_states once Security Hub has the finding, so a finding that
+        # failed to import is evaluated and sent again on the next incremental run
+        with self.lock:
+            self.pendingResourceStates[(finding['ProductArn'], finding['Id'])] = (scope, findingId, configHash, status)
+
+    def release_resource_states(self, findings):
+        with self.lock:
+            rows = [self.pendingResourceStates.pop((finding['ProductArn'], finding['Id']), None) for finding in findings]
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO resource_state (scope, finding_id, config_hash, status) VALUES (?, ?, ?, ?)',
+                [row for row in rows if row is not None]
+            )
+
+    def discard_resource_states(self, findings):
+        with self.lock:
+            for finding in findings:
+                self.pendingResourceStates.pop((finding['ProductArn'], finding['Id']), None)
+
+    def finding_changed(self, finding):
+        # True if the finding is new or differs from the last one imported with the same Id
+        with self.lock:
+            row = self.connection.execute(
+                'SELECT content_hash FROM finding_state WHERE product_arn = ? AND finding_id = ?',
+                (finding['ProductArn'], finding['Id'])
+            ).fetchone()
+        return row is None or row[0] != finding_hash(finding)
+
+    def record_findings(self, findings):
+        # only called for findings Security Hub accepted
+        with self.lock:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO finding_state (product_arn, finding_id, content_hash) VALUES (?, ?, ?)',
+                [(finding['ProductArn'], finding['Id'], finding_hash(finding)) for finding in findings]
+            )
+        self.release_resource_states(findings)
+
+    def cached_lookups(self, scope, cacheKeys, maxAgeSeconds):
+        # per resource API responses kept from earlier runs, {cacheKey: value} for the keys that have one
+        # recorded in the last maxAgeSeconds, a full refresh ignores them so they are looked up again and re-recorded
+        if self.fullRefresh or not cacheKeys or maxAgeSeconds <= 0:
+            return {}
+        with self.lock:
+            rows = self.connection.execute(
+                'SELECT cache_key, value FROM lookup_cache WHERE scope = ? AND recorded_at >= ? AND cache_key IN (' + ','.join('?' * len(cacheKeys)) + ')',
+                [scope, time.time() - maxAgeSeconds] + list(cacheKeys)
+            ).fetchall()
+        return {cacheKey: json.loads(value) for cacheKey, value in rows}
+
+    def record_lookups(self, scope, values):
+        recordedAt = time.time()
+        with self.lock:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO lookup_cache (scope, cache_key, value, recorded_at) VALUES (?, ?, ?, ?)',
+                [(scope, cacheKey, json.dumps(value, default=str), recordedAt) for cacheKey, value in values.items()]
+            )
+
+    def count(self, counterName):
+        with self.lock:
+            self.counters[counterName] += 1
+
+    def stats(self):
+        with self.lock:
+            return dict(self.counters)
+
+    def close(self):
+        with self.lock:
+            if self.fullRefresh:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO run_state (name, value) VALUES ('last_full_refresh', ?)",
+                    (str(time.time()),)
+                )
+            self.connection.commit()
+            self.connection.close()
+
+def config_hash(item):
+    if isinstance(item, dict):
+        item = {key: value for key, value in item.items() if key not in volatileKeys}
+    return hashlib.sha256(json.dumps(item, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+def finding_hash(finding):
+    content = {key: value for key, value in finding.items() if key not in findingTimestampKeys}
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+defaultStateStore = None
+
+def open_state_store(path):
+    # called once by the runner when incremental scanning is turned on
+    global defaultStateStore
+    defaultStateStore = StateStore(path)
+    return defaultStateStore
+
+def default_state_store():
+    # None unless the runner opened a state store, auditors then evaluate every resource
+    return defaultStateStore
@@ -0,0 +1,328 @@
+# This file is part of ElectricEye.
+
+# ElectricEye is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# ElectricEye is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License along with ElectricEye.
+# If not, see https://github.com/jonrau1/ElectricEye/blob/master/LICENSE.
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+import boto3
+from botocore.awsrequest import AWSResponse
+# synthetic resources are served by a moto server running in this process, every auditor run
+# happens in a child process so its peak RSS is not mixed up with moto's own memory
+benchmarkDir = os.path.dirname(os.path.abspath(__file__))
+auditorDir = os.path.join(os.path.dirname(benchmarkDir), 'auditors')
+defaultBaselinePath = os.path.join(benchmarkDir, 'baseline.json')
+defaultScales = [10, 1000, 50000]
+benchmarkRegion = 'us-east-1'
+# relative increase over the baseline that is reported as a regression
+defaultThreshold = 0.2
+# wall time differences smaller than this are noise on short runs
+minimumWallSecondsDelta = 1.0
+# moto creates EC2 instances in batches
+instanceBatchSize = 500
+
+def fake_credentials():
+    return {
+        'AWS_ACCESS_KEY_ID': 'testing',
+        'AWS_SECRET_ACCESS_KEY': 'testing',
+        'AWS_SESSION_TOKEN': 'testing',
+        'AWS_REGION': benchmarkRegion,
+        'AWS_DEFAULT_REGION': benchmarkRegion
+    }
+
+def seed_security_groups(session, scale):
+    ec2 = session.client('ec2')
+    for index in range(scale):
+        groupId = ec2.create_security_group(GroupName='bench-sg-' + str(index), Description='ElectricEye benchmark')['GroupId']
+        ec2.authorize_security_group_ingress(
+            GroupId=groupId,
+            IpPermissions=[
+                {'IpProtocol': 'tcp', 'FromPort': 22, 'ToPort': 22, 'IpRanges': [{'CidrIp': '0.0.0.0/0'}]},
+                {'IpProtocol': 'tcp', 'FromPort': 443, 'ToPort': 443, 'IpRanges': [{'CidrIp': '0.0.0.0/0'}]},
+                {'IpProtocol': 'tcp', 'FromPort': 1024, 'ToPort': 65535, 'IpRanges': [{'CidrIp': '10.0.0.0/8'}]}
+            ]
+        )
+
+def seed_rds(session, scale):
+    rds = session.client('rds')
+    for index in range(scale):
+        instanceId = 'bench-db-' + str(index)
+        rds.create_db_instance(
+            DBInstanceIdentifier=instanceId,
+            DBInstanceClass='db.t3.micro',
+            Engine='postgres',
+            MasterUsername='electriceye',
+            MasterUserPassword='electriceye-benchmark',
+            AllocatedStorage=20
+        )
+        # one manual snapshot for every tenth instance
+        if index % 10 == 0:
+            rds.create_db_snapshot(DBInstanceIdentifier=instanceId, DBSnapshotIdentifier=instanceId + '-snapshot')
+
+def seed_ebs(session, scale):
+    ec2 = session.client('ec2')
+    for index in range(scale):
+        volumeId = ec2.create_volume(AvailabilityZone=benchmarkRegion + 'a', Size=8)['VolumeId']
+        ec2.create_snapshot(VolumeId=volumeId, Description='ElectricEye benchmark')
+
+def seed_ec2_instances(session, scale):
+    ec2 = session.client('ec2')
+    for start in range(0, scale, instanceBatchSize):
+        count = min(instanceBatchSize, scale - start)
+        ec2.run_instances(ImageId='ami-12c6146b', InstanceType='t3.micro', MinCount=count, MaxCount=count)
+
+# the hot auditors and how to fill the account for them
+seeders = {
+    'Amazon_EC2_Security_Group_Auditor': seed_security_groups,
+    'Amazon_RDS_Auditor': seed_rds,
+    'Amazon_EBS_Auditor': seed_ebs,
+    'Amazon_EC2_SSM_Auditor': seed_ec2_instances
+}
+
+def seeded_instance_ids():
+    # read straight from moto with a client the runner does not see, so it is not counted
+    ec2 = boto3.client('ec2')
+    instanceIds = []
+    for page in ec2.get_paginator('describe_instances').paginate():
+        for reservation in page['Reservations']:
+            instanceIds.extend(instance['InstanceId'] for instance in reservation['Instances'])
+    return instanceIds
+
+def synthetic_response(parsed):
+    # a before-call handler that returns a response short circuits the HTTP request
+    parsed['ResponseMetadata'] = {'HTTPStatusCode': 200, 'RetryAttempts': 0}
+    return AWSResponse(None, 200, {}, None), parsed
+
+def synthetic_instance_information(**kwargs):
+    # three out of four instances are managed, every other one runs an outdated agent
+    instanceInformation = []
+    for index, instanceId in enumerate(seeded_instance_ids()):
+        if index % 4 == 3:
+            continue
+        instanceInformation.append(
+            {
+                'InstanceId': instanceId,
+                'PingStatus': 'Online',
+                'AgentVersion': '3.0.0',
+                'IsLatestVersion': index % 2 == 0,
+                'PlatformType': 'Linux',
+                'AssociationStatus': 'Success'
+            }
+        )
+    return synthetic_response({'InstanceInformationList': instanceInformation})
+
+def synthetic_patch_states(params=None, **kwargs):
+    operationTime = datetime.datetime.now(datetime.timezone.utc)
+    patchStates = []
+    for index, instanceId in enumerate(params['InstanceIds']):
+        patchStates.append(
+            {
+                'InstanceId': instanceId,
+                'PatchGroup': 'electriceye-benchmark',
+                'BaselineId': 'pb-0123456789abcdef0',
+                'OperationStartTime': operationTime,
+                'OperationEndTime': operationTime,
+                'Operation': 'Scan',
+                'FailedCount': 0,
+                'MissingCount': index % 3
+            }
+        )
+    return synthetic_response({'InstancePatchStates': patchStates})
+
+# operations moto does not implement are answered with synthetic responses inside the child
+syntheticResponses = {
+    'Amazon_EC2_SSM_Auditor': {
+        'before-call.ssm.DescribeInstanceInformation': synthetic_instance_information,
+        'before-call.ssm.DescribeInstancePatchStates': synthetic_patch_states
+    }
+}
+
+def moto_reset(endpointUrl):
+    request = urllib.request.Request(endpointUrl + '/moto-api/reset', method='POST')
+    urllib.request.urlopen(request).read()
+
+def run_child(auditorName, endpointUrl):
+    # the auditor runs through the real runner so scopes, the governor and the finding sink are included
+    with tempfile.TemporaryDirectory() as workDir:
+        childEnv = dict(os.environ)
+        childEnv.update(fake_credentials())
+        childEnv['AWS_ENDPOINT_URL'] = endpointUrl
+        outputPath = os.path.join(workDir, 'result.json')
+        subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--child', auditorName, '--output', outputPath],
+            env=childEnv,
+            cwd=workDir,
+            check=True,
+            stdout=subprocess.DEVNULL
+        )
+        with open(outputPath) as resultFile:
+            return json.load(resultFile)
+
+def child_main(auditorName, outputPath):
+    # runs inside the child process, reports what the runner measured plus the peak RSS
+    import resource
+    sys.path.insert(0, auditorDir)
+    import electriceye_runner
+    from client_governor import default_governor
+    handlers = syntheticResponses.get(auditorName, {})
+    def synthetic_call(event_name, **kwargs):
+        # registered on every before-call event so the governor and run metrics still count the call
+        if event_name in handlers:
+            return handlers[event_name](**kwargs)
+        return None
+    if handlers:
+        default_governor().register('before-call', synthetic_call)
+    metricsPath = os.path.join(os.path.dirname(outputPath), 'metrics.json')
+    startTime = time.perf_counter()
+    exitCode = electriceye_runner.main(['--auditors', auditorName, '--metrics-path', metricsPath])
+    wallSeconds = time.perf_counter() - startTime
+    with open(metricsPath) as metricsFile:
+        runSummary = json.load(metricsFile)
+    peakRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peakRssMb = peakRss / (1024.0 * 1024.0) if sys.platform == 'darwin' else peakRss / 1024.0
+    apiCalls = {}
+    for operation in runSummary['ApiOperations']:
+        apiCalls[operation['Service'] + '.' + operation['Operation']] = operation['Calls']
+    result = {
+        'Auditor': auditorName,
+        'Status': runSummary['Auditors'][0]['Status'] if runSummary['Auditors'] else 'MISSING',
+        'ExitCode': exitCode,
+        'WallSeconds': round(wallSeconds, 3),
+        'ApiCalls': sum(apiCalls.values()),
+        'ApiCallsByOperation': apiCalls,
+        'Findings': runSummary['SecurityHub'].get('SuccessCount', 0) + runSummary['SecurityHub'].get('FailedCount', 0),
+        'PeakRssMb': round(peakRssMb, 1)
+    }
+    with open(outputPath, 'w') as resultFile:
+        json.dump(result, resultFile)
+
+def run_benchmarks(auditorNames, scales):
+    from moto.server import ThreadedMotoServer
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    os.environ.update(fake_credentials())
+    # moto counts automated RDS snapshots against its snapshot quota, lift it above the largest scale
+    os.environ.setdefault('MOTO_RDS_SNAPSHOT_LIMIT', str(2 * max(scales) + 1000))
+    server = ThreadedMotoServer(ip_address='127.0.0.1', port=0, verbose=False)
+    server.start()
+    host, port = server.get_host_and_port()
+    endpointUrl = 'http://' + host + ':' + str(port)
+    # seeding goes to the same server
+    os.environ['AWS_ENDPOINT_URL'] = endpointUrl
+    session = boto3.session.Session(region_name=benchmarkRegion)
+    results = []
+    try:
+        for scale in scales:
+            for auditorName in auditorNames:
+                moto_reset(endpointUrl)
+                seedStart = time.perf_counter()
+                seeders[auditorName](session, scale)
+                session.client('securityhub').enable_security_hub()
+                seedSeconds = time.perf_counter() - seedStart
+                result = run_child(auditorName, endpointUrl)
+                result['Scale'] = scale
+                result['SeedSeconds'] = round(seedSeconds, 3)
+                results.append(result)
+                print(
+                    '{:<36} {:>6} resources {:<10} {:>8.3f}s {:>7} API calls {:>7} findings {:>8.1f} MB peak RSS'.format(
+                        auditorName, scale, result['Status'], result['WallSeconds'], result['ApiCalls'],
+                        result['Findings'], result['PeakRssMb']
+                    )
+                )
+    finally:
+        server.stop()
+    return results
+
+def result_key(result):
+    return result['Auditor'] + '@' + str(result['Scale'])
+
+def compare(results, baseline, threshold):
+    # wall time and peak RSS may grow by the threshold, API calls and findings must not change
+    regressions = []
+    for result in results:
+        previous = baseline.get(result_key(result))
+        if previous is None:
+            continue
+        if result['WallSeconds'] > max(previous['WallSeconds'] * (1 + threshold), previous['WallSeconds'] + minimumWallSecondsDelta):
+            regressions.append(
+                result_key(result) + ' WallSeconds ' + str(previous['WallSeconds']) + ' -> ' + str(result['WallSeconds'])
+            )
+        if result['PeakRssMb'] > previous['PeakRssMb'] * (1 + threshold):
+            regressions.append(
+                result_key(result) + ' PeakRssMb ' + str(previous['PeakRssMb']) + ' -> ' + str(result['PeakRssMb'])
+            )
+        if result['ApiCalls'] > previous['ApiCalls']:
+            regressions.append(
+                result_key(result) + ' ApiCalls ' + str(previous['ApiCalls']) + ' -> ' + str(result['ApiCalls'])
+            )
+        if result['Findings'] != previous['Findings']:
+            regressions.append(
+                result_key(result) + ' Findings ' + str(previous['Findings']) + ' -> ' + str(result['Findings'])
+            )
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark ElectricEye auditors against synthetic resources served by moto')
+    parser.add_argument(
+        '--auditors',
+        nargs='*',
+        default=sorted(seeders),
+        choices=sorted(seeders),
+        help='Auditors to benchmark, defaults to every auditor with a seeder'
+    )
+    parser.add_argument('--scales', nargs='*', type=int, default=defaultScales, help='Resources created per run')
+    parser.add_argument('--baseline', default=defaultBaselinePath, help='Baseline file to compare against or save to')
+    parser.add_argument('--save-baseline', action='store_true', help='Write the results to the baseline file')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=defaultThreshold,
+        help='Relative increase in wall time or peak RSS over the baseline that counts as a regression'
+    )
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--output', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        child_main(args.child, args.output)
+        return 0
+    results = run_benchmarks(args.auditors, args.scales)
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as baselineFile:
+                baseline = json.load(baselineFile)
+        baseline.update({result_key(result): result for result in results})
+        with open(args.baseline, 'w') as baselineFile:
+            json.dump(baseline, baselineFile, indent=2, sort_keys=True)
+        print('Baseline saved to ' + args.baseline)
+        return 0
+    if not os.path.exists(args.baseline):
+        print('No baseline at ' + args.baseline + ', run with --save-baseline to create one')
+        return 0
+    with open(args.baseline) as baselineFile:
+        regressions = compare(results, json.load(baselineFile), args.threshold)
+    for regression in regressions:
+        print('REGRESSION ' + regression)
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
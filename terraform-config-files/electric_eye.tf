@@ -240,6 +240,7 @@ resource "aws_iam_role_policy" "Electric_Eye_Task_Role_Policy" {
                 "shield:DescribeDRTAccess",
                 "secretsmanager:ListSecrets",
                 "s3:GetLifecycleConfiguration",
+                "s3:GetBucketLocation",
                 "ec2:DescribeAddresses",
                 "appstream:DescribeUsers",
                 "kafka:ListClusters",
@@ -256,6 +257,7 @@ resource "aws_iam_role_policy" "Electric_Eye_Task_Role_Policy" {
                 "rds:DescribeDBParameterGroups",
                 "s3:ListBucket",
                 "backup:DescribeProtectedResource",
+                "backup:ListProtectedResources",
                 "s3:GetEncryptionConfiguration",
                 "elasticloadbalancing:DescribeListeners",
                 "es:DescribeElasticsearchDomain",
@@ -289,6 +291,7 @@ resource "aws_iam_role_policy" "Electric_Eye_Task_Role_Policy" {
                 "ssm:DescribeInstanceInformation",
                 "ec2:DescribeSecurityGroupReferences",
                 "ec2:DescribeVpcs",
+                "ec2:DescribeRegions",
                 "rds:DescribeDBClusterSnapshots",
                 "redshift:DescribeClusters",
                 "cloudfront:ListDistributions",